@@ -11,11 +11,46 @@ Literature:
 """
 
 import click
+from dataclasses import replace
 from pathlib import Path
 from datetime import datetime
 import json
 
 
+def _echo_cache_stats(result):
+    """Report the evaluation cache hit rate of a factory run (if enabled)."""
+    stats = result.optimization_metadata.get("evaluation_cache")
+    if stats:
+        lookups = stats["hits"] + stats["misses"]
+        click.echo(
+            f"✓ Evaluation cache: {stats['hits']}/{lookups} hits "
+            f"({100.0 * stats['hit_rate']:.1f}%), {stats['entries']} entries in {stats['path']}"
+        )
+
+
+def _parse_fidelity(ctx, param, value):
+    """Click callback parsing --fidelity into (fraction, n_points) stages."""
+    if value is None:
+        return None
+    from viberesp.optimization.optimizers.fidelity import parse_fidelity_schedule
+
+    try:
+        return [tuple(stage) for stage in parse_fidelity_schedule(value)]
+    except ValueError as e:
+        raise click.BadParameter(str(e))
+
+
+def _echo_generations(result):
+    """Report an early (converged) stop of a factory run, or a grid search's evaluations."""
+    metadata = result.optimization_metadata
+    if metadata.get("algorithm") == "grid":
+        click.echo(f"✓ Grid search evaluated {metadata['n_evaluations']} designs")
+        return
+    n_run, n_max = metadata.get("n_generations_run"), metadata.get("n_generations")
+    if n_run is not None and n_max is not None and n_run < n_max:
+        click.echo(f"✓ Converged after {n_run}/{n_max} generations")
+
+
 @click.group()
 def optimize():
     """Optimization commands using OptimizationScriptFactory."""
@@ -36,8 +71,50 @@ def optimize():
 @click.option('--generations', type=int, help='Number of generations (default: 100)')
 @click.option('--seed', type=int, help='Random seed for reproducibility')
 @click.option('--quiet', '-q', is_flag=True, help='Suppress progress output')
+@click.option('--workers', type=int, default=1, show_default=True,
+              help='Worker processes per generation (0 = all CPU cores)')
+@click.option('--cache', 'cache_path', type=click.Path(dir_okay=False),
+              help='SQLite evaluation cache; designs evaluated by earlier runs are re-used')
+@click.option('--cache-size', type=int, default=1_000_000, show_default=True,
+              help='Maximum number of designs kept in the evaluation cache')
+@click.option('--hv-tolerance', type=float,
+              help='Stop early once the relative hypervolume gain stays below this (e.g. 1e-3)')
+@click.option('--hv-patience', type=int, default=10, show_default=True,
+              help='Generations without hypervolume gain before stopping early')
+@click.option('--checkpoint', 'checkpoint_path', type=click.Path(dir_okay=False),
+              help='Save the optimizer state to this file during the run')
+@click.option('--checkpoint-every', type=int, default=10, show_default=True,
+              help='Generations between checkpoints')
+@click.option('--resume', is_flag=True,
+              help='Continue from --checkpoint if it exists (starts a new run otherwise)')
+@click.option('--fidelity', 'fidelity_schedule', callback=_parse_fidelity,
+              help='Coarse frequency grids early in the run: fraction:points stages '
+                   '(e.g. 0.5:24,1:64) or "default"; results are re-scored on full grids')
+@click.option('--islands', type=int, default=1, show_default=True,
+              help='Independent NSGA-II populations, one process each, with migration')
+@click.option('--migration-interval', type=int, default=10, show_default=True,
+              help='Generations between migrations of non-dominated designs (--islands)')
+@click.option('--island-presets',
+              help='Comma-separated parameter space preset per island, cycled (--islands)')
+@click.option('--seed-from', type=click.Path(exists=True, dir_okay=False),
+              help='Warm start: put the Pareto designs of an earlier results JSON in the initial population')
+@click.option('--algorithm', type=click.Choice(['nsga2', 'grid']),
+              help='nsga2 (default), or grid: exhaustive grid search for sealed/ported boxes')
+@click.option('--grid-points', type=int,
+              help='Grid points per variable (--algorithm grid; default: 4096 designs in total; '
+                   'clamped to at most 1,000,000 designs)')
+@click.option('--polish', is_flag=True,
+              help='Refine the Pareto designs by local gradient-based search after the run')
+@click.option('--archive', is_flag=True,
+              help='Return every non-dominated design seen during the run, not just the final population '
+                   '(stored in --checkpoint files and restored by --resume)')
+@click.option('--archive-size', type=int,
+              help='Maximum archived designs; the most crowded are dropped (--archive; default: unbounded)')
 def optimize_run(driver, enclosure_type, objectives, preset, output, config,
-                 pop_size, generations, seed, quiet):
+                 pop_size, generations, seed, quiet, workers, cache_path, cache_size,
+                 hv_tolerance, hv_patience, checkpoint_path, checkpoint_every, resume,
+                 fidelity_schedule, islands, migration_interval, island_presets, seed_from,
+                 algorithm, grid_points, polish, archive, archive_size):
     """
     Run optimization from configuration.
 
@@ -68,6 +145,51 @@ def optimize_run(driver, enclosure_type, objectives, preset, output, config,
             --pop-size 50 --generations 100 \\
             --output results.json
 
+        # Spread each generation across 16 worker processes
+        viberesp optimize run --driver BC_15DS115 \\
+            --enclosure-type exponential_horn \\
+            --objectives f3,flatness --workers 16
+
+        # Re-use evaluations from earlier runs of the same problem
+        viberesp optimize run --driver BC_8NDL51 --enclosure-type ported \\
+            --objectives f3,volume --cache ~/.cache/viberesp/evaluations.sqlite
+
+        # Stop once the Pareto front stops improving (max 500 generations)
+        viberesp optimize run --driver BC_15DS115 \\
+            --enclosure-type exponential_horn --objectives f3,flatness \\
+            --generations 500 --hv-tolerance 1e-3 --hv-patience 15
+
+        # Checkpoint a long run; re-run the same command after preemption
+        viberesp optimize run --driver BC_15DS115 \\
+            --enclosure-type multisegment_horn --objectives f3,flatness \\
+            --generations 500 --seed 42 --checkpoint horn.ckpt --resume
+
+        # 24-point grids for the first half, 64 points for the second half
+        viberesp optimize run --driver BC_15DS115 \\
+            --enclosure-type exponential_horn --objectives f3,flatness \\
+            --generations 200 --fidelity 0.5:24,1:64
+
+        # Four islands on separate cores, alternating two parameter spaces
+        viberesp optimize run --driver BC_15DS115 \\
+            --enclosure-type mixed_profile_horn --objectives f3,flatness \\
+            --islands 4 --island-presets bass_horn,fullrange_horn --seed 42
+
+        # Deterministic Pareto front of a ported box from a 10^4-design grid
+        viberesp optimize run --driver BC_8NDL51 --enclosure-type ported \\
+            --objectives f3,volume --preset ported --algorithm grid --grid-points 10
+
+        # Tighten the final front with local SLSQP steps per design
+        viberesp optimize run --driver BC_8NDL51 --enclosure-type ported \\
+            --objectives f3,flatness --preset ported --generations 30 --polish
+
+        # Large front: keep up to 5000 non-dominated designs from all generations
+        viberesp optimize run --driver BC_15DS115 \\
+            --enclosure-type mixed_profile_horn --objectives f3,flatness,volume \\
+            --generations 300 --archive --archive-size 5000
+
+        # Re-optimize after a constraint change, starting from the old front
+        viberesp optimize run --config my_config.yaml --seed-from results.json
+
         # Run from YAML config
         viberesp optimize run --config my_config.yaml
 
@@ -78,12 +200,58 @@ def optimize_run(driver, enclosure_type, objectives, preset, output, config,
     from viberesp.optimization.factory import OptimizationScriptFactory
     from viberesp.optimization.config import OptimizationConfig, AlgorithmConfig
 
+    island_list = [p.strip() for p in island_presets.split(',')] if island_presets else None
+
     # Load config from YAML if provided
     if config:
         click.echo(f"Loading configuration from: {config}")
         opt_config = OptimizationConfig.from_yaml(config)
+
+        # Collect the CLI overrides and rebuild the configs with replace(),
+        # so the same validation as a fresh config (e.g. unsupported feature
+        # combinations of islands, archives and grid searches) is re-run
+        algorithm_overrides = {}
+        if seed is not None:
+            algorithm_overrides["seed"] = seed
+        if hv_tolerance is not None:
+            algorithm_overrides["hv_tolerance"] = hv_tolerance
+            algorithm_overrides["hv_patience"] = hv_patience
+        if algorithm:
+            algorithm_overrides["type"] = algorithm
+        if grid_points is not None:
+            algorithm_overrides["grid_points"] = grid_points
+
+        overrides = {}
         if quiet:
-            opt_config.verbose = False
+            overrides["verbose"] = False
+        if workers != 1:
+            overrides["workers"] = workers
+        if cache_path:
+            overrides["cache_path"] = cache_path
+            overrides["cache_max_entries"] = cache_size
+        if checkpoint_path:
+            overrides["checkpoint_path"] = checkpoint_path
+            overrides["checkpoint_every"] = checkpoint_every
+        if fidelity_schedule:
+            overrides["fidelity_schedule"] = fidelity_schedule
+        if islands != 1:
+            overrides["islands"] = islands
+            overrides["migration_interval"] = migration_interval
+        if island_presets:
+            overrides["island_presets"] = island_list
+        if seed_from:
+            overrides["seed_from"] = seed_from
+        if polish:
+            overrides["polish"] = True
+        if archive:
+            overrides["archive"] = True
+            overrides["archive_size"] = archive_size
+
+        opt_config = replace(
+            opt_config,
+            algorithm=replace(opt_config.algorithm, **algorithm_overrides),
+            **overrides,
+        )
     else:
         # Build config from CLI options
         click.echo(f"Building configuration for: {driver} - {enclosure_type}")
@@ -93,9 +261,13 @@ def optimize_run(driver, enclosure_type, objectives, preset, output, config,
 
         # Build algorithm config
         algo_config = AlgorithmConfig(
-            type="nsga2",
+            type=algorithm or "nsga2",
             pop_size=pop_size or 100,
             n_generations=generations or 100,
+            seed=seed,
+            hv_tolerance=hv_tolerance,
+            hv_patience=hv_patience,
+            grid_points=grid_points,
         )
 
         # Create optimization config
@@ -107,8 +279,24 @@ def optimize_run(driver, enclosure_type, objectives, preset, output, config,
             algorithm=algo_config,
             save_results=True,
             verbose=not quiet,
+            workers=workers,
+            cache_path=cache_path,
+            cache_max_entries=cache_size,
+            checkpoint_path=checkpoint_path,
+            checkpoint_every=checkpoint_every,
+            fidelity_schedule=fidelity_schedule,
+            islands=islands,
+            migration_interval=migration_interval,
+            island_presets=island_list,
+            seed_from=seed_from,
+            polish=polish,
+            archive=archive,
+            archive_size=archive_size,
         )
 
+    if resume and not opt_config.checkpoint_path:
+        raise click.UsageError("--resume requires --checkpoint (or checkpoint_path in the YAML config)")
+
     # Set seed if provided
     if seed is not None:
         import numpy as np
@@ -118,7 +306,7 @@ def optimize_run(driver, enclosure_type, objectives, preset, output, config,
     # Run optimization
     click.echo("\nStarting optimization...")
     factory = OptimizationScriptFactory(opt_config)
-    result = factory.run()
+    result = factory.run(resume=resume)
 
     # Save results
     if output is None:
@@ -147,7 +335,9 @@ def optimize_run(driver, enclosure_type, objectives, preset, output, config,
 
     click.echo(f"\n✓ Optimization complete!")
     click.echo(f"✓ Found {result.n_designs_found} Pareto-optimal designs")
+    _echo_generations(result)
     click.echo(f"✓ Results saved to: {output}")
+    _echo_cache_stats(result)
 
 
 @optimize.command(name='preset')
@@ -178,10 +368,23 @@ def optimize_run(driver, enclosure_type, objectives, preset, output, config,
 @click.option('--plot-dpi', type=int, default=150, help='Plot image resolution')
 @click.option('--plot-style', default='default', help='Plot style (default, dark, presentation)')
 @click.option('--num-spl-designs', type=int, default=5, help='Number of designs for SPL plot (overrides preset)')
+@click.option('--workers', type=int, default=1, show_default=True,
+              help='Worker processes per generation (0 = all CPU cores)')
+@click.option('--cache', 'cache_path', type=click.Path(dir_okay=False),
+              help='SQLite evaluation cache; designs evaluated by earlier runs are re-used')
+@click.option('--cache-size', type=int, default=1_000_000, show_default=True,
+              help='Maximum number of designs kept in the evaluation cache')
+@click.option('--hv-tolerance', type=float,
+              help='Stop early once the relative hypervolume gain stays below this (e.g. 1e-3)')
+@click.option('--hv-patience', type=int, default=10, show_default=True,
+              help='Generations without hypervolume gain before stopping early')
+@click.option('--seed-from', type=click.Path(exists=True, dir_okay=False),
+              help='Warm start: put the Pareto designs of an earlier results JSON in the initial population')
 def optimize_preset(driver, preset_name, enclosure_type, output,
                     f3_target, max_volume, f3_max, min_efficiency,
                     pop_size, generations, seed, quiet, plot, plot_preset,
-                    plot_output_dir, plot_dpi, plot_style, num_spl_designs):
+                    plot_output_dir, plot_dpi, plot_style, num_spl_designs, workers,
+                    cache_path, cache_size, hv_tolerance, hv_patience, seed_from):
     """
     Run optimization using predefined preset.
 
@@ -278,8 +481,15 @@ def optimize_preset(driver, preset_name, enclosure_type, output,
             'type': algo_config.type,
             'pop_size': algo_config.pop_size,
             'n_generations': algo_config.n_generations,
+            'seed': seed,
+            'hv_tolerance': hv_tolerance,
+            'hv_patience': hv_patience,
         },
         verbose=not quiet,
+        workers=workers,
+        cache_path=cache_path,
+        cache_max_entries=cache_size,
+        seed_from=seed_from,
     )
 
     # Set seed if provided
@@ -320,7 +530,9 @@ def optimize_preset(driver, preset_name, enclosure_type, output,
 
     click.echo(f"\n✓ Preset '{preset_name}' optimization complete!")
     click.echo(f"✓ Found {result.n_designs_found} Pareto-optimal designs")
+    _echo_generations(result)
     click.echo(f"✓ Results saved to: {output}")
+    _echo_cache_stats(result)
 
     # Generate plots if requested
     if plot:
@@ -16,6 +16,8 @@ Literature:
 import math
 import cmath
 
+import numpy as np
+
 from viberesp.driver.parameters import ThieleSmallParameters
 from viberesp.simulation.constants import angular_frequency
 
@@ -102,6 +104,77 @@ def voice_coil_impedance_leach(
     return Z_voice_coil
 
 
+def voice_coil_impedance_array(
+    frequencies,
+    driver: ThieleSmallParameters,
+    voice_coil_model: str = "simple",
+    leach_K: float = None,
+    leach_n: float = None,
+    leach_crossover_hz: float = 1000.0,
+) -> np.ndarray:
+    """
+    Calculate voice coil impedance for an array of frequencies.
+
+    Array counterpart of the voice coil branch used by the enclosure
+    impedance functions: the lossless jωL_e model, the Leach (2002) lossy
+    model at all frequencies, or the frequency-limited combination of both.
+
+    Literature:
+        - Leach (2002), "Loudspeaker Voice-Coil Inductance Losses", Eq. 19
+        - COMSOL (2020), Figure 2 - Electrical domain
+        - literature/thiele_small/leach_2002_voice_coil_inductance.md
+
+    Args:
+        frequencies: Array of frequencies in Hz
+        driver: ThieleSmallParameters instance (for R_e, L_e)
+        voice_coil_model: "simple" (R_e + jωL_e), "leach-full" (Leach model
+            everywhere) or "leach" (simple below leach_crossover_hz, Leach above)
+        leach_K: Leach impedance scaling factor in Ω·s^n
+        leach_n: Leach loss exponent (0 ≤ n ≤ 1)
+        leach_crossover_hz: Crossover frequency for the "leach" model (Hz)
+
+    Returns:
+        Complex numpy array of voice coil impedances (Ω)
+
+    Raises:
+        ValueError: If any frequency <= 0, or leach_K/leach_n are missing
+            for a Leach model that needs them
+        TypeError: If driver is not ThieleSmallParameters
+
+    Examples:
+        >>> Z_vc = voice_coil_impedance_array(np.array([100, 20000]), driver)
+        >>> Z_vc.shape
+        (2,)
+
+    Validation:
+        Matches complex(R_e, ωL_e) and voice_coil_impedance_leach() pointwise.
+    """
+    freqs = np.asarray(frequencies, dtype=float)
+    if np.any(freqs <= 0):
+        raise ValueError(f"Frequency must be > 0, got {np.min(freqs)} Hz")
+
+    if not isinstance(driver, ThieleSmallParameters):
+        raise TypeError(f"driver must be ThieleSmallParameters, got {type(driver)}")
+
+    omega = 2 * math.pi * freqs
+    Z_simple = driver.R_e + 1j * (omega * driver.L_e)
+
+    if voice_coil_model == "simple":
+        return Z_simple
+
+    use_leach = np.ones(freqs.shape, dtype=bool) if voice_coil_model == "leach-full" \
+        else freqs >= leach_crossover_hz
+    if not np.any(use_leach):
+        return Z_simple
+    if leach_K is None or leach_n is None:
+        raise ValueError("leach_K and leach_n must be provided for Leach models")
+
+    # Leach (2002), Eq. 19: Z_L(jω) = K·ω^n [cos(nπ/2) + j·sin(nπ/2)]
+    Z_lossy = leach_K * (omega ** leach_n) * complex(math.cos(leach_n * math.pi / 2),
+                                                     math.sin(leach_n * math.pi / 2))
+    return np.where(use_leach, driver.R_e + Z_lossy, Z_simple)
+
+
 def electrical_impedance_bare_driver(
     frequency: float,
     driver: ThieleSmallParameters,
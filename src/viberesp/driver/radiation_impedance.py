@@ -11,6 +11,8 @@ Literature:
 """
 
 import math
+
+import numpy as np
 from scipy.special import j1, struve
 
 from viberesp.simulation.constants import (
@@ -130,6 +132,61 @@ def radiation_impedance_piston(
     return Z_R
 
 
+def radiation_impedance_piston_array(
+    frequencies,
+    piston_area: float,
+    speed_of_sound: float = SPEED_OF_SOUND,
+    air_density: float = AIR_DENSITY
+) -> np.ndarray:
+    """
+    Calculate piston radiation impedance for an array of frequencies.
+
+    Array version of radiation_impedance_piston(): the same Bessel/Struve
+    expressions and the same ka < 0.01 asymptote, evaluated in one call.
+
+    Literature:
+        - Beranek (1954), Eq. 5.20 - Piston radiation impedance
+        - literature/horns/beranek_1954.md
+
+    Args:
+        frequencies: Array of frequencies in Hz
+        piston_area: Piston effective area (m²)
+        speed_of_sound: Speed of sound in m/s, default 343 m/s at 20°C
+        air_density: Air density in kg/m³, default 1.18 kg/m³ at 20°C
+
+    Returns:
+        Complex numpy array of radiation impedances, same shape as frequencies
+
+    Raises:
+        ValueError: If any frequency <= 0 or piston_area <= 0
+
+    Examples:
+        >>> Z = radiation_impedance_piston_array(np.array([100, 2000]), 0.05)
+        >>> Z.shape
+        (2,)
+
+    Validation:
+        Element i equals radiation_impedance_piston(frequencies[i], ...).
+    """
+    freqs = np.asarray(frequencies, dtype=float)
+    if np.any(freqs <= 0):
+        raise ValueError(f"Frequency must be > 0, got {np.min(freqs)} Hz")
+
+    if piston_area <= 0:
+        raise ValueError(f"Piston area must be > 0, got {piston_area} m²")
+
+    # Beranek (1954), Eq. 5.20 with the ka << 1 asymptote below ka = 0.01
+    ka = (2.0 * math.pi * freqs / speed_of_sound) * math.sqrt(piston_area / math.pi)
+    small = ka < 0.01
+    ka_safe = np.where(small, 1.0, ka)
+
+    R1 = np.where(small, ka ** 2 / 2.0, 1.0 - j1(2 * ka_safe) / ka_safe)
+    X1 = np.where(small, 4.0 * ka / (3.0 * math.pi), struve(1, 2 * ka_safe) / ka_safe)
+
+    Z0 = air_density * speed_of_sound  # Characteristic impedance of air
+    return Z0 * piston_area * (R1 + 1j * X1)
+
+
 def radiation_impedance_piston_asymptotic_check(
     frequency: float,
     piston_area: float,
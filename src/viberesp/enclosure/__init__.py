@@ -15,15 +15,19 @@ from viberesp.enclosure.sealed_box import (
     SealedBoxSystemParameters,
     calculate_sealed_box_system_parameters,
     sealed_box_electrical_impedance,
+    sealed_box_electrical_impedance_array,
 )
 
 from viberesp.enclosure.ported_box import (
     PortedBoxSystemParameters,
+    PortedBoxGrid,
     helmholtz_resonance_frequency,
     calculate_port_length_for_area,
     calculate_optimal_port_dimensions,
     calculate_ported_box_system_parameters,
     ported_box_electrical_impedance,
+    ported_box_electrical_impedance_array,
+    ported_box_grid,
 )
 
 __all__ = [
@@ -31,12 +35,16 @@ __all__ = [
     "SealedBoxSystemParameters",
     "calculate_sealed_box_system_parameters",
     "sealed_box_electrical_impedance",
+    "sealed_box_electrical_impedance_array",
     # Ported box
     "PortedBoxSystemParameters",
+    "PortedBoxGrid",
     "helmholtz_resonance_frequency",
     "calculate_port_length_for_area",
     "calculate_optimal_port_dimensions",
     "calculate_ported_box_system_parameters",
     "ported_box_electrical_impedance",
+    "ported_box_electrical_impedance_array",
+    "ported_box_grid",
 ]
 
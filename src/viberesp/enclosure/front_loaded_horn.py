@@ -16,8 +16,8 @@ Literature:
 
 import math
 import cmath
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field, fields, is_dataclass
+from typing import Optional, Tuple
 import numpy as np
 from numpy.typing import NDArray
 
@@ -26,7 +26,7 @@ from viberesp.simulation.types import ExponentialHorn
 from viberesp.simulation.horn_theory import MediumProperties
 from viberesp.simulation.horn_driver_integration import (
     horn_electrical_impedance,
-    horn_system_acoustic_impedance,
+    horn_system_response,
 )
 from viberesp.simulation.constants import (
     SPEED_OF_SOUND,
@@ -37,6 +37,166 @@ from viberesp.simulation.constants import (
 
 # Type aliases
 FloatArray = NDArray[np.floating]
+ComplexArray = NDArray[np.complexfloating]
+
+# Number of solved frequency grids kept per FrontLoadedHorn instance
+SOLUTION_CACHE_SIZE = 8
+
+
+def _field_values(value):
+    """Hashable snapshot of a (nested) dataclass's field values, used to key cached solutions."""
+    if is_dataclass(value):
+        return (type(value).__name__,) + tuple(
+            _field_values(getattr(value, f.name)) for f in fields(value)
+        )
+    if isinstance(value, (list, tuple)):
+        return tuple(_field_values(item) for item in value)
+    if isinstance(value, np.ndarray):
+        return value.tobytes()
+    return value
+
+
+@dataclass
+class HornSolution:
+    """
+    Complete horn system solution over a frequency array.
+
+    Produced by FrontLoadedHorn.solve(). Every array has the same shape as
+    frequencies; derived metrics are computed from the stored arrays without
+    re-solving the acoustic network.
+
+    Literature:
+        - Kolbrek, "Horn Loudspeaker Simulation Part 3" - Power from T-matrix
+        - Beranek (1954), Chapter 4 - Loudspeaker efficiency
+        - Small (1972) - Electromechanical analogies
+        - literature/horns/kolbrek_horn_theory_tutorial.md
+        - literature/horns/beranek_1954.md
+
+    Attributes:
+        frequencies: Frequency array [Hz]
+        voltage: Input voltage used for the solve [V]
+        measurement_distance: SPL measurement distance [m]
+        tmatrix: Chained horn T-matrix elements (a, b, c, d)
+        Z_front: Front acoustic impedance (throat chamber || horn) [Pa·s/m³]
+        Z_rear: Rear acoustic impedance [Pa·s/m³]
+        Ze: Complex electrical impedance [Ω]
+        diaphragm_velocity: Diaphragm velocity magnitude [m/s]
+        diaphragm_displacement: Diaphragm displacement magnitude [m]
+        throat_pressure: Complex throat pressure [Pa]
+        throat_volume_velocity: Complex throat volume velocity [m³/s]
+        mouth_pressure: Complex mouth pressure [Pa]
+        mouth_volume_velocity: Complex mouth volume velocity [m³/s]
+        acoustic_power: Radiated acoustic power [W]
+        spl: SPL at measurement_distance [dB], -inf where power is zero
+
+    Note:
+        Solutions are cached and shared by FrontLoadedHorn.solve(), so every
+        array is read-only; copy an array before modifying it.
+    """
+    frequencies: FloatArray
+    voltage: float
+    measurement_distance: float
+    tmatrix: Tuple[ComplexArray, ComplexArray, ComplexArray, ComplexArray]
+    Z_front: ComplexArray
+    Z_rear: ComplexArray
+    Ze: ComplexArray
+    diaphragm_velocity: FloatArray
+    diaphragm_displacement: FloatArray
+    throat_pressure: ComplexArray
+    throat_volume_velocity: ComplexArray
+    mouth_pressure: ComplexArray
+    mouth_volume_velocity: ComplexArray
+    acoustic_power: FloatArray
+    spl: FloatArray
+
+    def __post_init__(self):
+        """Mark the arrays read-only (the solution is shared through the cache)."""
+        for value in vars(self).values():
+            for array in (value if isinstance(value, tuple) else (value,)):
+                if isinstance(array, np.ndarray):
+                    array.setflags(write=False)
+
+    @property
+    def electrical_power(self) -> FloatArray:
+        """Real electrical power delivered: P_e = V²·Re(Z_e)/|Z_e|² [W]."""
+        Ze_abs_sq = np.abs(self.Ze) ** 2
+        safe = np.where(Ze_abs_sq > 0, Ze_abs_sq, 1.0)
+        return np.where(Ze_abs_sq > 0, self.voltage ** 2 * self.Ze.real / safe, 0.0)
+
+    @property
+    def efficiency(self) -> FloatArray:
+        """System efficiency η = W_acoustic / W_electrical (0 where W_e = 0).
+
+        Literature:
+            Beranek (1954), Chapter 4 - Loudspeaker efficiency
+        """
+        W_electrical = self.electrical_power
+        safe = np.where(W_electrical != 0, W_electrical, 1.0)
+        return np.where(W_electrical != 0, self.acoustic_power / safe, 0.0)
+
+    def _band(self, f_min: Optional[float], f_max: Optional[float]) -> NDArray[np.bool_]:
+        """Boolean mask selecting f_min <= f <= f_max (open ends if None)."""
+        mask = np.ones_like(self.frequencies, dtype=bool)
+        if f_min is not None:
+            mask &= self.frequencies >= f_min
+        if f_max is not None:
+            mask &= self.frequencies <= f_max
+        return mask
+
+    def max_displacement(
+        self,
+        f_min: Optional[float] = None,
+        f_max: Optional[float] = None
+    ) -> float:
+        """Peak diaphragm displacement [m] within [f_min, f_max]."""
+        band = self._band(f_min, f_max)
+        if not np.any(band):
+            return 0.0
+        return float(np.max(self.diaphragm_displacement[band]))
+
+    def flatness(
+        self,
+        f_min: Optional[float] = None,
+        f_max: Optional[float] = None
+    ) -> float:
+        """Standard deviation of SPL [dB] within [f_min, f_max].
+
+        Literature:
+            Beranek (1954), Chapter 8 - Flatness criterion
+        """
+        band = self._band(f_min, f_max) & np.isfinite(self.spl)
+        if not np.any(band):
+            return float('inf')
+        return float(np.std(self.spl[band]))
+
+    def f3(self, reference_band: Tuple[float, float] = (50.0, 500.0)) -> float:
+        """Lower -3 dB frequency [Hz] relative to the peak SPL in reference_band.
+
+        The first upward crossing of (reference - 3 dB) is interpolated in
+        log-frequency. Returns the lowest frequency if the response is above
+        the target everywhere, and the highest frequency if it never reaches
+        the target.
+        """
+        finite = np.isfinite(self.spl)
+        if not np.any(finite):
+            return float(self.frequencies[-1])
+
+        freqs = self.frequencies[finite]
+        spl = self.spl[finite]
+
+        in_band = (freqs >= reference_band[0]) & (freqs <= reference_band[1])
+        reference_spl = np.max(spl[in_band]) if np.any(in_band) else np.max(spl)
+        target_spl = reference_spl - 3.0
+
+        below = spl < target_spl
+        crossings = np.nonzero(below[:-1] & ~below[1:])[0]
+        if crossings.size == 0:
+            return float(freqs[-1] if np.all(below) else freqs[0])
+
+        i = crossings[0]
+        log_f1, log_f2 = np.log10(freqs[i]), np.log10(freqs[i + 1])
+        log_f3 = log_f1 + (log_f2 - log_f1) * (target_spl - spl[i]) / (spl[i + 1] - spl[i])
+        return float(10 ** log_f3)
 
 
 @dataclass
@@ -78,12 +238,120 @@ class FrontLoadedHorn:
     A_tc: Optional[float] = None  # Throat chamber area [m²]
     V_rc: float = 0.0  # Rear chamber volume [m³]
     radiation_angle: float = 2 * np.pi  # Half-space
+    _solutions: dict = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         """Set default throat chamber area and validate parameters."""
         if self.A_tc is None:
             self.A_tc = self.horn.throat_area
 
+    def __setattr__(self, name, value):
+        # Reassignment drops every cached solution; in-place edits of driver
+        # and horn are caught by the field values in the solve() cache key
+        solutions = self.__dict__.get("_solutions")
+        if solutions and name != "_solutions":
+            solutions.clear()
+        super().__setattr__(name, value)
+
+    def solve(
+        self,
+        frequencies: FloatArray,
+        voltage: float = 2.83,
+        measurement_distance: float = 1.0,
+        medium: Optional[MediumProperties] = None
+    ) -> "HornSolution":
+        """
+        Solve the complete horn system once over a frequency array.
+
+        Throat impedance, chained T-matrix, electrical impedance, diaphragm
+        motion, mouth power and SPL are computed in a single vectorized pass
+        by horn_system_response(). The most recent solutions are cached on
+        the instance, so metrics that need the same frequencies (F3,
+        flatness, efficiency, excursion) share one solve. Solutions are
+        keyed on the current driver and horn field values as well as the
+        chambers, so mutating them in place (flh.horn.length = 2.0) re-solves
+        instead of returning a stale result. The returned solution's arrays
+        are read-only.
+
+        Literature:
+            - Kolbrek, "Horn Loudspeaker Simulation Part 1" - T-matrix chain
+            - Olson (1947), Chapter 8 - Horn driver systems
+            - Beranek (1954), Chapter 5 - Electromechanical analogies
+            - literature/horns/kolbrek_horn_theory_tutorial.md
+
+        Args:
+            frequencies: Frequency [Hz] or array of frequencies
+            voltage: Input voltage [V], default 2.83V
+            measurement_distance: SPL measurement distance [m], default 1m
+            medium: Acoustic medium properties (uses default if None)
+
+        Returns:
+            HornSolution with every quantity evaluated at frequencies
+
+        Raises:
+            ValueError: If any frequency <= 0
+
+        Examples:
+            >>> import numpy as np
+            >>> solution = flh.solve(np.logspace(1, 4, 200))
+            >>> solution.spl.shape
+            (200,)
+            >>> solution.f3()
+            95.3...  # Hz
+        """
+        if medium is None:
+            medium = MediumProperties()
+
+        # Own copy: the solution's arrays are made read-only
+        frequencies = np.array(frequencies, dtype=float, ndmin=1)
+        key = (
+            frequencies.tobytes(), voltage, measurement_distance,
+            medium.c, medium.rho,
+            self.V_tc, self.A_tc, self.V_rc, self.radiation_angle,
+            _field_values(self.driver), _field_values(self.horn),
+        )
+        cached = self._solutions.get(key)
+        if cached is not None:
+            return cached
+
+        response = horn_system_response(
+            frequencies=frequencies,
+            driver=self.driver,
+            horn=self.horn,
+            V_tc=self.V_tc,
+            A_tc=self.A_tc,
+            V_rc=self.V_rc,
+            voltage=voltage,
+            measurement_distance=measurement_distance,
+            medium=medium,
+            radiation_angle=self.radiation_angle,
+        )
+        solution = HornSolution(
+            frequencies=response['frequencies'],
+            voltage=voltage,
+            measurement_distance=measurement_distance,
+            tmatrix=response['tmatrix'],
+            Z_front=response['Z_front'],
+            Z_rear=response['Z_rear'],
+            Ze=response['Ze'],
+            diaphragm_velocity=response['diaphragm_velocity'],
+            diaphragm_displacement=response['diaphragm_displacement'],
+            throat_pressure=response['throat_pressure'],
+            throat_volume_velocity=response['throat_volume_velocity'],
+            mouth_pressure=response['mouth_pressure'],
+            mouth_volume_velocity=response['mouth_volume_velocity'],
+            acoustic_power=response['acoustic_power'],
+            spl=response['SPL'],
+        )
+
+        # Bounded cache: drop the oldest entry once full
+        if len(self._solutions) >= SOLUTION_CACHE_SIZE:
+            self._solutions.pop(next(iter(self._solutions)))
+        self._solutions[key] = solution
+        return solution
+
     def electrical_impedance(
         self,
         frequency: float,
@@ -149,6 +417,7 @@ class FrontLoadedHorn:
         Calculate electrical impedance across frequency array.
 
         Vectorized version of electrical_impedance() for batch processing.
+        The whole frequency vector is solved in one pass by solve().
 
         Args:
             frequencies: Array of frequencies [Hz]
@@ -176,34 +445,16 @@ class FrontLoadedHorn:
             Compare with Hornresp electrical impedance export.
             Expected: <2% magnitude, <5° phase for f > F_s/2
         """
-        frequencies = np.atleast_1d(frequencies).astype(float)
-
-        # Pre-allocate result arrays
-        Ze_magnitude = np.zeros_like(frequencies)
-        Ze_phase = np.zeros_like(frequencies)
-        Ze_real = np.zeros_like(frequencies)
-        Ze_imag = np.zeros_like(frequencies)
-        diaphragm_velocity = np.zeros_like(frequencies)
-        diaphragm_displacement = np.zeros_like(frequencies)
-
-        # Calculate at each frequency
-        for i, f in enumerate(frequencies):
-            result = self.electrical_impedance(f, voltage, medium)
-            Ze_magnitude[i] = result['Ze_magnitude']
-            Ze_phase[i] = result['Ze_phase']
-            Ze_real[i] = result['Ze_real']
-            Ze_imag[i] = result['Ze_imag']
-            diaphragm_velocity[i] = result['diaphragm_velocity']
-            diaphragm_displacement[i] = result['diaphragm_displacement']
+        solution = self.solve(frequencies, voltage, medium=medium)
 
         return {
-            'frequencies': frequencies,
-            'Ze_magnitude': Ze_magnitude,
-            'Ze_phase': Ze_phase,
-            'Ze_real': Ze_real,
-            'Ze_imag': Ze_imag,
-            'diaphragm_velocity': diaphragm_velocity,
-            'diaphragm_displacement': diaphragm_displacement,
+            'frequencies': solution.frequencies,
+            'Ze_magnitude': np.abs(solution.Ze),
+            'Ze_phase': np.degrees(np.angle(solution.Ze)),
+            'Ze_real': solution.Ze.real,
+            'Ze_imag': solution.Ze.imag,
+            'diaphragm_velocity': solution.diaphragm_velocity,
+            'diaphragm_displacement': solution.diaphragm_displacement,
         }
 
     def acoustic_power(
@@ -253,169 +504,7 @@ class FrontLoadedHorn:
             Compare with Hornresp acoustic power export.
             Expected: <10% deviation in passband
         """
-        if medium is None:
-            medium = MediumProperties()
-
-        # Get electrical impedance result (complex phasors)
-        result = self.electrical_impedance(frequency, voltage, medium)
-
-        # Calculate diaphragm volume velocity (complex)
-        # From electrical impedance calculation:
-        # I = voltage / Ze
-        # F = Bl × I
-        # u_d = F / Z_mechanical_total
-        # U_d = u_d × S_d (diaphragm volume velocity)
-        Ze = result['Ze_real'] + 1j * result['Ze_imag']
-        if abs(Ze) == 0:
-            return 0.0
-
-        omega = 2 * np.pi * frequency
-        I_complex = voltage / Ze
-        F_complex = self.driver.BL * I_complex
-
-        # Reconstruct mechanical impedance (same as in horn_electrical_impedance)
-        Z_mechanical_driver = (self.driver.R_ms +
-                              complex(0, omega * self.driver.M_md) +
-                              complex(0, -1 / (omega * self.driver.C_ms)))
-
-        # Get acoustic impedance at throat
-        frequencies = np.array([frequency])
-        Z_front, Z_rear = horn_system_acoustic_impedance(
-            frequencies, self.horn, self.V_tc, self.A_tc,
-            self.V_rc, self.driver.S_d, medium, self.radiation_angle
-        )
-        Z_acoustic_throat = Z_front[0] + Z_rear[0]
-
-        # Transform acoustic impedance to mechanical domain using shared utility
-        # Import the shared function to avoid code duplication
-        from viberesp.simulation.horn_driver_integration import scale_throat_acoustic_to_mechanical
-
-        Z_mechanical_acoustic = scale_throat_acoustic_to_mechanical(
-            Z_acoustic_throat, self.horn.throat_area, self.driver.S_d
-        )
-
-        # Total mechanical impedance
-        Z_mechanical_total = Z_mechanical_driver + Z_mechanical_acoustic
-
-        if abs(Z_mechanical_total) == 0:
-            return 0.0
-
-        # Diaphragm velocity (complex)
-        u_diaphragm_complex = F_complex / Z_mechanical_total
-
-        # Volume velocity at throat
-        # For compression driver: U_throat = u_d × S_d (not S_throat!)
-        # The driver's diaphragm area determines the volume velocity
-        U_throat_complex = u_diaphragm_complex * self.driver.S_d
-
-        # Pressure at throat
-        # p_throat = Z_acoustic_throat × U_throat
-        p_throat_complex = Z_acoustic_throat * U_throat_complex
-
-        # Check horn type for appropriate power calculation
-        horn_type = type(self.horn).__name__
-
-        if horn_type == "MultiSegmentHorn":
-            # For multi-segment horn: transform throat quantities to mouth
-            # CRITICAL: Chain T-matrices in FORWARD order (throat -> mouth)
-            # Then invert to transform from throat to mouth
-            #
-            # Literature: Kolbrek "Horn Theory" - T_total = T_1 × T_2 × ... × T_n
-            # where matrices are applied from throat to mouth (FORWARD order)
-
-            from viberesp.simulation.types import HornSegment, ConicalHorn, HyperbolicHorn
-            from viberesp.simulation.horn_theory import exponential_horn_tmatrix
-
-            # Start with identity matrix
-            a, b, c_mat, d = 1.0, 0.0, 0.0, 1.0
-
-            # Chain T-matrices in FORWARD order (throat to mouth)
-            # This is CRITICAL - T-matrices relate throat to mouth
-            for segment in self.horn.segments:
-                if isinstance(segment, (ConicalHorn, HyperbolicHorn)):
-                    # Use the segment's T-matrix method
-                    T = segment.calculate_t_matrix(frequency, medium.c, medium.rho)
-                    # Chain: T_total = T_total @ T_segment
-                    # (apply new segment on the right)
-                    a_new = a * T[0, 0] + b * T[1, 0]
-                    b_new = a * T[0, 1] + b * T[1, 1]
-                    c_new = c_mat * T[0, 0] + d * T[1, 0]
-                    d_new = c_mat * T[0, 1] + d * T[1, 1]
-                    a, b, c_mat, d = a_new, b_new, c_new, d_new
-                else:
-                    # HornSegment (exponential): use exponential T-matrix
-                    from viberesp.simulation.types import ExponentialHorn
-
-                    segment_horn = ExponentialHorn(
-                        throat_area=segment.throat_area,
-                        mouth_area=segment.mouth_area,
-                        length=segment.length
-                    )
-                    a_seg, b_seg, c_seg, d_seg = exponential_horn_tmatrix(
-                        np.array([frequency]), segment_horn, medium
-                    )
-
-                    # Chain: T_total = T_total @ T_segment
-                    # (apply new segment on the right)
-                    a_new = a * a_seg[0] + b * c_seg[0]
-                    b_new = a * b_seg[0] + b * d_seg[0]
-                    c_new = c_mat * a_seg[0] + d * c_seg[0]
-                    d_new = c_mat * b_seg[0] + d * d_seg[0]
-                    a, b, c_mat, d = a_new, b_new, c_new, d_new
-
-            # Determinant of T-matrix (should be 1 for lossless horn)
-            det = a * d - b * c_mat
-
-            if abs(det) < 1e-15:
-                return 0.0
-
-            # Inverse transform: [p_mouth, U_mouth] = (1/det) × [d, -b; -c, a] @ [p_throat, U_throat]
-            p_mouth_complex = (d * p_throat_complex - b * U_throat_complex) / det
-            U_mouth_complex = (-c_mat * p_throat_complex + a * U_throat_complex) / det
-
-            # Acoustic power at mouth
-            # W = Re(p_m × U_m*)
-            # Kolbrek, "Horn Loudspeaker Simulation Part 3"
-            # Beranek (1954), Chapter 4
-            # Factor of 0.5 for RMS (peak values used in calculation)
-            power = 0.5 * np.real(p_mouth_complex * np.conj(U_mouth_complex))
-        else:
-            # For single-segment exponential horn: transform to mouth
-            # [p_throat, U_throat] = T_horn @ [p_mouth, U_mouth]
-            # Therefore: [p_mouth, U_mouth] = inv(T_horn) @ [p_throat, U_throat]
-
-            from viberesp.simulation.horn_theory import exponential_horn_tmatrix
-
-            # Get horn T-matrix
-            a, b, c_mat, d = exponential_horn_tmatrix(
-                np.array([frequency]), self.horn, medium
-            )
-
-            # T-matrix elements at this frequency
-            a_f = a[0]
-            b_f = b[0]
-            c_f = c_mat[0]
-            d_f = d[0]
-
-            # Determinant of T-matrix (should be 1 for lossless horn)
-            det = a_f * d_f - b_f * c_f
-
-            if abs(det) < 1e-15:
-                return 0.0
-
-            # Inverse transform: [p_mouth, U_mouth] = (1/det) × [d, -b; -c, a] @ [p_throat, U_throat]
-            p_mouth_complex = (d_f * p_throat_complex - b_f * U_throat_complex) / det
-            U_mouth_complex = (-c_f * p_throat_complex + a_f * U_throat_complex) / det
-
-            # Acoustic power at mouth
-            # W = Re(p_m × U_m*)
-            # Kolbrek, "Horn Loudspeaker Simulation Part 3"
-            # Beranek (1954), Chapter 4
-            # Factor of 0.5 for RMS (peak values used in calculation)
-            power = 0.5 * np.real(p_mouth_complex * np.conj(U_mouth_complex))
-
-        # Ensure non-negative (numerical errors can give tiny negative values)
-        return max(0.0, power)
+        return float(self.solve(frequency, voltage, medium=medium).acoustic_power[0])
 
     def spl_response(
         self,
@@ -457,26 +546,8 @@ class FrontLoadedHorn:
             Compare with Hornresp SPL export.
             Expected: <3 dB deviation in passband (f > 2×f_c)
         """
-        if medium is None:
-            medium = MediumProperties()
-
-        # Calculate acoustic power
-        power = self.acoustic_power(frequency, voltage, medium)
-
-        # Pressure from acoustic power (half-space radiation)
-        # p_rms = √(W·ρ₀·c/(2π·r²))
-        # Kinsler et al. (1982), Chapter 4
-        pressure_rms = math.sqrt(
-            power * medium.rho * medium.c / (2 * math.pi * measurement_distance ** 2)
-        )
-
-        # Sound pressure level
-        # SPL = 20·log₁₀(p_rms / p_ref) where p_ref = 20 μPa
-        # Kinsler et al. (1982), Chapter 2
-        p_ref = 20e-6  # Reference pressure: 20 μPa
-        spl = 20 * math.log10(pressure_rms / p_ref) if pressure_rms > 0 else -float('inf')
-
-        return spl
+        solution = self.solve(frequency, voltage, measurement_distance, medium)
+        return float(solution.spl[0])
 
     def spl_response_array(
         self,
@@ -489,6 +560,7 @@ class FrontLoadedHorn:
         Calculate SPL response across frequency array.
 
         Vectorized version of spl_response() for batch processing.
+        The whole frequency vector is solved in one pass by solve().
 
         Args:
             frequencies: Array of frequencies [Hz]
@@ -512,18 +584,11 @@ class FrontLoadedHorn:
             Compare with Hornresp SPL export.
             Expected: <3 dB deviation in passband (f > 2×f_c)
         """
-        frequencies = np.atleast_1d(frequencies).astype(float)
-
-        # Pre-allocate result array
-        SPL = np.zeros_like(frequencies)
-
-        # Calculate at each frequency
-        for i, f in enumerate(frequencies):
-            SPL[i] = self.spl_response(f, voltage, measurement_distance, medium)
+        solution = self.solve(frequencies, voltage, measurement_distance, medium)
 
         return {
-            'frequencies': frequencies,
-            'SPL': SPL,
+            'frequencies': solution.frequencies,
+            'SPL': solution.spl,
         }
 
     def system_efficiency(
@@ -568,26 +633,7 @@ class FrontLoadedHorn:
             Compare with Hornresp efficiency export.
             Expected: <10% relative error in passband
         """
-        # Calculate acoustic power
-        W_acoustic = self.acoustic_power(frequency, voltage, medium)
-
-        # Get electrical impedance
-        result = self.electrical_impedance(frequency, voltage, medium)
-        Ze = result['Ze_real'] + 1j * result['Ze_imag']
-
-        # Electrical power: P_e = V² × Re(Z_e) / |Z_e|²
-        # Real power delivered to the system
-        if abs(Ze) == 0:
-            W_electrical = 0
-        else:
-            W_electrical = (voltage ** 2) * Ze.real / (abs(Ze) ** 2)
-
-        # Efficiency
-        if W_electrical == 0:
-            return 0.0
-
-        efficiency = W_acoustic / W_electrical
-        return efficiency
+        return float(self.solve(frequency, voltage, medium=medium).efficiency[0])
 
     def cutoff_frequency(self) -> float:
         """
@@ -22,10 +22,18 @@ import cmath
 from dataclasses import dataclass
 from typing import Optional
 
+import numpy as np
+
 from viberesp.driver.parameters import ThieleSmallParameters
 from viberesp.driver.radiation_mass import calculate_resonance_with_radiation_mass_tuned
-from viberesp.driver.radiation_impedance import radiation_impedance_piston
-from viberesp.driver.electrical_impedance import voice_coil_impedance_leach
+from viberesp.driver.radiation_impedance import (
+    radiation_impedance_piston,
+    radiation_impedance_piston_array,
+)
+from viberesp.driver.electrical_impedance import (
+    voice_coil_impedance_array,
+    voice_coil_impedance_leach,
+)
 from viberesp.simulation.constants import (
     SPEED_OF_SOUND,
     AIR_DENSITY,
@@ -76,6 +84,48 @@ class PortedBoxSystemParameters:
     QB: float
 
 
+@dataclass
+class PortedBoxGrid:
+    """
+    Ported box performance over a (Vb, Fb) tuning grid.
+
+    Produced by ported_box_grid(). Arrays indexed [i, j] refer to box
+    volume Vb[i] tuned to Fb[j]; the SPL cube adds the frequency axis.
+
+    Literature:
+        - Small (1973), Eq. 13, 19, 25 - Vented-box response and losses
+        - Thiele (1971), Part 1, Section 4 - Air velocity in the vent
+        - literature/thiele_small/thiele_1971_vented_boxes.md
+
+    Attributes:
+        Vb: Box volumes (m³), shape (n_vb,)
+        Fb: Tuning frequencies (Hz), shape (n_fb,)
+        frequencies: Frequency grid (Hz), shape (n_freq,)
+        spl: SPL cube (dB at measurement distance), shape (n_vb, n_fb, n_freq)
+        F3: -3dB frequency (Hz), same definition as calculate_f3_from_spl()
+        peak_db: Largest rise of the normalized response above its
+            high-frequency asymptote (dB); ≤ 0 for non-peaking alignments
+        ripple_db: Max - min of the normalized response between F3 and the
+            top of the frequency grid (dB)
+        Q_equivalent: Q of the 2nd-order high-pass with the same peaking
+            (0.707 for responses without a peak)
+        port_area: Port cross-sectional area (m²), shape (n_vb, n_fb)
+        port_length: Physical port length (m), NaN where no practical port exists
+        port_velocity: Peak port air velocity at X_max (m/s)
+    """
+    Vb: np.ndarray
+    Fb: np.ndarray
+    frequencies: np.ndarray
+    spl: np.ndarray
+    F3: np.ndarray
+    peak_db: np.ndarray
+    ripple_db: np.ndarray
+    Q_equivalent: np.ndarray
+    port_area: np.ndarray
+    port_length: np.ndarray
+    port_velocity: np.ndarray
+
+
 def helmholtz_resonance_frequency(
     Sp: float,
     Vb: float,
@@ -424,20 +474,15 @@ def calculate_f3_from_spl(
     # Small (1973), Eq. 13: 4th-order vented box transfer function
     # Thiele (1971), Part 2: F3 is -3dB point from reference level
     freqs = np.linspace(f_min, f_max, num_points)
-    spl_values = []
-
-    for f in freqs:
-        try:
-            # Small (1973), Eq. 20: Normalized pressure response
-            spl = calculate_spl_ported_transfer_function(
-                f, driver, Vb, Fb, voltage=2.83, measurement_distance=1.0
-            )
-            spl_values.append(spl)
-        except Exception:
-            # If SPL calculation fails, use 0 to avoid corrupting peak detection
-            spl_values.append(0)
 
-    spl_values = np.array(spl_values)
+    try:
+        # Small (1973), Eq. 20: Normalized pressure response
+        spl_values = calculate_spl_ported_array(
+            freqs, driver, Vb, Fb, voltage=2.83, measurement_distance=1.0
+        )
+    except Exception:
+        # If SPL calculation fails, use 0 to avoid corrupting peak detection
+        spl_values = np.zeros_like(freqs)
 
     # Find peak in bass region
     # Thiele (1971), Part 2, Table 1: Reference level for F3 calculation
@@ -989,6 +1034,458 @@ def calculate_spl_ported_transfer_function(
     return spl
 
 
+def calculate_spl_ported_array(
+    frequencies,
+    driver: ThieleSmallParameters,
+    Vb,
+    Fb,
+    voltage: float = 2.83,
+    measurement_distance: float = 1.0,
+    speed_of_sound: float = SPEED_OF_SOUND,
+    air_density: float = AIR_DENSITY,
+    Qp=7.0,
+    include_hf_rolloff: bool = True,
+    QL: float = 7.0,
+    QA: float = 100.0,
+):
+    """
+    Calculate ported box SPL using vectorized numpy array operations.
+
+    This function is the array-based version of
+    calculate_spl_ported_transfer_function(), evaluating Small's 4th-order
+    vented-box transfer function and the high-frequency roll-off for a whole
+    frequency vector at once.
+
+    Vb, Fb and Qp may also be numpy arrays; all inputs broadcast together
+    with numpy rules, so e.g. Vb[:, None] against a 1-D frequency vector
+    returns one SPL curve per box volume.
+
+    Literature:
+        - Small (1973), "Vented-Box Loudspeaker Systems Part I", JAES
+          Equation 13 for normalized pressure response
+          Equation 19 for combined box losses
+          Equation 25 for reference efficiency
+        - Thiele (1971), Part 1, Section 6 - "Acoustic Output"
+        - Leach (2002), "Loudspeaker Voice-Coil Inductance Losses"
+        - literature/thiele_small/thiele_1971_vented_boxes.md
+
+    Args:
+        frequencies: Array of frequencies in Hz (numpy array or list)
+        driver: ThieleSmallParameters instance
+        Vb: Box volume (m³), scalar or array
+        Fb: Port tuning frequency (Hz), scalar or array
+        voltage: Input voltage (V), default 2.83V (1W into 8Ω)
+        measurement_distance: SPL measurement distance (m), default 1m
+        speed_of_sound: Speed of sound (m/s)
+        air_density: Air density (kg/m³)
+        Qp: Port Q factor (default 7.0), scalar or array
+        include_hf_rolloff: Include mass and inductance high-frequency roll-off (default True)
+        QL: Leakage losses Q factor (default 7.0 = Hornresp, typical 7-20)
+        QA: Absorption losses Q factor (default 100.0 ≈ negligible, typical 50-100)
+
+    Returns:
+        numpy array of SPL values in dB at measurement_distance, with the
+        broadcast shape of frequencies, Vb, Fb and Qp
+
+    Raises:
+        ValueError: If any frequency <= 0, Vb <= 0, Fb <= 0, or
+            measurement_distance <= 0
+        TypeError: If driver is not ThieleSmallParameters
+
+    Examples:
+        >>> import numpy as np
+        >>> from viberesp.driver import load_driver
+        >>> driver = load_driver("BC_8NDL51")
+        >>> freqs = np.logspace(1, 3, 200)
+        >>> spl = calculate_spl_ported_array(freqs, driver, Vb=0.020, Fb=50.0)
+        >>> spl.shape
+        (200,)
+
+    Validation:
+        Matches calculate_spl_ported_transfer_function() point by point
+        (same equations, evaluated with numpy instead of math/complex).
+    """
+    # Validate inputs
+    if not isinstance(driver, ThieleSmallParameters):
+        raise TypeError(f"driver must be ThieleSmallParameters, got {type(driver)}")
+
+    freqs = np.asarray(frequencies, dtype=float)
+    Vb = np.asarray(Vb, dtype=float)
+    Fb = np.asarray(Fb, dtype=float)
+    Qp = np.asarray(Qp, dtype=float)
+
+    if np.any(freqs <= 0):
+        raise ValueError(f"All frequencies must be > 0, min={np.min(freqs)} Hz")
+    if np.any(Vb <= 0):
+        raise ValueError(f"Box volume Vb must be > 0, got {np.min(Vb)} m³")
+    if np.any(Fb <= 0):
+        raise ValueError(f"Tuning frequency Fb must be > 0, got {np.min(Fb)} Hz")
+    if measurement_distance <= 0:
+        raise ValueError(f"Measurement distance must be > 0, got {measurement_distance} m")
+
+    G = _ported_transfer_function(freqs, driver, Vb, Fb, Qp, QL, QA)
+    spl_ref = _ported_reference_spl(
+        driver, Vb, voltage, measurement_distance, speed_of_sound, air_density
+    )
+    with np.errstate(divide='ignore'):
+        spl = spl_ref + 20 * np.log10(np.abs(G))
+
+    if include_hf_rolloff:
+        spl = spl + _ported_hf_rolloff_db(freqs, driver)
+
+    return spl
+
+
+def _ported_transfer_function(freqs, driver: ThieleSmallParameters, Vb, Fb, Qp, QL, QA):
+    """
+    Small (1973) normalized vented-box pressure response G(jω), broadcasting.
+
+    Literature:
+        - Small (1973), Eq. 13 - G(s) = s⁴T_B²T_S² / D(s)
+        - Small (1973), Eq. 19 - 1/QB = 1/QL + 1/QA + 1/QP
+    """
+    # Small (1973): Normalized parameters
+    # literature/thiele_small/thiele_1971_vented_boxes.md
+    omega_s = 2 * math.pi * driver.F_s
+    omega_b = 2 * np.pi * Fb
+    Ts = 1.0 / omega_s  # Driver time constant
+    Tb = 1.0 / omega_b  # Box (port) time constant
+    alpha = driver.V_as / Vb  # Compliance ratio
+
+    # Total driver Q for SPL response (NOT Q_ES)
+    Qt = driver.Q_ts
+
+    # Small (1973), Eq. 19: Combined box losses
+    with np.errstate(divide='ignore'):
+        QB = 1.0 / (1.0 / QL + 1.0 / QA + 1.0 / Qp)
+
+    # Small (1973), Eq. 13: Denominator polynomial coefficients
+    # (Tb * Tb rather than Tb ** 2: numpy scalars square with pow() and
+    # arrays with x*x, so this keeps per-design and broadcast results identical)
+    Tb2 = Tb * Tb
+    a4 = (Ts ** 2) * Tb2
+    a3 = (Tb2 * Ts / QB) + (Tb * Ts ** 2 / Qt)
+    a2 = (alpha + 1) * Tb2 + (Tb * Ts / (QB * Qt)) + (Ts ** 2)
+    a1 = Tb / QB + Ts / Qt
+    a0 = 1
+
+    # Vectorized evaluation: s = jω
+    s = 1j * (2 * np.pi * freqs)
+    denominator = (s ** 4) * a4 + (s ** 3) * a3 + (s ** 2) * a2 + s * a1 + a0
+    numerator = (s ** 4) * a4
+
+    # G(s) = s⁴T_B²T_S² / D(s), zero where D(s) vanishes
+    nonzero = denominator != 0
+    return np.where(nonzero, numerator / np.where(nonzero, denominator, 1.0), 0.0)
+
+
+def _ported_reference_spl(
+    driver: ThieleSmallParameters,
+    Vb,
+    voltage: float,
+    measurement_distance: float,
+    speed_of_sound: float,
+    air_density: float,
+):
+    """
+    Passband reference SPL of a vented box (half-space), broadcasting over Vb.
+
+    Literature:
+        - Small (1973), Eq. 25 - η₀ = (4π²/c³) × (Fs³Vas/Qes), η = η₀/(α + 1)
+        - Kinsler et al. (1982), Chapter 4 - Pressure from acoustic power
+    """
+    alpha = driver.V_as / Vb
+    K_ETA = (4 * math.pi ** 2) / (speed_of_sound ** 3)
+    eta_0 = K_ETA * (driver.F_s ** 3 * driver.V_as) / driver.Q_es
+    eta = eta_0 / (1.0 + alpha)
+
+    P_ref = (voltage ** 2) / driver.R_e
+    p_ref = 20e-6  # Reference pressure: 20 μPa
+    pressure_rms = np.sqrt(eta * P_ref * air_density * speed_of_sound /
+                           (2 * math.pi * measurement_distance ** 2))
+    with np.errstate(divide='ignore'):
+        return np.where(pressure_rms > 0, 20 * np.log10(pressure_rms / p_ref), 0.0)
+
+
+def _ported_hf_rolloff_db(freqs, driver: ThieleSmallParameters):
+    """
+    Direct-radiator HF roll-off (inductance corner with f_mass ≈ f_le) in dB.
+
+    Literature:
+        - Leach (2002), "Loudspeaker Voice-Coil Inductance Losses"
+        - Hornresp validation: f_mass ≈ f_le gives the 2nd-order roll-off
+    """
+    f_le = calculate_inductance_corner_frequency(
+        re=driver.R_e,
+        le=driver.L_e,
+        frequency=None
+    )
+    if not 0 < f_le < float('inf'):
+        return np.zeros_like(freqs)
+
+    # Inductance and mass roll-off terms (f_mass = f_le)
+    return 2 * (-10 * np.log10(1 + (freqs / f_le) ** 2))
+
+
+def ported_box_grid(
+    driver: ThieleSmallParameters,
+    Vb_values,
+    Fb_values,
+    frequencies=None,
+    port_area: Optional[float] = None,
+    voltage: float = 2.83,
+    measurement_distance: float = 1.0,
+    speed_of_sound: float = SPEED_OF_SOUND,
+    air_density: float = AIR_DENSITY,
+    Qp: float = 7.0,
+    QL: float = 7.0,
+    QA: float = 100.0,
+    include_hf_rolloff: bool = True,
+    max_port_velocity: float = 0.05,
+    safety_factor: float = 1.5,
+) -> PortedBoxGrid:
+    """
+    Evaluate a ported box over every (Vb, Fb) combination with broadcasting.
+
+    The whole Vb × Fb × frequency SPL cube is computed with numpy
+    broadcasting (in Vb chunks to bound memory), and F3, peaking, ripple,
+    port length and port velocity are reduced from it without Python loops.
+    A dense 200×200 tuning map therefore replaces tens of thousands of
+    calculate_ported_box_system_parameters() calls, and for this
+    two-variable problem an exhaustive map can stand in for NSGA-II.
+
+    Literature:
+        - Small (1973), "Vented-Box Loudspeaker Systems Part I", JAES
+          Eq. 13 (response), Eq. 19 (box losses), Eq. 25 (efficiency)
+        - Thiele (1971), Part 1, Section 2 - Helmholtz resonator (port length)
+        - Thiele (1971), Part 1, Section 4 - Air velocity in the vent
+        - literature/thiele_small/thiele_1971_vented_boxes.md
+
+    Args:
+        driver: ThieleSmallParameters instance
+        Vb_values: Box volumes (m³), 1-D array-like
+        Fb_values: Tuning frequencies (Hz), 1-D array-like
+        frequencies: Frequency grid (Hz). Default np.linspace(20, 300, 280),
+            the grid calculate_f3_from_spl() uses, so F3 matches it exactly
+        port_area: Fixed port area (m²). If None, the port is sized per cell
+            as in calculate_optimal_port_dimensions()
+        voltage: Input voltage (V), default 2.83V
+        measurement_distance: SPL measurement distance (m), default 1m
+        speed_of_sound: Speed of sound (m/s)
+        air_density: Air density (kg/m³)
+        Qp: Port Q factor used for the response (default 7.0)
+        QL: Leakage losses Q factor (default 7.0)
+        QA: Absorption losses Q factor (default 100.0)
+        include_hf_rolloff: Include HF roll-off in the SPL cube (default True)
+        max_port_velocity: Velocity limit as fraction of c for port sizing
+        safety_factor: Port area safety multiplier for port sizing
+
+    Returns:
+        PortedBoxGrid with (n_vb, n_fb) metric arrays and the SPL cube
+
+    Raises:
+        ValueError: If any Vb, Fb or frequency is not positive, or if the
+            driver has no X_max (needed for port velocity)
+
+    Examples:
+        >>> import numpy as np
+        >>> from viberesp.driver import load_driver
+        >>> driver = load_driver("BC_12NDL76")
+        >>> grid = ported_box_grid(
+        ...     driver, np.linspace(0.02, 0.10, 200), np.linspace(30, 60, 200)
+        ... )
+        >>> grid.F3.shape
+        (200, 200)
+        >>> i, j = np.unravel_index(np.nanargmin(grid.F3), grid.F3.shape)
+
+    Validation:
+        F3[i, j] equals calculate_f3_from_spl(driver, Vb[i], Fb[j]) and
+        spl[i, j] equals calculate_spl_ported_array() for the same box.
+    """
+    if not isinstance(driver, ThieleSmallParameters):
+        raise TypeError(f"driver must be ThieleSmallParameters, got {type(driver)}")
+    if driver.X_max is None:
+        raise ValueError("Driver must have X_max parameter for port sizing")
+
+    Vb = np.atleast_1d(np.asarray(Vb_values, dtype=float))
+    Fb = np.atleast_1d(np.asarray(Fb_values, dtype=float))
+    if frequencies is None:
+        frequencies = np.linspace(20.0, 300.0, 280)
+    freqs = np.asarray(frequencies, dtype=float)
+
+    if np.any(Vb <= 0):
+        raise ValueError(f"Box volume Vb must be > 0, got {np.min(Vb)} m³")
+    if np.any(Fb <= 0):
+        raise ValueError(f"Tuning frequency Fb must be > 0, got {np.min(Fb)} Hz")
+    if np.any(freqs <= 0):
+        raise ValueError(f"All frequencies must be > 0, min={np.min(freqs)} Hz")
+
+    n_vb, n_fb, n_freq = len(Vb), len(Fb), len(freqs)
+    spl = np.empty((n_vb, n_fb, n_freq))
+    response_db = np.empty((n_vb, n_fb, n_freq))
+
+    hf_db = _ported_hf_rolloff_db(freqs, driver) if include_hf_rolloff else 0.0
+    spl_ref = _ported_reference_spl(
+        driver, Vb, voltage, measurement_distance, speed_of_sound, air_density
+    )
+
+    # Chunk over Vb so temporaries stay around a few million complex values
+    chunk = max(1, 2_000_000 // max(1, n_fb * n_freq))
+    for start in range(0, n_vb, chunk):
+        stop = min(start + chunk, n_vb)
+        G = _ported_transfer_function(
+            freqs, driver,
+            Vb[start:stop, np.newaxis, np.newaxis],
+            Fb[np.newaxis, :, np.newaxis],
+            Qp, QL, QA,
+        )
+        with np.errstate(divide='ignore'):
+            response_db[start:stop] = 20 * np.log10(np.abs(G))
+        spl[start:stop] = (
+            spl_ref[start:stop, np.newaxis, np.newaxis] + response_db[start:stop] + hf_db
+        )
+
+    F3 = _f3_from_spl_cube(freqs, spl)
+
+    # Peaking of the normalized response above its asymptote (|G| → 1)
+    peak_db = np.max(response_db, axis=-1)
+    # 2nd-order high-pass with peak gain g: Q² = (g² + √(g⁴ - g²)) / 2
+    g2 = 10 ** (np.maximum(peak_db, 0.0) / 10)
+    Q_equivalent = np.sqrt((g2 + np.sqrt(g2 * g2 - g2)) / 2)
+
+    passband = freqs >= F3[..., np.newaxis]
+    ripple_db = (
+        np.max(np.where(passband, response_db, -np.inf), axis=-1)
+        - np.min(np.where(passband, response_db, np.inf), axis=-1)
+    )
+
+    # Port sizing: Thiele (1971), Part 1, Sections 2 and 4
+    Vb_2d = Vb[:, np.newaxis]
+    Fb_2d = Fb[np.newaxis, :]
+
+    if port_area is None:
+        Sp, Lpt, practical = _optimal_port_dimensions_array(
+            driver, Vb_2d, Fb_2d, max_port_velocity, safety_factor, speed_of_sound
+        )
+    else:
+        if port_area <= 0:
+            raise ValueError(f"Port area Sp must be > 0, got {port_area} m²")
+        Sp = np.full((n_vb, n_fb), float(port_area))
+        Lpt = _port_length_array(Sp, Vb_2d, Fb_2d, speed_of_sound)
+        practical = Lpt > 0
+    port_length = np.where(practical, Lpt, np.nan)
+
+    # Peak port velocity at X_max (as in constraint_port_velocity)
+    port_velocity = (2 * np.pi * Fb_2d * driver.X_max * driver.S_d) / Sp
+
+    return PortedBoxGrid(
+        Vb=Vb,
+        Fb=Fb,
+        frequencies=freqs,
+        spl=spl,
+        F3=F3,
+        peak_db=peak_db,
+        ripple_db=ripple_db,
+        Q_equivalent=Q_equivalent,
+        port_area=Sp,
+        port_length=port_length,
+        port_velocity=port_velocity,
+    )
+
+
+def _port_length_array(Sp, Vb, Fb, speed_of_sound: float = SPEED_OF_SOUND):
+    """
+    Vectorized calculate_port_length_for_area() (flanged), broadcasting.
+
+    Non-positive lengths are returned as-is instead of raising.
+
+    Literature:
+        - Thiele (1971), Part 1, Section 2 - Lp = c²Sp / (Vb Fb² (2π)²) - ΔL
+    """
+    Lp_eff = (speed_of_sound ** 2) * Sp / (Vb * (Fb ** 2) * (2 * math.pi) ** 2)
+    return Lp_eff - 0.85 * np.sqrt(Sp / math.pi)
+
+
+def _optimal_port_dimensions_array(
+    driver: ThieleSmallParameters,
+    Vb,
+    Fb,
+    max_port_velocity: float = 0.05,
+    safety_factor: float = 1.5,
+    speed_of_sound: float = SPEED_OF_SOUND,
+):
+    """
+    Vectorized calculate_optimal_port_dimensions(), broadcasting Vb and Fb.
+
+    Returns:
+        Tuple (port_area, port_length, practical) where practical is False
+        wherever the scalar function would raise ValueError (port length
+        not positive, or longer than twice the cube-root box dimension)
+
+    Literature:
+        - Thiele (1971), Part 1, Section 4 - Air velocity in the vent
+    """
+    Vb = np.asarray(Vb, dtype=float)
+    Fb = np.asarray(Fb, dtype=float)
+    shape = np.broadcast(Vb, Fb).shape
+
+    Sp_min = (2 * math.pi * Fb * driver.X_max * driver.S_d) / (
+        max_port_velocity * speed_of_sound
+    )
+    Sp = np.broadcast_to(Sp_min * safety_factor, shape).copy()
+    Lpt = _port_length_array(Sp, Vb, Fb, speed_of_sound)
+
+    # Same fallback as calculate_optimal_port_dimensions(): double Sp_min
+    retry = Lpt <= 0
+    Sp[retry] = np.broadcast_to(Sp_min * 2.0, shape)[retry]
+    Lpt = np.where(retry, _port_length_array(Sp, Vb, Fb, speed_of_sound), Lpt)
+
+    practical = (Lpt > 0) & (Lpt <= 2.0 * Vb ** (1 / 3))
+    return Sp, Lpt, practical
+
+
+def _port_Q_array(port_area, port_length, Vb, Fb, speed_of_sound: float = SPEED_OF_SOUND):
+    """
+    Vectorized calculate_port_Q() (clamped to 5-100), broadcasting.
+
+    Literature:
+        - Thiele (1971), Part 1, Section 4 - Port losses and Qp
+    """
+    port_radius = np.sqrt(port_area / math.pi)
+    Lp_eff = port_length + 0.85 * port_radius
+    omega_b = 2 * math.pi * Fb
+    Qp_theoretical = ((omega_b ** 2) * Lp_eff * (port_radius ** 2)) / (speed_of_sound * port_area)
+    return np.clip(Qp_theoretical, 5.0, 100.0)
+
+
+def _f3_from_spl_cube(freqs, spl):
+    """
+    Vectorized calculate_f3_from_spl() reduction over the last axis.
+
+    Normalizes each curve to its peak and finds the highest index at or
+    below the peak that lies more than 3 dB down, interpolating against
+    the previous point exactly as the scalar search does; curves that
+    never drop 3 dB below their peak return freqs[0].
+    """
+    n = spl.shape[-1]
+    peak_idx = np.argmax(spl, axis=-1)[..., np.newaxis]
+    spl_norm = spl - np.take_along_axis(spl, peak_idx, axis=-1)
+
+    idx = np.arange(n)
+    candidates = (spl_norm < -3.0) & (idx >= 1) & (idx <= peak_idx)
+    found = np.any(candidates, axis=-1)
+    last = n - 1 - np.argmax(candidates[..., ::-1], axis=-1)
+    i = np.where(found, last, 1)[..., np.newaxis]
+
+    f1, f2 = freqs[i - 1], freqs[i]
+    spl1 = np.take_along_axis(spl_norm, i - 1, axis=-1)
+    spl2 = np.take_along_axis(spl_norm, i, axis=-1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        f3 = (f1 + (f2 - f1) * (-3.0 - spl1) / (spl2 - spl1))[..., 0]
+
+    return np.where(found, f3, freqs[0])
+
+
 def ported_box_impedance_small(
     frequency: float,
     driver: ThieleSmallParameters,
@@ -1762,3 +2259,235 @@ def ported_box_electrical_impedance(
     }
 
     return result
+
+
+def _ported_box_impedance_small_array(freqs, driver: ThieleSmallParameters, Vb, Fb, Qp):
+    """Small (1973) vented-box input impedance, array form of ported_box_impedance_small()."""
+    Ts = 1.0 / (2 * math.pi * driver.F_s)
+    Tp = 1.0 / (2 * math.pi * Fb)
+    alpha = driver.V_as / Vb
+
+    R_ms = (2 * math.pi * driver.F_s) * driver.M_ms / driver.Q_ms
+    R_es = (driver.BL ** 2) / R_ms
+
+    s = 1j * (2 * math.pi * freqs)
+    numerator = (s * Tp / driver.Q_es) * ((s ** 2) * (Tp ** 2) + s * (Tp / Qp) + 1)
+    denominator = (
+        (s ** 4) * ((Ts ** 2) * (Tp ** 2))
+        + (s ** 3) * ((Tp ** 2 * Ts / Qp) + (Ts * Tp ** 2 / driver.Q_es))
+        + (s ** 2) * ((alpha + 1) * (Tp ** 2) + (Ts * Tp / (Qp * driver.Q_es)) + (Ts ** 2))
+        + s * (Tp / Qp + Ts / driver.Q_es)
+        + 1
+    )
+    return driver.R_e + R_es * (numerator / denominator)
+
+
+def ported_box_electrical_impedance_array(
+    frequencies,
+    driver: ThieleSmallParameters,
+    Vb: float,
+    Fb: float,
+    port_area: float,
+    port_length: float,
+    voltage: float = 2.83,
+    measurement_distance: float = 1.0,
+    speed_of_sound: float = SPEED_OF_SOUND,
+    air_density: float = AIR_DENSITY,
+    voice_coil_model: str = "simple",
+    leach_K: float = None,
+    leach_n: float = None,
+    impedance_model: str = "small",
+    use_transfer_function_spl: bool = True,
+    QL: float = 7.0,
+    QA: float = 100.0,
+    QP: Optional[float] = None,
+) -> dict:
+    """
+    Calculate ported box electrical impedance, velocity and excursion over frequency.
+
+    Array version of ported_box_electrical_impedance(): both impedance models
+    ("small" and "circuit") and all voice coil models are evaluated for every
+    frequency in one pass, and the diaphragm displacement |u|/ω is returned
+    alongside the velocity so excursion limits can be checked without a
+    per-frequency loop.
+
+    Literature:
+        - Small (1973), "Vented-Box Loudspeaker Systems Part I", Eq. 19
+        - Thiele (1971), Part 1, Section 5 - Input impedance
+        - COMSOL (2020), Figure 2 - Force and velocity relationship
+        - literature/thiele_small/thiele_1971_vented_boxes.md
+
+    Args:
+        frequencies: Array of frequencies in Hz
+        driver: ThieleSmallParameters instance
+        Vb: Box volume (m³)
+        Fb: Port tuning frequency (Hz)
+        port_area: Port cross-sectional area (m²)
+        port_length: Physical port length (m)
+        voltage: Input voltage (V), default 2.83V (1W into 8Ω)
+        measurement_distance: SPL measurement distance (m), default 1m
+        speed_of_sound: Speed of sound (m/s)
+        air_density: Air density (kg/m³)
+        voice_coil_model: "simple", "leach" or "leach-full"
+        leach_K: Leach (2002) K parameter (required for Leach models)
+        leach_n: Leach (2002) n parameter (required for Leach models)
+        impedance_model: "small" (Small 1973 transfer function) or "circuit"
+        use_transfer_function_spl: If True, SPL from calculate_spl_ported_array();
+            otherwise from the diaphragm velocity (impedance coupling)
+        QL: Leakage losses Q (default 7.0)
+        QA: Absorption losses Q (default 100.0)
+        QP: Port losses Q; calculated from the port dimensions if None
+
+    Returns:
+        Dictionary of numpy arrays with the same keys as
+        ported_box_electrical_impedance() plus:
+        - 'Ze': Complex electrical impedance (Ω)
+        - 'diaphragm_displacement': Peak diaphragm excursion |u|/ω (m)
+
+    Raises:
+        ValueError: If any frequency, Vb, Fb, port dimension or
+            measurement_distance <= 0
+        TypeError: If driver is not ThieleSmallParameters
+
+    Examples:
+        >>> freqs = np.logspace(1, 3, 200)
+        >>> result = ported_box_electrical_impedance_array(
+        ...     freqs, driver, Vb=0.030, Fb=40, port_area=0.003, port_length=0.15
+        ... )
+        >>> result['diaphragm_displacement'].max()  # Peak excursion (m)
+        0.006...
+
+    Validation:
+        Element i equals ported_box_electrical_impedance(frequencies[i], ...).
+    """
+    # Validate inputs
+    freqs = np.asarray(frequencies, dtype=float)
+    if np.any(freqs <= 0):
+        raise ValueError(f"Frequency must be > 0, got {np.min(freqs)} Hz")
+    if not isinstance(driver, ThieleSmallParameters):
+        raise TypeError(f"driver must be ThieleSmallParameters, got {type(driver)}")
+    if Vb <= 0:
+        raise ValueError(f"Box volume Vb must be > 0, got {Vb} m³")
+    if Fb <= 0:
+        raise ValueError(f"Tuning frequency Fb must be > 0, got {Fb} Hz")
+    if port_area <= 0:
+        raise ValueError(f"Port area must be > 0, got {port_area} m²")
+    if port_length <= 0:
+        raise ValueError(f"Port length must be > 0, got {port_length} m")
+    if measurement_distance <= 0:
+        raise ValueError(f"Measurement distance must be > 0, got {measurement_distance} m")
+
+    omega = 2 * math.pi * freqs
+
+    # Thiele (1971): α = Vas/Vb, C_mb = C_ms / (1 + α), h = Fb/Fs
+    alpha = driver.V_as / Vb
+    C_mb = driver.C_ms / (1.0 + alpha)
+    h = Fb / driver.F_s
+
+    # Beranek (1954), Eq. 5.20: diaphragm front radiation load
+    Z_rad = radiation_impedance_piston_array(
+        freqs, driver.S_d, speed_of_sound=speed_of_sound, air_density=air_density
+    )
+
+    Z_voice_coil = voice_coil_impedance_array(
+        freqs, driver, voice_coil_model, leach_K=leach_K, leach_n=leach_n
+    )
+
+    # Small (1973), Eq. 19: combined box losses 1/QB = 1/QL + 1/QA + 1/QP
+    # (the circuit model has always used the default medium for QP)
+    if QP is None:
+        if impedance_model == "small":
+            QP = calculate_port_Q(
+                port_area, port_length, Vb, Fb,
+                speed_of_sound=speed_of_sound,
+                air_density=air_density
+            )
+        else:
+            QP = calculate_port_Q(port_area, port_length, Vb, Fb)
+    if QL == float('inf') and QA == float('inf') and QP == float('inf'):
+        QB = float('inf')
+    else:
+        QB = 1.0 / (1.0/QL + 1.0/QA + 1.0/QP)
+
+    if impedance_model == "small":
+        # Small (1973) transfer function impedance plus the voice coil
+        # reactance (Small's model is purely resistive R_e)
+        Ze = _ported_box_impedance_small_array(freqs, driver, Vb, Fb, QP) + \
+            (Z_voice_coil - driver.R_e)
+
+        # Velocity from the reflected impedance Z_m = (BL)² / (Z_e - Z_vc),
+        # with Z_vc the simple R_e + jωL_e model as in the scalar function
+        Z_reflected = Ze - (driver.R_e + 1j * (omega * driver.L_e))
+        velocity = np.abs(voltage / Ze) * np.abs(Z_reflected) / driver.BL
+    else:  # impedance_model == "circuit"
+        _, M_ms_enclosed = calculate_resonance_with_radiation_mass_tuned(
+            driver.M_md,
+            C_mb,
+            driver.S_d,
+            radiation_multiplier=2.0,
+            air_density=air_density,
+            speed_of_sound=speed_of_sound,
+        )
+
+        # Empirical box damping R_box = ωM_ms/QB (see ported_box_electrical_impedance)
+        R_box = 0.0 if QB == float('inf') else (omega * M_ms_enclosed) / QB
+        Z_m_driver = (driver.R_ms + R_box) + 1j * (omega * M_ms_enclosed) - 1j / (omega * C_mb)
+
+        # Thiele (1971), Section 5: port branch (mass + radiation + box
+        # compliance) in parallel with the driver in the acoustic domain
+        Lp_eff = port_length + 0.85 * math.sqrt(port_area / math.pi)
+        Z_a_port = 1j * (omega * (air_density * Lp_eff / port_area)) + \
+            radiation_impedance_piston_array(
+                freqs, port_area, speed_of_sound=speed_of_sound, air_density=air_density
+            ) + (-1j / (omega * C_mb)) * (port_area ** 2)
+        Z_a_driver = Z_m_driver / (driver.S_d ** 2)
+        Z_a_total = (Z_a_driver * Z_a_port) / (Z_a_driver + Z_a_port)
+        Z_mechanical_total = Z_a_total * (driver.S_d ** 2) + Z_rad * (driver.S_d ** 2)
+
+        Ze = Z_voice_coil + (driver.BL ** 2) / Z_mechanical_total
+        velocity = driver.BL * np.abs(voltage / Ze) / np.abs(Z_mechanical_total)
+
+    if use_transfer_function_spl:
+        spl = calculate_spl_ported_array(
+            freqs, driver, Vb, Fb,
+            voltage=voltage,
+            measurement_distance=measurement_distance,
+            speed_of_sound=speed_of_sound,
+            air_density=air_density,
+            Qp=calculate_port_Q(
+                port_area, port_length, Vb, Fb,
+                speed_of_sound=speed_of_sound,
+                air_density=air_density
+            ),
+            QL=QL,
+            QA=QA,
+        )
+    else:
+        # Kinsler et al. (1982), Eq. 4.58: p = ωρ₀·|U| / (2πr), diaphragm only
+        pressure_amplitude = (omega * air_density * velocity * driver.S_d) / \
+                             (2 * math.pi * measurement_distance)
+        with np.errstate(divide='ignore'):
+            spl = 20 * np.log10(pressure_amplitude / 20e-6)
+
+    return {
+        'frequency': freqs,
+        'Ze': Ze,
+        'Ze_magnitude': np.abs(Ze),
+        'Ze_phase': np.degrees(np.angle(Ze)),
+        'Ze_real': Ze.real,
+        'Ze_imag': Ze.imag,
+        'SPL': spl,
+        'diaphragm_velocity': velocity,
+        'diaphragm_velocity_phase': np.zeros_like(velocity),
+        'diaphragm_displacement': velocity / omega,
+        'radiation_impedance': Z_rad,
+        'radiation_resistance': Z_rad.real,
+        'radiation_reactance': Z_rad.imag,
+        'alpha': alpha,
+        'h': h,
+        'Fb': Fb,
+        'QL': QL,
+        'QA': QA,
+        'QP': QP,
+        'QB': QB,
+    }
@@ -21,8 +21,14 @@ import cmath
 from dataclasses import dataclass
 
 from viberesp.driver.parameters import ThieleSmallParameters
-from viberesp.driver.radiation_impedance import radiation_impedance_piston
-from viberesp.driver.electrical_impedance import voice_coil_impedance_leach
+from viberesp.driver.radiation_impedance import (
+    radiation_impedance_piston,
+    radiation_impedance_piston_array,
+)
+from viberesp.driver.electrical_impedance import (
+    voice_coil_impedance_array,
+    voice_coil_impedance_leach,
+)
 from viberesp.simulation.constants import (
     SPEED_OF_SOUND,
     AIR_DENSITY,
@@ -507,7 +513,8 @@ def calculate_spl_array(
     Args:
         frequencies: Array of frequencies in Hz (numpy array or list)
         driver: ThieleSmallParameters instance
-        Vb: Box volume (m³)
+        Vb: Box volume (m³); an array broadcasts against frequencies
+            (e.g. Vb[:, None] gives one SPL curve per volume)
         voltage: Input voltage (V), default 2.83V (1W into 8Ω)
         measurement_distance: SPL measurement distance (m), default 1m
         speed_of_sound: Speed of sound (m/s)
@@ -562,8 +569,9 @@ def calculate_spl_array(
     # Validate inputs
     if not isinstance(driver, ThieleSmallParameters):
         raise TypeError(f"driver must be ThieleSmallParameters, got {type(driver)}")
-    if Vb <= 0:
-        raise ValueError(f"Box volume Vb must be > 0, got {Vb} m³")
+    Vb = np.asarray(Vb, dtype=float)
+    if np.any(Vb <= 0):
+        raise ValueError(f"Box volume Vb must be > 0, got {np.min(Vb)} m³")
     if measurement_distance <= 0:
         raise ValueError(f"Measurement distance must be > 0, got {measurement_distance} m")
 
@@ -573,7 +581,7 @@ def calculate_spl_array(
     # Small (1972): System parameters
     # literature/thiele_small/small_1972_closed_box.md
     alpha = driver.V_as / Vb
-    sqrt_factor = math.sqrt(1.0 + alpha)
+    sqrt_factor = np.sqrt(1.0 + alpha)
     fc = driver.F_s * sqrt_factor  # System resonance frequency
     wc = 2 * math.pi * fc  # System cutoff angular frequency
 
@@ -704,6 +712,168 @@ def calculate_spl_array(
     return spl
 
 
+def calculate_sealed_box_system_parameters_array(
+    driver: ThieleSmallParameters,
+    Vb,
+    Quc: float = 7.0,
+) -> SealedBoxSystemParameters:
+    """
+    Calculate sealed box system parameters for many box volumes at once.
+
+    Vectorized version of calculate_sealed_box_system_parameters(): every
+    field of the returned dataclass (except Quc) is a numpy array with the
+    shape of Vb.
+
+    Literature:
+        - Small (1972), Eq. 9 for parallel Q combination
+        - literature/thiele_small/small_1972_closed_box.md
+
+    Args:
+        driver: ThieleSmallParameters instance
+        Vb: Box volumes (m³), array-like
+        Quc: Mechanical + absorption losses (default 7.0)
+
+    Returns:
+        SealedBoxSystemParameters with array-valued Vb, alpha, Fc, Qec,
+        Qtc_total and F3
+
+    Raises:
+        ValueError: If any Vb <= 0 or Quc <= 0
+
+    Examples:
+        >>> import numpy as np
+        >>> from viberesp.driver import load_driver
+        >>> driver = load_driver("BC_8NDL51")
+        >>> params = calculate_sealed_box_system_parameters_array(
+        ...     driver, np.linspace(0.005, 0.050, 500)
+        ... )
+        >>> params.F3.shape
+        (500,)
+
+    Validation:
+        Element-wise identical to calculate_sealed_box_system_parameters().
+    """
+    import numpy as np
+
+    Vb = np.asarray(Vb, dtype=float)
+    if np.any(Vb <= 0):
+        raise ValueError(f"Box volume Vb must be > 0, got {np.min(Vb)} m³")
+    if Quc <= 0:
+        raise ValueError(f"Quc must be > 0, got {Quc}")
+    if Quc < 3.0:
+        import warnings
+        warnings.warn(f"Quc={Quc} is unusually low (typical range: 5-100)")
+
+    # Small (1972): α = Vas/Vb, Fc = Fs·√(1 + α), Qec = Qes·√(1 + α)
+    alpha = driver.V_as / Vb
+    sqrt_factor = np.sqrt(1.0 + alpha)
+    Fc = driver.F_s * sqrt_factor
+    Qec = driver.Q_es * sqrt_factor
+
+    # Small (1972), Eq. 9: parallel combination Qtc = Qec·Quc/(Qec + Quc)
+    if Quc == float('inf'):
+        Qtc_total = Qec
+    else:
+        Qtc_total = (Qec * Quc) / (Qec + Quc)
+
+    # F3 from |G(jω)|² = 0.5; Butterworth alignment (Qtc ≈ 0.707) gives F3 = Fc
+    term1 = 1.0 / (Qtc_total * Qtc_total) - 2.0
+    term2 = np.sqrt(term1 * term1 + 4.0)
+    F3_ratio = np.sqrt((term1 + term2) / 2.0)
+    F3 = np.where(np.abs(Qtc_total - 0.707) < 0.01, Fc, Fc * F3_ratio)
+
+    return SealedBoxSystemParameters(
+        Vb=Vb,
+        alpha=alpha,
+        Fc=Fc,
+        Qec=Qec,
+        Quc=Quc,
+        Qtc_total=Qtc_total,
+        F3=F3,
+    )
+
+
+def calculate_spl_array_batch(
+    frequencies,
+    driver: ThieleSmallParameters,
+    Vb,
+    voltage: float = 2.83,
+    measurement_distance: float = 1.0,
+    speed_of_sound: float = SPEED_OF_SOUND,
+    air_density: float = AIR_DENSITY,
+    f_mass: float = None,
+    Quc: float = 7.0,
+):
+    """
+    Calculate sealed box SPL for many box volumes in one array expression.
+
+    Batched version of calculate_spl_array(): Vb is a vector of volumes (or
+    an (n_designs, n_vars) design matrix whose first column is Vb) and the
+    result is a (n_volumes, n_frequencies) SPL matrix together with the
+    vectorized system parameters.
+
+    Literature:
+        - Small (1972), Equation 1 - Normalized pressure response transfer function
+        - Small (1972), Eq. 9 - Parallel Q combination
+        - literature/thiele_small/small_1972_closed_box.md
+
+    Args:
+        frequencies: Array of frequencies in Hz (numpy array or list)
+        driver: ThieleSmallParameters instance
+        Vb: Box volumes (m³), shape (n,), or design matrix of shape (n, k)
+            with Vb in column 0
+        voltage: Input voltage (V), default 2.83V (1W into 8Ω)
+        measurement_distance: SPL measurement distance (m), default 1m
+        speed_of_sound: Speed of sound (m/s)
+        air_density: Air density (kg/m³)
+        f_mass: Mass break frequency (Hz) for HF roll-off. If None, no HF roll-off applied.
+        Quc: Mechanical + absorption losses (default 7.0)
+
+    Returns:
+        Tuple of (spl, params):
+        - spl: numpy array of SPL values, shape (n_volumes, n_frequencies)
+        - params: SealedBoxSystemParameters with array-valued Fc, Qtc_total, F3
+
+    Raises:
+        ValueError: If any Vb <= 0, or invalid driver
+
+    Examples:
+        >>> import numpy as np
+        >>> from viberesp.driver import load_driver
+        >>> driver = load_driver("BC_8NDL51")
+        >>> freqs = np.logspace(1, 3, 100)
+        >>> spl, params = calculate_spl_array_batch(
+        ...     freqs, driver, np.linspace(0.005, 0.050, 500)
+        ... )
+        >>> spl.shape
+        (500, 100)
+
+    Validation:
+        Row i equals calculate_spl_array(frequencies, driver, Vb[i], ...).
+    """
+    import numpy as np
+
+    Vb = np.asarray(Vb, dtype=float)
+    if Vb.ndim == 2:
+        Vb = Vb[:, 0]
+    Vb = np.atleast_1d(Vb)
+
+    spl = calculate_spl_array(
+        np.asarray(frequencies, dtype=float),
+        driver,
+        Vb[:, np.newaxis],
+        voltage=voltage,
+        measurement_distance=measurement_distance,
+        speed_of_sound=speed_of_sound,
+        air_density=air_density,
+        f_mass=f_mass,
+        Quc=Quc,
+    )
+    params = calculate_sealed_box_system_parameters_array(driver, Vb, Quc=Quc)
+
+    return spl, params
+
+
 def sealed_box_electrical_impedance(
     frequency: float,
     driver: ThieleSmallParameters,
@@ -1082,3 +1252,152 @@ def sealed_box_electrical_impedance(
 
     return result
 
+
+def sealed_box_electrical_impedance_array(
+    frequencies,
+    driver: ThieleSmallParameters,
+    Vb,
+    voltage: float = 2.83,
+    measurement_distance: float = 1.0,
+    speed_of_sound: float = SPEED_OF_SOUND,
+    air_density: float = AIR_DENSITY,
+    voice_coil_model: str = "simple",
+    leach_K: float = None,
+    leach_n: float = None,
+    use_transfer_function_spl: bool = True,
+    f_mass: float = None,
+    Quc: float = 7.0,
+) -> dict:
+    """
+    Calculate sealed box electrical impedance, velocity and excursion over frequency.
+
+    Array version of sealed_box_electrical_impedance(): the radiation load,
+    voice coil model and mechanical impedance are evaluated for all
+    frequencies in one pass, and the diaphragm displacement |u|/ω is returned
+    alongside the velocity so excursion limits can be checked without a
+    per-frequency loop.
+
+    Literature:
+        - Small (1972), "Closed-Box Loudspeaker Systems Part I", Eq. 9
+        - COMSOL (2020), Figure 2 - Electro-mechano-acoustical circuit
+        - Beranek (1954), Eq. 5.20 - Piston radiation impedance
+        - literature/thiele_small/small_1972_closed_box.md
+
+    Args:
+        frequencies: Array of frequencies in Hz
+        driver: ThieleSmallParameters instance
+        Vb: Box volume (m³); an array broadcasts against frequencies
+            (e.g. Vb[:, None] gives one row per volume)
+        voltage: Input voltage (V), default 2.83V (1W into 8Ω)
+        measurement_distance: SPL measurement distance (m), default 1m
+        speed_of_sound: Speed of sound (m/s)
+        air_density: Air density (kg/m³)
+        voice_coil_model: "simple", "leach" or "leach-full"
+        leach_K: Leach (2002) K parameter (required for Leach models)
+        leach_n: Leach (2002) n parameter (required for Leach models)
+        use_transfer_function_spl: If True, SPL from calculate_spl_array();
+            otherwise from the diaphragm velocity (impedance coupling)
+        f_mass: Mass break frequency (Hz) for the transfer function SPL
+        Quc: Mechanical + absorption losses (default 7.0)
+
+    Returns:
+        Dictionary of numpy arrays with the same keys as
+        sealed_box_electrical_impedance() plus:
+        - 'Ze': Complex electrical impedance (Ω)
+        - 'diaphragm_displacement': Peak diaphragm excursion |u|/ω (m)
+
+    Raises:
+        ValueError: If any frequency or Vb <= 0, or measurement_distance <= 0
+        TypeError: If driver is not ThieleSmallParameters
+
+    Examples:
+        >>> freqs = np.logspace(1, 3, 200)
+        >>> result = sealed_box_electrical_impedance_array(freqs, driver, Vb=0.010)
+        >>> result['diaphragm_displacement'].max()  # Peak excursion (m)
+        0.004...
+
+    Validation:
+        Element i equals sealed_box_electrical_impedance(frequencies[i], ...).
+    """
+    import numpy as np
+
+    # Validate inputs
+    freqs = np.asarray(frequencies, dtype=float)
+    if np.any(freqs <= 0):
+        raise ValueError(f"Frequency must be > 0, got {np.min(freqs)} Hz")
+    if not isinstance(driver, ThieleSmallParameters):
+        raise TypeError(f"driver must be ThieleSmallParameters, got {type(driver)}")
+    Vb = np.asarray(Vb, dtype=float)
+    if np.any(Vb <= 0):
+        raise ValueError(f"Box volume Vb must be > 0, got {np.min(Vb)} m³")
+    if measurement_distance <= 0:
+        raise ValueError(f"Measurement distance must be > 0, got {measurement_distance} m")
+
+    omega = 2 * math.pi * freqs
+
+    # Small (1972): α = Vas/Vb, C_mb = C_ms / (1 + α), Fc = Fs × √(1 + α)
+    alpha = driver.V_as / Vb
+    C_mb = driver.C_ms / (1.0 + alpha)
+    Fc = driver.F_s * np.sqrt(1.0 + alpha)
+
+    # Beranek (1954), Eq. 5.20: front radiation load
+    Z_rad = radiation_impedance_piston_array(
+        freqs, driver.S_d, speed_of_sound=speed_of_sound, air_density=air_density
+    )
+
+    # Mechanical impedance with box compliance and empirical box damping
+    # R_box = ω × M_ms / Quc (see sealed_box_electrical_impedance)
+    R_box = 0.0 if Quc == float('inf') else (omega * driver.M_ms) / Quc
+    Z_mechanical_total = (driver.R_ms + R_box) + 1j * (omega * driver.M_ms) \
+        - 1j / (omega * C_mb) + Z_rad * (driver.S_d ** 2)
+
+    # COMSOL (2020), Figure 2: Z_e = Z_vc + (BL)² / Z_m_total
+    Z_voice_coil = voice_coil_impedance_array(
+        freqs, driver, voice_coil_model, leach_K=leach_K, leach_n=leach_n
+    )
+    Ze = Z_voice_coil + (driver.BL ** 2) / Z_mechanical_total
+
+    # Diaphragm velocity u = BL·(V/Z_e) / Z_m and displacement x = |u|/ω
+    u_diaphragm = driver.BL * (voltage / Ze) / Z_mechanical_total
+    velocity = np.abs(u_diaphragm)
+
+    if use_transfer_function_spl:
+        spl = calculate_spl_array(
+            freqs, driver, Vb,
+            voltage=voltage,
+            measurement_distance=measurement_distance,
+            speed_of_sound=speed_of_sound,
+            air_density=air_density,
+            f_mass=f_mass,
+            Quc=Quc,
+        )
+    else:
+        # Kinsler et al. (1982), Eq. 4.58: p = ωρ₀·|U| / (2πr)
+        pressure_amplitude = (omega * air_density * velocity * driver.S_d) / \
+                             (2 * math.pi * measurement_distance)
+        with np.errstate(divide='ignore'):
+            spl = 20 * np.log10(pressure_amplitude / 20e-6)
+
+    # Small (1972), Eq. 9: Qec = Qes × √(1 + α), parallel with Quc
+    Qec = driver.Q_es * np.sqrt(1.0 + alpha)
+    Qtc_total = Qec if Quc == float('inf') else (Qec * Quc) / (Qec + Quc)
+
+    return {
+        'frequency': freqs,
+        'Ze': Ze,
+        'Ze_magnitude': np.abs(Ze),
+        'Ze_phase': np.degrees(np.angle(Ze)),
+        'Ze_real': Ze.real,
+        'Ze_imag': Ze.imag,
+        'SPL': spl,
+        'diaphragm_velocity': velocity,
+        'diaphragm_velocity_phase': np.degrees(np.angle(u_diaphragm)),
+        'diaphragm_displacement': velocity / omega,
+        'radiation_impedance': Z_rad,
+        'radiation_resistance': Z_rad.real,
+        'radiation_reactance': Z_rad.imag,
+        'Fc': Fc,
+        'Qec': Qec,
+        'Quc': Quc,
+        'Qtc_total': Qtc_total,
+    }
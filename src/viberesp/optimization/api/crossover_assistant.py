@@ -170,7 +170,7 @@ class CrossoverDesignAssistant:
             1000
         """
         import math
-        from viberesp.enclosure.ported_box import calculate_spl_ported_transfer_function
+        from viberesp.enclosure.ported_box import calculate_spl_ported_array
 
         # Load drivers
         lf_driver = load_driver(lf_driver_name)
@@ -182,10 +182,7 @@ class CrossoverDesignAssistant:
         if lf_enclosure_type == "ported":
             vb = lf_enclosure_params["Vb"]
             fb = lf_enclosure_params["Fb"]
-            lf_response = np.array([
-                calculate_spl_ported_transfer_function(f, lf_driver, vb, fb)
-                for f in freq
-            ])
+            lf_response = calculate_spl_ported_array(freq, lf_driver, vb, fb)
         elif lf_enclosure_type == "sealed":
             vb = lf_enclosure_params["Vb"]
             from viberesp.enclosure.sealed_box import calculate_spl_from_transfer_function
@@ -27,6 +27,8 @@ Example usage:
     ...     print(design['parameters'], design['objectives'])
 """
 
+import os
+
 import numpy as np
 from typing import List, Dict, Optional
 
@@ -249,13 +251,20 @@ class DesignAssistant:
         population_size: int = 100,
         generations: int = 100,
         top_n: int = 10,
-        num_segments: int = 2
+        num_segments: int = 2,
+        cache_path: Optional[str] = None,
+        algorithm: str = "nsga2",
+        polish: bool = False
     ) -> OptimizationResult:
         """
         Run multi-objective optimization for enclosure design.
 
         Uses NSGA-II algorithm to find Pareto-optimal designs trading off
-        multiple objectives.
+        multiple objectives. For sealed and ported boxes (one to four design
+        variables), algorithm="grid" evaluates a dense grid of designs
+        instead and returns its exact non-dominated set, refined around the
+        front; it is faster than NSGA-II for these and returns the same
+        designs on every call (see run_grid_search).
 
         Literature:
             - Deb et al. (2002) - NSGA-II algorithm
@@ -271,6 +280,14 @@ class DesignAssistant:
             generations: Number of generations (default 100)
             top_n: Number of top designs to return (default 10)
             num_segments: Number of segments for multisegment_horn (2 or 3)
+            cache_path: Optional SQLite evaluation cache; designs evaluated by
+                       earlier runs of the same problem are not re-simulated and
+                       hit rates are reported in optimization_metadata
+            algorithm: "nsga2" (default) or "grid"; grid searches return at
+                       most population_size designs and ignore generations
+            polish: Refine every Pareto design by local gradient-based
+                    search after the run; evaluation counts and improvements
+                    are reported in optimization_metadata["polishing"]
 
         Returns:
             OptimizationResult with Pareto front and best designs
@@ -290,6 +307,20 @@ class DesignAssistant:
             47
             >>> len(result.best_designs)
             10
+
+            Deterministic front of a ported box:
+            >>> result = assistant.optimize_design(
+            ...     "BC_8NDL51", "ported", ["f3", "size"], algorithm="grid"
+            ... )
+            >>> result.optimization_metadata["algorithm"]
+            'grid'
+
+            Tighten an NSGA-II front by local SLSQP polishing:
+            >>> result = assistant.optimize_design(
+            ...     "BC_8NDL51", "ported", ["f3", "flatness"], generations=30, polish=True
+            ... )
+            >>> result.optimization_metadata["polishing"]["n_improved"]
+            97
         """
         from viberesp.driver import load_driver
         from viberesp.optimization.parameters import (
@@ -310,6 +341,11 @@ class DesignAssistant:
             build_mixed_profile_horn,
         )
         from viberesp.optimization.objectives.composite import EnclosureOptimizationProblem
+        from viberesp.optimization.optimizers.grid_search import (
+            GRID_ENCLOSURE_TYPES,
+            run_grid_search,
+        )
+        from viberesp.optimization.optimizers.polishing import polish_front
         from viberesp.optimization.optimizers.pymoo_interface import run_nsga2
         from viberesp.optimization.results.pareto_front import rank_designs
 
@@ -328,6 +364,37 @@ class DesignAssistant:
                 warnings=[f"Unknown driver: {driver_name}"]
             )
 
+        # Validate algorithm
+        supported_algorithms = ["nsga2", "grid"]
+        if algorithm not in supported_algorithms:
+            return OptimizationResult(
+                success=False,
+                pareto_front=[],
+                n_designs_found=0,
+                best_designs=[],
+                parameter_names=[],
+                objective_names=objectives,
+                optimization_metadata={},
+                warnings=[
+                    f"Unsupported algorithm: {algorithm}",
+                    f"Currently supported: {', '.join(supported_algorithms)}"
+                ]
+            )
+        if algorithm == "grid" and enclosure_type not in GRID_ENCLOSURE_TYPES:
+            return OptimizationResult(
+                success=False,
+                pareto_front=[],
+                n_designs_found=0,
+                best_designs=[],
+                parameter_names=[],
+                objective_names=objectives,
+                optimization_metadata={},
+                warnings=[
+                    f"Grid search does not support enclosure type: {enclosure_type}",
+                    f"Grid search supports: {', '.join(GRID_ENCLOSURE_TYPES)}"
+                ]
+            )
+
         # Validate enclosure type
         supported_types = ["sealed", "ported", "exponential_horn", "multisegment_horn", "conical_horn", "mixed_profile_horn"]
         if enclosure_type not in supported_types:
@@ -468,14 +535,26 @@ class DesignAssistant:
                 warnings=[f"Problem setup failed: {e}"]
             )
 
+        # Re-use evaluations of earlier runs
+        if cache_path:
+            from viberesp.optimization.optimizers.evaluation_cache import EvaluationCache
+            problem.evaluation_cache = EvaluationCache(os.path.expanduser(cache_path))
+
         # Run optimization
         try:
-            result, metadata = run_nsga2(
-                problem=problem,
-                pop_size=population_size,
-                n_generations=generations,
-                verbose=False  # Don't print progress
-            )
+            if algorithm == "grid":
+                result, metadata = run_grid_search(
+                    problem,
+                    max_front=population_size,
+                    verbose=False
+                )
+            else:
+                result, metadata = run_nsga2(
+                    problem=problem,
+                    pop_size=population_size,
+                    n_generations=generations,
+                    verbose=False  # Don't print progress
+                )
             # Check if optimization succeeded
             if result.F is None or len(result.F) == 0:
                 return OptimizationResult(
@@ -488,6 +567,8 @@ class DesignAssistant:
                     optimization_metadata={},
                     warnings=["Optimization completed but found no valid designs. This may indicate all designs violated constraints."]
                 )
+            if polish:
+                metadata["polishing"] = polish_front(result, problem)
         except Exception as e:
             return OptimizationResult(
                 success=False,
@@ -499,6 +580,9 @@ class DesignAssistant:
                 optimization_metadata={},
                 warnings=[f"Optimization failed: {e}"]
             )
+        finally:
+            if problem.evaluation_cache is not None:
+                problem.evaluation_cache.close()
 
         # Rank designs
         ranked = rank_designs(
@@ -19,7 +19,8 @@ class AlgorithmConfig:
     Configuration for optimization algorithm parameters.
 
     Attributes:
-        type: Algorithm type ("nsga2", "nsga3", "moead")
+        type: Algorithm type ("nsga2", "nsga3", "moead", or "grid" for an
+              exhaustive grid search of low-dimensional sealed/ported spaces)
         pop_size: Population size for genetic algorithm
         n_generations: Number of generations to run
         sampling: Sampling method ("lhs", "random")
@@ -27,11 +28,28 @@ class AlgorithmConfig:
         crossover_eta: Crossover distribution index (higher = more near-parent)
         mutation_eta: Mutation distribution index (higher = more small mutations)
         eliminate_duplicates: Whether to eliminate duplicate solutions
+        seed: Random seed; seeded runs are reproducible and re-use an
+              evaluation cache completely (None = random)
+        hv_tolerance: Stop before n_generations once the relative hypervolume
+                      improvement stays below this value (None = disabled)
+        hv_patience: Stagnant generations before stopping early
+        grid_points: Grid points per variable of a grid search (None = as
+                     many as grid_max_evaluations allows)
+        grid_max_evaluations: Designs of the initial grid when grid_points
+                              is not given
+        grid_refinements: Grid search refinement rounds around the front
+
+    Grid searches apply to sealed and ported enclosures only (see
+    OptimizationConfig), evaluate every grid design and return at most pop_size
+    Pareto designs; n_generations, sampling, the variation operators and
+    seed do not apply to them.
 
     Examples:
         >>> config = AlgorithmConfig(type="nsga2", pop_size=100, n_generations=100)
         >>> config.type
         'nsga2'
+
+        >>> config = AlgorithmConfig(type="grid", grid_points=64)
     """
     type: str = "nsga2"
     pop_size: int = 100
@@ -41,10 +59,16 @@ class AlgorithmConfig:
     crossover_eta: float = 15.0
     mutation_eta: float = 20.0
     eliminate_duplicates: bool = True
+    seed: Optional[int] = None
+    hv_tolerance: Optional[float] = None
+    hv_patience: int = 10
+    grid_points: Optional[int] = None
+    grid_max_evaluations: int = 4096
+    grid_refinements: int = 2
 
     def __post_init__(self):
         """Validate configuration parameters."""
-        valid_algorithms = ["nsga2", "nsga3", "moead"]
+        valid_algorithms = ["nsga2", "nsga3", "moead", "grid"]
         if self.type not in valid_algorithms:
             raise ValueError(
                 f"Invalid algorithm '{self.type}'. Must be one of {valid_algorithms}"
@@ -65,6 +89,23 @@ class AlgorithmConfig:
         if self.n_generations < 1:
             raise ValueError(f"n_generations must be at least 1, got {self.n_generations}")
 
+        if self.hv_tolerance is not None and self.hv_tolerance < 0:
+            raise ValueError(f"hv_tolerance must be >= 0, got {self.hv_tolerance}")
+
+        if self.hv_patience < 1:
+            raise ValueError(f"hv_patience must be at least 1, got {self.hv_patience}")
+
+        if self.grid_points is not None and self.grid_points < 2:
+            raise ValueError(f"grid_points must be at least 2, got {self.grid_points}")
+
+        if self.grid_max_evaluations < 2:
+            raise ValueError(
+                f"grid_max_evaluations must be at least 2, got {self.grid_max_evaluations}"
+            )
+
+        if self.grid_refinements < 0:
+            raise ValueError(f"grid_refinements must be >= 0, got {self.grid_refinements}")
+
 
 @dataclass
 class OptimizationConfig:
@@ -89,6 +130,38 @@ class OptimizationConfig:
         output_dir: Directory to save results
         save_results: Whether to save results to file
         verbose: Whether to print progress during optimization
+        workers: Number of worker processes evaluating each generation
+                 (1 = serial, 0 = all CPU cores)
+        cache_path: Optional SQLite file storing evaluated designs; repeated
+                    and resumed runs re-use stored evaluations (None = off)
+        cache_max_entries: Maximum number of designs kept in the cache
+                           (least recently used are evicted)
+        checkpoint_path: Optional file the algorithm state is saved to, so an
+                         interrupted run can be resumed (None = off)
+        checkpoint_every: Save a checkpoint every N generations
+        fidelity_schedule: Optional multi-fidelity schedule of
+                           (fraction of generations, frequency points) stages,
+                           e.g. [(0.5, 24), (1.0, 64)]; the returned designs
+                           are re-scored on full grids (None = full grids
+                           throughout)
+        islands: Number of independent NSGA-II populations run in separate
+                 processes with periodic migration (1 = single population)
+        migration_interval: Generations between migrations of an island run
+        n_migrants: Non-dominated designs each island sends to the next
+                    per migration
+        island_presets: Optional parameter_space_preset per island (cycled
+                        over the islands; default: parameter_space_preset)
+        seed_from: Optional warm start: results JSON path of an earlier run,
+                   OptimizationResult, DesignRecommendation or list of design
+                   dicts placed in the initial population (None = random start)
+        polish: Refine every Pareto design by local gradient-based search
+                after the run (see optimizers.polishing)
+        polish_iterations: SLSQP iterations per polished design
+        archive: Collect every feasible non-dominated design evaluated during
+                 the run in a ParetoArchive and return its front instead of
+                 the final population's (see results.archive)
+        archive_size: Maximum number of archived designs, the most crowded
+                      are dropped (None = unbounded)
 
     Valid objectives:
         - "f3": Minimize -3dB cutoff frequency
@@ -134,9 +207,109 @@ class OptimizationConfig:
     output_dir: str = "tasks"
     save_results: bool = True
     verbose: bool = True
+    workers: int = 1
+    cache_path: Optional[str] = None
+    cache_max_entries: int = 1_000_000
+    checkpoint_path: Optional[str] = None
+    checkpoint_every: int = 10
+    fidelity_schedule: Optional[List[Tuple[float, int]]] = None
+    islands: int = 1
+    migration_interval: int = 10
+    n_migrants: int = 5
+    island_presets: Optional[List[str]] = None
+    seed_from: Optional[Any] = None
+    polish: bool = False
+    polish_iterations: int = 20
+    archive: bool = False
+    archive_size: Optional[int] = None
 
     def __post_init__(self):
         """Validate configuration parameters."""
+        if self.workers < 0:
+            raise ValueError(f"workers must be >= 0, got {self.workers}")
+
+        if self.cache_max_entries < 1:
+            raise ValueError(
+                f"cache_max_entries must be >= 1, got {self.cache_max_entries}"
+            )
+
+        if self.checkpoint_every < 1:
+            raise ValueError(
+                f"checkpoint_every must be >= 1, got {self.checkpoint_every}"
+            )
+
+        if self.fidelity_schedule is not None:
+            from viberesp.optimization.optimizers.fidelity import validate_fidelity_schedule
+
+            self.fidelity_schedule = list(validate_fidelity_schedule(self.fidelity_schedule))
+
+        if self.polish_iterations < 1:
+            raise ValueError(
+                f"polish_iterations must be >= 1, got {self.polish_iterations}"
+            )
+
+        if self.archive_size is not None and self.archive_size < 2:
+            raise ValueError(f"archive_size must be >= 2, got {self.archive_size}")
+        if self.archive:
+            unsupported = [
+                name for name, value in (
+                    ("islands", self.islands if self.islands > 1 else None),
+                    ("grid searches", "grid" if self.algorithm.type == "grid" else None),
+                    ("fidelity_schedule", self.fidelity_schedule),
+                ) if value is not None
+            ]
+            if unsupported:
+                raise ValueError(
+                    f"Pareto archives do not support {', '.join(unsupported)}"
+                )
+
+        if self.islands < 1:
+            raise ValueError(f"islands must be >= 1, got {self.islands}")
+        if self.migration_interval < 1:
+            raise ValueError(
+                f"migration_interval must be >= 1, got {self.migration_interval}"
+            )
+        if self.n_migrants < 0:
+            raise ValueError(f"n_migrants must be >= 0, got {self.n_migrants}")
+        if self.islands > 1:
+            unsupported = [
+                name for name, value in (
+                    ("checkpoint_path", self.checkpoint_path),
+                    ("fidelity_schedule", self.fidelity_schedule),
+                    ("algorithm.hv_tolerance", self.algorithm.hv_tolerance),
+                ) if value is not None
+            ]
+            if unsupported:
+                raise ValueError(
+                    f"Island runs do not support {', '.join(unsupported)}"
+                )
+        if self.algorithm.type == "grid":
+            from viberesp.optimization.optimizers.grid_search import GRID_ENCLOSURE_TYPES
+
+            if self.enclosure_type not in GRID_ENCLOSURE_TYPES:
+                raise ValueError(
+                    f"Grid searches support only {', '.join(GRID_ENCLOSURE_TYPES)} "
+                    f"enclosures, got '{self.enclosure_type}'"
+                )
+            unsupported = [
+                name for name, value in (
+                    ("islands", self.islands if self.islands > 1 else None),
+                    ("checkpoint_path", self.checkpoint_path),
+                    ("fidelity_schedule", self.fidelity_schedule),
+                    ("seed_from", self.seed_from),
+                    ("algorithm.hv_tolerance", self.algorithm.hv_tolerance),
+                ) if value is not None
+            ]
+            if unsupported:
+                raise ValueError(
+                    f"Grid searches do not support {', '.join(unsupported)}"
+                )
+
+        if self.seed_from is not None and not isinstance(self.seed_from, str):
+            from viberesp.optimization.optimizers.warm_start import load_seed_designs
+
+            load_seed_designs(self.seed_from)
+
         # Validate objectives
         valid_objectives = [
             "f3",
@@ -175,11 +348,12 @@ class OptimizationConfig:
             "sealed",
             "ported",
         ]
-        if self.parameter_space_preset not in valid_presets:
-            raise ValueError(
-                f"Invalid parameter_space_preset '{self.parameter_space_preset}'. "
-                f"Must be one of {valid_presets}"
-            )
+        for preset in [self.parameter_space_preset] + list(self.island_presets or []):
+            if preset not in valid_presets:
+                raise ValueError(
+                    f"Invalid parameter_space_preset '{preset}'. "
+                    f"Must be one of {valid_presets}"
+                )
 
         # Validate objectives match constraints
         if "f3_deviation" in self.objectives and "f3_target" not in self.constraints:
@@ -245,6 +419,21 @@ class OptimizationConfig:
             output_dir=kwargs.get("output_dir", "tasks"),
             save_results=kwargs.get("save_results", True),
             verbose=kwargs.get("verbose", True),
+            workers=kwargs.get("workers", 1),
+            cache_path=kwargs.get("cache_path"),
+            cache_max_entries=kwargs.get("cache_max_entries", 1_000_000),
+            checkpoint_path=kwargs.get("checkpoint_path"),
+            checkpoint_every=kwargs.get("checkpoint_every", 10),
+            fidelity_schedule=kwargs.get("fidelity_schedule"),
+            islands=kwargs.get("islands", 1),
+            migration_interval=kwargs.get("migration_interval", 10),
+            n_migrants=kwargs.get("n_migrants", 5),
+            island_presets=kwargs.get("island_presets"),
+            seed_from=kwargs.get("seed_from"),
+            polish=kwargs.get("polish", False),
+            polish_iterations=kwargs.get("polish_iterations", 20),
+            archive=kwargs.get("archive", False),
+            archive_size=kwargs.get("archive_size"),
         )
 
     @classmethod
@@ -264,6 +453,15 @@ class OptimizationConfig:
             parameter_space_preset: bass_horn
             parameter_overrides:
               mouth_area: [0.4, 1.5]
+            workers: 8
+            cache_path: ~/.cache/viberesp/evaluations.sqlite
+            checkpoint_path: runs/horn.ckpt
+            checkpoint_every: 10
+            fidelity_schedule: [[0.5, 24], [1.0, 64]]
+            seed_from: tasks/BC_21DS115_multisegment_horn_20250101_120000.json
+            polish: true
+            archive: true
+            archive_size: 2000
             algorithm:
               type: nsga2
               pop_size: 100
@@ -348,11 +546,44 @@ class OptimizationConfig:
                 "crossover_eta": self.algorithm.crossover_eta,
                 "mutation_eta": self.algorithm.mutation_eta,
                 "eliminate_duplicates": self.algorithm.eliminate_duplicates,
+                "seed": self.algorithm.seed,
+                "hv_tolerance": self.algorithm.hv_tolerance,
+                "hv_patience": self.algorithm.hv_patience,
+                "grid_points": self.algorithm.grid_points,
+                "grid_max_evaluations": self.algorithm.grid_max_evaluations,
+                "grid_refinements": self.algorithm.grid_refinements,
             },
             "output_dir": self.output_dir,
             "save_results": self.save_results,
             "verbose": self.verbose,
+            "workers": self.workers,
+            "cache_path": self.cache_path,
+            "cache_max_entries": self.cache_max_entries,
+            "checkpoint_path": self.checkpoint_path,
+            "checkpoint_every": self.checkpoint_every,
+            "fidelity_schedule": (
+                [list(stage) for stage in self.fidelity_schedule]
+                if self.fidelity_schedule is not None else None
+            ),
+            "islands": self.islands,
+            "migration_interval": self.migration_interval,
+            "n_migrants": self.n_migrants,
+            "island_presets": self.island_presets,
+            "seed_from": self._seed_from_yaml(),
+            "polish": self.polish,
+            "polish_iterations": self.polish_iterations,
+            "archive": self.archive,
+            "archive_size": self.archive_size,
         }
 
         with open(yaml_path, "w") as f:
             yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+
+    def _seed_from_yaml(self):
+        """seed_from as a results path or a list of parameter dicts."""
+        if self.seed_from is None or isinstance(self.seed_from, str):
+            return self.seed_from
+
+        from viberesp.optimization.optimizers.warm_start import load_seed_designs
+
+        return load_seed_designs(self.seed_from).designs
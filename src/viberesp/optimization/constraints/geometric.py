@@ -0,0 +1,125 @@
+"""
+Pre-simulation screening on geometric constraints.
+
+Constraints fall into two classes:
+
+    geometric   checks that the design vector describes a valid horn (area
+                continuity, flare limits, throat sizing, ...); closed-form,
+                microseconds per design
+    performance limits on the simulated system (excursion, F3, volume,
+                Qtc, ...); some need the acoustic response and are as
+                expensive as the objectives
+
+The geometric constraints of constraints.physical have batch versions
+taking the full design matrix X (see constraints.vectorized). Optimization
+problems evaluate them for the whole population first and only simulate designs
+that satisfy all of them (see screen_population). Designs that fail a
+geometric check receive the problem's penalty objectives and their
+geometric constraint values (so constrained survival still ranks them by
+how far they are from valid geometry); their performance constraints are
+left at 0.
+
+Literature:
+    - Olson (1947), Chapters 5, 8 - Horn geometry and flare limits
+    - Beranek (1954), Chapter 5 - Horn throat design
+    - Deb (2000) - "An efficient constraint handling method for genetic
+      algorithms" (feasibility-first comparison of infeasible designs)
+"""
+
+from typing import Callable, Collection, Dict, Optional, Tuple
+
+import numpy as np
+
+from viberesp.optimization.constraints.physical import (
+    constraint_conical_expansion_ratio,
+    constraint_conical_monotonic_expansion,
+    constraint_exponential_monotonic_expansion,
+    constraint_horn_throat_sizing,
+    constraint_minimum_expansion,
+    constraint_mouth_loading,
+    constraint_multisegment_continuity,
+    constraint_multisegment_flare_curvature,
+    constraint_multisegment_flare_limits,
+)
+from viberesp.optimization.constraints import vectorized
+
+# Per-design geometric constraint -> batch version
+GEOMETRIC_CONSTRAINTS: Dict[Callable, Callable] = {
+    func: vectorized.VECTORIZED_CONSTRAINTS[func]
+    for func in (
+        constraint_multisegment_continuity,
+        constraint_multisegment_flare_limits,
+        constraint_multisegment_flare_curvature,
+        constraint_minimum_expansion,
+        constraint_conical_expansion_ratio,
+        constraint_conical_monotonic_expansion,
+        constraint_exponential_monotonic_expansion,
+        constraint_horn_throat_sizing,
+        constraint_mouth_loading,
+    )
+}
+
+
+def batch_constraint(func: Callable) -> Optional[Callable]:
+    """
+    Batch version of a per-design constraint if it is geometric.
+
+    Args:
+        func: Constraint function, or a functools.partial binding its
+            keyword arguments (as OptimizationScriptFactory builds them)
+
+    Returns:
+        Function (X, driver, enclosure_type, **kwargs) -> violations per
+        row, with the partial's keywords bound; None for constraints that
+        are not geometric (see constraints.vectorized for every constraint
+        with a batch version)
+
+    Examples:
+        >>> batch_constraint(constraint_horn_throat_sizing)(X, driver, "exponential_horn")
+        array([0.   , 0.012])
+        >>> batch_constraint(constraint_max_displacement) is None
+        True
+    """
+    return vectorized.vectorized_constraint(func, GEOMETRIC_CONSTRAINTS)
+
+
+def screen_population(
+    X: np.ndarray,
+    G_geometric: np.ndarray,
+    geometric_columns: list,
+    evaluate: Callable[[np.ndarray], Tuple[np.ndarray, np.ndarray]],
+    n_obj: int,
+    n_constr: int,
+    penalty: float,
+    vectorized_columns: Collection[int] = (),
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Simulate only the designs that satisfy every geometric constraint.
+
+    Args:
+        X: Design matrix (n_designs × n_var)
+        G_geometric: Geometric constraint values (n_designs × len(geometric_columns))
+        geometric_columns: Columns of G holding the geometric constraints
+        evaluate: Full evaluation X -> (F, G) of the designs that pass
+        n_obj: Number of objectives
+        n_constr: Number of constraints
+        penalty: Objective value assigned to designs that fail
+        vectorized_columns: Columns filled afterwards for the whole
+            population (see constraints.vectorized.fill_vectorized_constraints);
+            they are left NaN for failed rows so closed-form constraints such
+            as the volume limit keep their true values
+
+    Returns:
+        Tuple (F, G); failed rows hold ``penalty`` objectives, their
+        geometric constraint values, NaN for the other vectorized
+        constraints and 0 for the remaining ones
+    """
+    F = np.full((len(X), n_obj), penalty, dtype=float)
+    G = np.zeros((len(X), n_constr))
+    G[:, sorted(vectorized_columns)] = np.nan
+    G[:, geometric_columns] = G_geometric
+
+    valid = ~np.any(G_geometric > 0, axis=1)
+    if np.any(valid):
+        F[valid], G[valid] = evaluate(X[valid])
+    return F, G
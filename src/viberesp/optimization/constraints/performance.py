@@ -15,8 +15,10 @@ Literature:
 """
 
 import numpy as np
+from typing import Optional
 
 from viberesp.driver.parameters import ThieleSmallParameters
+from viberesp.optimization.objectives.context import EvaluationContext
 from viberesp.optimization.objectives.response_metrics import objective_f3
 from viberesp.enclosure.sealed_box import calculate_sealed_box_system_parameters
 
@@ -25,7 +27,8 @@ def constraint_f3_limit(
     design_vector: np.ndarray,
     driver: ThieleSmallParameters,
     enclosure_type: str,
-    max_f3: float = 100.0
+    max_f3: float = 100.0,
+    context: Optional[EvaluationContext] = None
 ) -> float:
     """
     Constrain F3 to be below specified limit.
@@ -40,6 +43,8 @@ def constraint_f3_limit(
         driver: ThieleSmallParameters instance
         enclosure_type: Type of enclosure ("sealed", "ported")
         max_f3: Maximum allowed F3 in Hz (default 100 Hz)
+        context: Optional EvaluationContext for this design (F3 reuses the
+            response already simulated for the objectives)
 
     Returns:
         Constraint violation (positive if F3 > max_f3)
@@ -54,7 +59,7 @@ def constraint_f3_limit(
         >>> # If violation > 0, F3 is higher than 80 Hz (constraint failed)
     """
     try:
-        f3 = objective_f3(design_vector, driver, enclosure_type)
+        f3 = objective_f3(design_vector, driver, enclosure_type, context=context)
         return f3 - max_f3
     except Exception:
         return 1000.0  # Large violation if calculation fails
@@ -65,7 +70,8 @@ def constraint_f3_target(
     driver: ThieleSmallParameters,
     enclosure_type: str,
     target_f3: float = 60.0,
-    tolerance: float = 5.0
+    tolerance: float = 5.0,
+    context: Optional[EvaluationContext] = None
 ) -> float:
     """
     Constrain F3 to be close to target value.
@@ -81,6 +87,7 @@ def constraint_f3_target(
         enclosure_type: Type of enclosure
         target_f3: Target F3 in Hz (default 60 Hz)
         tolerance: Allowed deviation from target in Hz (default 5 Hz)
+        context: Optional EvaluationContext for this design (shared response)
 
     Returns:
         Maximum constraint violation (positive if outside tolerance range)
@@ -96,7 +103,7 @@ def constraint_f3_target(
         >>> # If |violation| <= 0, F3 is in [65, 75] Hz range
     """
     try:
-        f3 = objective_f3(design_vector, driver, enclosure_type)
+        f3 = objective_f3(design_vector, driver, enclosure_type, context=context)
 
         # Two-sided constraint: target - tolerance <= F3 <= target + tolerance
         violation_low = (target_f3 - tolerance) - f3  # Positive if F3 too low
@@ -157,8 +164,8 @@ def constraint_qtc_range(
         params = calculate_sealed_box_system_parameters(driver, Vb)
 
         # Return maximum violation (positive if outside range)
-        violation_low = qtc_min - params.Qtc
-        violation_high = params.Qtc - qtc_max
+        violation_low = qtc_min - params.Qtc_total
+        violation_high = params.Qtc_total - qtc_max
 
         return max(violation_low, violation_high, 0.0)
 
@@ -19,13 +19,16 @@ from typing import Optional
 from viberesp.driver.parameters import ThieleSmallParameters
 from viberesp.enclosure.sealed_box import calculate_sealed_box_system_parameters
 from viberesp.enclosure.ported_box import calculate_ported_box_system_parameters
+from viberesp.optimization.objectives.context import EvaluationContext
 
 
 def constraint_max_displacement(
     design_vector: np.ndarray,
     driver: ThieleSmallParameters,
     enclosure_type: str,
-    max_excursion_ratio: float = 0.8
+    max_excursion_ratio: float = 0.8,
+    frequencies: Optional[np.ndarray] = None,
+    context: Optional[EvaluationContext] = None
 ) -> float:
     """
     Constrain maximum diaphragm displacement to prevent X_max violation.
@@ -43,6 +46,11 @@ def constraint_max_displacement(
         driver: ThieleSmallParameters instance (must have X_max)
         enclosure_type: Type of enclosure ("sealed", "ported")
         max_excursion_ratio: Maximum fraction of X_max to allow (default 0.8)
+        frequencies: Frequencies (Hz) to search for the peak excursion. If
+            None, the worst-case frequency is used (Fc for sealed, Fb/2 for
+            ported).
+        context: Optional EvaluationContext for this design (shared
+            electrical response)
 
     Returns:
         Constraint violation (positive = violation, negative = satisfied)
@@ -63,58 +71,30 @@ def constraint_max_displacement(
     # Find worst-case displacement frequency
     # For sealed: displacement maximum at Fc
     # For ported: displacement maximum below tuning
+    # Rated input 2.83V (1W into 8Ω); displacement = velocity / (2πf)
 
     try:
         if enclosure_type == "sealed":
-            Vb = design_vector[0]
-            params = calculate_sealed_box_system_parameters(driver, Vb)
-
-            # At Fc, displacement is maximum for a given voltage
-            # Calculate displacement at Fc for rated power (2.83V = 1W into 8Ω)
-            from viberesp.optimization.objectives.response_metrics import sealed_box_electrical_impedance
-
-            result = sealed_box_electrical_impedance(
-                params.Fc, driver, Vb=Vb, voltage=2.83
-            )
-
-            # Diaphragm velocity from result
-            v_diaphragm = result['diaphragm_velocity']
-
-            # Displacement = velocity / (2πf)
-            x_diaphragm = v_diaphragm / (2.0 * np.pi * params.Fc)
+            if frequencies is None:
+                Vb = design_vector[0]
+                frequencies = [calculate_sealed_box_system_parameters(driver, Vb).Fc]
 
         elif enclosure_type == "ported":
-            Vb = design_vector[0]
-            Fb = design_vector[1]
-
             # Below Fb, displacement increases
             # Worst case at Fb/2 approximately
-            f_worst = Fb / 2.0
-
-            from viberesp.optimization.objectives.response_metrics import ported_box_electrical_impedance
-            from viberesp.enclosure.ported_box import calculate_optimal_port_dimensions
-
-            # Get port dimensions
-            if len(design_vector) >= 4:
-                port_area = design_vector[2]
-                port_length = design_vector[3]
-            else:
-                port_area, port_length, _ = calculate_optimal_port_dimensions(
-                    driver, Vb, Fb
-                )
-
-            result = ported_box_electrical_impedance(
-                f_worst, driver, Vb=Vb, Fb=Fb,
-                port_area=port_area, port_length=port_length,
-                voltage=2.83
-            )
-
-            v_diaphragm = result['diaphragm_velocity']
-            x_diaphragm = v_diaphragm / (2.0 * np.pi * f_worst)
+            if frequencies is None:
+                Fb = design_vector[1]
+                frequencies = [Fb / 2.0]
 
         else:
             return 0.0  # No constraint for other types (yet)
 
+        if context is None:
+            context = EvaluationContext(design_vector, driver, enclosure_type)
+        result = context.electrical_response(frequencies, voltage=2.83)
+
+        x_diaphragm = np.max(result['diaphragm_displacement'])
+
         # Constraint: x_diaphragm ≤ max_excursion_ratio × X_max
         # Return violation (positive if violated)
         x_limit = max_excursion_ratio * driver.X_max
@@ -205,7 +185,8 @@ def constraint_multisegment_continuity(
     Ensures throat < middle < mouth (for 2 segments) to prevent
     area discontinuities that would cause reflections.
 
-    Works with both standard and hyperbolic design vectors (auto-detects).
+    Works with standard, hyperbolic and mixed-profile design vectors (the
+    areas always come first).
 
     Literature:
         - Olson (1947), Chapter 8 - Horn area continuity
@@ -216,7 +197,7 @@ def constraint_multisegment_continuity(
             Standard: [throat_area, middle_area, mouth_area, length1, length2, V_tc, V_rc]
             Hyperbolic: [throat_area, middle_area, mouth_area, length1, length2, T1, T2, V_tc, V_rc]
         driver: ThieleSmallParameters instance (not used for this constraint)
-        enclosure_type: Must be "multisegment_horn"
+        enclosure_type: "multisegment_horn" or "mixed_profile_horn"
         num_segments: Number of segments (2 or 3)
 
     Returns:
@@ -227,7 +208,7 @@ def constraint_multisegment_continuity(
         >>> constraint_multisegment_continuity(design, driver, "multisegment_horn", num_segments=2)
         -0.004  # Satisfied (0.001 < 0.005 < 0.01)
     """
-    if enclosure_type != "multisegment_horn":
+    if enclosure_type not in ("multisegment_horn", "mixed_profile_horn"):
         return 0.0  # Not applicable for other enclosure types
 
     # Extract areas (first 3 or 4 elements are always areas)
@@ -0,0 +1,495 @@
+"""
+Population-vectorized constraint functions.
+
+Every constraint in constraints.physical and constraints.performance takes a
+single design vector, so an optimization problem calls n_designs ×
+n_constraints Python functions per generation. Most constraints are
+closed-form in the design vector (and the driver's T/S parameters), so the
+whole population can be checked with a few array expressions instead. The
+functions here take the full design matrix X (n_designs × n_var) and return
+one constraint column, reproducing the per-design functions exactly,
+including their fallback values for invalid designs:
+
+    per-design function                        batch version
+    constraint_multisegment_continuity         multisegment_continuity
+    constraint_multisegment_flare_limits       multisegment_flare_limits
+    constraint_multisegment_flare_curvature    multisegment_flare_curvature
+    constraint_minimum_expansion               minimum_expansion
+    constraint_conical_expansion_ratio         conical_expansion_ratio
+    constraint_conical_monotonic_expansion     conical_monotonic_expansion
+    constraint_exponential_monotonic_expansion exponential_monotonic_expansion
+    constraint_horn_throat_sizing              horn_throat_sizing
+    constraint_mouth_loading                   mouth_loading
+    constraint_port_velocity                   port_velocity
+    constraint_qtc_range                       qtc_range
+    constraint_volume_limit                    volume_limit
+    constraint_horn_cutoff_frequency           horn_cutoff_frequency
+    constraint_mouth_size                      mouth_size
+    constraint_flare_constant_limits           flare_constant_limits
+
+Constraints that need the acoustic response (excursion, F3) remain
+per-design. Optimization problems evaluate the per-design constraints with
+the objectives, leaving the vectorized columns NaN, and fill those for the
+whole population afterwards (see fill_vectorized_constraints).
+
+Literature:
+    - Olson (1947), Chapters 5, 8 - Horn geometry, flare and mouth limits
+    - Beranek (1954), Chapter 5 - Horn throat design
+    - Small (1972) - Closed-box system parameters (Qtc)
+    - Thiele (1971), Part 1, Section 4 - Air velocity in the vent
+"""
+
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from viberesp.driver.parameters import ThieleSmallParameters
+from viberesp.optimization.constraints.performance import (
+    constraint_flare_constant_limits,
+    constraint_horn_cutoff_frequency,
+    constraint_mouth_size,
+    constraint_qtc_range,
+    constraint_volume_limit,
+)
+from viberesp.optimization.constraints.physical import (
+    constraint_conical_expansion_ratio,
+    constraint_conical_monotonic_expansion,
+    constraint_exponential_monotonic_expansion,
+    constraint_horn_throat_sizing,
+    constraint_minimum_expansion,
+    constraint_mouth_loading,
+    constraint_multisegment_continuity,
+    constraint_multisegment_flare_curvature,
+    constraint_multisegment_flare_limits,
+    constraint_port_velocity,
+)
+
+HORN_TYPES = ("exponential_horn", "multisegment_horn", "conical_horn", "mixed_profile_horn")
+
+
+def _segments(X: np.ndarray, num_segments: int) -> Tuple[list, list]:
+    """Area columns (throat to mouth) and segment length columns of a segmented horn."""
+    n_areas = num_segments + 1
+    areas = [X[:, k] for k in range(n_areas)]
+    lengths = [X[:, n_areas + k] for k in range(num_segments)]
+    return areas, lengths
+
+
+def _max_present(violations: list, present: list) -> np.ndarray:
+    """Row-wise ``max()`` of the violations present per row (0.0 where none are)."""
+    result = np.zeros_like(violations[0])
+    found = np.zeros(len(result), dtype=bool)
+    for violation, mask in zip(violations, present):
+        # As max(): the first present value, replaced by any larger one
+        result = np.where(mask & (~found | (violation > result)), violation, result)
+        found |= mask
+    return np.where(found, result, 0.0)
+
+
+def _builtin_max(*values) -> np.ndarray:
+    """Row-wise ``max(*values)`` with Python's NaN semantics (a later NaN never wins)."""
+    result = values[0]
+    for value in values[1:]:
+        result = np.where(value > result, value, result)
+    return result
+
+
+def _flare(a_in: np.ndarray, a_out: np.ndarray, length: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Flare constant per row and where it is defined (expanding segment of positive length)."""
+    valid = (length > 0) & (a_out > a_in)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        m = np.log(a_out / a_in) / length
+    return m, valid
+
+
+def _cutoff_frequency(X: np.ndarray) -> np.ndarray:
+    """Batch calculate_horn_cutoff_frequency of [throat_area, mouth_area, length, ...] rows."""
+    from viberesp.simulation.constants import SPEED_OF_SOUND
+
+    throat_area, mouth_area, length = X[:, 0], X[:, 1], X[:, 2]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        m_olson = np.log(mouth_area / throat_area) / length
+    fc = (SPEED_OF_SOUND * (m_olson / 2.0)) / (2 * np.pi)
+    return np.where(length <= 0, np.inf, fc)
+
+
+def enclosure_volume(X: np.ndarray, enclosure_type: str) -> np.ndarray:
+    """
+    Batch objective_enclosure_volume (m³ per row).
+
+    Raises:
+        ValueError: For unsupported enclosure types
+        IndexError: If X has fewer columns than the enclosure type needs
+    """
+    n_var = X.shape[1]
+
+    def column(k):
+        return X[:, k] if n_var > k else 0.0
+
+    if enclosure_type == "sealed":
+        return X[:, 0]
+
+    if enclosure_type == "ported":
+        if n_var >= 4:
+            return X[:, 0] + X[:, 2] * X[:, 3] * 1.2
+        return X[:, 0]
+
+    if enclosure_type == "exponential_horn":
+        throat_area, mouth_area, length = X[:, 0], X[:, 1], X[:, 2]
+        conical = (throat_area + mouth_area) / 2 * length
+        with np.errstate(divide="ignore", invalid="ignore"):
+            flare_constant = np.log(mouth_area / throat_area) / length
+            v_horn = (mouth_area - throat_area) / flare_constant
+        v_horn = np.where((mouth_area <= throat_area) | (flare_constant <= 0), conical, v_horn)
+        return v_horn + column(3)
+
+    if enclosure_type in ("multisegment_horn", "mixed_profile_horn"):
+        S_t, S_m, S_mouth, L1, L2 = (X[:, k] for k in range(5))
+        with np.errstate(invalid="ignore"):
+            V1 = (L1 / 3) * (S_t + S_m + np.sqrt(S_t * S_m))
+            V2 = (L2 / 3) * (S_m + S_mouth + np.sqrt(S_m * S_mouth))
+        return V1 + V2 + column(5) + column(6)
+
+    if enclosure_type == "conical_horn":
+        S_t, S_m, L = X[:, 0], X[:, 1], X[:, 2]
+        with np.errstate(invalid="ignore"):
+            V_horn = (L / 3) * (S_t + S_m + np.sqrt(S_t * S_m))
+        return V_horn + column(3) + column(4)
+
+    raise ValueError(f"Unsupported enclosure type: {enclosure_type}")
+
+
+def multisegment_continuity(
+    X: np.ndarray, driver: ThieleSmallParameters, enclosure_type: str, num_segments: int = 2
+) -> np.ndarray:
+    """Batch constraint_multisegment_continuity."""
+    if enclosure_type not in ("multisegment_horn", "mixed_profile_horn") or num_segments not in (2, 3):
+        return np.zeros(len(X))
+    areas = [X[:, k] for k in range(num_segments + 1)]
+    return np.max([areas[k] - areas[k + 1] for k in range(num_segments)], axis=0)
+
+
+def multisegment_flare_limits(
+    X: np.ndarray,
+    driver: ThieleSmallParameters,
+    enclosure_type: str,
+    num_segments: int = 2,
+    min_mL: float = 0.5,
+    max_mL: float = 6.0,
+) -> np.ndarray:
+    """Batch constraint_multisegment_flare_limits."""
+    if enclosure_type != "multisegment_horn" or num_segments not in (2, 3):
+        return np.zeros(len(X))
+    areas, lengths = _segments(X, num_segments)
+
+    violations, present = [], []
+    for k in range(num_segments):
+        m, valid = _flare(areas[k], areas[k + 1], lengths[k])
+        with np.errstate(invalid="ignore"):
+            mL = m * lengths[k]
+        violations += [min_mL - mL, mL - max_mL]
+        present += [valid, valid]
+    return _max_present(violations, present)
+
+
+def multisegment_flare_curvature(
+    X: np.ndarray,
+    driver: ThieleSmallParameters,
+    enclosure_type: str,
+    num_segments: int = 2,
+    max_flare_increase: float = 0.1,
+) -> np.ndarray:
+    """Batch constraint_multisegment_flare_curvature."""
+    if enclosure_type != "multisegment_horn" or num_segments not in (2, 3):
+        return np.zeros(len(X))
+    areas, lengths = _segments(X, num_segments)
+
+    flares = [_flare(areas[k], areas[k + 1], lengths[k]) for k in range(num_segments)]
+    all_valid = np.all([valid for _, valid in flares], axis=0)
+    violation = np.max(
+        [flares[k + 1][0] - flares[k][0] - max_flare_increase for k in range(num_segments - 1)],
+        axis=0,
+    )
+    return np.where(all_valid, violation, 0.0)
+
+
+def minimum_expansion(
+    X: np.ndarray,
+    driver: ThieleSmallParameters,
+    enclosure_type: str,
+    num_segments: int = 2,
+    min_expansion_ratio: float = 1.1,
+) -> np.ndarray:
+    """Batch constraint_minimum_expansion."""
+    if enclosure_type != "multisegment_horn" or num_segments not in (2, 3):
+        return np.zeros(len(X))
+    areas = [X[:, k] for k in range(num_segments + 1)]
+
+    violations, present = [], []
+    for k in range(num_segments):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            violations.append(min_expansion_ratio - areas[k + 1] / areas[k])
+        present.append(areas[k] > 0)
+    return _max_present(violations, present)
+
+
+def conical_expansion_ratio(
+    X: np.ndarray,
+    driver: ThieleSmallParameters,
+    enclosure_type: str,
+    min_ratio: float = 2.0,
+    max_ratio: float = 100.0,
+) -> np.ndarray:
+    """Batch constraint_conical_expansion_ratio."""
+    if enclosure_type != "conical_horn":
+        return np.zeros(len(X))
+    throat_area, mouth_area = X[:, 0], X[:, 1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = mouth_area / throat_area
+    return np.where(
+        throat_area <= 0, 1000.0, np.maximum(min_ratio - ratio, ratio - max_ratio)
+    )
+
+
+def conical_monotonic_expansion(
+    X: np.ndarray, driver: ThieleSmallParameters, enclosure_type: str
+) -> np.ndarray:
+    """Batch constraint_conical_monotonic_expansion."""
+    if enclosure_type != "conical_horn":
+        return np.zeros(len(X))
+    return X[:, 0] - X[:, 1]
+
+
+def exponential_monotonic_expansion(
+    X: np.ndarray, driver: ThieleSmallParameters, enclosure_type: str
+) -> np.ndarray:
+    """Batch constraint_exponential_monotonic_expansion."""
+    if enclosure_type != "exponential_horn":
+        return np.zeros(len(X))
+    return X[:, 0] - X[:, 1]
+
+
+def horn_throat_sizing(
+    X: np.ndarray,
+    driver: ThieleSmallParameters,
+    enclosure_type: str,
+    min_compression_ratio: float = 0.5,
+    max_compression_ratio: float = 2.0,
+) -> np.ndarray:
+    """Batch constraint_horn_throat_sizing."""
+    if enclosure_type not in HORN_TYPES:
+        return np.zeros(len(X))
+    throat_area = X[:, 0]
+    min_throat = driver.S_d * min_compression_ratio
+    max_throat = driver.S_d * 1.0
+    return np.maximum(np.maximum(min_throat - throat_area, throat_area - max_throat), 0.0)
+
+
+def mouth_loading(
+    X: np.ndarray,
+    driver: ThieleSmallParameters,
+    enclosure_type: str,
+    min_circumference_ratio: float = 0.7,
+) -> np.ndarray:
+    """Batch constraint_mouth_loading."""
+    from viberesp.simulation.constants import SPEED_OF_SOUND
+
+    mouth_column = {"multisegment_horn": 2, "exponential_horn": 1, "conical_horn": 1}
+    if enclosure_type not in mouth_column:
+        return np.zeros(len(X))
+
+    mouth_circumference = 2 * np.sqrt(np.pi * X[:, mouth_column[enclosure_type]])
+    wavelength = SPEED_OF_SOUND / driver.F_s
+    return min_circumference_ratio * wavelength - mouth_circumference
+
+
+def port_velocity(
+    X: np.ndarray,
+    driver: ThieleSmallParameters,
+    enclosure_type: str,
+    max_velocity_fraction: float = 0.05,
+) -> np.ndarray:
+    """Batch constraint_port_velocity."""
+    from viberesp.simulation.constants import SPEED_OF_SOUND
+
+    if enclosure_type != "ported" or driver.X_max is None or X.shape[1] < 3:
+        return np.zeros(len(X))
+    Fb, port_area = X[:, 1], X[:, 2]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        v_port_max = (2.0 * np.pi * Fb * driver.X_max * driver.S_d) / port_area
+    return v_port_max / SPEED_OF_SOUND - max_velocity_fraction
+
+
+def qtc_range(
+    X: np.ndarray,
+    driver: ThieleSmallParameters,
+    enclosure_type: str,
+    qtc_min: float = 0.5,
+    qtc_max: float = 1.2,
+) -> np.ndarray:
+    """Batch constraint_qtc_range."""
+    from viberesp.enclosure.sealed_box import calculate_sealed_box_system_parameters_array
+
+    if enclosure_type != "sealed":
+        return np.zeros(len(X))
+    Vb = X[:, 0]
+    valid = ~(Vb <= 0)
+    Qtc = calculate_sealed_box_system_parameters_array(driver, np.where(valid, Vb, 1.0)).Qtc_total
+    return np.where(valid, _builtin_max(qtc_min - Qtc, Qtc - qtc_max, 0.0), 1000.0)
+
+
+def volume_limit(
+    X: np.ndarray,
+    driver: ThieleSmallParameters,
+    enclosure_type: str,
+    max_volume_liters: float = 50.0,
+) -> np.ndarray:
+    """Batch constraint_volume_limit."""
+    try:
+        volume_liters = enclosure_volume(X, enclosure_type) * 1000.0
+    except (ValueError, IndexError):
+        return np.full(len(X), 1000.0)
+    return volume_liters - max_volume_liters
+
+
+def horn_cutoff_frequency(
+    X: np.ndarray,
+    driver: ThieleSmallParameters,
+    enclosure_type: str,
+    target_fc: float = 60.0,
+    tolerance: float = 10.0,
+) -> np.ndarray:
+    """Batch constraint_horn_cutoff_frequency."""
+    if enclosure_type != "exponential_horn":
+        return np.zeros(len(X))
+    fc = _cutoff_frequency(X)
+    return _builtin_max((target_fc - tolerance) - fc, fc - (target_fc + tolerance), 0.0)
+
+
+def mouth_size(
+    X: np.ndarray,
+    driver: ThieleSmallParameters,
+    enclosure_type: str,
+    min_mouth_radius_wavelengths: float = 0.5,
+) -> np.ndarray:
+    """Batch constraint_mouth_size."""
+    from viberesp.simulation.constants import SPEED_OF_SOUND
+
+    if enclosure_type != "exponential_horn":
+        return np.zeros(len(X))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        wavelength_cutoff = SPEED_OF_SOUND / _cutoff_frequency(X)
+        mouth_radius = np.sqrt(X[:, 1] / np.pi)
+    min_radius = min_mouth_radius_wavelengths * wavelength_cutoff / 2
+    return _builtin_max(min_radius - mouth_radius, 0.0)
+
+
+def flare_constant_limits(
+    X: np.ndarray,
+    driver: ThieleSmallParameters,
+    enclosure_type: str,
+    min_m_length: float = 0.5,
+    max_m_length: float = 3.0,
+) -> np.ndarray:
+    """Batch constraint_flare_constant_limits."""
+    if enclosure_type != "exponential_horn":
+        return np.zeros(len(X))
+    throat_area, mouth_area, length = X[:, 0], X[:, 1], X[:, 2]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        m_times_L = (np.log(mouth_area / throat_area) / length) * length
+    return _builtin_max(min_m_length - m_times_L, m_times_L - max_m_length, 0.0)
+
+
+# Per-design constraint -> batch version
+VECTORIZED_CONSTRAINTS: Dict[Callable, Callable] = {
+    constraint_multisegment_continuity: multisegment_continuity,
+    constraint_multisegment_flare_limits: multisegment_flare_limits,
+    constraint_multisegment_flare_curvature: multisegment_flare_curvature,
+    constraint_minimum_expansion: minimum_expansion,
+    constraint_conical_expansion_ratio: conical_expansion_ratio,
+    constraint_conical_monotonic_expansion: conical_monotonic_expansion,
+    constraint_exponential_monotonic_expansion: exponential_monotonic_expansion,
+    constraint_horn_throat_sizing: horn_throat_sizing,
+    constraint_mouth_loading: mouth_loading,
+    constraint_port_velocity: port_velocity,
+    constraint_qtc_range: qtc_range,
+    constraint_volume_limit: volume_limit,
+    constraint_horn_cutoff_frequency: horn_cutoff_frequency,
+    constraint_mouth_size: mouth_size,
+    constraint_flare_constant_limits: flare_constant_limits,
+}
+
+
+def vectorized_constraint(
+    func: Callable, registry: Optional[Dict[Callable, Callable]] = None
+) -> Optional[Callable]:
+    """
+    Batch version of a per-design constraint, if it has one.
+
+    Args:
+        func: Constraint function, or a functools.partial binding its
+            keyword arguments (as OptimizationScriptFactory builds them)
+        registry: Per-design -> batch mapping to look the constraint up in
+            (default: VECTORIZED_CONSTRAINTS)
+
+    Returns:
+        Function (X, driver, enclosure_type, **kwargs) -> violations per
+        row, with the partial's keywords bound; None for constraints
+        without a batch version
+
+    Examples:
+        >>> batch = vectorized_constraint(partial(constraint_volume_limit, max_volume_liters=30))
+        >>> batch(np.array([[0.020], [0.040]]), driver, "sealed")
+        array([-10.,  10.])
+        >>> vectorized_constraint(constraint_max_displacement) is None
+        True
+    """
+    registry = VECTORIZED_CONSTRAINTS if registry is None else registry
+    if isinstance(func, partial):
+        batch = registry.get(func.func)
+        if batch is None or func.args:
+            return None
+        return partial(batch, **func.keywords)
+    try:
+        return registry.get(func)
+    except TypeError:  # Unhashable callable
+        return None
+
+
+def fill_vectorized_constraints(
+    X: np.ndarray,
+    G: np.ndarray,
+    columns: List[Tuple[int, Callable]],
+    driver: ThieleSmallParameters,
+    enclosure_type: str,
+    failure_value: float = 1000.0,
+) -> np.ndarray:
+    """
+    Fill the vectorized constraint columns of a population's G matrix.
+
+    The per-design evaluation leaves the vectorized columns NaN; each is
+    computed here for all of those rows in one batch call. Entries that are
+    not NaN (penalized or screened designs) are kept.
+
+    Args:
+        X: Design matrix (n_designs × n_var)
+        G: Constraint matrix (n_designs × n_constr), modified in place
+        columns: (column, batch function) pairs of the vectorized constraints
+        driver: Driver parameters
+        enclosure_type: Enclosure type
+        failure_value: Violation assigned if a batch function raises (as the
+            per-design path does for a failing constraint)
+
+    Returns:
+        G with the vectorized columns filled
+    """
+    for j, batch in columns:
+        missing = np.isnan(G[:, j])
+        if not np.any(missing):
+            continue
+        try:
+            G[missing, j] = batch(X[missing], driver, enclosure_type)
+        except Exception:
+            G[missing, j] = failure_value
+    return G
@@ -13,6 +13,9 @@ Literature:
 
 import os
 import json
+import warnings
+from functools import partial
+
 import numpy as np
 from typing import Dict, Any, List, Optional, Callable, Tuple
 from dataclasses import dataclass, field
@@ -24,7 +27,6 @@ from pymoo.operators.sampling.lhs import LHS
 from pymoo.operators.sampling.rnd import FloatRandomSampling
 from pymoo.operators.crossover.sbx import SBX
 from pymoo.operators.mutation.pm import PM
-from pymoo.optimize import minimize
 from pymoo.core.problem import Problem
 from pymoo.util.ref_dirs import get_reference_directions
 
@@ -32,6 +34,239 @@ from viberesp.driver import load_driver
 from viberesp.driver.parameters import ThieleSmallParameters
 from viberesp.optimization.config import OptimizationConfig, AlgorithmConfig
 from viberesp.optimization.api.result_structures import OptimizationResult
+from viberesp.optimization.objectives.composite import EnclosureEvaluationMixin
+from viberesp.optimization.objectives.context import EvaluationContext
+from viberesp.optimization.objectives.vectorized import (
+    F3_PENALTY,
+    evaluate_objectives_vectorized,
+    supports_vectorized,
+)
+from viberesp.optimization.optimizers.checkpoint import minimize_with_checkpoints
+from viberesp.optimization.optimizers.grid_search import (
+    MAX_GRID_DESIGNS,
+    grid_points_per_variable,
+    run_grid_search,
+)
+from viberesp.optimization.optimizers.polishing import polish_front
+from viberesp.optimization.optimizers.evaluation_cache import (
+    EvaluationCache,
+    callable_name,
+)
+from viberesp.optimization.optimizers.fidelity import (
+    FidelitySchedule,
+    fidelity_kwargs,
+    rescore_front,
+)
+from viberesp.optimization.optimizers.islands import run_islands
+from viberesp.optimization.optimizers.termination import build_termination
+from viberesp.optimization.optimizers.warm_start import SeededSampling, load_seed_designs
+from viberesp.optimization.results.archive import ParetoArchive
+
+
+# Factory objective names with a population-wide version (objectives.vectorized)
+VECTORIZED_OBJECTIVE_NAMES = {
+    "f3": "f3", "flatness": "flatness", "efficiency": "efficiency", "volume": "size",
+}
+
+# Band of the factory's flatness objective
+FLATNESS_RANGE = (20.0, 200.0)
+
+
+def _f3_deviation(X, driver, enclosure_type, target_f3: float, context=None, **kwargs) -> float:
+    """Calculate absolute deviation from target F3."""
+    from viberesp.optimization.objectives.response_metrics import objective_f3
+    f3_actual = objective_f3(X, driver, enclosure_type, context=context, **kwargs)
+    return abs(f3_actual - target_f3)
+
+
+class FactoryOptimizationProblem(EnclosureEvaluationMixin, Problem):
+    """
+    pymoo Problem built by OptimizationScriptFactory.
+
+    Defined at module level (rather than inside the factory) with picklable
+    objective/constraint callables so it can be shipped to worker processes
+    when ``OptimizationConfig.workers > 1``. Evaluation (cache, screening,
+    vectorized objectives and constraints, worker pool) is shared with
+    EnclosureOptimizationProblem through EnclosureEvaluationMixin; failed
+    designs are penalized with 1e6.
+
+    Attributes:
+        objective_funcs: List of (objective_name, objective_function) tuples
+        constraint_funcs: List of (constraint_name, constraint_function) tuples
+        driver: Driver parameters
+        enclosure_type: Type of enclosure
+        verbose: Whether to print warnings for failed designs
+        workers: Number of worker processes per generation (1 = serial)
+        evaluation_cache: Optional EvaluationCache re-using evaluations
+            of previous runs
+        n_frequency_points: Frequency grid size of the response objectives
+            (None = full grids; set by FidelitySchedule during a run)
+        screen_geometry: True if designs failing a geometric constraint
+            (continuity, flare limits, throat sizing) are penalized without
+            simulation (see constraints.geometric)
+        vectorize: True if the constraints with a batch version (continuity,
+            flare limits, throat sizing, volume) are evaluated population-wide
+            (see constraints.vectorized), and sealed/ported objectives too
+            when every objective has a vectorized version
+            (see objectives.vectorized)
+        vectorized: True if the objectives are evaluated population-wide
+    """
+
+    objective_penalty = 1e6
+    constraint_penalty = 1e6
+
+    def __init__(
+        self,
+        objective_funcs: List[Tuple[str, Callable]],
+        constraint_funcs: List[Tuple[str, Callable]],
+        driver: ThieleSmallParameters,
+        enclosure_type: str,
+        xl: np.ndarray,
+        xu: np.ndarray,
+        verbose: bool = True,
+        workers: int = 1,
+        evaluation_cache: Optional[EvaluationCache] = None,
+        screen_geometry: bool = True,
+        vectorize: bool = True,
+    ):
+        self.objective_funcs = objective_funcs
+        self.constraint_funcs = constraint_funcs
+        self.driver = driver
+        self.enclosure_type = enclosure_type
+        self.verbose = verbose
+        self._setup_evaluation(
+            objective_funcs,
+            [func for _, func in constraint_funcs],
+            dict(
+                objectives=[(name, callable_name(func)) for name, func in objective_funcs],
+                constraints=[(name, callable_name(func)) for name, func in constraint_funcs],
+            ),
+            workers=workers,
+            vectorize=vectorize,
+            evaluation_cache=evaluation_cache,
+            screen_geometry=screen_geometry,
+            flatness_range=FLATNESS_RANGE,
+        )
+
+        # Sealed/ported objectives evaluated for the whole population at once
+        names = [VECTORIZED_OBJECTIVE_NAMES.get(name) for name, _ in objective_funcs]
+        self._vectorized_objectives = (
+            names if vectorize and None not in names and supports_vectorized(enclosure_type, names)
+            else None
+        )
+        self.vectorized = self._vectorized_objectives is not None
+
+        super().__init__(
+            n_var=len(xl),
+            n_obj=len(objective_funcs),
+            n_constr=len(constraint_funcs),
+            xl=xl,
+            xu=xu,
+            exclude_from_serialization=["_population_evaluator", "evaluation_cache"],
+        )
+
+    def _evaluate_vectorized_objectives(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Sealed/ported objectives of the whole population in one array evaluation.
+
+        The constraints without a batch version are evaluated per design;
+        a design whose constraint raises is penalized as in
+        _evaluate_individual.
+        """
+        F = evaluate_objectives_vectorized(
+            X, self.driver, self.enclosure_type, self._vectorized_objectives,
+            target_band=FLATNESS_RANGE,
+        )
+        G = np.full((len(X), self.n_constr), np.nan)
+
+        # objective_f3 raises for designs it cannot size (F3_PENALTY here);
+        # the per-design path penalizes every value of those designs
+        failed = np.zeros(len(X), dtype=bool)
+        if "f3" in self._vectorized_objectives:
+            failed = F[:, self._vectorized_objectives.index("f3")] == F3_PENALTY
+        F[failed] = self.objective_penalty
+        G[failed] = self.constraint_penalty
+
+        columns = [j for j in range(self.n_constr) if j not in self._vectorized_columns]
+        for i in np.flatnonzero(~failed) if columns else ():
+            design = X[i]
+            context = EvaluationContext(design, self.driver, self.enclosure_type)
+            try:
+                for j in columns:
+                    _, constr_func = self.constraint_funcs[j]
+                    G[i, j] = constr_func(
+                        design,
+                        self.driver,
+                        self.enclosure_type,
+                        **({"context": context} if self._constraint_takes_context[j] else {}),
+                    )
+            except Exception as e:
+                if self.verbose:
+                    print(f"Warning: Design {i} failed: {e}")
+                F[i] = self.objective_penalty
+                G[i] = self.constraint_penalty
+        return F, G
+
+    def _evaluate_individual(
+        self,
+        i: int,
+        design: np.ndarray,
+        context: Optional[EvaluationContext] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Evaluate objectives and constraints of design ``i`` (sharing one EvaluationContext)."""
+        objectives = np.zeros(self.n_obj)
+        constraints = np.zeros(self.n_constr)
+        if context is None:
+            context = EvaluationContext(design, self.driver, self.enclosure_type)
+
+        try:
+            # Evaluate objectives - each may have different signature
+            for j, (obj_name, obj_func) in enumerate(self.objective_funcs):
+                grid_kwargs = fidelity_kwargs(obj_name, self.n_frequency_points)
+                if self._objective_takes_context[j]:
+                    grid_kwargs["context"] = context
+                # Call objective with appropriate arguments
+                if obj_name in ["flatness", "passband_flatness"]:
+                    obj_val = obj_func(
+                        design,
+                        self.driver,
+                        self.enclosure_type,
+                        frequency_range=FLATNESS_RANGE,
+                        n_points=grid_kwargs.get("n_points", 100),
+                        **({"context": context} if self._objective_takes_context[j] else {}),
+                    )
+                else:
+                    # For f3, volume, efficiency - use simpler signature
+                    obj_val = obj_func(
+                        design,
+                        self.driver,
+                        self.enclosure_type,
+                        **grid_kwargs,
+                    )
+                objectives[j] = obj_val
+
+            # Evaluate constraints (vectorized ones are left NaN and filled
+            # for the whole population in _evaluate_designs)
+            for j, (constr_name, constr_func) in enumerate(self.constraint_funcs):
+                if j in self._vectorized_columns:
+                    constraints[j] = np.nan
+                    continue
+                constr_val = constr_func(
+                    design,
+                    self.driver,
+                    self.enclosure_type,
+                    **({"context": context} if self._constraint_takes_context[j] else {}),
+                )
+                constraints[j] = constr_val
+
+        except Exception as e:
+            # Penalize invalid designs
+            if self.verbose:
+                print(f"Warning: Design {i} failed: {e}")
+            objectives[:] = self.objective_penalty
+            constraints[:] = self.constraint_penalty
+
+        return objectives, constraints
 
 
 class OptimizationScriptFactory:
@@ -77,15 +312,18 @@ class OptimizationScriptFactory:
         self.param_space = None
         self._problem = None
         self._algorithm = None
+        self._evaluation_cache = None
+        self._seed_designs = None
 
-    def _get_parameter_space(self):
-        """Get parameter space for enclosure type."""
+    def _get_parameter_space(self, preset: Optional[str] = None):
+        """Get parameter space for enclosure type (default: config preset)."""
+        preset = preset or self.config.parameter_space_preset
         if self.config.enclosure_type == "exponential_horn":
             from viberesp.optimization.parameters.exponential_horn_params import (
                 get_exponential_horn_parameter_space,
             )
             return get_exponential_horn_parameter_space(
-                self.driver, preset=self.config.parameter_space_preset
+                self.driver, preset=preset
             )
 
         elif self.config.enclosure_type == "multisegment_horn":
@@ -94,7 +332,7 @@ class OptimizationScriptFactory:
             )
             return get_multisegment_horn_parameter_space(
                 self.driver,
-                preset=self.config.parameter_space_preset,
+                preset=preset,
                 num_segments=2
             )
 
@@ -104,7 +342,7 @@ class OptimizationScriptFactory:
             )
             return get_mixed_profile_parameter_space(
                 self.driver,
-                preset=self.config.parameter_space_preset,
+                preset=preset,
                 num_segments=2
             )
 
@@ -113,7 +351,7 @@ class OptimizationScriptFactory:
                 get_conical_horn_parameter_space,
             )
             return get_conical_horn_parameter_space(
-                self.driver, preset=self.config.parameter_space_preset
+                self.driver, preset=preset
             )
 
         elif self.config.enclosure_type == "sealed":
@@ -193,14 +431,7 @@ class OptimizationScriptFactory:
     def _create_f3_deviation_objective(self) -> Callable:
         """Create F3 deviation objective function from target in constraints."""
         target_f3 = self.config.constraints.get("f3_target", 40.0)
-
-        def f3_deviation(X, driver, enclosure_type, **kwargs):
-            """Calculate absolute deviation from target F3."""
-            from viberesp.optimization.objectives.response_metrics import objective_f3
-            f3_actual = objective_f3(X, driver, enclosure_type, **kwargs)
-            return abs(f3_actual - target_f3)
-
-        return f3_deviation
+        return partial(_f3_deviation, target_f3=target_f3)
 
     def _build_constraint_functions(self) -> List[Tuple[str, Callable]]:
         """
@@ -237,115 +468,88 @@ class OptimizationScriptFactory:
         # Performance constraints from config
         if "f3_max" in self.config.constraints:
             f3_limit = self.config.constraints["f3_max"]
-            # Create wrapper function with parameter
-            def f3_max_constraint(X, driver, enclosure_type):
-                return constraint_f3_limit(X, driver, enclosure_type, f3_max_hz=f3_limit)
-            constraints.append(("f3_max", f3_max_constraint))
+            # Bind parameter (partial stays picklable for worker processes)
+            constraints.append(("f3_max", partial(constraint_f3_limit, f3_max_hz=f3_limit)))
 
         if "max_volume" in self.config.constraints:
             volume_limit = self.config.constraints["max_volume"]
-            # Create wrapper function with parameter
-            def volume_limit_constraint(X, driver, enclosure_type):
-                return constraint_volume_limit(X, driver, enclosure_type, max_volume_liters=volume_limit)
-            constraints.append(("volume_limit", volume_limit_constraint))
+            # Bind parameter (partial stays picklable for worker processes)
+            constraints.append((
+                "volume_limit",
+                partial(constraint_volume_limit, max_volume_liters=volume_limit),
+            ))
 
         return constraints
 
-    def _create_problem(self) -> Problem:
+    def _create_problem(self, preset: Optional[str] = None) -> Problem:
         """
         Create pymoo Problem from configuration.
 
+        Args:
+            preset: Parameter space preset of an island (default:
+                    config.parameter_space_preset, which also sets
+                    self.param_space)
+
         Returns:
             Configured optimization problem
+
+        Raises:
+            ValueError: If an island preset has different design variables
         """
         # Get parameter space
-        param_space = self._get_parameter_space()
+        param_space = self._get_parameter_space(preset)
         param_space = self._apply_parameter_overrides(param_space)
-        self.param_space = param_space
+        if preset is None:
+            self.param_space = param_space
+        elif param_space.get_parameter_names() != self.param_space.get_parameter_names():
+            raise ValueError(
+                f"Island preset '{preset}' has different design variables than "
+                f"'{self.config.parameter_space_preset}'"
+            )
 
         # Get bounds
         xl, xu = param_space.get_bounds_array()
-        n_var = len(xl)
-
-        # Get objectives and constraints
-        objective_funcs = self._build_objective_functions()
-        constraint_funcs = self._build_constraint_functions()
-
-        n_obj = len(objective_funcs)
-        n_constr = len(constraint_funcs)
-
-        # Create problem class dynamically
-        class FactoryOptimizationProblem(Problem):
-            def __init__(self, factory):
-                self.factory = factory
-                self.objective_funcs = objective_funcs
-                self.constraint_funcs = constraint_funcs
-                self.driver = factory.driver
-                self.enclosure_type = factory.config.enclosure_type
-
-                super().__init__(
-                    n_var=n_var,
-                    n_obj=n_obj,
-                    n_constr=n_constr,
-                    xl=xl,
-                    xu=xu,
-                )
 
-            def _evaluate(self, X, out, *args, **kwargs):
-                """Evaluate designs."""
-                n_samples = X.shape[0]
-                objectives = np.zeros((n_samples, n_obj))
-                constraints = np.zeros((n_samples, n_constr))
-
-                for i in range(n_samples):
-                    design = X[i]
-
-                    try:
-                        # Evaluate objectives - each may have different signature
-                        for j, (obj_name, obj_func) in enumerate(self.objective_funcs):
-                            # Call objective with appropriate arguments
-                            if obj_name in ["flatness", "passband_flatness"]:
-                                obj_val = obj_func(
-                                    design,
-                                    self.driver,
-                                    self.enclosure_type,
-                                    frequency_range=(20.0, 200.0),
-                                    n_points=100,
-                                )
-                            else:
-                                # For f3, volume, efficiency - use simpler signature
-                                obj_val = obj_func(
-                                    design,
-                                    self.driver,
-                                    self.enclosure_type,
-                                )
-                            objectives[i, j] = obj_val
-
-                        # Evaluate constraints
-                        for j, (constr_name, constr_func) in enumerate(self.constraint_funcs):
-                            constr_val = constr_func(
-                                design,
-                                self.driver,
-                                self.enclosure_type,
-                            )
-                            constraints[i, j] = constr_val
-
-                    except Exception as e:
-                        # Penalize invalid designs
-                        if self.factory.config.verbose:
-                            print(f"Warning: Design {i} failed: {e}")
-                        objectives[i, :] = 1e6
-                        constraints[i, :] = 1e6
-
-                out["F"] = objectives
-                out["G"] = constraints
-
-        return FactoryOptimizationProblem(self)
+        return FactoryOptimizationProblem(
+            objective_funcs=self._build_objective_functions(),
+            constraint_funcs=self._build_constraint_functions(),
+            driver=self.driver,
+            enclosure_type=self.config.enclosure_type,
+            xl=xl,
+            xu=xu,
+            verbose=self.config.verbose,
+            workers=self.config.workers,
+            evaluation_cache=self._evaluation_cache,
+        )
+
+    def _grid_points(self) -> Optional[int]:
+        """
+        Grid points per variable of a grid search (config.algorithm.grid_points).
+
+        Grids larger than MAX_GRID_DESIGNS (e.g. 40 points over the four
+        ported variables) are clamped to the densest grid within it, with a
+        warning.
+        """
+        n_points = self.config.algorithm.grid_points
+        n_var = self._problem.n_var
+        if n_points is not None and n_points ** n_var > MAX_GRID_DESIGNS:
+            clamped = grid_points_per_variable(n_var, MAX_GRID_DESIGNS)
+            warnings.warn(
+                f"A grid of {n_points} points over {n_var} variables has "
+                f"{n_points ** n_var} designs (at most {MAX_GRID_DESIGNS}); "
+                f"using {clamped} points per variable"
+            )
+            n_points = clamped
+        return n_points
 
     def _create_algorithm(self) -> NSGA2:
         """
         Create optimization algorithm from config.
 
+        With config.seed_from, the initial population starts with the seed
+        designs (see warm_start.SeededSampling); the sampling method fills
+        the remaining slots. Call after _create_problem().
+
         Returns:
             Configured algorithm instance
         """
@@ -357,6 +561,17 @@ class OptimizationScriptFactory:
         else:
             sampling = FloatRandomSampling()
 
+        # Warm start from earlier designs (config.seed_from)
+        if self.config.seed_from is not None:
+            if self._seed_designs is None:
+                self._seed_designs = load_seed_designs(self.config.seed_from)
+            sampling = SeededSampling(
+                self._seed_designs,
+                self.param_space.get_parameter_names(),
+                sampling=sampling,
+                driver_name=self.config.driver_name,
+            )
+
         # Create algorithm based on type
         if algo_config.type == "nsga2":
             algorithm = NSGA2(
@@ -394,10 +609,46 @@ class OptimizationScriptFactory:
 
         return algorithm
 
-    def run(self) -> OptimizationResult:
+    def _run_islands(self):
+        """
+        Run config.islands NSGA-II populations with migration (see run_islands).
+
+        Island i uses seed ``config.algorithm.seed + i`` and preset
+        ``config.island_presets[i % len(island_presets)]``. Islands run in
+        their own processes and evaluate serially, without the evaluation
+        cache.
+
+        Returns:
+            pymoo Result with the merged front of all islands
+        """
+        presets = self.config.island_presets or [self.config.parameter_space_preset]
+        problems = []
+        for i in range(self.config.islands):
+            problem = self._create_problem(presets[i % len(presets)])
+            problem.workers = 1
+            problem.evaluation_cache = None
+            problems.append(problem)
+
+        n_generations = self.config.algorithm.n_generations
+        return run_islands(
+            problems,
+            [self._create_algorithm() for _ in problems],
+            n_generations,
+            migration_interval=self.config.migration_interval,
+            n_migrants=self.config.n_migrants,
+            seed=self.config.algorithm.seed,
+            callback=lambda gen: print("=", end="", flush=True) if self.config.verbose else None,
+        )
+
+    def run(self, resume: bool = False) -> OptimizationResult:
         """
         Execute optimization and return results.
 
+        Args:
+            resume: Continue from config.checkpoint_path if it exists (a new
+                    run is started otherwise). The resumed run produces the
+                    same designs as an uninterrupted run.
+
         Returns:
             OptimizationResult with Pareto front and best designs
 
@@ -414,37 +665,145 @@ class OptimizationScriptFactory:
                     print(f"  - {key}: {value}")
             print("=" * 80)
 
+        # Open the evaluation cache (config.cache_path)
+        if self.config.cache_path:
+            cache_path = os.path.expanduser(self.config.cache_path)
+            os.makedirs(os.path.dirname(os.path.abspath(cache_path)), exist_ok=True)
+            self._evaluation_cache = EvaluationCache(
+                cache_path, max_entries=self.config.cache_max_entries
+            )
+
         # Create problem
         if self.config.verbose:
             print("\n[1/4] Creating optimization problem...")
         self._problem = self._create_problem()
 
-        # Create algorithm
+        # Create algorithm (grid searches have none)
+        grid = self.config.algorithm.type == "grid"
         if self.config.verbose:
             print("[2/4] Configuring algorithm...")
-        self._algorithm = self._create_algorithm()
+        if not grid:
+            self._algorithm = self._create_algorithm()
 
         # Run optimization
         if self.config.verbose:
-            print(f"[3/4] Running optimization ({self.config.algorithm.n_generations} generations)...")
+            if grid:
+                print("[3/4] Running grid search...")
+            else:
+                print(f"[3/4] Running optimization ({self.config.algorithm.n_generations} generations)...")
+            if self.config.islands > 1:
+                print(f"  Islands: {self.config.islands} "
+                      f"(migration every {self.config.migration_interval} generations)")
+            if self._seed_designs is not None:
+                print(f"  Warm start: {len(self._seed_designs.designs)} seed designs")
             print("  Progress: [", end="", flush=True)
 
-        result = minimize(
-            self._problem,
-            self._algorithm,
-            termination=('n_gen', self.config.algorithm.n_generations),
-            verbose=False,
-            callback=lambda alg: print("=", end="", flush=True) if alg.n_gen % max(1, self.config.algorithm.n_generations // 20) == 0 and self.config.verbose else None
-        )
+        checkpoint_path = None
+        if self.config.checkpoint_path:
+            checkpoint_path = os.path.expanduser(self.config.checkpoint_path)
+            if self.config.verbose and resume and os.path.exists(checkpoint_path):
+                print(f"  Resuming from checkpoint: {checkpoint_path}")
+
+        # Coarse frequency grids in early generations (config.fidelity_schedule)
+        fidelity = None
+        if self.config.fidelity_schedule:
+            fidelity = FidelitySchedule(
+                self.config.fidelity_schedule, self.config.algorithm.n_generations
+            )
+
+        # Every non-dominated design of the run (config.archive)
+        archive = ParetoArchive(self.config.archive_size) if self.config.archive else None
+        n_generations = self.config.algorithm.n_generations
+
+        def callback(algorithm):
+            if self.config.verbose and algorithm.n_gen % max(1, n_generations // 20) == 0:
+                print("=", end="", flush=True)
+
+        grid_metadata = None
+        polishing = None
+        try:
+            if grid:
+                algo_config = self.config.algorithm
+                result, grid_metadata = run_grid_search(
+                    self._problem,
+                    n_points=self._grid_points(),
+                    max_evaluations=algo_config.grid_max_evaluations,
+                    refinements=algo_config.grid_refinements,
+                    max_front=algo_config.pop_size,
+                    verbose=False,
+                )
+            elif self.config.islands > 1:
+                result = self._run_islands()
+            else:
+                result = minimize_with_checkpoints(
+                    self._problem,
+                    self._algorithm,
+                    termination=build_termination(
+                        self.config.algorithm.n_generations,
+                        self.config.algorithm.hv_tolerance,
+                        self.config.algorithm.hv_patience,
+                    ),
+                    checkpoint_path=checkpoint_path,
+                    checkpoint_every=self.config.checkpoint_every,
+                    resume=resume,
+                    callback=callback,
+                    before_generation=fidelity.before_generation if fidelity else None,
+                    archive=archive,
+                    seed=self.config.algorithm.seed,
+                    verbose=False,
+                )
+            if fidelity is not None:
+                # Report full-fidelity objective values
+                rescore_front(result, self._problem)
+            if archive is not None:
+                archive.update_result(result)
+            if self.config.polish:
+                # Move the front designs onto the local Pareto front
+                polishing = polish_front(
+                    result, self._problem, max_iterations=self.config.polish_iterations
+                )
+        finally:
+            # Shut down the worker pool (config.workers > 1)
+            self._problem.close()
+            if self._evaluation_cache is not None:
+                cache_stats = self._evaluation_cache.stats()
+                self._evaluation_cache.close()
+                self._evaluation_cache = None
 
         if self.config.verbose:
-            print(f"] {self.config.algorithm.n_generations}/{self.config.algorithm.n_generations} generations")
+            if grid:
+                print(f"] {grid_metadata['n_evaluations']} designs evaluated")
+            else:
+                print(f"] {result.algorithm.n_gen - 1}/{self.config.algorithm.n_generations} generations")
 
         # Process results
         if self.config.verbose:
             print("[4/4] Processing results...")
 
         processed_result = self._process_results(result)
+        if self.config.cache_path:
+            processed_result.optimization_metadata["evaluation_cache"] = cache_stats
+        if fidelity is not None:
+            processed_result.optimization_metadata["fidelity_schedule"] = list(fidelity.stages)
+        if archive is not None:
+            processed_result.optimization_metadata["archive"] = archive.stats()
+        if polishing is not None:
+            processed_result.optimization_metadata["polishing"] = polishing
+        if grid:
+            processed_result.optimization_metadata.update({
+                key: grid_metadata[key]
+                for key in ("grid_points", "refinements", "n_evaluations")
+            })
+        if self.config.islands > 1:
+            processed_result.optimization_metadata.update({
+                "islands": self.config.islands,
+                "migration_interval": self.config.migration_interval,
+                "n_evaluations": sum(island.evaluator.n_eval for island in result.islands),
+            })
+        if self.config.seed_from is not None:
+            processed_result.optimization_metadata["seed_designs"] = (
+                result.algorithm.initialization.sampling.n_seeded
+            )
 
         # Save results if requested
         if self.config.save_results:
@@ -523,9 +882,17 @@ class OptimizationScriptFactory:
             "algorithm": self.config.algorithm.type,
             "pop_size": self.config.algorithm.pop_size,
             "n_generations": self.config.algorithm.n_generations,
+            "n_generations_run": (
+                pymoo_result.algorithm.n_gen - 1 if pymoo_result.algorithm is not None else 0
+            ),
+            "workers": self._problem.workers if self._problem is not None else self.config.workers,
             "driver": self.config.driver_name,
             "enclosure_type": self.config.enclosure_type,
             "objectives": self.config.objectives,
+            "parameter_bounds": {
+                name: [float(bound) for bound in bounds]
+                for name, bounds in self.param_space.get_bounds_dict().items()
+            },
             "timestamp": datetime.now().isoformat(),
         }
 
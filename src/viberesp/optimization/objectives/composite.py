@@ -16,13 +16,57 @@ The problem class supports:
 - Different enclosure types (sealed, ported)
 """
 
+import inspect
+from functools import partial
+
 import numpy as np
-from typing import List, Dict, Callable, Optional, Tuple
+from typing import Any, List, Dict, Callable, Optional, Tuple
 from dataclasses import dataclass
 
 from pymoo.core.problem import Problem
 
 from viberesp.driver.parameters import ThieleSmallParameters
+from viberesp.optimization.constraints.geometric import (
+    batch_constraint,
+    screen_population,
+)
+from viberesp.optimization.constraints.vectorized import (
+    fill_vectorized_constraints,
+    vectorized_constraint,
+)
+from viberesp.optimization.objectives.context import (
+    EvaluationContext,
+    f3_frequency_grid,
+    population_contexts,
+    shared_frequency_grid,
+)
+from viberesp.optimization.objectives.efficiency import efficiency_frequencies
+from viberesp.optimization.objectives.response_metrics import FLATNESS_FREQUENCY_RANGE
+from viberesp.optimization.objectives.vectorized import (
+    evaluate_objectives_vectorized,
+    supports_vectorized,
+)
+from viberesp.optimization.optimizers.evaluation_cache import (
+    EvaluationCache,
+    callable_name,
+    problem_signature,
+)
+from viberesp.optimization.optimizers.fidelity import (
+    fidelity_kwargs,
+    fidelity_signature,
+)
+from viberesp.optimization.optimizers.parallel import (
+    ParallelEvaluationMixin,
+    resolve_workers,
+)
+
+
+def _accepts_context(func: Callable) -> bool:
+    """True if an objective/constraint function takes a ``context`` argument."""
+    try:
+        return "context" in inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return False
 
 
 @dataclass
@@ -42,12 +86,236 @@ class ObjectiveConfig:
     weight: float = 1.0
 
 
-class EnclosureOptimizationProblem(Problem):
+class EnclosureEvaluationMixin(ParallelEvaluationMixin):
+    """
+    Population evaluation pipeline shared by the enclosure problems.
+
+    _evaluate() looks designs up in the ``evaluation_cache`` and evaluates
+    the rest either population-wide (``vectorized`` problems, see
+    _evaluate_vectorized_objectives) or by screening them on the geometric constraints
+    and simulating the remaining designs serially or in the worker pool
+    (see ParallelEvaluationMixin), with exponential horn populations
+    batch-simulated (see _population_contexts). The constraints with a
+    batch version are then filled for the whole population.
+
+    Subclasses set ``driver`` and ``enclosure_type``, call
+    _setup_evaluation() from ``__init__`` and implement
+    _evaluate_individual(); problems with vectorized objectives also
+    override _evaluate_vectorized_objectives(), which otherwise falls back
+    to per-design evaluation.
+
+    Attributes:
+        objective_penalty: Objective value of designs that fail (screened
+            designs and failed simulations)
+        constraint_penalty: Value of a constraint that cannot be evaluated
+    """
+
+    objective_penalty: float = 1e10
+    constraint_penalty: float = 1000.0
+    vectorized: bool = False
+
+    # Sent to the worker processes with every generation
+    _synced_attributes = ("n_frequency_points",)
+
+    def _setup_evaluation(
+        self,
+        objectives: List[Tuple[str, Callable]],
+        constraint_funcs: List[Callable],
+        signature: Dict[str, Any],
+        workers: int,
+        vectorize: bool,
+        evaluation_cache: Optional[EvaluationCache],
+        screen_geometry: bool,
+        num_segments: Optional[int] = None,
+        flatness_range: Tuple[float, float] = FLATNESS_FREQUENCY_RANGE,
+    ) -> None:
+        """
+        Set up workers, caching, screening and the vectorized constraints.
+
+        Args:
+            objectives: (name, function) pairs in objective order
+            constraint_funcs: Constraint functions in constraint order
+            signature: Problem configuration identifying cached evaluations
+                (see evaluation_cache.problem_signature)
+            workers: Worker processes per generation (0 = all CPU cores)
+            vectorize: Evaluate the constraints with a batch version
+                population-wide and batch-simulate exponential horns
+            evaluation_cache: Optional EvaluationCache
+            screen_geometry: Penalize designs failing a geometric constraint
+                without simulating them
+            num_segments: Passed to the batch versions of the multisegment
+                constraints (None = not a multisegment problem)
+            flatness_range: Band the flatness objective is evaluated over
+                (batch-simulated for exponential horns, see _batch_frequencies)
+        """
+        self.workers = resolve_workers(workers)
+        self._population_evaluator = None
+        self.evaluation_cache = evaluation_cache
+        self.n_frequency_points = None
+        self._objective_names = [name for name, _ in objectives]
+        self._flatness_range = flatness_range
+
+        # Constraints evaluated population-wide, and the geometric ones
+        # among them checked before simulating
+        self.screen_geometry = screen_geometry
+        self.vectorize = vectorize
+        self._vectorized_constraints = []
+        self._geometric_constraints = []
+        for j, constraint_func in enumerate(constraint_funcs):
+            batch = vectorized_constraint(constraint_func)
+            if batch is None:
+                continue
+            if num_segments is not None and 'multisegment' in getattr(constraint_func, '__name__', ''):
+                batch = partial(batch, num_segments=num_segments)
+            if vectorize:
+                self._vectorized_constraints.append((j, batch))
+            if screen_geometry and batch_constraint(constraint_func) is not None:
+                self._geometric_constraints.append((j, batch))
+        self._vectorized_columns = {j for j, _ in self._vectorized_constraints}
+
+        # Screened designs get penalty values instead of simulated ones
+        screened = (
+            {"screened_constraints": [j for j, _ in self._geometric_constraints]}
+            if self._geometric_constraints else {}
+        )
+        self.cache_signature = problem_signature(
+            self.driver, self.enclosure_type, **signature, **screened
+        )
+
+        # Which objectives/constraints accept a shared EvaluationContext
+        self._objective_takes_context = [_accepts_context(func) for _, func in objectives]
+        self._constraint_takes_context = [_accepts_context(func) for func in constraint_funcs]
+
+    def _evaluate(self, X, out, *args, **kwargs):
+        """
+        Evaluate objective functions for population X.
+
+        pymoo calls this method with design matrix X (n_individuals × n_variables).
+        Problems whose objectives all have a vectorized implementation (see
+        ``vectorized``) evaluate the whole population in one array
+        operation. Otherwise, with ``workers > 1`` the individuals are spread
+        across a process pool (see ParallelEvaluationMixin); results are
+        identical to serial evaluation and returned in population order.
+        Constraints with a batch version (see constraints.vectorized) are
+        evaluated for the whole population at once rather than per design.
+        With an ``evaluation_cache`` only designs not stored by earlier runs
+        are evaluated. With ``screen_geometry``, designs failing a geometric
+        constraint are not simulated (see _evaluate_screened). While
+        ``n_frequency_points`` is set (multi-fidelity runs, see
+        FidelitySchedule) the response objectives of per-design evaluations
+        use frequency grids of that size; the vectorized objectives and the
+        constraints always use their full grids.
+
+        Args:
+            X: Design matrix where each row is a design vector
+            out: Output dictionary to store results
+
+        Note:
+            Invalid designs (e.g., calculation failures) are heavily penalized
+            by assigning ``objective_penalty`` objective values.
+        """
+        if self.evaluation_cache is not None:
+            F, G = self.evaluation_cache.evaluate(
+                X, self._evaluate_designs,
+                fidelity_signature(self.cache_signature, self.n_frequency_points),
+                self.n_obj, self.n_constr,
+            )
+        else:
+            F, G = self._evaluate_designs(X)
+
+        out["F"], out["G"] = F, G
+
+    def _evaluate_designs(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Evaluate every row of X (vectorized, in the worker pool or serially)."""
+        if self.vectorized:
+            F, G = self._evaluate_vectorized_objectives(X)
+        else:
+            F, G = self._evaluate_screened(X)
+        return F, fill_vectorized_constraints(
+            X, G, self._vectorized_constraints, self.driver, self.enclosure_type,
+            failure_value=self.constraint_penalty,
+        )
+
+    def _evaluate_vectorized_objectives(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Objectives of the whole population in one array evaluation.
+
+        Returns F and G with the vectorized constraint columns left NaN.
+        Problems without a population-wide implementation evaluate their
+        designs individually (see _evaluate_screened).
+        """
+        return self._evaluate_screened(X)
+
+    def _evaluate_screened(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Simulate only the designs that satisfy every geometric constraint.
+
+        The geometric constraints are evaluated for the whole population at
+        once; failing designs get ``objective_penalty`` objective values (as
+        failed simulations), their geometric constraint values, the batch
+        values of the other vectorized constraints and 0 for the remaining
+        constraints (see constraints.geometric.screen_population).
+        """
+        if not self._geometric_constraints:
+            return self._evaluate_population(X)
+
+        G_geometric = np.column_stack([
+            batch(X, self.driver, self.enclosure_type) for _, batch in self._geometric_constraints
+        ])
+        return screen_population(
+            X, G_geometric, [j for j, _ in self._geometric_constraints],
+            self._evaluate_population, self.n_obj, self.n_constr,
+            penalty=self.objective_penalty,
+            vectorized_columns=self._vectorized_columns,
+        )
+
+    def _batch_frequencies(self) -> np.ndarray:
+        """
+        Union of the SPL grids the objectives read (see _population_contexts).
+
+        The horn F3 search grid, the flatness grid over ``flatness_range``
+        and the 1/3-octave efficiency band, at the current
+        ``n_frequency_points`` (multi-fidelity runs batch only the coarse
+        grids). Exponential horn flatness bands start at 1.5·Fc, inside
+        ``flatness_range`` for bass horns; samples outside the union are
+        simulated per design on demand.
+        """
+        n_points = self.n_frequency_points
+        grids = []
+        for name in self._objective_names:
+            if name in ("f3", "f3_deviation"):
+                grids.append(f3_frequency_grid(n_points))
+            elif name in ("flatness", "response_flatness", "composite_flatness"):
+                grids.append(shared_frequency_grid(*self._flatness_range, n_points or 100))
+            elif name == "efficiency":
+                grids.append(efficiency_frequencies())
+        return np.unique(np.concatenate(grids)) if grids else np.empty(0)
+
+    def _population_contexts(self, X: np.ndarray) -> Optional[List[EvaluationContext]]:
+        """
+        Batch-simulated contexts for evaluation of exponential horns.
+
+        With ``vectorize`` the SPL of a whole exponential horn population is
+        computed in one exponential_horn_batch_response() call over the
+        objectives' grids (see _batch_frequencies and
+        context.population_contexts); the objectives then read their grids
+        from the primed contexts instead of solving each horn.
+        """
+        if self.vectorize and self.enclosure_type == "exponential_horn":
+            return population_contexts(
+                X, self.driver, self.enclosure_type, frequencies=self._batch_frequencies()
+            )
+        return None
+
+
+class EnclosureOptimizationProblem(EnclosureEvaluationMixin, Problem):
     """
     Multi-objective enclosure optimization problem for pymoo.
 
     This class wraps viberesp's objective functions into a format that
-    pymoo's optimization algorithms can work with.
+    pymoo's optimization algorithms can work with. Each individual gets one
+    EvaluationContext, so objectives and constraints that accept a
+    ``context`` argument share a single simulation of the design.
 
     Literature:
         - Deb (2001) - Multi-Objective Optimization using Evolutionary Algorithms
@@ -64,6 +332,18 @@ class EnclosureOptimizationProblem(Problem):
         n_obj: Number of objectives
         n_constr: Number of constraints
         num_segments: Number of segments for multisegment_horn (2 or 3)
+        workers: Number of worker processes per generation (1 = serial)
+        vectorized: True if objectives are evaluated population-wide
+            (sealed/ported problems, see objectives.vectorized)
+        vectorize: True if the constraints with a batch version (see
+            constraints.vectorized) are evaluated population-wide, and
+            exponential horn responses batch-simulated (serial evaluation)
+        evaluation_cache: Optional EvaluationCache re-using evaluations
+            of previous runs
+        n_frequency_points: Frequency grid size of the response objectives
+            (None = full grids; set by FidelitySchedule during a run)
+        screen_geometry: True if designs failing a geometric constraint are
+            penalized without simulation (see constraints.geometric)
 
     Examples:
         >>> driver = load_driver("BC_8NDL51")
@@ -88,7 +368,11 @@ class EnclosureOptimizationProblem(Problem):
         constraints: List[str] = None,
         num_segments: int = 2,
         target_band: Tuple[float, float] = None,
-        hf_cutoff: float = None
+        hf_cutoff: float = None,
+        workers: int = 1,
+        vectorize: bool = True,
+        evaluation_cache: Optional[EvaluationCache] = None,
+        screen_geometry: bool = True
     ):
         """
         Initialize optimization problem.
@@ -106,6 +390,21 @@ class EnclosureOptimizationProblem(Problem):
             hf_cutoff: Optional HF cutoff frequency for passband_flatness objective (Hz).
                        If using passband_flatness, this defines the upper frequency bound
                        (e.g., 200 Hz for subwoofers, 500 Hz for bass horns).
+            workers: Number of worker processes used to evaluate each generation
+                     (default 1 = serial, 0 = all CPU cores). Call close() after
+                     the run to shut the pool down.
+            vectorize: Evaluate sealed/ported populations with the vectorized
+                       objectives when every objective supports it, and the
+                       closed-form constraints (continuity, flare limits,
+                       volume, Qtc, ...) of any enclosure population-wide;
+                       serially evaluated exponential horn populations are
+                       simulated in one batch (default True)
+            evaluation_cache: Optional EvaluationCache; designs already stored
+                              for this driver and configuration are not re-simulated
+            screen_geometry: Evaluate the geometric constraints (continuity,
+                             monotonic expansion, throat sizing, ...) for the
+                             whole population first and simulate only the
+                             designs that satisfy them (default True)
         """
         # Import objective functions
         from viberesp.optimization.objectives.response_metrics import (
@@ -191,6 +490,29 @@ class EnclosureOptimizationProblem(Problem):
         self.target_band = target_band
         self.hf_cutoff = hf_cutoff
 
+        self.vectorized = vectorize and supports_vectorized(enclosure_type, objectives)
+        self._setup_evaluation(
+            [(obj_config.name, obj_config.function) for obj_config in self.objective_configs],
+            self.constraint_funcs,
+            dict(
+                param_names=self.param_names,
+                objectives=list(objectives),
+                constraints=[callable_name(func) for func in self.constraint_funcs],
+                num_segments=num_segments,
+                target_band=target_band,
+                hf_cutoff=hf_cutoff,
+            ),
+            workers=workers,
+            vectorize=vectorize,
+            evaluation_cache=evaluation_cache,
+            screen_geometry=screen_geometry,
+            num_segments=(
+                num_segments
+                if enclosure_type in ["multisegment_horn", "mixed_profile_horn"] else None
+            ),
+            flatness_range=target_band or FLATNESS_FREQUENCY_RANGE,
+        )
+
         # Extract parameter bounds in order
         xl = np.array([parameter_bounds[p][0] for p in self.param_names])
         xu = np.array([parameter_bounds[p][1] for p in self.param_names])
@@ -218,150 +540,212 @@ class EnclosureOptimizationProblem(Problem):
             n_constr=n_constr,
             xl=xl,
             xu=xu,
-            vtype=vtype  # Mix of continuous (True) and integer (False)
+            vtype=vtype,  # Mix of continuous (True) and integer (False)
+            # The worker pool stays with this process when the problem is
+            # pickled to workers or deep-copied into the result history
+            exclude_from_serialization=["_population_evaluator", "evaluation_cache"],
         )
 
-    def _evaluate(self, X, out, *args, **kwargs):
+    def _evaluate_vectorized_objectives(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Sealed/ported objectives of the whole population in one array evaluation."""
+        F = evaluate_objectives_vectorized(
+            X, self.driver, self.enclosure_type,
+            [obj_config.name for obj_config in self.objective_configs],
+            target_band=self.target_band,
+        )
+        if len(self._vectorized_columns) < self.n_constr:
+            G = np.array([
+                self._evaluate_constraints(x, EvaluationContext(x, self.driver, self.enclosure_type))
+                for x in X
+            ]).reshape(X.shape[0], self.n_constr)
+        else:
+            G = np.full((X.shape[0], self.n_constr), np.nan)
+        return F, G
+
+    def _evaluate_individual(
+        self,
+        i: int,
+        x: np.ndarray,
+        context: Optional[EvaluationContext] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Evaluate objective functions for population X.
+        Evaluate the objectives and constraints of one individual.
 
-        pymoo calls this method with design matrix X (n_individuals × n_variables)
+        One EvaluationContext is created for the individual (unless given)
+        and passed to every objective/constraint whose signature accepts it.
 
         Args:
-            X: Design matrix where each row is a design vector
-            out: Output dictionary to store results
+            i: Index of the individual in the population (for warnings)
+            x: Design vector
+            context: Optional EvaluationContext of x (e.g. batch-primed by
+                _population_contexts)
 
-        Note:
-            Invalid designs (e.g., calculation failures) are heavily penalized
-            by assigning large objective values.
+        Returns:
+            Tuple (f_row, g_row) of objective and constraint values
         """
-        n_individuals = X.shape[0]
-
-        # Initialize objective matrix
-        F = np.zeros((n_individuals, self.n_obj))
-
         # Determine if we need to pass num_segments parameter
         # (for multisegment_horn and mixed_profile_horn objectives)
         needs_num_segments = self.enclosure_type in ["multisegment_horn", "mixed_profile_horn"]
 
-        # Evaluate each individual
-        for i in range(n_individuals):
-            design_vector = X[i].copy()
-
-            # For mixed_profile_horn, ensure profile_type parameters are integers
-            if self.enclosure_type == "mixed_profile_horn":
-                for param_idx, param_name in enumerate(self.param_names):
-                    if param_name.startswith("profile_type"):
-                        design_vector[param_idx] = int(np.round(design_vector[param_idx]))
-
-            # Evaluate each objective
-            for j, obj_config in enumerate(self.objective_configs):
-                try:
-                    # Check if this objective needs target_band parameter
-                    needs_target_band = (
-                        self.target_band is not None and
-                        obj_config.name in ["flatness", "response_flatness"]
-                    )
+        f_row = np.zeros(self.n_obj)
+        design_vector = x.copy()
 
-                    # Check if this objective needs hf_cutoff parameter
-                    needs_hf_cutoff = (
-                        self.hf_cutoff is not None and
-                        obj_config.name == "passband_flatness"
+        # For mixed_profile_horn, ensure profile_type parameters are integers
+        if self.enclosure_type == "mixed_profile_horn":
+            for param_idx, param_name in enumerate(self.param_names):
+                if param_name.startswith("profile_type"):
+                    design_vector[param_idx] = int(np.round(design_vector[param_idx]))
+
+        if context is None or not np.array_equal(context.design_vector, design_vector):
+            context = EvaluationContext(design_vector, self.driver, self.enclosure_type)
+
+        # Evaluate each objective
+        for j, obj_config in enumerate(self.objective_configs):
+            context_kwargs = {"context": context} if self._objective_takes_context[j] else {}
+            grid_kwargs = fidelity_kwargs(obj_config.name, self.n_frequency_points)
+            try:
+                # Check if this objective needs target_band parameter
+                needs_target_band = (
+                    self.target_band is not None and
+                    obj_config.name in ["flatness", "response_flatness"]
+                )
+
+                # Check if this objective needs hf_cutoff parameter
+                needs_hf_cutoff = (
+                    self.hf_cutoff is not None and
+                    obj_config.name == "passband_flatness"
+                )
+
+                # For passband_flatness, pass hf_cutoff and num_segments
+                if needs_hf_cutoff:
+                    obj_value = obj_config.function(
+                        design_vector,
+                        self.driver,
+                        self.enclosure_type,
+                        hf_cutoff=self.hf_cutoff,
+                        n_points=grid_kwargs.get("n_points", 100),
+                        voltage=2.83,
+                        num_segments=self.num_segments,
+                        **context_kwargs
                     )
-
-                    # For passband_flatness, pass hf_cutoff and num_segments
-                    if needs_hf_cutoff:
-                        obj_value = obj_config.function(
-                            design_vector,
-                            self.driver,
-                            self.enclosure_type,
-                            hf_cutoff=self.hf_cutoff,
-                            n_points=100,
-                            voltage=2.83,
-                            num_segments=self.num_segments
-                        )
-                    # For multisegment_horn objectives, pass num_segments
-                    elif needs_num_segments and obj_config.name in [
-                        "wavefront_sphericity", "impedance_smoothness",
-                        "response_flatness", "response_slope", "flatness", "slope"
-                    ]:
-                        # Pass both num_segments and target_band (if needed)
-                        if needs_target_band:
-                            obj_value = obj_config.function(
-                                design_vector,
-                                self.driver,
-                                self.enclosure_type,
-                                frequency_range=self.target_band,
-                                n_points=100,
-                                voltage=2.83,
-                                num_segments=self.num_segments,
-                                target_band=self.target_band
-                            )
-                        else:
-                            obj_value = obj_config.function(
-                                design_vector,
-                                self.driver,
-                                self.enclosure_type,
-                                num_segments=self.num_segments
-                            )
-                    elif needs_target_band:
-                        # Not multisegment, but needs target_band
+                # For multisegment_horn objectives, pass num_segments
+                elif needs_num_segments and obj_config.name in [
+                    "wavefront_sphericity", "impedance_smoothness",
+                    "response_flatness", "response_slope", "flatness", "slope"
+                ]:
+                    # Pass both num_segments and target_band (if needed)
+                    if needs_target_band:
                         obj_value = obj_config.function(
                             design_vector,
                             self.driver,
                             self.enclosure_type,
                             frequency_range=self.target_band,
-                            n_points=100,
+                            n_points=grid_kwargs.get("n_points", 100),
                             voltage=2.83,
-                            target_band=self.target_band
+                            num_segments=self.num_segments,
+                            target_band=self.target_band,
+                            **context_kwargs
                         )
                     else:
-                        # Standard evaluation
                         obj_value = obj_config.function(
                             design_vector,
                             self.driver,
-                            self.enclosure_type
+                            self.enclosure_type,
+                            num_segments=self.num_segments,
+                            **grid_kwargs,
+                            **context_kwargs
                         )
-                    F[i, j] = obj_value
-                except Exception as e:
-                    # Penalize invalid designs heavily
-                    F[i, j] = 1e10
-                    # Log warning for debugging (in development)
-                    import warnings
-                    warnings.warn(
-                        f"Objective evaluation failed for design {i}, "
-                        f"objective {j} ({obj_config.name}): {e}"
+                elif needs_target_band:
+                    # Not multisegment, but needs target_band
+                    obj_value = obj_config.function(
+                        design_vector,
+                        self.driver,
+                        self.enclosure_type,
+                        frequency_range=self.target_band,
+                        n_points=grid_kwargs.get("n_points", 100),
+                        voltage=2.83,
+                        target_band=self.target_band,
+                        **context_kwargs
+                    )
+                else:
+                    # Standard evaluation
+                    obj_value = obj_config.function(
+                        design_vector,
+                        self.driver,
+                        self.enclosure_type,
+                        **grid_kwargs,
+                        **context_kwargs
+                    )
+                f_row[j] = obj_value
+            except Exception as e:
+                # Penalize invalid designs heavily
+                f_row[j] = self.objective_penalty
+                # Log warning for debugging (in development)
+                import warnings
+                warnings.warn(
+                    f"Objective evaluation failed for design {i}, "
+                    f"objective {j} ({obj_config.name}): {e}"
+                )
+
+        # Share the objectives' simulation unless the design vector
+        # was adjusted for them (mixed_profile_horn integer rounding)
+        shared = np.array_equal(context.design_vector, x)
+        g_row = self._evaluate_constraints(x, context if shared else None)
+
+        return f_row, g_row
+
+    def _evaluate_constraints(
+        self,
+        x: np.ndarray,
+        context: Optional[EvaluationContext] = None
+    ) -> np.ndarray:
+        """
+        Evaluate the constraints of one design vector.
+
+        Args:
+            x: Design vector
+            context: Optional EvaluationContext shared with the objectives
+
+        Returns:
+            Constraint values (``constraint_penalty`` where a constraint fails); NaN for the
+            vectorized constraints, which _evaluate_designs fills for the
+            whole population
+        """
+        needs_num_segments = self.enclosure_type in ["multisegment_horn", "mixed_profile_horn"]
+        g_row = np.zeros(self.n_constr)
+
+        for j, constraint_func in enumerate(self.constraint_funcs):
+            if j in self._vectorized_columns:
+                g_row[j] = np.nan
+                continue
+            context_kwargs = (
+                {"context": context}
+                if context is not None and self._constraint_takes_context[j] else {}
+            )
+            try:
+                # For multisegment_horn constraints, pass num_segments
+                # Check if this is a multisegment constraint by name
+                func_name = constraint_func.__name__ if hasattr(constraint_func, '__name__') else ''
+                if needs_num_segments and 'multisegment' in func_name:
+                    g_row[j] = constraint_func(
+                        x,
+                        self.driver,
+                        self.enclosure_type,
+                        num_segments=self.num_segments,
+                        **context_kwargs
+                    )
+                else:
+                    g_row[j] = constraint_func(
+                        x,
+                        self.driver,
+                        self.enclosure_type,
+                        **context_kwargs
                     )
+            except Exception:
+                # If constraint fails, treat as violation
+                g_row[j] = self.constraint_penalty
 
-        # Evaluate constraints if any
-        if self.n_constr > 0:
-            G = np.zeros((n_individuals, self.n_constr))
-            for i in range(n_individuals):
-                design_vector = X[i]
-                for j, constraint_func in enumerate(self.constraint_funcs):
-                    try:
-                        # For multisegment_horn constraints, pass num_segments
-                        # Check if this is a multisegment constraint by name
-                        func_name = constraint_func.__name__ if hasattr(constraint_func, '__name__') else ''
-                        if needs_num_segments and 'multisegment' in func_name:
-                            G[i, j] = constraint_func(
-                                design_vector,
-                                self.driver,
-                                self.enclosure_type,
-                                num_segments=self.num_segments
-                            )
-                        else:
-                            G[i, j] = constraint_func(
-                                design_vector,
-                                self.driver,
-                                self.enclosure_type
-                            )
-                    except Exception:
-                        # If constraint fails, treat as violation
-                        G[i, j] = 1000.0
-            out["G"] = G
-
-        out["F"] = F
+        return g_row
 
     def decode_design_vector(self, x: np.ndarray) -> Dict[str, float]:
         """
@@ -0,0 +1,448 @@
+"""
+Per-design evaluation context shared by objectives and constraints.
+
+During optimization every individual is scored by several objectives and
+constraints, and most of them need the same simulated response: F3, flatness,
+maximum SPL and efficiency are all read off the SPL curve of one design. The
+EvaluationContext simulates each design once and hands the same response to
+every metric that asks for it.
+
+SPL is cached per frequency and a request only simulates the frequencies
+that are not cached yet, in one vectorized call. For that cache to be
+shared, the objectives draw their frequency grids from one log-frequency
+lattice, f_i = 100 Hz · 2^(i/48) (see shared_frequency_grid): F3 (48
+points per octave), flatness (24-48 per octave, depending on its band) and
+efficiency (1/3 octave) grids nest into each other, so the flatness and
+efficiency samples of a bass horn are already part of its F3 sweep.
+
+Literature:
+    - Small (1972) - Closed-box transfer function (sealed SPL)
+    - Small (1973) - Vented-box transfer function (ported SPL)
+    - Kolbrek, "Horn Loudspeaker Simulation Part 1" - T-matrix horn response
+    - literature/thiele_small/small_1972_closed_box.md
+    - literature/horns/kolbrek_horn_theory_tutorial.md
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from viberesp.driver.parameters import ThieleSmallParameters
+from viberesp.enclosure.front_loaded_horn import FrontLoadedHorn
+
+HORN_ENCLOSURE_TYPES = ("exponential_horn", "multisegment_horn", "mixed_profile_horn")
+
+# Shared frequency lattice: f_i = LATTICE_REFERENCE_HZ · 2^(i / LATTICE_POINTS_PER_OCTAVE)
+LATTICE_REFERENCE_HZ = 100.0
+LATTICE_POINTS_PER_OCTAVE = 48
+
+# Grid densities (points per octave); each grid contains every coarser one
+GRID_POINTS_PER_OCTAVE = (3, 6, 12, 24, 48)
+
+# Band and default grid size of the horn F3 search (objective_f3)
+F3_FREQUENCY_RANGE = (20.0, 500.0)
+F3_N_POINTS = 200
+
+
+def lattice_frequencies(
+    f_min: float,
+    f_max: float,
+    points_per_octave: int = LATTICE_POINTS_PER_OCTAVE,
+) -> np.ndarray:
+    """
+    Frequencies of the shared lattice within [f_min, f_max].
+
+    Every caller gets bit-identical values for the same lattice point, so
+    grids of different objectives hit the same EvaluationContext entries.
+
+    Args:
+        f_min: Lower band edge in Hz
+        f_max: Upper band edge in Hz
+        points_per_octave: Lattice density (a divisor of 48; 3 = 1/3 octave)
+
+    Returns:
+        Increasing frequency array (may be empty for narrow bands)
+
+    Raises:
+        ValueError: If points_per_octave does not divide 48
+
+    Examples:
+        >>> lattice_frequencies(50.0, 200.0, points_per_octave=3).round(1)
+        array([ 50. ,  63. ,  79.4, 100. , 126. , 158.7, 200. ])
+    """
+    if points_per_octave < 1 or LATTICE_POINTS_PER_OCTAVE % points_per_octave:
+        raise ValueError(
+            f"points_per_octave must divide {LATTICE_POINTS_PER_OCTAVE}, got {points_per_octave}"
+        )
+    step = LATTICE_POINTS_PER_OCTAVE // points_per_octave
+    position = np.log2(np.array([f_min, f_max]) / LATTICE_REFERENCE_HZ) * points_per_octave
+    first = int(np.ceil(position[0] - 1e-9))
+    last = int(np.floor(position[1] + 1e-9))
+    index = np.arange(first, last + 1) * step
+    return LATTICE_REFERENCE_HZ * 2.0 ** (index / LATTICE_POINTS_PER_OCTAVE)
+
+
+def shared_frequency_grid(f_min: float, f_max: float, n_points: int) -> np.ndarray:
+    """
+    Log-spaced grid of about ``n_points`` frequencies on the shared lattice.
+
+    Uses the coarsest density of GRID_POINTS_PER_OCTAVE that gives at least
+    n_points over the band (at most 48 points per octave). Bands too narrow
+    for two lattice points fall back to np.logspace(f_min, f_max, n_points).
+
+    Args:
+        f_min: Lower band edge in Hz
+        f_max: Upper band edge in Hz
+        n_points: Requested number of points
+
+    Returns:
+        Increasing frequency array within [f_min, f_max]
+
+    Examples:
+        >>> len(shared_frequency_grid(20.0, 500.0, 200))  # 48 per octave
+        223
+        >>> len(shared_frequency_grid(20.0, 500.0, 100))  # 24 per octave
+        111
+    """
+    octaves = np.log2(f_max / f_min)
+    for points_per_octave in GRID_POINTS_PER_OCTAVE:
+        if points_per_octave * octaves + 1 >= n_points:
+            break
+    frequencies = lattice_frequencies(f_min, f_max, points_per_octave)
+    if len(frequencies) < 2:
+        return np.logspace(np.log10(f_min), np.log10(f_max), n_points)
+    return frequencies
+
+
+def f3_frequency_grid(n_points: Optional[int] = None) -> np.ndarray:
+    """
+    Frequency grid of the horn F3 search (objective_f3).
+
+    Args:
+        n_points: Requested number of points (None = F3_N_POINTS, which
+            gives the full 48 points per octave)
+
+    Returns:
+        shared_frequency_grid() over F3_FREQUENCY_RANGE
+    """
+    return shared_frequency_grid(*F3_FREQUENCY_RANGE, F3_N_POINTS if n_points is None else n_points)
+
+
+class EvaluationContext:
+    """
+    Simulation cache for a single design vector.
+
+    Create one context per individual and pass it to every objective and
+    constraint that accepts a ``context`` argument. The context owns the
+    expensive state for that design (the FrontLoadedHorn instance, the SPL
+    samples, the sealed/ported electrical response) so each is computed at
+    most once.
+
+    Attributes:
+        design_vector: Enclosure parameters of the design
+        driver: ThieleSmallParameters instance
+        enclosure_type: "sealed", "ported", "infinite_baffle", "exponential_horn",
+            "multisegment_horn", "mixed_profile_horn"
+        n_requested: Number of SPL frequency samples requested by metrics
+        n_simulated: Number of SPL frequency samples actually simulated
+
+    Examples:
+        >>> context = EvaluationContext(np.array([0.010]), driver, "sealed")
+        >>> f3 = objective_f3(context.design_vector, driver, "sealed", context=context)
+        >>> flatness = objective_response_flatness(
+        ...     context.design_vector, driver, "sealed", context=context
+        ... )
+        >>> context.n_simulated <= context.n_requested
+        True
+    """
+
+    def __init__(
+        self,
+        design_vector: np.ndarray,
+        driver: ThieleSmallParameters,
+        enclosure_type: str,
+    ):
+        self.design_vector = np.asarray(design_vector, dtype=float)
+        self.driver = driver
+        self.enclosure_type = enclosure_type
+        self.n_requested = 0
+        self.n_simulated = 0
+        self._horns: Dict[Optional[int], FrontLoadedHorn] = {}
+        self._spl: Dict[Tuple[float, Optional[int]], Dict[float, float]] = {}
+        self._electrical: Dict[Tuple[bytes, float], dict] = {}
+
+    def _segments_key(self, num_segments: int) -> Optional[int]:
+        # Only multi-segment horns depend on the segment count
+        if self.enclosure_type in ("multisegment_horn", "mixed_profile_horn"):
+            return num_segments
+        return None
+
+    def front_loaded_horn(self, num_segments: int = 2) -> FrontLoadedHorn:
+        """
+        Build (once) the FrontLoadedHorn for a horn design.
+
+        Args:
+            num_segments: Number of segments for multi-segment horns
+
+        Returns:
+            FrontLoadedHorn shared by every metric of this design
+
+        Raises:
+            ValueError: If the enclosure type is not a horn, or the design
+                vector does not describe a valid horn
+        """
+        key = self._segments_key(num_segments)
+        if key not in self._horns:
+            from viberesp.simulation.types import ExponentialHorn
+            from viberesp.optimization.parameters.multisegment_horn_params import (
+                build_mixed_profile_horn,
+                build_multisegment_horn,
+            )
+
+            dv = self.design_vector
+            if self.enclosure_type == "exponential_horn":
+                horn = ExponentialHorn(dv[0], dv[1], dv[2])
+                V_tc = dv[3] if len(dv) >= 4 else 0.0
+                V_rc = dv[4] if len(dv) >= 5 else 0.0
+            elif self.enclosure_type == "multisegment_horn":
+                horn, V_tc, V_rc = build_multisegment_horn(dv, self.driver, num_segments)
+            elif self.enclosure_type == "mixed_profile_horn":
+                horn, V_tc, V_rc = build_mixed_profile_horn(dv, self.driver, num_segments)
+            else:
+                raise ValueError(f"Not a horn enclosure: {self.enclosure_type}")
+
+            self._horns[key] = FrontLoadedHorn(self.driver, horn, V_tc=V_tc, V_rc=V_rc)
+        return self._horns[key]
+
+    def spl(
+        self,
+        frequencies: np.ndarray,
+        voltage: float = 2.83,
+        num_segments: int = 2,
+    ) -> np.ndarray:
+        """
+        SPL of the design at the requested frequencies.
+
+        Frequencies already simulated for this design are served from the
+        cache; the rest are simulated together in one vectorized call.
+        Frequencies whose simulation fails are NaN.
+
+        Args:
+            frequencies: Frequency array in Hz
+            voltage: Input voltage (default 2.83V)
+            num_segments: Number of segments for multi-segment horns
+
+        Returns:
+            SPL in dB at 1m, same shape as frequencies
+
+        Raises:
+            ValueError: If the design itself cannot be simulated (invalid
+                horn geometry, unsupported enclosure type)
+        """
+        freqs = np.asarray(frequencies, dtype=float)
+        cache = self._spl.setdefault((voltage, self._segments_key(num_segments)), {})
+
+        missing = [f for f in dict.fromkeys(freqs.ravel().tolist()) if f not in cache]
+        if missing:
+            values = self._simulate_spl(np.array(missing), voltage, num_segments)
+            cache.update(zip(missing, values.tolist()))
+            self.n_simulated += len(missing)
+
+        self.n_requested += freqs.size
+        return np.array([cache[f] for f in freqs.ravel().tolist()]).reshape(freqs.shape)
+
+    def prime_spl(
+        self,
+        frequencies: np.ndarray,
+        spl: np.ndarray,
+        voltage: float = 2.83,
+        num_segments: int = 2,
+    ) -> None:
+        """
+        Store SPL samples simulated outside the context (e.g. in a batch).
+
+        Args:
+            frequencies: Frequency array in Hz
+            spl: SPL in dB at 1m, same shape as frequencies
+            voltage: Input voltage the samples were simulated at
+            num_segments: Number of segments for multi-segment horns
+        """
+        freqs = np.asarray(frequencies, dtype=float).ravel().tolist()
+        cache = self._spl.setdefault((voltage, self._segments_key(num_segments)), {})
+        cache.update(zip(freqs, np.asarray(spl, dtype=float).ravel().tolist()))
+        self.n_simulated += len(freqs)
+
+    def _simulate_spl(
+        self,
+        freqs: np.ndarray,
+        voltage: float,
+        num_segments: int,
+    ) -> np.ndarray:
+        """Simulate SPL for the uncached frequencies of this design."""
+        if self.enclosure_type == "sealed":
+            from viberesp.enclosure.sealed_box import calculate_spl_array
+
+            return calculate_spl_array(freqs, self.driver, self.design_vector[0], voltage=voltage)
+
+        if self.enclosure_type == "ported":
+            from viberesp.optimization.objectives.response_metrics import _ported_spl_array
+
+            return _ported_spl_array(self.design_vector, self.driver, freqs, voltage)
+
+        if self.enclosure_type in ("infinite_baffle", "direct_radiator"):
+            from viberesp.driver.response import direct_radiator_electrical_impedance
+
+            return self._per_frequency(
+                lambda f: direct_radiator_electrical_impedance(f, self.driver, voltage=voltage)['SPL'],
+                freqs,
+            )
+
+        if self.enclosure_type in HORN_ENCLOSURE_TYPES:
+            flh = self.front_loaded_horn(num_segments)
+            try:
+                return flh.solve(freqs, voltage=voltage).spl
+            except Exception:
+                # Isolate the failing frequencies, as a per-frequency loop would
+                return self._per_frequency(
+                    lambda f: flh.spl_response(f, voltage=voltage), freqs
+                )
+
+        raise ValueError(f"Unsupported enclosure type: {self.enclosure_type}")
+
+    @staticmethod
+    def _per_frequency(spl_at, freqs: np.ndarray) -> np.ndarray:
+        values = np.full(len(freqs), np.nan)
+        for i, freq in enumerate(freqs):
+            try:
+                values[i] = spl_at(freq)
+            except Exception:
+                pass
+        return values
+
+    def electrical_response(
+        self,
+        frequencies: np.ndarray,
+        voltage: float = 2.83,
+    ) -> dict:
+        """
+        Electrical impedance, diaphragm velocity and excursion of a box design.
+
+        Wraps sealed_box_electrical_impedance_array() and
+        ported_box_electrical_impedance_array() (impedance-coupling model, no
+        SPL) and caches the result per frequency grid.
+
+        Args:
+            frequencies: Frequency array in Hz
+            voltage: Input voltage (default 2.83V)
+
+        Returns:
+            Dictionary of arrays from the array impedance function
+
+        Raises:
+            ValueError: If the enclosure type is not "sealed" or "ported"
+        """
+        freqs = np.asarray(frequencies, dtype=float)
+        key = (freqs.tobytes(), voltage)
+        if key not in self._electrical:
+            dv = self.design_vector
+            if self.enclosure_type == "sealed":
+                from viberesp.enclosure.sealed_box import sealed_box_electrical_impedance_array
+
+                result = sealed_box_electrical_impedance_array(
+                    freqs, self.driver, Vb=dv[0], voltage=voltage,
+                    use_transfer_function_spl=False
+                )
+            elif self.enclosure_type == "ported":
+                from viberesp.enclosure.ported_box import (
+                    calculate_optimal_port_dimensions,
+                    ported_box_electrical_impedance_array,
+                )
+
+                if len(dv) >= 4:
+                    port_area, port_length = dv[2], dv[3]
+                else:
+                    port_area, port_length, _ = calculate_optimal_port_dimensions(
+                        self.driver, dv[0], dv[1]
+                    )
+                result = ported_box_electrical_impedance_array(
+                    freqs, self.driver, Vb=dv[0], Fb=dv[1],
+                    port_area=port_area, port_length=port_length,
+                    voltage=voltage, use_transfer_function_spl=False
+                )
+            else:
+                raise ValueError(
+                    f"Electrical response only supports sealed/ported, got {self.enclosure_type}"
+                )
+            self._electrical[key] = result
+        return self._electrical[key]
+
+
+def population_contexts(
+    X: np.ndarray,
+    driver: ThieleSmallParameters,
+    enclosure_type: str,
+    voltage: float = 2.83,
+    frequencies: Optional[np.ndarray] = None,
+) -> List[EvaluationContext]:
+    """
+    One EvaluationContext per row of X, batch-simulated where possible.
+
+    For exponential horns the SPL of every design with a valid geometry is
+    computed in one exponential_horn_batch_response() call over
+    ``frequencies`` and primed into its context, so the objectives' grids
+    are served without a per-design horn solve. Pass the union of the grids
+    the objectives read (lattice points, see shared_frequency_grid); any
+    other frequency an objective asks for is simulated on demand. Other
+    enclosure types, and horn designs the batch cannot take, get empty
+    contexts that simulate on demand.
+
+    Literature:
+        - Kolbrek, "Horn Loudspeaker Simulation Part 1" - T-matrix horn response
+        - literature/horns/kolbrek_horn_theory_tutorial.md
+
+    Args:
+        X: Design matrix, one design vector per row
+        driver: ThieleSmallParameters instance
+        enclosure_type: Enclosure type of every design
+        voltage: Input voltage the SPL is primed at (default 2.83V)
+        frequencies: Frequencies simulated for every design (default: the
+            F3 search grid, which contains the default flatness and
+            efficiency grids of bass horns)
+
+    Returns:
+        List of EvaluationContext, in row order
+
+    Examples:
+        >>> contexts = population_contexts(X, driver, "exponential_horn")
+        >>> objective_f3(X[0], driver, "exponential_horn", context=contexts[0])
+        62.4...  # Hz, no further simulation
+    """
+    contexts = [EvaluationContext(x, driver, enclosure_type) for x in X]
+    X = np.asarray(X, dtype=float)
+    if enclosure_type != "exponential_horn" or X.ndim != 2 or X.shape[1] < 3:
+        return contexts
+
+    from viberesp.simulation.horn_driver_integration import exponential_horn_batch_response
+
+    # Designs the batch solver rejects are left to the per-design path
+    rows = np.flatnonzero(np.all(np.isfinite(X), axis=1) & np.all(X[:, :3] > 0, axis=1))
+    if len(rows) == 0:
+        return contexts
+
+    if frequencies is None:
+        frequencies = f3_frequency_grid()
+    frequencies = np.asarray(frequencies, dtype=float)
+    if len(frequencies) == 0:
+        return contexts
+
+    design = X[rows]
+    response = exponential_horn_batch_response(
+        frequencies, driver,
+        throat_area=design[:, 0], mouth_area=design[:, 1], length=design[:, 2],
+        V_tc=design[:, 3] if X.shape[1] >= 4 else 0.0,
+        V_rc=design[:, 4] if X.shape[1] >= 5 else 0.0,
+        voltage=voltage,
+    )
+    for row, spl in zip(rows, response['SPL']):
+        contexts[row].prime_spl(frequencies, spl, voltage=voltage)
+    return contexts
@@ -16,11 +16,35 @@ Literature:
 """
 
 import numpy as np
-from typing import Tuple
+from typing import Optional, Tuple
 
 from viberesp.driver.parameters import ThieleSmallParameters
 from viberesp.simulation.types import ExponentialHorn
 from viberesp.enclosure.front_loaded_horn import FrontLoadedHorn
+from viberesp.optimization.objectives.context import EvaluationContext, lattice_frequencies
+
+
+def efficiency_frequencies(
+    reference_frequency: float = 100.0,
+    bandwidth_octaves: float = 2.0,
+) -> np.ndarray:
+    """
+    1/3-octave lattice frequencies of the objective_efficiency band.
+
+    Args:
+        reference_frequency: Center frequency of the band (Hz)
+        bandwidth_octaves: Bandwidth in octaves around reference_frequency
+
+    Returns:
+        Frequency array (the reference frequency alone if no 1/3-octave
+        lattice point falls in the band)
+    """
+    f_min = reference_frequency / (2.0 ** (bandwidth_octaves / 2.0))
+    f_max = reference_frequency * (2.0 ** (bandwidth_octaves / 2.0))
+    frequencies = lattice_frequencies(f_min, f_max, points_per_octave=3)
+    if len(frequencies) == 0:
+        return np.array([reference_frequency])
+    return frequencies
 
 
 def objective_efficiency(
@@ -29,7 +53,8 @@ def objective_efficiency(
     enclosure_type: str,
     reference_frequency: float = 100.0,
     bandwidth_octaves: float = 2.0,
-    voltage: float = 2.83
+    voltage: float = 2.83,
+    context: Optional[EvaluationContext] = None
 ) -> float:
     """
     Calculate average efficiency over specified bandwidth (for maximization).
@@ -54,6 +79,7 @@ def objective_efficiency(
         reference_frequency: Center frequency for efficiency calculation (Hz)
         bandwidth_octaves: Bandwidth in octaves around reference frequency
         voltage: Input voltage for SPL calculation (default 2.83V)
+        context: Optional EvaluationContext for this design (shared SPL cache)
 
     Returns:
         Negative average SPL over bandwidth (dB at 1m, 2.83V)
@@ -77,109 +103,24 @@ def objective_efficiency(
     # instead of SPL-based approximation
     if enclosure_type in ["multisegment_horn", "mixed_profile_horn"]:
         return objective_efficiency_percent(
-            design_vector, driver, enclosure_type, reference_frequency, voltage
+            design_vector, driver, enclosure_type, reference_frequency, voltage,
+            context=context
         )
 
-    from viberesp.optimization.objectives.response_metrics import (
-        sealed_box_electrical_impedance,
-        ported_box_electrical_impedance
-    )
-    from viberesp.driver.response import direct_radiator_electrical_impedance
-    from viberesp.enclosure.ported_box import calculate_optimal_port_dimensions
-
-    # Calculate frequency range
-    f_min = reference_frequency / (2.0 ** (bandwidth_octaves / 2.0))
-    f_max = reference_frequency * (2.0 ** (bandwidth_octaves / 2.0))
-
-    # Use 1/3-octave spacing (standard for efficiency measurements)
+    # Use 1/3-octave spacing (standard for efficiency measurements),
+    # on the lattice shared with the F3 and flatness grids
     # Kinsler et al. (1982), Chapter 4
-    frequencies = 10.0 ** np.arange(
-        np.log10(f_min),
-        np.log10(f_max),
-        np.log10(2) / 3.0  # 1/3 octave steps
-    )
+    frequencies = efficiency_frequencies(reference_frequency, bandwidth_octaves)
 
-    # If no frequencies in range, use simple midpoint
-    if len(frequencies) == 0:
-        frequencies = np.array([reference_frequency])
-
-    # Calculate SPL at each frequency
-    spl_values = []
-    for freq in frequencies:
-        try:
-            if enclosure_type == "sealed":
-                Vb = design_vector[0]
-                result = sealed_box_electrical_impedance(
-                    freq, driver, Vb=Vb, voltage=voltage
-                )
-            elif enclosure_type == "ported":
-                Vb = design_vector[0]
-                Fb = design_vector[1]
-
-                # Get port dimensions
-                if len(design_vector) >= 4:
-                    port_area = design_vector[2]
-                    port_length = design_vector[3]
-                else:
-                    port_area, port_length, _ = calculate_optimal_port_dimensions(
-                        driver, Vb, Fb
-                    )
-
-                result = ported_box_electrical_impedance(
-                    freq, driver, Vb=Vb, Fb=Fb,
-                    port_area=port_area, port_length=port_length,
-                    voltage=voltage
-                )
-            elif enclosure_type == "infinite_baffle" or enclosure_type == "direct_radiator":
-                result = direct_radiator_electrical_impedance(
-                    freq, driver, voltage=voltage
-                )
-            elif enclosure_type == "exponential_horn":
-                throat_area = design_vector[0]
-                mouth_area = design_vector[1]
-                length = design_vector[2]
-                V_tc = design_vector[3] if len(design_vector) >= 4 else 0.0
-                V_rc = design_vector[4] if len(design_vector) >= 5 else 0.0
-
-                # Create horn system
-                # Olson (1947), Section 5.11 - Horn efficiency
-                horn = ExponentialHorn(throat_area, mouth_area, length)
-                flh = FrontLoadedHorn(driver, horn, V_tc=V_tc, V_rc=V_rc)
-
-                # Calculate SPL at this frequency
-                spl = flh.spl_response(freq, voltage=voltage)
-                result = {'SPL': spl}
-            elif enclosure_type == "multisegment_horn":
-                from viberesp.optimization.parameters.multisegment_horn_params import build_multisegment_horn
-
-                # Build horn (handles both standard and hyperbolic designs)
-                horn, V_tc, V_rc = build_multisegment_horn(design_vector, driver, num_segments=2)
-                flh = FrontLoadedHorn(driver, horn, V_tc=V_tc, V_rc=V_rc)
-
-                # Calculate SPL at this frequency
-                spl = flh.spl_response(freq, voltage=voltage)
-                result = {'SPL': spl}
-            elif enclosure_type == "mixed_profile_horn":
-                from viberesp.optimization.parameters.multisegment_horn_params import build_mixed_profile_horn
-
-                # Build mixed-profile horn (exponential/conical/hyperbolic segments)
-                horn, V_tc, V_rc = build_mixed_profile_horn(design_vector, driver, num_segments=2)
-                flh = FrontLoadedHorn(driver, horn, V_tc=V_tc, V_rc=V_rc)
-
-                # Calculate SPL at this frequency
-                spl = flh.spl_response(freq, voltage=voltage)
-                result = {'SPL': spl}
-            else:
-                raise ValueError(f"Unsupported enclosure type: {enclosure_type}")
-
-            spl_values.append(result['SPL'])
-
-        except Exception as e:
-            import warnings
-            warnings.warn(f"Efficiency calculation failed at {freq:.1f}Hz: {e}")
-            spl_values.append(np.nan)
-
-    spl_values = np.array(spl_values)
+    # Calculate SPL over the band from the shared per-design response
+    if context is None:
+        context = EvaluationContext(design_vector, driver, enclosure_type)
+    try:
+        spl_values = context.spl(frequencies, voltage=voltage)
+    except Exception as e:
+        import warnings
+        warnings.warn(f"Efficiency calculation failed: {e}")
+        spl_values = np.full(len(frequencies), np.nan)
 
     # Remove NaN values
     valid_mask = ~np.isnan(spl_values)
@@ -316,7 +257,8 @@ def objective_efficiency_percent(
     driver: ThieleSmallParameters,
     enclosure_type: str,
     reference_frequency: float = 1000.0,
-    voltage: float = 2.83
+    voltage: float = 2.83,
+    context: Optional[EvaluationContext] = None
 ) -> float:
     """
     Calculate actual efficiency as percentage (for maximization).
@@ -336,6 +278,7 @@ def objective_efficiency_percent(
         enclosure_type: Type of enclosure (must be "multisegment_horn")
         reference_frequency: Frequency for efficiency measurement (Hz), default 1 kHz
         voltage: Input voltage (default 2.83V)
+        context: Optional EvaluationContext for this design (shared horn solve)
 
     Returns:
         Negative efficiency percentage (for minimization)
@@ -350,46 +293,15 @@ def objective_efficiency_percent(
         0.57  # % efficiency at 1 kHz (example value)
     """
     try:
-        if enclosure_type == "multisegment_horn":
-            from viberesp.optimization.parameters.multisegment_horn_params import build_multisegment_horn
-
-            # Build horn (handles both standard and hyperbolic designs)
-            horn, V_tc, V_rc = build_multisegment_horn(design_vector, driver, num_segments=2)
-            flh = FrontLoadedHorn(driver, horn, V_tc=V_tc, V_rc=V_rc)
-
-            # Calculate acoustic power at reference frequency
-            power_acoustic = flh.acoustic_power(reference_frequency, voltage=voltage)
-
-            # Calculate electrical power
-            result = flh.electrical_impedance(reference_frequency, voltage=voltage)
-            Ze = result['Ze_real'] + 1j * result['Ze_imag']
-
-            if abs(Ze) > 0:
-                power_electrical = (voltage ** 2) * Ze.real / (abs(Ze) ** 2)
-            else:
-                power_electrical = 0
-
-            # Calculate efficiency as percentage
-            if power_electrical > 0:
-                efficiency_percent = (power_acoustic / power_electrical) * 100
-            else:
-                efficiency_percent = 0
-
-            # Return as negative for minimization (pymoo minimizes by default)
-            return -efficiency_percent
-        elif enclosure_type == "mixed_profile_horn":
-            from viberesp.optimization.parameters.multisegment_horn_params import build_mixed_profile_horn
-
-            # Build mixed-profile horn (exponential/conical/hyperbolic segments)
-            horn, V_tc, V_rc = build_mixed_profile_horn(design_vector, driver, num_segments=2)
-            flh = FrontLoadedHorn(driver, horn, V_tc=V_tc, V_rc=V_rc)
-
-            # Calculate acoustic power at reference frequency
-            power_acoustic = flh.acoustic_power(reference_frequency, voltage=voltage)
-
-            # Calculate electrical power
-            result = flh.electrical_impedance(reference_frequency, voltage=voltage)
-            Ze = result['Ze_real'] + 1j * result['Ze_imag']
+        if enclosure_type in ["multisegment_horn", "mixed_profile_horn"]:
+            if context is None:
+                context = EvaluationContext(design_vector, driver, enclosure_type)
+            flh = context.front_loaded_horn(num_segments=2)
+
+            # Acoustic and electrical power from one solve at the reference frequency
+            solution = flh.solve(np.array([reference_frequency]), voltage=voltage)
+            power_acoustic = float(solution.acoustic_power[0])
+            Ze = complex(solution.Ze[0])
 
             if abs(Ze) > 0:
                 power_electrical = (voltage ** 2) * Ze.real / (abs(Ze) ** 2)
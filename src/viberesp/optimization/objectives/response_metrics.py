@@ -15,12 +15,14 @@ Literature:
 """
 
 import numpy as np
-from typing import Tuple
+from typing import Optional, Tuple
 
 from viberesp.driver.parameters import ThieleSmallParameters
-from viberesp.enclosure.sealed_box import calculate_sealed_box_system_parameters, SealedBoxSystemParameters
+from viberesp.enclosure.sealed_box import (
+    calculate_sealed_box_system_parameters,
+    SealedBoxSystemParameters,
+)
 from viberesp.enclosure.ported_box import calculate_ported_box_system_parameters, PortedBoxSystemParameters
-from viberesp.driver.response import direct_radiator_electrical_impedance
 from viberesp.simulation.types import ExponentialHorn
 from viberesp.enclosure.front_loaded_horn import FrontLoadedHorn
 from viberesp.optimization.parameters.exponential_horn_params import calculate_horn_cutoff_frequency
@@ -33,13 +35,22 @@ from viberesp.optimization.parameters.multisegment_horn_params import (
     detect_design_type,
 )
 from viberesp.simulation.constants import SPEED_OF_SOUND
+from viberesp.optimization.objectives.context import (
+    EvaluationContext,
+    f3_frequency_grid,
+    shared_frequency_grid,
+)
+
+# Default band of objective_response_flatness
+FLATNESS_FREQUENCY_RANGE = (20.0, 500.0)
 
 
 def objective_f3(
     design_vector: np.ndarray,
     driver: ThieleSmallParameters,
     enclosure_type: str,
-    frequency_points: np.ndarray = None
+    frequency_points: np.ndarray = None,
+    context: Optional[EvaluationContext] = None
 ) -> float:
     """
     Calculate -3dB cutoff frequency for minimization.
@@ -63,7 +74,11 @@ def objective_f3(
             - Exponential horn: [throat_area, mouth_area, length, V_rc] (m², m², m, m³)
         driver: ThieleSmallParameters instance
         enclosure_type: "sealed", "ported", "infinite_baffle", "exponential_horn"
-        frequency_points: Frequency array for interpolation (not used for sealed/ported/horns)
+        frequency_points: Frequency array for horn F3 search (default: 48 points
+            per octave from 20 to 500 Hz, see f3_frequency_grid; pass a
+            lattice grid so samples are shared with the other objectives)
+        context: Optional EvaluationContext for this design; horn responses
+            are taken from (and stored in) its shared SPL cache
 
     Returns:
         F3 frequency in Hz (to be minimized)
@@ -102,37 +117,23 @@ def objective_f3(
         # For infinite baffle, F3 ≈ Fs (driver resonance)
         return driver.F_s
 
-    elif enclosure_type == "exponential_horn":
-        # For exponential horn, calculate F3 from actual frequency response
+    elif enclosure_type in ["exponential_horn", "multisegment_horn", "mixed_profile_horn"]:
+        # For horns, calculate F3 from actual frequency response
         # NOT just the theoretical cutoff frequency!
         # Literature: Olson (1947), Eq. 5.18 - f_c = c·m/(2π) (for reference only)
         # Actual F3 depends on driver parameters and chamber volumes
-        throat_area = design_vector[0]
-        mouth_area = design_vector[1]
-        length = design_vector[2]
-        V_tc = design_vector[3] if len(design_vector) > 3 else 0.0
-        V_rc = design_vector[4] if len(design_vector) > 4 else 0.0
+        if context is None:
+            context = EvaluationContext(design_vector, driver, enclosure_type)
 
-        # Create horn
-        horn = ExponentialHorn(throat_area=throat_area, mouth_area=mouth_area, length=length)
-        flh = FrontLoadedHorn(driver, horn, V_tc=V_tc, V_rc=V_rc)
-
-        # Generate frequency array for F3 calculation (bass range: 20-500 Hz)
+        # Generate frequency array for F3 calculation (bass range: 20-500 Hz,
+        # on the shared lattice so flatness/efficiency reuse its samples)
         if frequency_points is None:
-            frequencies = np.logspace(np.log10(20), np.log10(500), 200)
+            frequencies = f3_frequency_grid()
         else:
             frequencies = frequency_points
 
-        # Calculate SPL response
-        spl_values = []
-        for freq in frequencies:
-            try:
-                spl = flh.spl_response(freq, voltage=2.83)
-                spl_values.append(spl)
-            except Exception:
-                spl_values.append(np.nan)
-
-        spl_values = np.array(spl_values)
+        # Calculate SPL response (NaN where the simulation failed)
+        spl_values = context.spl(frequencies, voltage=2.83, num_segments=2)
 
         # Remove NaN values
         valid_mask = ~np.isnan(spl_values)
@@ -171,102 +172,64 @@ def objective_f3(
                 f3 = 10 ** log_f3
                 return f3
 
-        # If F3 not found in range, return minimum frequency measured
-        return freq_valid[0]
-
-    elif enclosure_type in ["multisegment_horn", "mixed_profile_horn"]:
-        # For multi-segment and mixed-profile horns, calculate F3 from frequency response
-        # F3 is the -3dB point relative to the passband reference level
-        from viberesp.optimization.parameters.multisegment_horn_params import (
-            build_multisegment_horn,
-            build_mixed_profile_horn,
-        )
-
-        # Build horn based on type
-        if enclosure_type == "multisegment_horn":
-            horn, V_tc, V_rc = build_multisegment_horn(design_vector, driver, num_segments=2)
-        else:  # mixed_profile_horn
-            horn, V_tc, V_rc = build_mixed_profile_horn(design_vector, driver, num_segments=2)
-
-        # Create front-loaded horn system
-        flh = FrontLoadedHorn(driver, horn, V_tc=V_tc, V_rc=V_rc)
-
-        # Generate frequency array for F3 calculation (bass range: 20-500 Hz)
-        if frequency_points is None:
-            frequencies = np.logspace(np.log10(20), np.log10(500), 200)
-        else:
-            frequencies = frequency_points
-
-        # Calculate SPL response
-        spl_values = []
-        for freq in frequencies:
-            try:
-                spl = flh.spl_response(freq, voltage=2.83)
-                spl_values.append(spl)
-            except Exception:
-                spl_values.append(np.nan)
-
-        spl_values = np.array(spl_values)
-
-        # Remove NaN values
-        valid_mask = ~np.isnan(spl_values)
-        if np.sum(valid_mask) < 10:
-            return 500.0  # Large penalty if calculation failed
+        # For multi-segment horns, if all frequencies are below target
+        # (response never reaches -3dB), return the highest frequency
+        # measured (poor bass extension)
+        if enclosure_type != "exponential_horn" and np.all(spl_valid < target_spl):
+            return freq_valid[-1]
 
-        freq_valid = frequencies[valid_mask]
-        spl_valid = spl_values[valid_mask]
+        # If F3 not found in range (response is flat to bass limit),
+        # return the lowest frequency measured
+        return freq_valid[0]
 
-        # Find reference level (max SPL in passband, typically 100-500 Hz for bass horns)
-        passband_mask = (freq_valid >= 50) & (freq_valid <= 500)
-        if np.sum(passband_mask) > 0:
-            reference_spl = np.max(spl_valid[passband_mask])
-        else:
-            reference_spl = np.max(spl_valid)
+    else:
+        raise ValueError(f"Unsupported enclosure type: {enclosure_type}")
 
-        # Find F3: frequency where SPL crosses reference - 3dB
-        # For bass horns, we want the lower -3dB frequency (bass extension)
-        # Look for crossover from BELOW target to ABOVE target
-        target_spl = reference_spl - 3.0
 
-        # Iterate through frequencies to find where response crosses -3dB
-        # (from bass region upward, looking for transition from below to above)
-        for i in range(len(freq_valid) - 1):
-            below_current = spl_valid[i] < target_spl
-            below_next = spl_valid[i + 1] < target_spl
-
-            # Found crossover: current is below, next is above (or at target)
-            if below_current and not below_next:
-                # Interpolate to find exact F3
-                f1, f2 = freq_valid[i], freq_valid[i + 1]
-                spl1, spl2 = spl_valid[i], spl_valid[i + 1]
-                # Linear interpolation in log-frequency space
-                log_f3 = np.log10(f1) + (np.log10(f2) - np.log10(f1)) * \
-                         (target_spl - spl1) / (spl2 - spl1)
-                f3 = 10 ** log_f3
-                return f3
+def _ported_spl_array(
+    design_vector: np.ndarray,
+    driver: ThieleSmallParameters,
+    frequencies: np.ndarray,
+    voltage: float
+) -> np.ndarray:
+    """
+    SPL of a ported design over a frequency array.
 
-        # If all frequencies are below target (response never reaches -3dB),
-        # return the highest frequency measured (poor bass extension)
-        if np.all(spl_valid < target_spl):
-            return freq_valid[-1]
+    Same result as ported_box_electrical_impedance(...)['SPL'] at every
+    frequency (transfer-function SPL with the port Q from the port
+    geometry), evaluated in one vectorized call.
 
-        # If all frequencies are above target (response is flat to bass limit),
-        # return the lowest frequency measured (excellent bass extension)
-        return freq_valid[0]
+    Design vector: [Vb, Fb] or [Vb, Fb, port_area, port_length]; the port
+    is sized with calculate_optimal_port_dimensions() when not given.
+    """
+    from viberesp.enclosure.ported_box import (
+        calculate_optimal_port_dimensions,
+        calculate_port_Q,
+        calculate_spl_ported_array,
+    )
 
+    Vb = design_vector[0]
+    Fb = design_vector[1]
+    if len(design_vector) >= 4:
+        port_area = design_vector[2]
+        port_length = design_vector[3]
     else:
-        raise ValueError(f"Unsupported enclosure type: {enclosure_type}")
+        port_area, port_length, _ = calculate_optimal_port_dimensions(driver, Vb, Fb)
+
+    Qp = calculate_port_Q(port_area, port_length, Vb, Fb)
+    return calculate_spl_ported_array(frequencies, driver, Vb, Fb, voltage=voltage, Qp=Qp)
 
 
 def objective_response_flatness(
     design_vector: np.ndarray,
     driver: ThieleSmallParameters,
     enclosure_type: str,
-    frequency_range: Tuple[float, float] = (20.0, 500.0),
+    frequency_range: Tuple[float, float] = FLATNESS_FREQUENCY_RANGE,
     n_points: int = 100,
     voltage: float = 2.83,
     num_segments: int = 2,
-    target_band: Tuple[float, float] = None
+    target_band: Tuple[float, float] = None,
+    context: Optional[EvaluationContext] = None
 ) -> float:
     """
     Calculate frequency response variation (standard deviation) for minimization.
@@ -289,17 +252,29 @@ def objective_response_flatness(
         enclosure_type: "sealed", "ported", "infinite_baffle", "exponential_horn",
                        "multisegment_horn"
         frequency_range: (f_min, f_max) in Hz for flatness calculation
-        n_points: Number of frequency points to evaluate
+        n_points: Minimum number of frequency points. The grid is the
+            coarsest shared-lattice density (3, 6, 12, 24 or 48 points per
+            octave) giving at least n_points over the band, so it usually
+            holds more points and never more than 48 per octave; bands too
+            narrow for two lattice points use exactly n_points log-spaced
+            frequencies (see shared_frequency_grid). Ported boxes use
+            max(n_points // 2, 20) over their reduced band.
         voltage: Input voltage for SPL calculation (default 2.83V)
         num_segments: Number of segments for multisegment_horn (default 2)
         target_band: Optional (f_min, f_max) target frequency band for optimization.
                      When provided, overrides auto-calculated range for horns.
+        context: Optional EvaluationContext for this design; the SPL is taken
+            from (and stored in) its shared response cache
 
     Returns:
         Standard deviation of SPL (dB) over frequency range (lower is better)
 
     Note:
-        Uses log-spaced frequencies to match human hearing perception.
+        Uses log-spaced frequencies to match human hearing perception,
+        drawn from the lattice shared with F3 and efficiency so the
+        samples of one EvaluationContext are reused. Values therefore
+        differ slightly from a standard deviation over
+        np.logspace(f_min, f_max, n_points).
         Ported box evaluation excludes frequencies below Fb to avoid
         steep rolloff region dominating the metric.
         Horn evaluation excludes frequencies below 1.5×Fc to avoid
@@ -313,41 +288,28 @@ def objective_response_flatness(
         ... )
         1.23  # dB standard deviation (example value)
     """
-    # Generate frequency array (log-spaced)
-    frequencies = np.logspace(
-        np.log10(frequency_range[0]),
-        np.log10(frequency_range[1]),
-        n_points
-    )
+    # Generate frequency array (log-spaced, on the shared lattice)
+    frequencies = shared_frequency_grid(frequency_range[0], frequency_range[1], n_points)
 
     # For ported box, adjust frequency range to exclude deep rolloff below Fb
     if enclosure_type == "ported" and len(design_vector) >= 2:
         Fb = design_vector[1]
         f_min = max(frequency_range[0], Fb * 0.8)  # Start slightly below Fb
         if f_min < frequency_range[1]:
-            frequencies = np.logspace(
-                np.log10(f_min),
-                np.log10(frequency_range[1]),
+            frequencies = shared_frequency_grid(
+                f_min, frequency_range[1],
                 max(n_points // 2, 20)  # Fewer points for reduced range
             )
 
     # For multisegment_horn, use target_band if provided
     elif enclosure_type == "multisegment_horn" and target_band is not None:
         f_min, f_max = target_band
-        frequencies = np.logspace(
-            np.log10(f_min),
-            np.log10(f_max),
-            n_points
-        )
+        frequencies = shared_frequency_grid(f_min, f_max, n_points)
 
     # For mixed_profile_horn, use target_band if provided
     elif enclosure_type == "mixed_profile_horn" and target_band is not None:
         f_min, f_max = target_band
-        frequencies = np.logspace(
-            np.log10(f_min),
-            np.log10(f_max),
-            n_points
-        )
+        frequencies = shared_frequency_grid(f_min, f_max, n_points)
 
     # For exponential horn, adjust frequency range to exclude cutoff region
     elif enclosure_type == "exponential_horn" and len(design_vector) >= 3:
@@ -383,94 +345,27 @@ def objective_response_flatness(
 
         # Ensure f_min < f_max for valid range
         if f_min < f_max:
-            frequencies = np.logspace(
-                np.log10(f_min),
-                np.log10(f_max),
-                n_points  # Use full n_points for wide range
-            )
+            frequencies = shared_frequency_grid(f_min, f_max, n_points)
 
-    # Calculate SPL at each frequency
-    spl_values = []
-    for freq in frequencies:
-        try:
-            if enclosure_type == "sealed":
-                Vb = design_vector[0]
-                result = sealed_box_electrical_impedance(
-                    freq, driver, Vb=Vb, voltage=voltage
-                )
-            elif enclosure_type == "ported":
-                Vb = design_vector[0]
-                Fb = design_vector[1]
-                # For sweep, may not have port parameters yet
-                if len(design_vector) >= 4:
-                    port_area = design_vector[2]
-                    port_length = design_vector[3]
-                    result = ported_box_electrical_impedance(
-                        freq, driver, Vb=Vb, Fb=Fb,
-                        port_area=port_area, port_length=port_length,
-                        voltage=voltage
-                    )
-                else:
-                    # Simplified calculation without port detail
-                    from viberesp.enclosure.ported_box import calculate_optimal_port_dimensions
-                    port_area, port_length, _ = calculate_optimal_port_dimensions(
-                        driver, Vb, Fb
-                    )
-                    result = ported_box_electrical_impedance(
-                        freq, driver, Vb=Vb, Fb=Fb,
-                        port_area=port_area, port_length=port_length,
-                        voltage=voltage
-                    )
-            elif enclosure_type == "infinite_baffle" or enclosure_type == "direct_radiator":
-                result = direct_radiator_electrical_impedance(
-                    freq, driver, voltage=voltage
-                )
-            elif enclosure_type == "exponential_horn":
-                throat_area = design_vector[0]
-                mouth_area = design_vector[1]
-                length = design_vector[2]
-                V_tc = design_vector[3] if len(design_vector) >= 4 else 0.0
-                V_rc = design_vector[4] if len(design_vector) >= 5 else 0.0
-
-                # Create horn system
-                horn = ExponentialHorn(throat_area, mouth_area, length)
-                flh = FrontLoadedHorn(driver, horn, V_tc=V_tc, V_rc=V_rc)
-
-                # Calculate SPL at this frequency
-                spl = flh.spl_response(freq, voltage=voltage)
-                result = {'SPL': spl}
-            elif enclosure_type == "multisegment_horn":
-                # Build multi-segment horn (handles both standard and hyperbolic)
-                horn, V_tc, V_rc = build_multisegment_horn(design_vector, driver, num_segments)
-
-                # Create front-loaded horn
-                flh = FrontLoadedHorn(driver, horn, V_tc=V_tc, V_rc=V_rc)
-
-                # Calculate SPL at this frequency
-                spl = flh.spl_response(freq, voltage=voltage)
-                result = {'SPL': spl}
-            elif enclosure_type == "mixed_profile_horn":
-                # Build mixed-profile horn (exponential/conical/hyperbolic segments)
-                horn, V_tc, V_rc = build_mixed_profile_horn(design_vector, driver, num_segments)
-
-                # Create front-loaded horn
-                flh = FrontLoadedHorn(driver, horn, V_tc=V_tc, V_rc=V_rc)
-
-                # Calculate SPL at this frequency
-                spl = flh.spl_response(freq, voltage=voltage)
-                result = {'SPL': spl}
-            else:
-                raise ValueError(f"Unsupported enclosure type: {enclosure_type}")
-
-            spl_values.append(result['SPL'])
+    if context is None:
+        context = EvaluationContext(design_vector, driver, enclosure_type)
 
+    if enclosure_type in ("sealed", "ported"):
+        # Whole grid in one vectorized Small (1972/1973) transfer function call
+        try:
+            spl_values = context.spl(frequencies, voltage=voltage)
         except Exception as e:
-            # Fill with NaN on failure
             import warnings
-            warnings.warn(f"SPL calculation failed at {freq:.1f}Hz: {e}")
-            spl_values.append(np.nan)
-
-    spl_values = np.array(spl_values)
+            warnings.warn(f"SPL calculation failed: {e}")
+            spl_values = np.full(len(frequencies), np.nan)
+    else:
+        # Horns and direct radiators: shared per-design response
+        try:
+            spl_values = context.spl(frequencies, voltage=voltage, num_segments=num_segments)
+        except Exception as e:
+            import warnings
+            warnings.warn(f"SPL calculation failed: {e}")
+            spl_values = np.full(len(frequencies), np.nan)
 
     # Remove NaN values
     valid_mask = ~np.isnan(spl_values)
@@ -713,7 +608,8 @@ def objective_max_spl(
     enclosure_type: str,
     frequency_range: Tuple[float, float] = (40.0, 200.0),
     n_points: int = 50,
-    voltage: float = 2.83
+    voltage: float = 2.83,
+    context: Optional[EvaluationContext] = None
 ) -> float:
     """
     Calculate maximum SPL in frequency range (for maximization).
@@ -730,62 +626,28 @@ def objective_max_spl(
         driver: ThieleSmallParameters instance
         enclosure_type: "sealed", "ported", "infinite_baffle"
         frequency_range: (f_min, f_max) in Hz for evaluation
-        n_points: Number of frequency points to evaluate
+        n_points: Minimum number of frequency points, rounded up to the
+            coarsest shared-lattice density that provides them (at most 48
+            points per octave, see shared_frequency_grid)
         voltage: Input voltage for SPL calculation (default 2.83V)
+        context: Optional EvaluationContext for this design (shared SPL cache)
 
     Returns:
         Maximum SPL in dB (to be maximized)
     """
-    # Generate frequency array (log-spaced)
-    frequencies = np.logspace(
-        np.log10(frequency_range[0]),
-        np.log10(frequency_range[1]),
-        n_points
-    )
+    # Generate frequency array (log-spaced, on the shared lattice)
+    frequencies = shared_frequency_grid(frequency_range[0], frequency_range[1], n_points)
 
-    # Calculate SPL at each frequency
-    spl_values = []
-    for freq in frequencies:
-        try:
-            if enclosure_type == "sealed":
-                Vb = design_vector[0]
-                result = sealed_box_electrical_impedance(
-                    freq, driver, Vb=Vb, voltage=voltage
-                )
-            elif enclosure_type == "ported":
-                Vb = design_vector[0]
-                Fb = design_vector[1]
-                if len(design_vector) >= 4:
-                    port_area = design_vector[2]
-                    port_length = design_vector[3]
-                    result = ported_box_electrical_impedance(
-                        freq, driver, Vb=Vb, Fb=Fb,
-                        port_area=port_area, port_length=port_length,
-                        voltage=voltage
-                    )
-                else:
-                    from viberesp.enclosure.ported_box import calculate_optimal_port_dimensions
-                    port_area, port_length, _ = calculate_optimal_port_dimensions(
-                        driver, Vb, Fb
-                    )
-                    result = ported_box_electrical_impedance(
-                        freq, driver, Vb=Vb, Fb=Fb,
-                        port_area=port_area, port_length=port_length,
-                        voltage=voltage
-                    )
-            elif enclosure_type == "infinite_baffle" or enclosure_type == "direct_radiator":
-                result = direct_radiator_electrical_impedance(
-                    freq, driver, voltage=voltage
-                )
-            else:
-                raise ValueError(f"Unsupported enclosure type: {enclosure_type}")
-
-            spl_values.append(result['SPL'])
+    if enclosure_type not in ["sealed", "ported", "infinite_baffle", "direct_radiator"]:
+        return 0.0  # Unsupported enclosure type (no valid SPL)
 
-        except Exception:
-            spl_values.append(np.nan)
+    if context is None:
+        context = EvaluationContext(design_vector, driver, enclosure_type)
 
-    spl_values = np.array(spl_values)
+    try:
+        spl_values = context.spl(frequencies, voltage=voltage)
+    except Exception:
+        spl_values = np.full(len(frequencies), np.nan)
 
     # Remove NaN values
     valid_mask = ~np.isnan(spl_values)
@@ -1227,6 +1089,7 @@ def objective_passband_flatness(
     n_points: int = 100,
     voltage: float = 2.83,
     num_segments: int = 2,
+    context: Optional[EvaluationContext] = None,
 ) -> float:
     """
     Calculate frequency response flatness from F3 to HF cutoff for minimization.
@@ -1263,9 +1126,13 @@ def objective_passband_flatness(
         driver: ThieleSmallParameters instance
         enclosure_type: "multisegment_horn" or "mixed_profile_horn"
         hf_cutoff: High-frequency cutoff in Hz (default 200 Hz for subwoofers)
-        n_points: Number of frequency points to evaluate
+        n_points: Minimum number of frequency points from F3 to hf_cutoff,
+            rounded up to the coarsest shared-lattice density that provides
+            them (at most 48 points per octave, see shared_frequency_grid)
         voltage: Input voltage for SPL calculation (default 2.83V)
         num_segments: Number of segments (default 2)
+        context: Optional EvaluationContext for this design; F3 and the
+            passband SPL share its horn response
 
     Returns:
         Standard deviation of SPL (dB) over F3 to hf_cutoff range (lower is better)
@@ -1284,60 +1151,41 @@ def objective_passband_flatness(
         1.23  # dB standard deviation (example value)
 
     Notes:
-        - Uses log-spaced frequencies to match human hearing perception
+        - Uses log-spaced frequencies on the shared lattice, so F3 and the
+          passband share one horn response
         - Automatically excludes frequencies below F3 (by definition)
         - For bass horns, typical hf_cutoff values: 150-300 Hz
         - For full-range horns, use higher hf_cutoff: 500-2000 Hz
     """
-    # Step 1: Calculate F3 for this design
-    f3 = objective_f3(design_vector, driver, enclosure_type)
-
-    # Step 2: Build the horn system
-    if enclosure_type == "multisegment_horn":
-        horn, V_tc, V_rc = build_multisegment_horn(design_vector, driver, num_segments)
-    elif enclosure_type == "mixed_profile_horn":
-        horn, V_tc, V_rc = build_mixed_profile_horn(design_vector, driver, num_segments)
-    else:
+    if enclosure_type not in ["multisegment_horn", "mixed_profile_horn"]:
         raise ValueError(
             f"objective_passband_flatness only supports horn enclosures "
             f"('multisegment_horn', 'mixed_profile_horn'), got '{enclosure_type}'"
         )
+    if context is None:
+        context = EvaluationContext(design_vector, driver, enclosure_type)
 
-    # Step 3: Create front-loaded horn system
-    flh = FrontLoadedHorn(driver, horn, V_tc=V_tc, V_rc=V_rc)
+    # Step 1: Calculate F3 for this design
+    f3 = objective_f3(design_vector, driver, enclosure_type, context=context)
 
-    # Step 4: Generate frequency array from F3 to HF cutoff
+    # Step 2: Generate frequency array from F3 to HF cutoff
     # Add 10% margin above F3 to ensure we're evaluating the passband
     f_min = f3 * 1.1
     f_max = max(hf_cutoff, f_min * 1.5)  # Ensure we have a valid range
 
-    frequencies = np.logspace(
-        np.log10(f_min),
-        np.log10(f_max),
-        n_points
-    )
+    frequencies = shared_frequency_grid(f_min, f_max, n_points)
 
-    # Step 5: Calculate SPL at each frequency
-    spl_values = []
-    for freq in frequencies:
-        try:
-            spl = flh.spl_response(freq, voltage=voltage)
-            spl_values.append(spl)
-        except Exception as e:
-            import warnings
-            warnings.warn(f"SPL calculation failed at {freq:.1f} Hz: {e}")
-            spl_values.append(np.nan)
-
-    spl_values = np.array(spl_values)
+    # Step 3: Calculate SPL from the shared horn response
+    spl_values = context.spl(frequencies, voltage=voltage, num_segments=num_segments)
 
-    # Step 6: Remove NaN values
+    # Step 4: Remove NaN values
     valid_mask = ~np.isnan(spl_values)
     if np.sum(valid_mask) < 10:
         return 100.0  # Large penalty if too many failures
 
     spl_valid = spl_values[valid_mask]
 
-    # Step 7: Calculate flatness as standard deviation
+    # Step 5: Calculate flatness as standard deviation
     # Beranek (1954), Chapter 8 - Flatness criterion
     flatness_metric = np.std(spl_valid)
 
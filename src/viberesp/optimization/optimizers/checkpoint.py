@@ -0,0 +1,236 @@
+"""
+Checkpoint and resume for long pymoo optimization runs.
+
+A 500-generation horn optimization can take hours, and batch nodes preempt
+jobs. minimize_with_checkpoints() drives the pymoo algorithm one generation
+at a time and periodically pickles the complete algorithm state to a file:
+population, archive/optimum, termination state, evaluation counter,
+generation counter and the algorithm's random generator, plus the
+ParetoArchive of the run if one is kept. Resuming loads that state and
+continues the generation loop, so a resumed run produces exactly the same
+designs (and archive) as an uninterrupted run with the same seed.
+
+The problem itself is re-attached on resume: the caller passes a freshly
+built problem (with its own worker pool and evaluation cache), which must
+have the same dimensions and bounds as the one the checkpoint was written
+for.
+
+Literature:
+    - Deb et al. (2002) - NSGA-II, generational population evaluation
+    - pymoo documentation - Checkpoints (object-oriented algorithm interface)
+"""
+
+import os
+import pickle
+from typing import Any, Callable, Optional
+
+import numpy as np
+from pymoo.core.result import Result
+from pymoo.termination.max_gen import MaximumGenerationTermination
+
+# Bump when the checkpoint payload changes
+CHECKPOINT_VERSION = 2
+
+
+def save_checkpoint(algorithm, path: str, archive=None) -> None:
+    """
+    Atomically write the algorithm state to ``path``.
+
+    The state is pickled to a temporary file that then replaces ``path``,
+    so a job killed mid-write leaves the previous checkpoint intact.
+
+    Args:
+        algorithm: pymoo Algorithm after setup()
+        path: Checkpoint file path
+        archive: Optional ParetoArchive of the run, stored with the algorithm
+    """
+    import pymoo
+
+    payload = {
+        "version": CHECKPOINT_VERSION,
+        "pymoo_version": pymoo.__version__,
+        "algorithm": algorithm,
+        "archive": archive.get_state() if archive is not None else None,
+    }
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path: str, problem=None, archive=None):
+    """
+    Load an algorithm state written by save_checkpoint().
+
+    Args:
+        path: Checkpoint file path
+        problem: Optional problem to attach to the algorithm (replacing the
+            pickled copy, which has no worker pool or evaluation cache)
+        archive: Optional ParetoArchive to restore from the checkpoint
+
+    Returns:
+        pymoo Algorithm ready to continue with next()
+
+    Raises:
+        ValueError: If the file is not a compatible checkpoint, the problem
+            does not match the checkpointed problem, or an archive is given
+            but the checkpointed run kept none
+    """
+    with open(path, "rb") as f:
+        payload = pickle.load(f)
+
+    if not isinstance(payload, dict) or payload.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(f"{path} is not a viberesp checkpoint (version {CHECKPOINT_VERSION})")
+
+    algorithm = payload["algorithm"]
+    if problem is not None:
+        _check_same_problem(algorithm.problem, problem, path)
+        algorithm.problem = problem
+    if archive is not None:
+        if payload["archive"] is None:
+            raise ValueError(f"Checkpoint {path} was written without a Pareto archive")
+        archive.set_state(payload["archive"])
+    return algorithm
+
+
+def _check_same_problem(saved, problem, path: str) -> None:
+    """Raise ValueError if ``problem`` differs from the checkpointed problem."""
+    same = (
+        saved.n_var == problem.n_var
+        and saved.n_obj == problem.n_obj
+        and saved.n_ieq_constr == problem.n_ieq_constr
+        and np.array_equal(saved.xl, problem.xl)
+        and np.array_equal(saved.xu, problem.xu)
+        and getattr(saved, "cache_signature", None) == getattr(problem, "cache_signature", None)
+    )
+    if not same:
+        raise ValueError(
+            f"Checkpoint {path} was written for a different problem "
+            f"(driver, objectives, constraints or bounds changed)"
+        )
+
+
+def minimize_with_checkpoints(
+    problem,
+    algorithm,
+    termination,
+    checkpoint_path: Optional[str] = None,
+    checkpoint_every: int = 10,
+    resume: bool = False,
+    callback: Optional[Callable[[Any], None]] = None,
+    before_generation: Optional[Callable[[Any], None]] = None,
+    archive=None,
+    **kwargs,
+) -> Result:
+    """
+    Run a pymoo algorithm generation by generation, checkpointing its state.
+
+    Equivalent to ``pymoo.optimize.minimize(problem, algorithm, termination,
+    **kwargs)`` when no checkpoint is written or resumed.
+
+    Args:
+        problem: pymoo Problem
+        algorithm: pymoo Algorithm (not yet set up)
+        termination: Termination object or tuple, e.g. ("n_gen", 500). On
+            resume the checkpointed termination (including any convergence
+            state) is kept and only its generation limit is taken from
+            ``termination``, so a finished run can be extended.
+        checkpoint_path: File the algorithm state is written to (None = off)
+        checkpoint_every: Write a checkpoint every N generations (and after
+            the last generation)
+        resume: Continue from ``checkpoint_path`` if the file exists; a new
+            run is started otherwise
+        callback: Optional function called with the algorithm after every
+            generation (not stored in the checkpoint)
+        before_generation: Optional function called with the algorithm
+            before every generation, e.g. FidelitySchedule.before_generation
+        archive: Optional ParetoArchive observing every generation; it is
+            stored in the checkpoint and restored on resume
+        **kwargs: Passed to algorithm.setup() for new runs (seed, verbose,
+            save_history, ...)
+
+    Returns:
+        pymoo Result (result.algorithm is the final algorithm state)
+
+    Raises:
+        ValueError: If checkpoint_every < 1, or the checkpoint belongs to a
+            different problem or has no archive to restore
+
+    Examples:
+        Checkpoint every 10 generations; re-running after preemption with
+        resume=True picks up at the last checkpoint:
+        >>> result = minimize_with_checkpoints(
+        ...     problem, NSGA2(pop_size=100), ("n_gen", 500),
+        ...     checkpoint_path="horn.ckpt", resume=True, seed=42
+        ... )
+    """
+    if checkpoint_every < 1:
+        raise ValueError(f"checkpoint_every must be >= 1, got {checkpoint_every}")
+
+    if resume and checkpoint_path and os.path.exists(checkpoint_path):
+        algorithm = load_checkpoint(checkpoint_path, problem, archive)
+        n_max_gen = _max_generations(termination)
+        if n_max_gen is not None:
+            extend_generations(algorithm, n_max_gen)
+    else:
+        algorithm.setup(problem, termination=termination, **kwargs)
+
+    while algorithm.has_next():
+        if before_generation is not None:
+            before_generation(algorithm)
+        algorithm.next()
+        if archive is not None:
+            archive.observe(algorithm)
+        if callback is not None:
+            callback(algorithm)
+        if checkpoint_path and algorithm.n_gen % checkpoint_every == 0:
+            save_checkpoint(algorithm, checkpoint_path, archive)
+
+    if checkpoint_path:
+        save_checkpoint(algorithm, checkpoint_path, archive)
+
+    result = algorithm.result()
+    result.algorithm = algorithm
+    return result
+
+
+def extend_generations(algorithm, n_max_gen: int) -> None:
+    """
+    Change the generation limit of a set-up algorithm.
+
+    The termination is re-evaluated for the last completed generation, so
+    has_next() reflects the new limit (other criteria keep their state).
+
+    Args:
+        algorithm: pymoo Algorithm after setup()
+        n_max_gen: New maximum number of generations
+    """
+    _set_max_generations(algorithm.termination, n_max_gen)
+    if algorithm.is_initialized:
+        algorithm.n_iter -= 1
+        algorithm.termination.update(algorithm)
+        algorithm.n_iter += 1
+
+
+def _max_generations(termination) -> Optional[int]:
+    """Generation limit of a ("n_gen", n) tuple or Termination, if any."""
+    if isinstance(termination, tuple):
+        return termination[1] if termination[0] in ("n_gen", "n_iter") else None
+    if isinstance(termination, MaximumGenerationTermination):
+        return termination.n_max_gen
+    for criterion in getattr(termination, "criteria", ()):
+        n_max_gen = _max_generations(criterion)
+        if n_max_gen is not None:
+            return n_max_gen
+    return None
+
+
+def _set_max_generations(termination, n_max_gen: int) -> None:
+    """Set the limit of every MaximumGenerationTermination in ``termination``."""
+    if isinstance(termination, MaximumGenerationTermination):
+        termination.n_max_gen = n_max_gen
+    for criterion in getattr(termination, "criteria", ()):
+        _set_max_generations(criterion, n_max_gen)
@@ -0,0 +1,307 @@
+"""
+Persistent on-disk cache of design evaluations.
+
+Presets are re-run many times against the same drivers, and seeded or
+resumed runs revisit the same design vectors. EvaluationCache stores the
+objective and constraint rows of every evaluated design in a SQLite file so
+later runs look them up instead of re-simulating.
+
+Each entry is keyed by a hash of:
+    - the driver's Thiele-Small parameters
+    - the enclosure type and the objective/constraint configuration
+      (the problem signature, see problem_signature())
+    - the design vector, quantized to a fixed number of significant digits
+
+Entries are evicted least-recently-used once the cache holds more than
+``max_entries`` designs. Only the parent process reads and writes the cache;
+worker processes (``workers > 1``) only see cache misses.
+
+Literature:
+    - Deb et al. (2002) - NSGA-II, generational population evaluation
+    - Jin (2005) - Fitness approximation and re-use in evolutionary computation
+"""
+
+import dataclasses
+import hashlib
+import json
+import sqlite3
+from functools import partial
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+
+# Bump when simulation changes make stored evaluations stale
+CACHE_SCHEMA_VERSION = 2
+
+# SQLite limits the number of bound parameters per statement
+_SQL_CHUNK = 500
+
+
+def callable_name(func: Callable) -> str:
+    """
+    Stable name of an objective/constraint callable for cache keys.
+
+    functools.partial objects include their bound keyword arguments, so
+    e.g. ``partial(constraint_f3_limit, f3_max_hz=40.0)`` and
+    ``f3_max_hz=45.0`` give different names.
+
+    Args:
+        func: Function or functools.partial
+
+    Returns:
+        "module.qualname" (plus sorted bound arguments for partials)
+    """
+    if isinstance(func, partial):
+        bound = json.dumps(
+            {"args": list(func.args), "kwargs": func.keywords or {}},
+            sort_keys=True, default=repr,
+        )
+        return f"{callable_name(func.func)}{bound}"
+    module = getattr(func, "__module__", "")
+    name = getattr(func, "__qualname__", getattr(func, "__name__", repr(func)))
+    return f"{module}.{name}"
+
+
+def problem_signature(driver, enclosure_type: str, **config: Any) -> str:
+    """
+    Hash of everything besides the design vector that determines F and G.
+
+    Args:
+        driver: ThieleSmallParameters instance
+        enclosure_type: Enclosure type of the problem
+        **config: Objective/constraint configuration (names, bands, bound
+            arguments); values must be JSON serializable or have a stable repr
+
+    Returns:
+        Hex digest identifying the problem
+
+    Examples:
+        >>> sig = problem_signature(driver, "sealed", objectives=["f3", "size"])
+        >>> len(sig)
+        64
+    """
+    if dataclasses.is_dataclass(driver):
+        driver_fields = dataclasses.asdict(driver)
+    else:
+        driver_fields = dict(vars(driver))
+    payload = {
+        "schema": CACHE_SCHEMA_VERSION,
+        "driver": driver_fields,
+        "enclosure_type": enclosure_type,
+        "config": config,
+    }
+    text = json.dumps(payload, sort_keys=True, default=repr)
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class EvaluationCache:
+    """
+    SQLite-backed LRU store of objective/constraint rows.
+
+    Attributes:
+        path: Database file (":memory:" for a non-persistent cache)
+        max_entries: Maximum number of stored designs (LRU eviction)
+        significant_digits: Design vectors are rounded to this many
+            significant digits before hashing
+        hits: Lookups answered from the cache since it was opened
+        misses: Lookups that had to be evaluated since it was opened
+
+    Examples:
+        >>> cache = EvaluationCache("~/.cache/viberesp/evaluations.sqlite")
+        >>> problem = EnclosureOptimizationProblem(
+        ...     driver, "ported", ["f3", "size"], bounds, evaluation_cache=cache
+        ... )
+        >>> result, metadata = run_nsga2(problem)
+        >>> cache.summary()
+        'Evaluation cache: 3120/10000 hits (31.2%), 26880 entries'
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = 1_000_000,
+        significant_digits: int = 12,
+    ):
+        """
+        Open (or create) a cache file.
+
+        Args:
+            path: SQLite database path; parent directories must exist
+            max_entries: Maximum number of stored designs (default 1,000,000)
+            significant_digits: Quantization of design vectors (default 12)
+
+        Raises:
+            ValueError: If max_entries or significant_digits is not positive
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be >= 1, got {max_entries}")
+        if significant_digits < 1:
+            raise ValueError(f"significant_digits must be >= 1, got {significant_digits}")
+
+        self.path = str(path)
+        self.max_entries = int(max_entries)
+        self.significant_digits = int(significant_digits)
+        self.hits = 0
+        self.misses = 0
+
+        self._connection = sqlite3.connect(self.path, timeout=30.0)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS evaluations ("
+            "key TEXT PRIMARY KEY, f BLOB NOT NULL, g BLOB NOT NULL, "
+            "last_used INTEGER NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS evaluations_last_used ON evaluations (last_used)"
+        )
+        self._connection.commit()
+        self._clock = self._connection.execute(
+            "SELECT COALESCE(MAX(last_used), 0) FROM evaluations"
+        ).fetchone()[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM evaluations").fetchone()[0]
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache (0.0 before any lookup)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def design_key(self, signature: str, x: np.ndarray) -> str:
+        """Cache key of design vector ``x`` of the problem ``signature``."""
+        digits = self.significant_digits - 1
+        quantized = ",".join(f"{float(v):.{digits}e}" for v in np.ravel(x))
+        return hashlib.sha256(f"{signature}|{quantized}".encode()).hexdigest()
+
+    def lookup(self, keys: List[str]) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """
+        Fetch stored rows and mark them as recently used.
+
+        Args:
+            keys: Design keys (see design_key)
+
+        Returns:
+            Dict mapping each found key to its (f_row, g_row)
+        """
+        found = {}
+        unique = list(dict.fromkeys(keys))
+        for start in range(0, len(unique), _SQL_CHUNK):
+            chunk = unique[start:start + _SQL_CHUNK]
+            rows = self._connection.execute(
+                f"SELECT key, f, g FROM evaluations WHERE key IN ({','.join('?' * len(chunk))})",
+                chunk,
+            )
+            for key, f_blob, g_blob in rows:
+                found[key] = (np.frombuffer(f_blob), np.frombuffer(g_blob))
+
+        if found:
+            self._clock += 1
+            self._connection.executemany(
+                "UPDATE evaluations SET last_used = ? WHERE key = ?",
+                [(self._clock, key) for key in found],
+            )
+            self._connection.commit()
+        return found
+
+    def store(self, entries: Dict[str, Tuple[np.ndarray, np.ndarray]]) -> None:
+        """
+        Store (f_row, g_row) per key, then evict least-recently-used entries.
+
+        Args:
+            entries: Dict mapping design keys to (f_row, g_row)
+        """
+        if not entries:
+            return
+        self._clock += 1
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO evaluations (key, f, g, last_used) VALUES (?, ?, ?, ?)",
+            [
+                (key, np.asarray(f_row, dtype=float).tobytes(),
+                 np.asarray(g_row, dtype=float).tobytes(), self._clock)
+                for key, (f_row, g_row) in entries.items()
+            ],
+        )
+        excess = len(self) - self.max_entries
+        if excess > 0:
+            self._connection.execute(
+                "DELETE FROM evaluations WHERE key IN "
+                "(SELECT key FROM evaluations ORDER BY last_used ASC LIMIT ?)",
+                (excess,),
+            )
+        self._connection.commit()
+
+    def evaluate(
+        self,
+        X: np.ndarray,
+        evaluate: Callable[[np.ndarray], Tuple[np.ndarray, np.ndarray]],
+        signature: str,
+        n_obj: int,
+        n_constr: int,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Evaluate a population, re-using stored rows.
+
+        Only the rows of X missing from the cache are passed to
+        ``evaluate``; their results are stored before returning.
+
+        Args:
+            X: Design matrix (n_individuals × n_variables)
+            evaluate: Population evaluation returning (F, G) for a design matrix
+            signature: Problem signature (see problem_signature)
+            n_obj: Number of objectives
+            n_constr: Number of constraints
+
+        Returns:
+            Tuple (F, G) in population order
+        """
+        X = np.atleast_2d(X)
+        keys = [self.design_key(signature, x) for x in X]
+        found = self.lookup(keys)
+
+        F = np.zeros((len(X), n_obj))
+        G = np.zeros((len(X), n_constr))
+        missing = [i for i, key in enumerate(keys) if key not in found]
+        for i, key in enumerate(keys):
+            if key in found:
+                F[i], G[i] = found[key]
+
+        self.hits += len(X) - len(missing)
+        self.misses += len(missing)
+
+        if missing:
+            F_new, G_new = evaluate(X[missing])
+            F[missing] = np.reshape(F_new, (len(missing), n_obj))
+            G[missing] = np.reshape(G_new, (len(missing), n_constr))
+            self.store({keys[i]: (F[i], G[i]) for i in missing})
+
+        return F, G
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counts for result metadata."""
+        return {
+            "path": self.path,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "entries": len(self),
+        }
+
+    def summary(self) -> str:
+        """One-line hit rate report for the CLI."""
+        lookups = self.hits + self.misses
+        return (
+            f"Evaluation cache: {self.hits}/{lookups} hits "
+            f"({100.0 * self.hit_rate:.1f}%), {len(self)} entries"
+        )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
@@ -0,0 +1,251 @@
+"""
+Multi-fidelity objective evaluation: coarse frequency grids early, fine late.
+
+Early generations only need to rank designs roughly, so evaluating every
+individual's response on the full frequency grid wastes most of the
+simulation budget. A fidelity schedule evaluates the response-based
+objectives (F3 search, flatness, passband flatness, impedance smoothness)
+on coarse grids while the population is still spread out, then on finer
+grids as it converges. The designs returned to the caller are always
+re-scored on the objectives' full grids, so reported objective values are
+exact.
+
+A schedule is a sequence of ``(fraction, n_points)`` stages: generations up
+to ``fraction`` of the run use about ``n_points`` frequencies per objective
+(grids are drawn from the shared lattice, see shared_frequency_grid, so
+coarse grids nest into the fine ones and into the batch-simulated horn
+samples), and generations after the last stage use the full grid. The default
+``((0.5, 24), (1.0, 64))`` evaluates 24 points for the first half and 64 for
+the second half, against 100-200 points at full fidelity.
+
+When the grid changes, the surviving population is re-evaluated on the new
+grid before the next generation, so parents and offspring are always
+compared on the same grid.
+
+Literature:
+    - Kennedy & O'Hagan (2000) - "Predicting the output from a complex
+      computer code when fast approximations are available" (multi-fidelity)
+    - Jin (2005) - "A comprehensive survey of fitness approximation in
+      evolutionary computation" (evolution control)
+"""
+
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from viberesp.optimization.objectives.context import f3_frequency_grid
+
+# Default (fraction of generations, frequency points) stages
+DEFAULT_FIDELITY_SCHEDULE: Tuple[Tuple[float, int], ...] = ((0.5, 24), (1.0, 64))
+
+# F3 needs at least 10 valid frequency samples (objective_f3)
+MIN_FREQUENCY_POINTS = 10
+
+# Key in algorithm.data recording the grid the population was evaluated on
+_DATA_KEY = "n_frequency_points"
+
+# Objectives whose ``n_points`` argument is the size of their frequency grid
+_N_POINTS_OBJECTIVES = (
+    "flatness",
+    "response_flatness",
+    "passband_flatness",
+    "composite_flatness",
+    "impedance_smoothness",
+)
+
+
+def validate_fidelity_schedule(
+    schedule: Sequence[Tuple[float, int]],
+) -> Tuple[Tuple[float, int], ...]:
+    """
+    Check a fidelity schedule and return it as a tuple of stages.
+
+    Args:
+        schedule: Sequence of (fraction, n_points) stages with increasing
+            fractions in (0, 1]
+
+    Returns:
+        Tuple of (float, int) stages
+
+    Raises:
+        ValueError: If the schedule is empty, fractions are not increasing
+            within (0, 1], or a stage has fewer than MIN_FREQUENCY_POINTS
+    """
+    stages = tuple((float(fraction), int(n_points)) for fraction, n_points in schedule)
+    if not stages:
+        raise ValueError("fidelity schedule must have at least one stage")
+
+    previous = 0.0
+    for fraction, n_points in stages:
+        if not previous < fraction <= 1.0:
+            raise ValueError(
+                f"fidelity schedule fractions must increase within (0, 1], got {fraction}"
+            )
+        if n_points < MIN_FREQUENCY_POINTS:
+            raise ValueError(
+                f"fidelity schedule needs >= {MIN_FREQUENCY_POINTS} frequency points "
+                f"per stage, got {n_points}"
+            )
+        previous = fraction
+    return stages
+
+
+def parse_fidelity_schedule(text: str) -> Tuple[Tuple[float, int], ...]:
+    """
+    Parse a command-line fidelity schedule.
+
+    Args:
+        text: Comma-separated ``fraction:n_points`` stages, e.g.
+            ``"0.5:24,1:64"``, or ``"default"`` for DEFAULT_FIDELITY_SCHEDULE
+
+    Returns:
+        Validated tuple of stages
+
+    Raises:
+        ValueError: If the text is malformed or the schedule is invalid
+
+    Examples:
+        >>> parse_fidelity_schedule("0.3:16,0.7:48")
+        ((0.3, 16), (0.7, 48))
+    """
+    if text.strip().lower() == "default":
+        return DEFAULT_FIDELITY_SCHEDULE
+
+    stages = []
+    for item in text.split(","):
+        try:
+            fraction, n_points = item.split(":")
+            stages.append((float(fraction), int(n_points)))
+        except ValueError:
+            raise ValueError(
+                f"Invalid fidelity stage '{item}', expected fraction:n_points (e.g. 0.5:24)"
+            ) from None
+    return validate_fidelity_schedule(stages)
+
+
+def fidelity_kwargs(objective_name: str, n_points: Optional[int]) -> Dict[str, object]:
+    """
+    Keyword arguments evaluating an objective on a reduced frequency grid.
+
+    Args:
+        objective_name: Objective name (e.g. "f3", "flatness")
+        n_points: Number of frequency points (None = objective's full grid)
+
+    Returns:
+        Keyword arguments for the objective function ({} at full fidelity
+        or for objectives without a frequency grid)
+    """
+    if n_points is None:
+        return {}
+    if objective_name in ("f3", "f3_deviation"):
+        # Horn F3 search grid (full fidelity: 48 points per octave, 20-500 Hz),
+        # coarsened on the shared lattice so batch-primed samples are reused
+        return {"frequency_points": f3_frequency_grid(n_points)}
+    if objective_name in _N_POINTS_OBJECTIVES:
+        return {"n_points": n_points}
+    return {}
+
+
+def fidelity_signature(signature: str, n_points: Optional[int]) -> str:
+    """Evaluation-cache signature of a problem evaluated on ``n_points``."""
+    return signature if n_points is None else f"{signature}|n_points={n_points}"
+
+
+class FidelitySchedule:
+    """
+    Switch a problem's frequency grid as the generations progress.
+
+    Pass ``before_generation`` to minimize_with_checkpoints(); it sets
+    ``problem.n_frequency_points`` for the upcoming generation and
+    re-evaluates the population when the grid changes. The grid the
+    population was evaluated on is stored in ``algorithm.data``, so resumed
+    runs continue on the same grid.
+
+    Attributes:
+        stages: Tuple of (fraction, n_points) stages
+        n_generations: Planned number of generations of the run
+
+    Examples:
+        >>> schedule = FidelitySchedule(DEFAULT_FIDELITY_SCHEDULE, n_generations=200)
+        >>> schedule.n_points(1), schedule.n_points(150), schedule.n_points(200)
+        (24, 64, 64)
+    """
+
+    def __init__(self, stages: Sequence[Tuple[float, int]], n_generations: int):
+        """
+        Args:
+            stages: Sequence of (fraction, n_points) stages
+            n_generations: Planned number of generations
+
+        Raises:
+            ValueError: If the schedule is invalid or n_generations < 1
+        """
+        if n_generations < 1:
+            raise ValueError(f"n_generations must be >= 1, got {n_generations}")
+        self.stages = validate_fidelity_schedule(stages)
+        self.n_generations = n_generations
+
+    def n_points(self, generation: int) -> Optional[int]:
+        """
+        Frequency points for a generation (1-based).
+
+        Returns:
+            Number of points, or None for the objectives' full grids
+        """
+        progress = (generation - 1) / self.n_generations
+        for fraction, n_points in self.stages:
+            if progress < fraction:
+                return n_points
+        return None
+
+    def before_generation(self, algorithm) -> None:
+        """Set the problem's grid for the upcoming generation of ``algorithm``."""
+        problem = algorithm.problem
+        n_points = self.n_points(algorithm.n_iter or 1)
+        problem.n_frequency_points = n_points
+
+        if algorithm.is_initialized and algorithm.data.get(_DATA_KEY) != n_points:
+            # Parents must be ranked on the same grid as their offspring
+            algorithm.evaluator.eval(problem, algorithm.pop, skip_already_evaluated=False)
+        algorithm.data[_DATA_KEY] = n_points
+
+
+def rescore_front(result, problem) -> int:
+    """
+    Re-evaluate the final population on full grids and update the front.
+
+    The final population is re-evaluated with ``problem.n_frequency_points``
+    set to None, and result.pop, result.opt and result.X/F/G/CV are replaced
+    by the full-fidelity values (designs dominated at full fidelity drop out
+    of the front).
+
+    Args:
+        result: pymoo Result of a multi-fidelity run
+        problem: The run's problem
+
+    Returns:
+        Number of designs re-evaluated
+    """
+    from pymoo.core.evaluator import Evaluator
+    from pymoo.core.population import Population
+    from pymoo.util.optimum import filter_optimum
+
+    problem.n_frequency_points = None
+    if result.pop is None or len(result.pop) == 0:
+        return 0
+
+    pop = Population.new(X=result.pop.get("X"))
+    Evaluator().eval(problem, pop)
+    result.pop = pop
+
+    opt = filter_optimum(pop, least_infeasible=True)
+    if opt is not None and not np.any(opt.get("FEAS")):
+        if not getattr(result.algorithm, "return_least_infeasible", False):
+            opt = None
+    result.opt = opt
+
+    if opt is None:
+        result.X, result.F, result.CV, result.G, result.H = None, None, None, None, None
+    else:
+        result.X, result.F, result.CV, result.G, result.H = opt.get("X", "F", "CV", "G", "H")
+    return len(pop)
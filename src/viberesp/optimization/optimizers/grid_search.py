@@ -0,0 +1,244 @@
+"""
+Exhaustive grid search for low-dimensional enclosures.
+
+Sealed boxes have one design variable (Vb) and ported boxes two to four
+(Vb, Fb, port area and length). For these a dense grid over the parameter
+bounds covers the design space completely within a few thousand
+evaluations, and the sealed/ported objectives evaluate whole batches of
+boxes at once (see the vectorized evaluation of EnclosureOptimizationProblem
+and FactoryOptimizationProblem).
+The non-dominated set of the grid is then the exact Pareto front at the
+grid's resolution: no population, no random operators, and the same front
+on every run.
+
+Each refinement round adds the compass stencil (± half the previous step
+along every variable) around the current front designs, so the front is
+resolved finer where it lies instead of refining the whole grid.
+
+Literature:
+    - Deb (2001) - Multi-Objective Optimization using Evolutionary
+      Algorithms, Section 2.4 (non-dominated set of a finite population)
+    - Torczon (1997) - "On the convergence of pattern search algorithms"
+      (compass stencil with halved steps)
+"""
+
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+from pymoo.core.population import Population
+from pymoo.core.result import Result
+from pymoo.util.optimum import filter_optimum
+
+from viberesp.optimization.optimizers.parallel import resolve_workers
+
+# Largest initial grid run_grid_search builds (designs)
+MAX_GRID_DESIGNS = 1_000_000
+
+# Enclosure types with design spaces small enough for an exhaustive grid
+GRID_ENCLOSURE_TYPES = ("sealed", "ported")
+
+
+def grid_points_per_variable(n_var: int, max_evaluations: int) -> int:
+    """
+    Largest number of grid points per variable within an evaluation budget.
+
+    Args:
+        n_var: Number of design variables
+        max_evaluations: Maximum number of designs of the initial grid
+
+    Returns:
+        Points per variable (n_points ** n_var <= max_evaluations)
+
+    Raises:
+        ValueError: If the budget does not allow 2 points per variable
+
+    Examples:
+        >>> grid_points_per_variable(1, 4096), grid_points_per_variable(4, 4096)
+        (4096, 8)
+    """
+    n_points = int(np.floor(max_evaluations ** (1.0 / n_var) + 1e-9))
+    while n_points ** n_var > max_evaluations:
+        n_points -= 1
+    if n_points < 2:
+        raise ValueError(
+            f"Grid search over {n_var} variables needs at least {2 ** n_var} "
+            f"evaluations, got max_evaluations={max_evaluations}"
+        )
+    return n_points
+
+
+def grid_designs(xl: np.ndarray, xu: np.ndarray, n_points: int) -> np.ndarray:
+    """
+    Full-factorial grid over the parameter bounds.
+
+    Args:
+        xl: Lower variable bounds
+        xu: Upper variable bounds
+        n_points: Points per variable (bounds included)
+
+    Returns:
+        Design matrix (n_points ** n_var × n_var); the last variable varies
+        fastest
+    """
+    axes = [np.linspace(lo, hi, n_points) for lo, hi in zip(xl, xu)]
+    return np.stack(np.meshgrid(*axes, indexing="ij"), axis=-1).reshape(-1, len(axes))
+
+
+def _evaluate(problem, X: np.ndarray, batch_size: int) -> Population:
+    """Evaluate designs in batches of ``batch_size`` rows."""
+    F, G = [], []
+    for start in range(0, len(X), batch_size):
+        out = problem.evaluate(X[start:start + batch_size], return_as_dictionary=True)
+        F.append(np.asarray(out["F"], dtype=float).reshape(-1, problem.n_obj))
+        G.append(np.asarray(out.get("G", np.empty((len(F[-1]), 0))), dtype=float)
+                 .reshape(len(F[-1]), -1))
+    return Population.new("X", X, "F", np.vstack(F), "G", np.vstack(G))
+
+
+def _front(pop: Population, max_front: Optional[int]) -> Population:
+    """
+    Non-dominated feasible designs (least infeasible if none is feasible).
+
+    Fronts larger than ``max_front`` are thinned to designs evenly spaced
+    along the first objective.
+    """
+    opt = filter_optimum(pop, least_infeasible=True)
+    if max_front is not None and len(opt) > max_front:
+        order = np.argsort(opt.get("F")[:, 0], kind="stable")
+        opt = opt[order[np.unique(np.round(np.linspace(0, len(opt) - 1, max_front)).astype(int))]]
+    return opt
+
+
+def _stencil(X: np.ndarray, step: np.ndarray, xl: np.ndarray, xu: np.ndarray) -> np.ndarray:
+    """Designs ± step along each variable around every row of X, clipped to the bounds."""
+    offsets = np.vstack([np.diag(step), -np.diag(step)])
+    candidates = (X[:, None, :] + offsets[None, :, :]).reshape(-1, X.shape[1])
+    return np.unique(np.clip(candidates, xl, xu), axis=0)
+
+
+def run_grid_search(
+    problem,
+    n_points: Optional[int] = None,
+    max_evaluations: int = 4096,
+    refinements: int = 2,
+    max_front: Optional[int] = None,
+    batch_size: int = 1024,
+    verbose: bool = True,
+    workers: Optional[int] = None,
+) -> Tuple[Result, Dict]:
+    """
+    Find the Pareto front by evaluating a dense grid of designs.
+
+    The grid spans the problem bounds with ``n_points`` per variable
+    (default: as many as ``max_evaluations`` allows) and is evaluated in
+    batches of ``batch_size`` designs. Each of the ``refinements`` rounds
+    evaluates the compass stencil around the current front with half the
+    previous step; designs already evaluated are skipped. The run is
+    deterministic: the same problem always gives the same front.
+
+    Literature:
+        - Deb (2001) - Non-dominated set of a finite population
+        - Torczon (1997) - Pattern search with halved steps
+
+    Args:
+        problem: pymoo problem (EnclosureOptimizationProblem,
+                 FactoryOptimizationProblem, ...)
+        n_points: Grid points per variable, bounds included
+                  (default: grid_points_per_variable(n_var, max_evaluations))
+        max_evaluations: Evaluation budget of the initial grid when
+                         n_points is not given (default 4096: 4096 sealed
+                         volumes, 64² or 8⁴ ported designs)
+        refinements: Refinement rounds around the front (default 2)
+        max_front: Maximum number of designs refined and returned; larger
+                   fronts are thinned evenly along the first objective
+                   (None = keep all)
+        batch_size: Designs per problem evaluation call (default 1024)
+        verbose: Whether to print progress
+        workers: Worker processes per batch (default: problem.workers;
+                 1 = serial, 0 = all CPU cores)
+
+    Returns:
+        Tuple of (result, metadata) as run_nsga2 returns them; result.pop
+        holds every evaluated design and result.algorithm is None
+
+    Raises:
+        ValueError: If n_points < 2, the grid exceeds MAX_GRID_DESIGNS,
+            refinements < 0 or the budget does not allow 2 points per variable
+
+    Examples:
+        >>> problem = EnclosureOptimizationProblem(
+        ...     driver, "ported", ["f3", "size"], {"Vb": (0.01, 0.08), "Fb": (25.0, 70.0)}
+        ... )
+        >>> result, metadata = run_grid_search(problem, n_points=64, max_front=100)
+        >>> metadata["n_evaluations"]  # 64² grid + refinement stencils
+        4733
+    """
+    xl = np.asarray(problem.xl, dtype=float)
+    xu = np.asarray(problem.xu, dtype=float)
+    if n_points is None:
+        n_points = grid_points_per_variable(problem.n_var, max_evaluations)
+    if n_points < 2:
+        raise ValueError(f"n_points must be >= 2, got {n_points}")
+    if n_points ** problem.n_var > MAX_GRID_DESIGNS:
+        raise ValueError(
+            f"A grid of {n_points} points over {problem.n_var} variables has "
+            f"{n_points ** problem.n_var} designs (at most {MAX_GRID_DESIGNS})"
+        )
+    if refinements < 0:
+        raise ValueError(f"refinements must be >= 0, got {refinements}")
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+    if workers is not None:
+        problem.workers = resolve_workers(workers)
+
+    X = grid_designs(xl, xu, n_points)
+    if verbose:
+        print("Running grid search:")
+        print(f"  Grid: {n_points} points × {problem.n_var} variables ({len(X)} designs)")
+        print(f"  Refinements: {refinements}")
+        print(f"  Objectives: {problem.n_obj}")
+        print(f"  Constraints: {problem.n_constr}")
+
+    try:
+        pop = _evaluate(problem, X, batch_size)
+        front = _front(pop, max_front)
+        seen = {row.tobytes() for row in X}
+
+        step = (xu - xl) / (n_points - 1)
+        for _ in range(refinements):
+            step = step / 2
+            candidates = _stencil(front.get("X"), step, xl, xu)
+            new = np.array([row.tobytes() not in seen for row in candidates], dtype=bool)
+            if not np.any(new):
+                continue
+            seen.update(row.tobytes() for row in candidates[new])
+            pop = Population.merge(pop, _evaluate(problem, candidates[new], batch_size))
+            front = _front(pop, max_front)
+    finally:
+        # Shut down the worker pool (if any) once the run is over
+        if hasattr(problem, "close"):
+            problem.close()
+
+    result = Result()
+    result.problem = problem
+    result.pop = pop
+    result.opt = front
+    result.X, result.F, result.G, result.CV = front.get("X", "F", "G", "CV")
+
+    metadata = {
+        "algorithm": "grid",
+        "grid_points": n_points,
+        "refinements": refinements,
+        "workers": getattr(problem, "workers", 1),
+        "n_evaluations": len(pop),
+        "n_pareto_designs": len(front),
+        "feasible": bool(np.any(front.get("feas"))),
+    }
+    if getattr(problem, "evaluation_cache", None) is not None:
+        metadata["evaluation_cache"] = problem.evaluation_cache.stats()
+
+    if verbose:
+        print(f"  Evaluations: {metadata['n_evaluations']}")
+        print(f"  Pareto designs: {metadata['n_pareto_designs']}")
+
+    return result, metadata
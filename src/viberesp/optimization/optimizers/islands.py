@@ -0,0 +1,209 @@
+"""
+Island-model NSGA-II: independent populations with periodic migration.
+
+Parallel evaluation (see parallel) speeds up one population but keeps every
+core waiting on the slowest individual of each generation, and one large
+population still converges to a single front. The island model runs several
+independent NSGA-II populations ("islands"), each in its own process with
+its own seed and optionally its own parameter space, for
+``migration_interval`` generations at a time. Between these epochs the
+non-dominated designs of each island migrate to the next island (ring
+topology), where they are evaluated and compete in that island's survival
+selection. The final front is the non-dominated set of all islands merged.
+
+Islands only exchange design vectors, so they may use different parameter
+bounds (e.g. different parameter space presets) as long as they share the
+design variables and objectives; migrants are clipped to the receiving
+island's bounds.
+
+Literature:
+    - Whitley, Rana & Heckendorn (1999) - "The island model genetic
+      algorithm: On separability, population size and convergence"
+    - Alba & Tomassini (2002) - "Parallelism and evolutionary algorithms"
+    - Deb et al. (2002) - NSGA-II
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, List, Optional, Sequence
+
+import numpy as np
+from pymoo.core.duplicate import DefaultDuplicateElimination
+from pymoo.core.population import Population
+from pymoo.core.result import Result
+from pymoo.termination.max_gen import MaximumGenerationTermination
+from pymoo.util.optimum import filter_optimum
+
+from viberesp.optimization.optimizers.checkpoint import extend_generations
+
+
+def _advance_island(algorithm, until_generation: int, immigrants: Optional[np.ndarray]):
+    """
+    Accept migrants, then run an island up to ``until_generation``.
+
+    Runs in a worker process; the algorithm (with its problem and random
+    state) is pickled there and back, so the result does not depend on the
+    number of processes.
+    """
+    if immigrants is not None and len(immigrants) > 0:
+        problem = algorithm.problem
+        arrivals = Population.new(X=np.clip(immigrants, problem.xl, problem.xu))
+        algorithm.evaluator.eval(problem, arrivals)
+        algorithm.pop = algorithm.survival.do(
+            problem,
+            Population.merge(algorithm.pop, arrivals),
+            n_survive=algorithm.pop_size,
+            algorithm=algorithm,
+            random_state=algorithm.random_state,
+        )
+
+    extend_generations(algorithm, until_generation)
+    while algorithm.has_next():
+        algorithm.next()
+    return algorithm
+
+
+def select_migrants(algorithm, n_migrants: int) -> np.ndarray:
+    """
+    Design vectors of up to ``n_migrants`` non-dominated designs of an island.
+
+    Migrants are spread evenly along the island's front (sorted by the
+    first objective), so the receiving island gets the whole trade-off
+    rather than one corner of it.
+
+    Args:
+        algorithm: Island algorithm after at least one generation
+        n_migrants: Maximum number of migrants
+
+    Returns:
+        Design matrix (n × n_var), empty if the island has no feasible front
+    """
+    opt = algorithm.opt
+    if n_migrants == 0 or opt is None or len(opt) == 0:
+        return np.zeros((0, algorithm.problem.n_var))
+
+    feasible = np.ravel(opt.get("FEAS"))
+    X, F = opt.get("X")[feasible], opt.get("F")[feasible]
+    if len(X) > n_migrants:
+        order = np.argsort(F[:, 0], kind="stable")
+        X = X[order[np.linspace(0, len(X) - 1, n_migrants).round().astype(int)]]
+    return X
+
+
+def run_islands(
+    problems: Sequence[Any],
+    algorithms: Sequence[Any],
+    n_generations: int,
+    migration_interval: int = 10,
+    n_migrants: int = 5,
+    seed: Optional[int] = None,
+    processes: Optional[int] = None,
+    callback: Optional[Callable[[int], None]] = None,
+) -> Result:
+    """
+    Run one algorithm per island with ring migration and merge the fronts.
+
+    Args:
+        problems: One pymoo Problem per island (same variables and
+            objectives; bounds may differ). Island problems are pickled to
+            the island processes, so they should evaluate serially.
+        algorithms: One pymoo Algorithm per island (not yet set up)
+        n_generations: Generations per island
+        migration_interval: Generations between migrations (default 10)
+        n_migrants: Non-dominated designs sent to the next island per
+            migration (default 5)
+        seed: Base random seed; island i uses ``seed + i`` (None = random)
+        processes: Worker processes (default: one per island; 1 runs the
+            islands in this process, with identical results)
+        callback: Optional function called with the completed generation
+            after every epoch
+
+    Returns:
+        pymoo Result with the merged, duplicate-free front of all islands.
+        result.algorithm is the first island and result.islands holds
+        every island's final algorithm state.
+
+    Raises:
+        ValueError: If the islands do not share the design variables and
+            objectives, or a setting is out of range
+
+    Examples:
+        >>> problems = [make_problem(preset) for preset in ("bass_horn", "fullrange_horn")] * 2
+        >>> result = run_islands(
+        ...     problems, [NSGA2(pop_size=50) for _ in problems], n_generations=200,
+        ...     migration_interval=10, seed=42
+        ... )
+        >>> len(result.islands)
+        4
+    """
+    if len(problems) != len(algorithms) or len(problems) == 0:
+        raise ValueError(
+            f"Need one problem per island, got {len(problems)} problems "
+            f"for {len(algorithms)} algorithms"
+        )
+    if migration_interval < 1:
+        raise ValueError(f"migration_interval must be >= 1, got {migration_interval}")
+    if n_migrants < 0:
+        raise ValueError(f"n_migrants must be >= 0, got {n_migrants}")
+    if len({(problem.n_var, problem.n_obj, problem.n_ieq_constr) for problem in problems}) > 1:
+        raise ValueError("All islands must have the same variables, objectives and constraints")
+
+    islands = list(algorithms)
+    for i, (algorithm, problem) in enumerate(zip(islands, problems)):
+        algorithm.setup(
+            problem,
+            termination=MaximumGenerationTermination(n_generations),
+            seed=None if seed is None else seed + i,
+            verbose=False,
+        )
+
+    n_processes = len(islands) if processes is None else max(1, min(processes, len(islands)))
+    executor = ProcessPoolExecutor(max_workers=n_processes) if n_processes > 1 else None
+    try:
+        generation = 0
+        immigrants: List[Optional[np.ndarray]] = [None] * len(islands)
+        while generation < n_generations:
+            generation = min(generation + migration_interval, n_generations)
+            epoch = (islands, [generation] * len(islands), immigrants)
+            if executor is not None:
+                islands = list(executor.map(_advance_island, *epoch))
+            else:
+                islands = [_advance_island(*args) for args in zip(*epoch)]
+
+            if callback is not None:
+                callback(generation)
+
+            # Ring migration: island i receives from island i - 1
+            if generation < n_generations:
+                emigrants = [select_migrants(algorithm, n_migrants) for algorithm in islands]
+                immigrants = emigrants[-1:] + emigrants[:-1]
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    # Islands were pickled to the workers; re-attach the caller's problems
+    for algorithm, problem in zip(islands, problems):
+        algorithm.problem = problem
+
+    return _merged_result(islands)
+
+
+def _merged_result(islands: List[Any]) -> Result:
+    """Result holding the non-dominated designs of all islands' populations."""
+    pop = Population.merge(*[algorithm.pop for algorithm in islands])
+    pop = DefaultDuplicateElimination().do(pop)
+
+    result = islands[0].result()
+    result.pop = pop
+    result.algorithm = islands[0]
+    result.islands = islands
+
+    opt = filter_optimum(pop, least_infeasible=True)
+    if opt is not None and not np.any(opt.get("FEAS")) and not islands[0].return_least_infeasible:
+        opt = None
+    result.opt = opt
+
+    if opt is None:
+        result.X, result.F, result.CV, result.G, result.H = None, None, None, None, None
+    else:
+        result.X, result.F, result.CV, result.G, result.H = opt.get("X", "F", "CV", "G", "H")
+    return result
@@ -0,0 +1,246 @@
+"""
+Process-pool population evaluation for pymoo problems.
+
+Enclosure simulations are CPU bound and independent per individual, so each
+generation can be spread across worker processes. The problem (driver,
+objective and constraint functions, bounds) is shipped to every worker once,
+when the pool starts, and stays resident for the whole run; each generation
+only sends design vectors and receives objective/constraint rows.
+
+Problems evaluated through PopulationEvaluator implement
+``_evaluate_individual(index, design_vector) -> (f_row, g_row)``, the same
+per-individual step their serial ``_evaluate`` loop performs, so serial and
+parallel runs produce identical F and G. ParallelEvaluationMixin adds the
+serial/parallel dispatch and pool lifecycle to a pymoo Problem.
+
+Literature:
+    - Deb et al. (2002) - NSGA-II, generational population evaluation
+    - pymoo documentation - Problem evaluation and parallelization
+"""
+
+import os
+import traceback
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Problem instance owned by a worker process (set once by _init_worker)
+_WORKER_PROBLEM = None
+
+
+def resolve_workers(workers: Optional[int]) -> int:
+    """
+    Resolve a ``workers`` setting to a process count.
+
+    Args:
+        workers: Number of worker processes. None or 1 evaluates serially,
+            0 uses every available CPU core.
+
+    Returns:
+        Number of worker processes (1 means serial evaluation)
+
+    Raises:
+        ValueError: If workers is negative
+
+    Examples:
+        >>> resolve_workers(None)
+        1
+        >>> resolve_workers(4)
+        4
+    """
+    if workers is None:
+        return 1
+    if workers < 0:
+        raise ValueError(f"workers must be >= 0, got {workers}")
+    if workers == 0:
+        return os.cpu_count() or 1
+    return int(workers)
+
+
+def _init_worker(problem) -> None:
+    """Pool initializer: keep the problem resident in this worker."""
+    global _WORKER_PROBLEM
+    _WORKER_PROBLEM = problem
+
+
+def _evaluate_chunk(start: int, rows: np.ndarray, state: Dict[str, Any]) -> List[tuple]:
+    """
+    Evaluate a contiguous block of individuals in a worker process.
+
+    Warnings raised while evaluating an individual are recorded and returned
+    with its result, so the parent can re-emit them. ``state`` holds the
+    parent problem's current values of its ``_synced_attributes`` (e.g. the
+    frequency-grid fidelity), which may change between generations. The
+    block shares the problem's population contexts, as in serial
+    evaluation. An exception escaping the problem's own error handling is
+    captured with its traceback instead of tearing down the pool.
+    """
+    for name, value in state.items():
+        setattr(_WORKER_PROBLEM, name, value)
+
+    population_contexts = getattr(_WORKER_PROBLEM, "_population_contexts", None)
+    contexts = population_contexts(rows) if population_contexts is not None else None
+
+    results = []
+    for k, x in enumerate(rows):
+        index = start + k
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            try:
+                if contexts is None:
+                    f_row, g_row = _WORKER_PROBLEM._evaluate_individual(index, x)
+                else:
+                    f_row, g_row = _WORKER_PROBLEM._evaluate_individual(index, x, contexts[k])
+                error = None
+            except Exception:
+                f_row, g_row = None, None
+                error = traceback.format_exc()
+        messages = [(str(w.message), w.category) for w in caught]
+        results.append((f_row, g_row, messages, error))
+    return results
+
+
+class PopulationEvaluator:
+    """
+    Evaluate a population across a pool of worker processes.
+
+    The pool is created on first use and reused for every generation until
+    close() is called. Individuals are split into one contiguous block per
+    worker and results are reassembled in population order, so the output
+    does not depend on scheduling.
+
+    Attributes:
+        problem: Problem implementing ``_evaluate_individual(index, x)``
+        workers: Number of worker processes
+
+    Examples:
+        >>> with PopulationEvaluator(problem, workers=8) as evaluator:
+        ...     F, G = evaluator.evaluate(X)
+    """
+
+    def __init__(self, problem, workers: int):
+        if workers < 1:
+            raise ValueError(f"workers must be >= 1, got {workers}")
+        self.problem = problem
+        self.workers = workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(self.problem,),
+            )
+        return self._executor
+
+    def evaluate(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Evaluate every row of X in the worker pool.
+
+        Args:
+            X: Design matrix (n_individuals × n_variables)
+
+        Returns:
+            Tuple (F, G) of objective rows (n_individuals × n_obj) and
+            constraint rows (n_individuals × n_constr)
+
+        Raises:
+            RuntimeError: If evaluating an individual raised an exception the
+                problem did not handle; the message includes the worker
+                traceback
+        """
+        X = np.atleast_2d(X)
+        blocks = np.array_split(np.arange(len(X)), min(self.workers, len(X)))
+        starts = [int(block[0]) for block in blocks if len(block)]
+        chunks = [X[block] for block in blocks if len(block)]
+
+        state = {
+            name: getattr(self.problem, name)
+            for name in getattr(self.problem, "_synced_attributes", ())
+        }
+        results_per_chunk = self._pool().map(
+            _evaluate_chunk, starts, chunks, [state] * len(chunks)
+        )
+
+        F, G = [], []
+        for start, results in zip(starts, results_per_chunk):
+            for k, (f_row, g_row, messages, error) in enumerate(results):
+                for message, category in messages:
+                    warnings.warn(message, category)
+                if error is not None:
+                    raise RuntimeError(
+                        f"Evaluation of design {start + k} failed in worker process:\n{error}"
+                    )
+                F.append(f_row)
+                G.append(g_row)
+
+        n_obj = getattr(self.problem, "n_obj", 0)
+        n_constr = getattr(self.problem, "n_constr", 0)
+        return (
+            np.array(F, dtype=float).reshape(len(X), n_obj),
+            np.array(G, dtype=float).reshape(len(X), n_constr),
+        )
+
+    def close(self) -> None:
+        """Shut down the worker pool (it is recreated on the next evaluate)."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+class ParallelEvaluationMixin:
+    """
+    Serial or process-pool population evaluation for a pymoo Problem.
+
+    Subclasses implement ``_evaluate_individual(index, x)`` and set
+    ``workers``; ``_evaluate_population(X)`` then evaluates serially or in a
+    PopulationEvaluator that lives until close(). Pass
+    ``exclude_from_serialization=["_population_evaluator"]`` to
+    ``Problem.__init__`` so the pool is never pickled with the problem.
+    Attributes named in ``_synced_attributes`` are sent to the workers with
+    every generation, so they may change during a run. Serial evaluation
+    and each worker's block pass the per-design contexts of
+    ``_population_contexts(X)`` (if it returns any) as a third argument to
+    ``_evaluate_individual``.
+    """
+
+    workers: int = 1
+    _population_evaluator: Optional[PopulationEvaluator] = None
+    _synced_attributes: Tuple[str, ...] = ()
+
+    def _evaluate_population(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Evaluate every row of X, in the worker pool if ``workers > 1``."""
+        if self.workers > 1 and len(X) > 1:
+            if (self._population_evaluator is None
+                    or self._population_evaluator.workers != self.workers):
+                self.close()
+                self._population_evaluator = PopulationEvaluator(self, self.workers)
+            return self._population_evaluator.evaluate(X)
+
+        contexts = self._population_contexts(X)
+        if contexts is None:
+            rows = [self._evaluate_individual(i, X[i]) for i in range(len(X))]
+        else:
+            rows = [self._evaluate_individual(i, X[i], contexts[i]) for i in range(len(X))]
+        F = np.array([f_row for f_row, _ in rows], dtype=float).reshape(len(X), self.n_obj)
+        G = np.array([g_row for _, g_row in rows], dtype=float).reshape(len(X), self.n_constr)
+        return F, G
+
+    def _population_contexts(self, X: np.ndarray) -> Optional[List[Any]]:
+        """Per-design evaluation contexts simulated for the whole population (None = none)."""
+        return None
+
+    def close(self) -> None:
+        """Shut down the worker pool, if one was started."""
+        if self._population_evaluator is not None:
+            self._population_evaluator.close()
+            self._population_evaluator = None
@@ -0,0 +1,227 @@
+"""
+Gradient-based local polishing of Pareto designs.
+
+Evolutionary runs stop with front designs that are close to, but not on,
+the true Pareto front: the last generations mostly reshuffle designs
+instead of moving them. Box and horn objectives are smooth in the design
+variables between failure regions, so a few gradient steps per design
+close that gap for far fewer evaluations than further generations.
+
+Each feasible front design x0 with objectives f0 is refined by SLSQP on
+the scalarized problem (Benson's method)
+
+    minimize    sum_i (f_i(x) - f_i(x0)) / s_i
+    subject to  f_i(x) <= f_i(x0)   for every objective i
+                g_j(x) <= 0         for every constraint j
+                xl <= x <= xu
+
+with s_i the spread of objective i over the front. Every feasible point of
+this problem weakly dominates x0, so a polished design can only move
+towards the front, never along it. Gradients are forward finite
+differences (backward at the upper bound) of all perturbed designs,
+evaluated in one batched problem.evaluate() call per SLSQP iteration; the
+sealed/ported problems evaluate such a batch vectorized.
+
+Of all designs evaluated for x0, the one that dominates x0 with the
+largest improvement replaces it; if none does, x0 is kept.
+
+Literature:
+    - Benson (1978) - "Existence of efficient solutions for vector
+      maximization problems" (scalarization by improvement over a
+      reference point)
+    - Kraft (1988) - "A software package for sequential quadratic
+      programming" (SLSQP)
+    - Deb (2001) - Multi-Objective Optimization using Evolutionary
+      Algorithms, Section 9.9 (hybrid evolutionary-local search)
+"""
+
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+from pymoo.core.population import Population
+from pymoo.util.optimum import filter_optimum
+
+from viberesp.optimization.optimizers.surrogate import PENALTY_THRESHOLD
+
+
+class _FiniteDifferenceModel:
+    """
+    Objective/constraint values and forward-difference Jacobians of a problem.
+
+    Works in normalized variables u in [0, 1] (x = xl + u * (xu - xl)) and
+    caches every evaluated design, so SLSQP's calls of the objective,
+    constraints and their Jacobians at the same point evaluate it once.
+    """
+
+    def __init__(self, problem, fd_step: float):
+        self.problem = problem
+        self.xl = np.asarray(problem.xl, dtype=float)
+        self.width = np.asarray(problem.xu, dtype=float) - self.xl
+        self.fd_step = fd_step
+        self.n_evaluations = 0
+        self.designs: Dict[bytes, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+
+    def _evaluate(self, U: np.ndarray) -> None:
+        """Evaluate the designs of U not evaluated yet in one batch."""
+        U = np.array([u for u in U if u.tobytes() not in self.designs])
+        if len(U) == 0:
+            return
+        X = self.xl + U * self.width
+        out = self.problem.evaluate(X, return_as_dictionary=True)
+        F = np.asarray(out["F"], dtype=float).reshape(len(X), -1)
+        G = np.asarray(out.get("G", np.empty((len(X), 0))), dtype=float).reshape(len(X), -1)
+        # Failed designs: keep SLSQP away from them with large finite values
+        F = np.where(np.isfinite(F), F, PENALTY_THRESHOLD)
+        G = np.where(np.isfinite(G), G, PENALTY_THRESHOLD)
+        self.n_evaluations += len(X)
+        for u, x, f, g in zip(U, X, F, G):
+            self.designs[u.tobytes()] = (x, f, g)
+
+    def values(self, u: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Objectives F and constraints G at u."""
+        u = np.asarray(u, dtype=float)
+        self._evaluate(u[None, :])
+        _, f, g = self.designs[u.tobytes()]
+        return f, g
+
+    def jacobians(self, u: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Jacobians dF/du (n_obj × n_var) and dG/du (n_constr × n_var) at u."""
+        u = np.asarray(u, dtype=float)
+        step = np.where(u + self.fd_step <= 1.0, self.fd_step, -self.fd_step)
+        U = u + np.diag(step)
+        self._evaluate(np.vstack([u[None, :], U]))
+
+        f, g = self.values(u)
+        dF = np.array([(self.designs[v.tobytes()][1] - f) / h for v, h in zip(U, step)])
+        dG = np.array([(self.designs[v.tobytes()][2] - g) / h for v, h in zip(U, step)])
+        return dF.reshape(len(u), len(f)).T, dG.reshape(len(u), len(g)).T
+
+
+def _polish_design(
+    problem,
+    x0: np.ndarray,
+    f0: np.ndarray,
+    scale: np.ndarray,
+    max_iterations: int,
+    fd_step: float,
+) -> Tuple[Optional[np.ndarray], int]:
+    """
+    Refine one feasible design (see module docstring).
+
+    Returns:
+        Tuple (design, n_evaluations); design is the (x, F, G) row of the
+        best evaluated design dominating x0, or None if none does
+    """
+    from scipy.optimize import minimize
+
+    model = _FiniteDifferenceModel(problem, fd_step)
+    width = np.where(model.width > 0, model.width, 1.0)
+    u0 = np.clip((x0 - model.xl) / width, 0.0, 1.0)
+    bounds = [(0.0, 1.0) if w > 0 else (u, u) for u, w in zip(u0, model.width)]
+
+    def objective(u):
+        return float(np.sum((model.values(u)[0] - f0) / scale))
+
+    def objective_jacobian(u):
+        return np.sum(model.jacobians(u)[0] / scale[:, None], axis=0)
+
+    def constraints(u):
+        f, g = model.values(u)
+        return np.concatenate([-(f - f0) / scale, -g])
+
+    def constraints_jacobian(u):
+        dF, dG = model.jacobians(u)
+        return np.vstack([-dF / scale[:, None], -dG])
+
+    with np.errstate(all="ignore"):
+        minimize(
+            objective, u0, jac=objective_jacobian, method="SLSQP", bounds=bounds,
+            constraints=[{"type": "ineq", "fun": constraints, "jac": constraints_jacobian}],
+            options={"maxiter": max_iterations, "ftol": 1e-10},
+        )
+
+    best, best_improvement = None, 0.0
+    for x, f, g in model.designs.values():
+        if np.all(g <= 0) and np.all(f <= f0) and np.any(f < f0):
+            improvement = float(np.sum((f0 - f) / scale))
+            if improvement > best_improvement:
+                best, best_improvement = (x, f, g), improvement
+    return best, model.n_evaluations
+
+
+def polish_front(
+    result,
+    problem,
+    max_iterations: int = 20,
+    fd_step: float = 1e-3,
+) -> Dict:
+    """
+    Refine every feasible front design of a result by local SLSQP.
+
+    Each design is replaced by the best design found that dominates it (see
+    module docstring); designs then dominated by a polished design drop out
+    of the front. result.opt and result.X/F/G/CV are updated; result.pop
+    (the final population) is left as it is.
+
+    Literature:
+        - Benson (1978) - Scalarization by improvement over a reference point
+        - Kraft (1988) - SLSQP
+
+    Args:
+        result: pymoo Result (any run_* function or the factory)
+        problem: The run's problem (evaluation cache and workers still open)
+        max_iterations: SLSQP iterations per design (default 20)
+        fd_step: Finite-difference step as a fraction of each variable's
+                 range (default 1e-3)
+
+    Returns:
+        Dict with n_designs (front designs polished), n_improved,
+        n_evaluations and mean_improvement (mean normalized objective
+        improvement of the improved designs)
+
+    Raises:
+        ValueError: If max_iterations < 1 or fd_step is not in (0, 0.5)
+
+    Examples:
+        >>> result, metadata = run_nsga2(problem, pop_size=50, n_generations=30)
+        >>> metadata["polishing"] = polish_front(result, problem)
+        >>> metadata["polishing"]["n_improved"]
+        41
+    """
+    if max_iterations < 1:
+        raise ValueError(f"max_iterations must be >= 1, got {max_iterations}")
+    if not 0 < fd_step < 0.5:
+        raise ValueError(f"fd_step must be between 0 and 0.5, got {fd_step}")
+
+    stats = {"n_designs": 0, "n_improved": 0, "n_evaluations": 0, "mean_improvement": 0.0}
+    if result.X is None or result.F is None:
+        return stats
+
+    X = np.atleast_2d(np.asarray(result.X, dtype=float)).copy()
+    F = np.asarray(result.F, dtype=float).reshape(len(X), -1).copy()
+    G = (np.asarray(result.G, dtype=float).reshape(len(X), -1).copy()
+         if result.G is not None else np.empty((len(X), 0)))
+
+    feasible = np.all(G <= 0, axis=1) & np.all(F < PENALTY_THRESHOLD, axis=1)
+    spread = np.ptp(F[feasible], axis=0) if np.any(feasible) else np.zeros(F.shape[1])
+    scale = np.where(spread > 0, spread, 1.0)
+
+    improvements = []
+    for i in np.flatnonzero(feasible):
+        polished, n_evaluations = _polish_design(
+            problem, X[i], F[i], scale, max_iterations, fd_step
+        )
+        stats["n_designs"] += 1
+        stats["n_evaluations"] += n_evaluations
+        if polished is not None:
+            improvements.append(float(np.sum((F[i] - polished[1]) / scale)))
+            X[i], F[i], G[i] = polished
+
+    stats["n_improved"] = len(improvements)
+    stats["mean_improvement"] = float(np.mean(improvements)) if improvements else 0.0
+
+    if improvements:
+        opt = filter_optimum(Population.new("X", X, "F", F, "G", G), least_infeasible=True)
+        result.opt = opt
+        result.X, result.F, result.G, result.CV = opt.get("X", "F", "G", "CV")
+    return stats
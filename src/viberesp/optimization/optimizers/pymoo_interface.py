@@ -12,6 +12,8 @@ Literature:
 Supported algorithms:
     - NSGA-II: Non-dominated Sorting Genetic Algorithm II (for 2-3 objectives)
     - NSGA-III: For many-objective problems (>3 objectives)
+    - Surrogate-assisted NSGA-II: NSGA-II simulating only the offspring an
+      RBF model ranks best (for expensive horn objectives)
 """
 
 import numpy as np
@@ -21,10 +23,65 @@ from pymoo.algorithms.moo.nsga3 import NSGA3
 from pymoo.operators.crossover.sbx import SBX
 from pymoo.operators.mutation.pm import PM
 from pymoo.operators.sampling.rnd import FloatRandomSampling
-from pymoo.optimize import minimize
-from pymoo.termination import get_termination
 
 from viberesp.optimization.objectives.composite import EnclosureOptimizationProblem
+from viberesp.optimization.optimizers.checkpoint import minimize_with_checkpoints
+from viberesp.optimization.optimizers.fidelity import FidelitySchedule, rescore_front
+from viberesp.optimization.optimizers.parallel import resolve_workers
+from viberesp.optimization.optimizers.surrogate import SurrogateAssistedNSGA2
+from viberesp.optimization.optimizers.termination import (
+    build_termination,
+    find_hypervolume_termination,
+)
+from viberesp.optimization.results.archive import ParetoArchive
+
+
+def _minimize(
+    problem,
+    algorithm,
+    termination,
+    workers: Optional[int],
+    n_generations: int,
+    fidelity_schedule: Optional[List[Tuple[float, int]]] = None,
+    **kwargs
+):
+    """
+    Run the algorithm, evaluating generations with ``workers`` processes.
+
+    Checkpoint options (checkpoint_path, checkpoint_every, resume) are
+    passed on to minimize_with_checkpoints(). With a ``fidelity_schedule``
+    the returned front is re-scored on full frequency grids.
+    """
+    if workers is not None:
+        problem.workers = resolve_workers(workers)
+
+    fidelity = None
+    if fidelity_schedule:
+        fidelity = FidelitySchedule(fidelity_schedule, n_generations)
+
+    try:
+        result = minimize_with_checkpoints(
+            problem, algorithm, termination,
+            before_generation=fidelity.before_generation if fidelity else None,
+            **kwargs
+        )
+        if fidelity is not None:
+            rescore_front(result, problem)
+        return result
+    finally:
+        # Shut down the worker pool (if any) once the run is over
+        if hasattr(problem, "close"):
+            problem.close()
+
+
+def _add_convergence_metadata(metadata: Dict, result) -> None:
+    """Record early termination and the hypervolume history (if tracked)."""
+    hv_termination = find_hypervolume_termination(result.algorithm.termination)
+    metadata["terminated_early"] = (
+        metadata["n_generations_run"] < metadata["n_generations"]
+    )
+    if hv_termination is not None:
+        metadata["hypervolume_history"] = list(hv_termination.history)
 
 
 def run_nsga2(
@@ -32,7 +89,15 @@ def run_nsga2(
     pop_size: int = 100,
     n_generations: int = 100,
     seed: Optional[int] = None,
-    verbose: bool = True
+    verbose: bool = True,
+    workers: Optional[int] = None,
+    checkpoint_path: Optional[str] = None,
+    checkpoint_every: int = 10,
+    resume: bool = False,
+    hv_tolerance: Optional[float] = None,
+    hv_patience: int = 10,
+    fidelity_schedule: Optional[List[Tuple[float, int]]] = None,
+    archive: Optional[ParetoArchive] = None
 ) -> Tuple[any, Dict]:
     """
     Run NSGA-II multi-objective optimization.
@@ -52,12 +117,33 @@ def run_nsga2(
         n_generations: Number of generations (default 100)
         seed: Random seed for reproducibility
         verbose: Whether to print progress
+        workers: Worker processes per generation (default: problem.workers;
+                 1 = serial, 0 = all CPU cores)
+        checkpoint_path: Optional file the algorithm state is saved to
+        checkpoint_every: Save a checkpoint every N generations (default 10)
+        resume: Continue from checkpoint_path if it exists; the resumed run
+                gives the same result as an uninterrupted run
+        hv_tolerance: Stop before n_generations once the relative hypervolume
+                      improvement stays below this value (None = disabled)
+        hv_patience: Stagnant generations before stopping early (default 10)
+        fidelity_schedule: Optional (fraction, n_points) stages evaluating
+                           the response objectives on coarse frequency grids
+                           in early generations, e.g. [(0.5, 24), (1.0, 64)];
+                           the returned front is re-scored on full grids
+        archive: Optional ParetoArchive collecting the non-dominated designs
+                 of every generation; the returned front is the archive's
+                 (not with fidelity_schedule). Checkpoints store it, so a
+                 resumed run keeps the designs archived before the
+                 interruption
 
     Returns:
         Tuple of (result, metadata) where:
         - result: pymoo Result object with .F (objectives) and .X (designs)
         - metadata: Dict with algorithm settings and convergence info
 
+    Raises:
+        ValueError: If both archive and fidelity_schedule are given
+
     Examples:
         >>> problem = EnclosureOptimizationProblem(
         ...     driver=driver,
@@ -68,7 +154,35 @@ def run_nsga2(
         >>> result, metadata = run_nsga2(problem, pop_size=50, n_generations=50)
         >>> result.F  # Objective values for Pareto front
         >>> result.X  # Design variables for Pareto front
+
+        Spread each generation over 16 processes:
+        >>> result, metadata = run_nsga2(problem, workers=16)
+
+        Stop once the Pareto front has converged:
+        >>> result, metadata = run_nsga2(problem, n_generations=500, hv_tolerance=1e-3)
+        >>> metadata["terminated_early"]
+        True
+
+        Survive preemption (re-run the same call to continue):
+        >>> result, metadata = run_nsga2(
+        ...     problem, n_generations=500, seed=42,
+        ...     checkpoint_path="horn.ckpt", resume=True
+        ... )
+
+        Rank early generations on coarse frequency grids:
+        >>> result, metadata = run_nsga2(
+        ...     problem, n_generations=200, fidelity_schedule=[(0.5, 24), (1.0, 64)]
+        ... )
+
+        Keep every non-dominated design seen, not just the final population's:
+        >>> result, metadata = run_nsga2(problem, archive=ParetoArchive(max_size=2000))
+        >>> metadata["archive"]["n_designs"]
+        1312
     """
+    if archive is not None and fidelity_schedule:
+        # Coarse-grid objectives are not comparable with full-grid ones
+        raise ValueError("archive does not support fidelity_schedule")
+
     # Initialize NSGA-II algorithm
     # Use Simulated Binary Crossover (SBX) and Polynomial Mutation (PM)
     # These are standard operators for real-coded genetic algorithms
@@ -81,7 +195,7 @@ def run_nsga2(
     )
 
     # Setup termination criterion
-    termination = get_termination("n_gen", n_generations)
+    termination = build_termination(n_generations, hv_tolerance, hv_patience)
 
     # Run optimization
     if verbose:
@@ -92,14 +206,23 @@ def run_nsga2(
         print(f"  Variables: {problem.n_var}")
         print(f"  Constraints: {problem.n_constr}")
 
-    result = minimize(
+    result = _minimize(
         problem,
         algorithm,
         termination,
+        workers,
+        n_generations,
+        fidelity_schedule=fidelity_schedule,
+        checkpoint_path=checkpoint_path,
+        checkpoint_every=checkpoint_every,
+        resume=resume,
         seed=seed,
         verbose=verbose,
+        archive=archive,
         save_history=verbose  # Save history for convergence analysis
     )
+    if archive is not None:
+        archive.update_result(result)
 
     # Extract convergence metrics if history was saved
     convergence_info = {}
@@ -113,10 +236,19 @@ def run_nsga2(
         "algorithm": "NSGA-II",
         "pop_size": pop_size,
         "n_generations": n_generations,
+        "workers": getattr(problem, "workers", 1),
         "n_evaluations": result.algorithm.evaluator.n_eval,
+        "n_generations_run": result.algorithm.n_gen - 1,
         "n_pareto_designs": len(result.F) if result.F is not None else 0,
         "convergence": convergence_info
     }
+    if getattr(problem, "evaluation_cache", None) is not None:
+        metadata["evaluation_cache"] = problem.evaluation_cache.stats()
+    if fidelity_schedule:
+        metadata["fidelity_schedule"] = [tuple(stage) for stage in fidelity_schedule]
+    if archive is not None:
+        metadata["archive"] = archive.stats()
+    _add_convergence_metadata(metadata, result)
 
     return result, metadata
 
@@ -126,7 +258,14 @@ def run_nsga3(
     pop_size: int = 100,
     n_generations: int = 100,
     seed: Optional[int] = None,
-    verbose: bool = True
+    verbose: bool = True,
+    workers: Optional[int] = None,
+    checkpoint_path: Optional[str] = None,
+    checkpoint_every: int = 10,
+    resume: bool = False,
+    hv_tolerance: Optional[float] = None,
+    hv_patience: int = 10,
+    fidelity_schedule: Optional[List[Tuple[float, int]]] = None
 ) -> Tuple[any, Dict]:
     """
     Run NSGA-III multi-objective optimization.
@@ -143,6 +282,19 @@ def run_nsga3(
         n_generations: Number of generations
         seed: Random seed for reproducibility
         verbose: Whether to print progress
+        workers: Worker processes per generation (default: problem.workers;
+                 1 = serial, 0 = all CPU cores)
+        checkpoint_path: Optional file the algorithm state is saved to
+        checkpoint_every: Save a checkpoint every N generations (default 10)
+        resume: Continue from checkpoint_path if it exists; the resumed run
+                gives the same result as an uninterrupted run
+        hv_tolerance: Stop before n_generations once the relative hypervolume
+                      improvement stays below this value (None = disabled)
+        hv_patience: Stagnant generations before stopping early (default 10)
+        fidelity_schedule: Optional (fraction, n_points) stages evaluating
+                           the response objectives on coarse frequency grids
+                           in early generations, e.g. [(0.5, 24), (1.0, 64)];
+                           the returned front is re-scored on full grids
 
     Returns:
         Tuple of (result, metadata)
@@ -164,7 +316,7 @@ def run_nsga3(
     )
 
     # Setup termination
-    termination = get_termination("n_gen", n_generations)
+    termination = build_termination(n_generations, hv_tolerance, hv_patience)
 
     # Run optimization
     if verbose:
@@ -174,10 +326,16 @@ def run_nsga3(
         print(f"  Objectives: {problem.n_obj}")
         print(f"  Variables: {problem.n_var}")
 
-    result = minimize(
+    result = _minimize(
         problem,
         algorithm,
         termination,
+        workers,
+        n_generations,
+        fidelity_schedule=fidelity_schedule,
+        checkpoint_path=checkpoint_path,
+        checkpoint_every=checkpoint_every,
+        resume=resume,
         seed=seed,
         verbose=verbose,
         save_history=verbose
@@ -187,9 +345,135 @@ def run_nsga3(
         "algorithm": "NSGA-III",
         "pop_size": pop_size,
         "n_generations": n_generations,
+        "workers": getattr(problem, "workers", 1),
         "n_evaluations": result.algorithm.evaluator.n_eval,
+        "n_generations_run": result.algorithm.n_gen - 1,
         "n_pareto_designs": len(result.F)
     }
+    if getattr(problem, "evaluation_cache", None) is not None:
+        metadata["evaluation_cache"] = problem.evaluation_cache.stats()
+    if fidelity_schedule:
+        metadata["fidelity_schedule"] = [tuple(stage) for stage in fidelity_schedule]
+    _add_convergence_metadata(metadata, result)
+
+    return result, metadata
+
+
+def run_surrogate_nsga2(
+    problem: EnclosureOptimizationProblem,
+    pop_size: int = 100,
+    n_generations: int = 100,
+    screen_fraction: float = 0.25,
+    seed: Optional[int] = None,
+    verbose: bool = True,
+    workers: Optional[int] = None,
+    checkpoint_path: Optional[str] = None,
+    checkpoint_every: int = 10,
+    resume: bool = False,
+    hv_tolerance: Optional[float] = None,
+    hv_patience: int = 10
+) -> Tuple[any, Dict]:
+    """
+    Run surrogate-assisted NSGA-II multi-objective optimization.
+
+    Each generation creates ``pop_size`` offspring as NSGA-II does, predicts
+    their objectives with an RBF model fitted to every design simulated so
+    far, and simulates only the best ``screen_fraction`` of them (see
+    SurrogateAssistedNSGA2). For multisegment and mixed-profile horns this
+    spends a fraction of NSGA-II's simulations per generation; survival and
+    the returned front use simulated values only.
+
+    Literature:
+        - Jin (2005) - Fitness approximation in evolutionary computation
+        - Regis & Shoemaker (2007) - RBF surrogates for expensive functions
+        - Deb et al. (2002) - NSGA-II
+
+    Args:
+        problem: EnclosureOptimizationProblem instance
+        pop_size: Population size and offspring candidates per generation
+                  (default 100)
+        n_generations: Number of generations (default 100)
+        screen_fraction: Fraction of the offspring candidates simulated per
+                         generation (default 0.25)
+        seed: Random seed for reproducibility
+        verbose: Whether to print progress
+        workers: Worker processes per generation (default: problem.workers;
+                 1 = serial, 0 = all CPU cores)
+        checkpoint_path: Optional file the algorithm state is saved to
+        checkpoint_every: Save a checkpoint every N generations (default 10)
+        resume: Continue from checkpoint_path if it exists
+        hv_tolerance: Stop before n_generations once the relative hypervolume
+                      improvement stays below this value (None = disabled)
+        hv_patience: Stagnant generations before stopping early (default 10)
+
+    Returns:
+        Tuple of (result, metadata); metadata["surrogate"] holds the
+        surrogate's prediction error statistics (see
+        surrogate_error_statistics) and the number of candidates screened out
+
+    Examples:
+        >>> problem = EnclosureOptimizationProblem(
+        ...     driver, "multisegment_horn", ["f3", "flatness"], bounds
+        ... )
+        >>> result, metadata = run_surrogate_nsga2(problem, n_generations=200)
+        >>> metadata["n_evaluations"]  # 100 + 200 * 25 instead of 100 + 200 * 100
+        5100
+        >>> metadata["surrogate"]["rank_correlation"]
+    """
+    algorithm = SurrogateAssistedNSGA2(
+        pop_size=pop_size,
+        screen_fraction=screen_fraction,
+        sampling=FloatRandomSampling(),
+        crossover=SBX(prob=0.9, eta=15),
+        mutation=PM(eta=20),
+        eliminate_duplicates=True
+    )
+
+    termination = build_termination(n_generations, hv_tolerance, hv_patience)
+
+    if verbose:
+        print("Running surrogate-assisted NSGA-II optimization:")
+        print(f"  Population: {pop_size}")
+        print(f"  Generations: {n_generations}")
+        print(f"  Simulated per generation: {algorithm.n_true} of {algorithm.n_offsprings}")
+        print(f"  Objectives: {problem.n_obj}")
+        print(f"  Variables: {problem.n_var}")
+        print(f"  Constraints: {problem.n_constr}")
+
+    result = _minimize(
+        problem,
+        algorithm,
+        termination,
+        workers,
+        n_generations,
+        checkpoint_path=checkpoint_path,
+        checkpoint_every=checkpoint_every,
+        resume=resume,
+        seed=seed,
+        verbose=verbose,
+    )
+
+    metadata = {
+        "algorithm": "SA-NSGA-II",
+        "pop_size": pop_size,
+        "n_generations": n_generations,
+        "screen_fraction": screen_fraction,
+        "workers": getattr(problem, "workers", 1),
+        "n_evaluations": result.algorithm.evaluator.n_eval,
+        "n_generations_run": result.algorithm.n_gen - 1,
+        "n_pareto_designs": len(result.F) if result.F is not None else 0,
+        "surrogate": result.algorithm.error_statistics(),
+    }
+    if getattr(problem, "evaluation_cache", None) is not None:
+        metadata["evaluation_cache"] = problem.evaluation_cache.stats()
+    _add_convergence_metadata(metadata, result)
+
+    if verbose:
+        stats = metadata["surrogate"]
+        print(f"  Simulations: {metadata['n_evaluations']} "
+              f"({stats['n_screened_out']} candidates screened out)")
+        print(f"  Surrogate rank correlation: "
+              f"{', '.join(f'{r:.2f}' for r in stats['rank_correlation'])}")
 
     return result, metadata
 
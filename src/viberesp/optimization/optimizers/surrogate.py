@@ -0,0 +1,330 @@
+"""
+Surrogate-assisted NSGA-II for expensive horn objectives.
+
+Multisegment and mixed-profile horn evaluations dominate the run time of an
+optimization, and plain NSGA-II simulates every offspring. The
+surrogate-assisted variant fits a radial basis function (RBF) model to all
+designs simulated so far, predicts the objectives and constraints of each
+generation's offspring, and sends only the most promising fraction (ranked
+by non-dominated sorting and crowding distance on the predictions) to the
+real simulator. Survival and the returned Pareto front use real
+evaluations only; the surrogate just decides which offspring are worth
+simulating.
+
+The predicted and simulated objective values of every screened offspring
+are kept, so the run can report how accurate the surrogate was (RMSE and
+rank correlation per objective).
+
+Literature:
+    - Jin (2005) - "A comprehensive survey of fitness approximation in
+      evolutionary computation" (pre-selection / evolution control)
+    - Regis & Shoemaker (2007) - "A stochastic radial basis function method
+      for the global optimization of expensive functions"
+    - Deb et al. (2002) - NSGA-II
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+from pymoo.algorithms.moo.nsga2 import NSGA2
+from pymoo.core.population import Population
+
+# Objective/constraint values at or beyond this mark failed designs
+# (penalties of EnclosureOptimizationProblem and FactoryOptimizationProblem)
+PENALTY_THRESHOLD = 1e6
+
+
+class RBFSurrogate:
+    """
+    Radial basis function model of a problem's objectives and constraints.
+
+    Design vectors are normalized to the problem bounds, and only the
+    ``max_training`` most recent distinct designs are used (the region the
+    population currently explores).
+
+    Attributes:
+        kernel: scipy RBFInterpolator kernel
+        max_training: Maximum number of training designs
+        n_training: Number of designs of the last fit
+    """
+
+    def __init__(
+        self,
+        xl: np.ndarray,
+        xu: np.ndarray,
+        kernel: str = "thin_plate_spline",
+        max_training: int = 500,
+    ):
+        """
+        Args:
+            xl: Lower variable bounds
+            xu: Upper variable bounds
+            kernel: RBF kernel (default "thin_plate_spline")
+            max_training: Maximum number of training designs (default 500)
+
+        Raises:
+            ValueError: If max_training is smaller than the number of
+                designs needed for one fit
+        """
+        self.xl = np.asarray(xl, dtype=float)
+        self.xu = np.asarray(xu, dtype=float)
+        if max_training < self.min_training:
+            raise ValueError(
+                f"max_training must be >= {self.min_training} for {len(self.xl)} "
+                f"variables, got {max_training}"
+            )
+        self.kernel = kernel
+        self.max_training = max_training
+        self.n_training = 0
+        self._model = None
+
+    @property
+    def min_training(self) -> int:
+        """Designs needed before the model is fitted (twice the linear tail)."""
+        return 2 * (len(self.xl) + 1)
+
+    def _normalize(self, X: np.ndarray) -> np.ndarray:
+        span = np.where(self.xu > self.xl, self.xu - self.xl, 1.0)
+        return (np.asarray(X, dtype=float) - self.xl) / span
+
+    def fit(self, X: np.ndarray, Y: np.ndarray) -> bool:
+        """
+        Fit the model to simulated designs.
+
+        Failed (penalized or non-finite) designs are left out.
+
+        Args:
+            X: Design matrix (n_designs × n_var), oldest first
+            Y: Objective and constraint values (n_designs × n_outputs)
+
+        Returns:
+            True if the model was fitted, False if there are too few
+            usable designs (or the interpolation system is singular)
+        """
+        from scipy.interpolate import RBFInterpolator
+
+        usable = np.all(np.isfinite(Y) & (np.abs(Y) < PENALTY_THRESHOLD), axis=1)
+        X, Y = X[usable][-self.max_training:], Y[usable][-self.max_training:]
+
+        # Repeated designs make the interpolation matrix singular
+        _, first = np.unique(self._normalize(X).round(12), axis=0, return_index=True)
+        X, Y = X[np.sort(first)], Y[np.sort(first)]
+
+        self._model = None
+        self.n_training = len(X)
+        if len(X) < self.min_training:
+            return False
+        try:
+            self._model = RBFInterpolator(self._normalize(X), Y, kernel=self.kernel)
+        except np.linalg.LinAlgError:
+            return False
+        return True
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """
+        Predicted objective and constraint values of designs X.
+
+        Raises:
+            RuntimeError: If the model has not been fitted
+        """
+        if self._model is None:
+            raise RuntimeError("RBFSurrogate.predict() called before a successful fit()")
+        return self._model(self._normalize(X))
+
+
+class SurrogateAssistedNSGA2(NSGA2):
+    """
+    NSGA-II that simulates only the offspring a surrogate ranks best.
+
+    Each generation ``n_offsprings`` candidates are created by the usual
+    selection, crossover and mutation. Once enough designs have been
+    simulated, an RBFSurrogate predicts the candidates' objectives and
+    constraints, and the best ``screen_fraction`` of them (by non-dominated
+    rank and crowding distance of the predictions) are simulated; the rest
+    are discarded. Until then, and whenever the model cannot be fitted,
+    every candidate is simulated.
+
+    Attributes:
+        screen_fraction: Fraction of the candidates simulated per generation
+        n_true: Number of candidates simulated per screened generation
+        n_screened_out: Candidates discarded on the surrogate's prediction
+        predicted_F: Predicted objectives of every screened, simulated design
+        actual_F: Simulated objectives of the same designs
+
+    Examples:
+        >>> algorithm = SurrogateAssistedNSGA2(pop_size=100, screen_fraction=0.25)
+        >>> result = minimize(problem, algorithm, ("n_gen", 200), seed=1)
+        >>> algorithm.error_statistics()["rank_correlation"]
+    """
+
+    def __init__(
+        self,
+        pop_size: int = 100,
+        screen_fraction: float = 0.25,
+        max_training: int = 500,
+        kernel: str = "thin_plate_spline",
+        **kwargs
+    ):
+        """
+        Args:
+            pop_size: Population size (default 100)
+            screen_fraction: Fraction of each generation's candidates sent
+                to the simulator (default 0.25)
+            max_training: Maximum number of designs the surrogate is fitted
+                to (most recent first, default 500)
+            kernel: RBF kernel (default "thin_plate_spline")
+            **kwargs: Passed to NSGA2 (sampling, crossover, mutation,
+                n_offsprings = candidates per generation, ...)
+
+        Raises:
+            ValueError: If screen_fraction is not in (0, 1]
+        """
+        if not 0.0 < screen_fraction <= 1.0:
+            raise ValueError(f"screen_fraction must be in (0, 1], got {screen_fraction}")
+        super().__init__(pop_size=pop_size, **kwargs)
+
+        self.screen_fraction = screen_fraction
+        self.max_training = max_training
+        self.kernel = kernel
+        self.n_true = max(1, int(round(screen_fraction * self.n_offsprings)))
+        self.n_screened_out = 0
+        self.predicted_F: List[np.ndarray] = []
+        self.actual_F: List[np.ndarray] = []
+
+        self.surrogate: Optional[RBFSurrogate] = None
+        self._train_X: List[np.ndarray] = []
+        self._train_Y: List[np.ndarray] = []
+
+    def _setup(self, problem, **kwargs):
+        super()._setup(problem, **kwargs)
+        self.surrogate = RBFSurrogate(
+            problem.xl, problem.xu, kernel=self.kernel,
+            max_training=max(self.max_training, 2 * (problem.n_var + 1)),
+        )
+
+    def _outputs(self, pop: Population) -> np.ndarray:
+        """Objectives and constraints of ``pop`` as one matrix."""
+        F = pop.get("F")
+        if self.problem.n_ieq_constr > 0:
+            return np.hstack([F, pop.get("G")])
+        return F
+
+    def _record(self, infills: Population) -> None:
+        """Add simulated designs to the training data (and the error log)."""
+        if infills is None or len(infills) == 0:
+            return
+        self._train_X.append(infills.get("X"))
+        self._train_Y.append(self._outputs(infills))
+
+        if infills[0].get("F_pred") is not None:
+            self.predicted_F.append(infills.get("F_pred"))
+            self.actual_F.append(infills.get("F"))
+
+    def _initialize_advance(self, infills=None, **kwargs):
+        self._record(infills)
+        super()._initialize_advance(infills=infills, **kwargs)
+
+    def _infill(self):
+        off = super()._infill()
+        if off is None or len(off) <= self.n_true:
+            return off
+
+        if not self.surrogate.fit(np.vstack(self._train_X), np.vstack(self._train_Y)):
+            return off
+
+        X = off.get("X")
+        prediction = self.surrogate.predict(X)
+        F_pred = prediction[:, :self.problem.n_obj]
+
+        # Rank the candidates on their predictions, as survival would
+        candidates = Population.new(X=X)
+        candidates.set("F", F_pred)
+        if self.problem.n_ieq_constr > 0:
+            candidates.set("G", prediction[:, self.problem.n_obj:])
+        selected = self.survival.do(
+            self.problem, candidates, n_survive=self.n_true,
+            random_state=self.random_state, return_indices=True,
+        )
+        selected = np.sort(selected)
+
+        self.n_screened_out += len(off) - len(selected)
+        off = off[selected]
+        off.set("F_pred", F_pred[selected])
+        return off
+
+    def _advance(self, infills=None, **kwargs):
+        self._record(infills)
+        return super()._advance(infills=infills, **kwargs)
+
+    def error_statistics(self) -> Dict:
+        """
+        Accuracy of the surrogate's objective predictions.
+
+        Returns:
+            Dict from surrogate_error_statistics() for all screened designs,
+            plus the number of candidates screened out
+        """
+        n_obj = self.problem.n_obj if self.problem is not None else 0
+        predicted = np.vstack(self.predicted_F) if self.predicted_F else np.zeros((0, n_obj))
+        actual = np.vstack(self.actual_F) if self.actual_F else np.zeros((0, n_obj))
+
+        stats = surrogate_error_statistics(predicted, actual)
+        stats["n_screened_out"] = self.n_screened_out
+        return stats
+
+
+def surrogate_error_statistics(predicted: np.ndarray, actual: np.ndarray) -> Dict:
+    """
+    Prediction error of a surrogate, per objective.
+
+    Failed (penalized) designs are left out.
+
+    Args:
+        predicted: Predicted objective values (n_designs × n_obj)
+        actual: Simulated objective values (n_designs × n_obj)
+
+    Returns:
+        Dict with:
+        - "n_predictions": Number of designs compared
+        - "rmse": Root-mean-square error per objective
+        - "mae": Mean absolute error per objective
+        - "normalized_rmse": RMSE divided by the objective's simulated range
+        - "rank_correlation": Spearman rank correlation per objective (how
+          well the surrogate orders designs, which is what screening needs)
+
+    Examples:
+        >>> stats = surrogate_error_statistics(F_pred, F_true)
+        >>> stats["rank_correlation"]
+        [0.97, 0.91]
+    """
+    from scipy.stats import spearmanr
+
+    predicted = np.asarray(predicted, dtype=float)
+    actual = np.asarray(actual, dtype=float)
+    usable = np.all(np.isfinite(actual) & (np.abs(actual) < PENALTY_THRESHOLD), axis=1)
+    predicted, actual = predicted[usable], actual[usable]
+
+    n_obj = actual.shape[1]
+    if len(actual) == 0:
+        nan = [float("nan")] * n_obj
+        return {"n_predictions": 0, "rmse": nan, "mae": nan,
+                "normalized_rmse": nan, "rank_correlation": nan}
+
+    errors = predicted - actual
+    rmse = np.sqrt(np.mean(errors ** 2, axis=0))
+    span = np.ptp(actual, axis=0)
+
+    rank_correlation = []
+    for j in range(n_obj):
+        if len(actual) < 2 or np.ptp(actual[:, j]) == 0 or np.ptp(predicted[:, j]) == 0:
+            rank_correlation.append(float("nan"))
+        else:
+            rank_correlation.append(float(spearmanr(predicted[:, j], actual[:, j])[0]))
+
+    return {
+        "n_predictions": int(len(actual)),
+        "rmse": rmse.tolist(),
+        "mae": np.mean(np.abs(errors), axis=0).tolist(),
+        "normalized_rmse": np.where(span > 0, rmse / np.where(span > 0, span, 1.0), np.nan).tolist(),
+        "rank_correlation": rank_correlation,
+    }
@@ -0,0 +1,156 @@
+"""
+Convergence-based termination for multi-objective runs.
+
+A fixed generation count either wastes generations after the Pareto front
+has converged or stops before it has. HypervolumeStagnationTermination
+tracks the hypervolume of the feasible non-dominated set each generation
+and stops once its relative improvement stays below a tolerance for
+``patience`` consecutive generations. build_termination() combines it with
+the usual maximum generation count (whichever comes first).
+
+Objectives are normalized with the ideal and nadir points of the first
+feasible front, and the reference point is placed 10% beyond that nadir, so
+objectives with different units (Hz, m³, dB) weigh equally.
+
+Literature:
+    - Zitzler & Thiele (1999) - Hypervolume (S metric)
+    - Wagner, Trautmann & Naujoks (2009) - "OCD: Online convergence
+      detection for evolutionary multi-objective algorithms based on
+      statistical testing" (indicator-based stopping)
+"""
+
+from typing import List, Optional
+
+import numpy as np
+from pymoo.core.termination import Termination, TerminateIfAny
+from pymoo.termination.max_gen import MaximumGenerationTermination
+
+from viberesp.optimization.results.pareto_front import hypervolume
+
+# Reference point distance beyond the first front's nadir (normalized units)
+REFERENCE_MARGIN = 0.1
+
+
+class HypervolumeStagnationTermination(Termination):
+    """
+    Stop when the front's hypervolume has stagnated for ``patience`` generations.
+
+    A generation counts as stagnant when the hypervolume improves by less
+    than ``tolerance`` relative to the best hypervolume so far. Generations
+    without a feasible design reset the count.
+
+    Attributes:
+        tolerance: Relative hypervolume improvement considered stagnant
+        patience: Consecutive stagnant generations before stopping
+        history: Hypervolume (normalized objectives) of every generation
+
+    Examples:
+        >>> termination = HypervolumeStagnationTermination(tolerance=1e-3, patience=10)
+        >>> result = minimize(problem, NSGA2(pop_size=100), termination)
+    """
+
+    def __init__(self, tolerance: float = 1e-3, patience: int = 10):
+        """
+        Args:
+            tolerance: Relative improvement below which a generation is
+                stagnant (default 1e-3, i.e. 0.1%)
+            patience: Number of consecutive stagnant generations (default 10)
+
+        Raises:
+            ValueError: If tolerance is negative or patience < 1
+        """
+        super().__init__()
+        if tolerance < 0:
+            raise ValueError(f"tolerance must be >= 0, got {tolerance}")
+        if patience < 1:
+            raise ValueError(f"patience must be >= 1, got {patience}")
+
+        self.tolerance = tolerance
+        self.patience = patience
+        self.history: List[float] = []
+
+        self._ideal: Optional[np.ndarray] = None
+        self._scale: Optional[np.ndarray] = None
+        self._best = 0.0
+        self._n_stagnant = 0
+        self._last_gen = None
+
+    def _update(self, algorithm) -> float:
+        # Re-evaluating a generation (e.g. after resuming) keeps the state
+        if algorithm.n_gen == self._last_gen:
+            return self.perc
+        self._last_gen = algorithm.n_gen
+
+        F = _feasible_front(algorithm)
+        if F is None:
+            self._n_stagnant = 0
+            return 0.0
+
+        if self._ideal is None:
+            self._ideal = F.min(axis=0)
+            span = F.max(axis=0) - self._ideal
+            self._scale = np.where(span > 0, span, 1.0)
+
+        normalized = (F - self._ideal) / self._scale
+        reference = np.full(F.shape[1], 1.0 + REFERENCE_MARGIN)
+        hv = hypervolume(normalized, reference)
+        self.history.append(hv)
+
+        if hv - self._best > self.tolerance * max(self._best, 1e-12):
+            self._n_stagnant = 0
+        else:
+            self._n_stagnant += 1
+        self._best = max(self._best, hv)
+
+        return min(self._n_stagnant / self.patience, 1.0)
+
+
+def _feasible_front(algorithm) -> Optional[np.ndarray]:
+    """Objective values of the algorithm's feasible optimum, or None."""
+    opt = algorithm.opt
+    if opt is None or len(opt) == 0:
+        return None
+    feasible = opt.get("FEAS")
+    if feasible is None or not np.any(feasible):
+        return None
+    return opt.get("F")[np.ravel(feasible)]
+
+
+def build_termination(
+    n_generations: int,
+    hv_tolerance: Optional[float] = None,
+    hv_patience: int = 10,
+) -> Termination:
+    """
+    Generation limit, optionally combined with hypervolume stagnation.
+
+    Args:
+        n_generations: Maximum number of generations
+        hv_tolerance: Stop early when the relative hypervolume improvement
+            stays below this value (None = run all generations)
+        hv_patience: Stagnant generations before stopping early
+
+    Returns:
+        pymoo Termination
+
+    Examples:
+        >>> termination = build_termination(500, hv_tolerance=1e-3, hv_patience=15)
+    """
+    max_generations = MaximumGenerationTermination(n_generations)
+    if hv_tolerance is None:
+        return max_generations
+    return TerminateIfAny(
+        max_generations,
+        HypervolumeStagnationTermination(hv_tolerance, hv_patience),
+    )
+
+
+def find_hypervolume_termination(termination) -> Optional[HypervolumeStagnationTermination]:
+    """The HypervolumeStagnationTermination within ``termination``, if any."""
+    if isinstance(termination, HypervolumeStagnationTermination):
+        return termination
+    for criterion in getattr(termination, "criteria", ()):
+        found = find_hypervolume_termination(criterion)
+        if found is not None:
+            return found
+    return None
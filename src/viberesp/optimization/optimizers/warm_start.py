@@ -0,0 +1,258 @@
+"""
+Warm-start optimization runs from earlier designs.
+
+Every run otherwise starts from a random or Latin hypercube population, even
+when a previous run of nearly the same problem (e.g. before a small
+constraint change) already found a good Pareto front. SeededSampling places
+known designs in the initial population and fills the remaining slots with
+the usual sampling, so NSGA-II starts from the old front and only has to
+adapt it.
+
+Seed designs can come from:
+    - a results JSON file written by OptimizationScriptFactory or
+      ``viberesp optimize run`` (its Pareto front)
+    - an OptimizationResult
+    - a DesignRecommendation (DesignAssistant.recommend_design)
+    - a list of design dicts ({"parameters": {...}} or plain {name: value})
+
+Designs from another driver's run are mapped by their relative position in
+that run's parameter bounds (stored in the results metadata), since the
+parameter spaces scale with the driver (e.g. Vas, Sd). Designs of the same
+driver keep their values and are clipped to the current bounds.
+
+Literature:
+    - Deb et al. (2002) - NSGA-II
+    - Louis & McDonnell (2004) - "Learning with case-injected genetic
+      algorithms" (seeding populations with solutions of similar problems)
+"""
+
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from pymoo.core.sampling import Sampling
+from pymoo.operators.sampling.rnd import FloatRandomSampling
+
+
+@dataclass
+class SeedDesigns:
+    """
+    Designs to seed an initial population with.
+
+    Attributes:
+        designs: Parameter values per design ({name: value})
+        driver_name: Driver the designs were optimized for (None = unknown)
+        enclosure_type: Enclosure type of the designs (None = unknown)
+        parameter_bounds: Parameter bounds of the source run, used to rescale
+                          designs of another driver (None = unknown)
+    """
+    designs: List[Dict[str, float]]
+    driver_name: Optional[str] = None
+    enclosure_type: Optional[str] = None
+    parameter_bounds: Optional[Dict[str, Tuple[float, float]]] = None
+
+
+def _design_parameters(design: Dict[str, Any]) -> Dict[str, float]:
+    """Parameter dict of a Pareto front entry or a plain {name: value} dict."""
+    parameters = design.get("parameters", design)
+    return {
+        name: float(value) for name, value in parameters.items()
+        if isinstance(value, (int, float)) and not isinstance(value, bool)
+    }
+
+
+def _from_dict(data: Dict[str, Any]) -> SeedDesigns:
+    """SeedDesigns of a saved results or recommendation dict."""
+    if "suggested_parameters" in data:
+        return SeedDesigns(
+            designs=[_design_parameters(data["suggested_parameters"])],
+            enclosure_type=data.get("enclosure_type"),
+        )
+
+    if "pareto_front" not in data:
+        raise ValueError(
+            "Seed source has neither a 'pareto_front' (results file) nor "
+            "'suggested_parameters' (design recommendation)"
+        )
+    metadata = data.get("optimization_metadata") or {}
+    bounds = metadata.get("parameter_bounds")
+    return SeedDesigns(
+        designs=[_design_parameters(design) for design in data["pareto_front"]],
+        driver_name=metadata.get("driver"),
+        enclosure_type=metadata.get("enclosure_type"),
+        parameter_bounds=(
+            {name: tuple(bound) for name, bound in bounds.items()} if bounds else None
+        ),
+    )
+
+
+def load_seed_designs(source: Any) -> SeedDesigns:
+    """
+    Collect seed designs from a previous result or recommendation.
+
+    Args:
+        source: Path of a results JSON file, OptimizationResult,
+                DesignRecommendation, SeedDesigns, or a list of design dicts
+
+    Returns:
+        SeedDesigns with the designs and, where known, their driver,
+        enclosure type and source parameter bounds
+
+    Raises:
+        ValueError: If the source holds no designs
+        FileNotFoundError: If a results file does not exist
+
+    Examples:
+        >>> seeds = load_seed_designs("results/BC_15DS115_exponential_horn.json")
+        >>> len(seeds.designs), seeds.driver_name
+        (42, 'BC_15DS115')
+        >>> rec = DesignAssistant().recommend_design("BC_8NDL51", enclosure_preference="ported")
+        >>> load_seed_designs(rec).designs
+        [{'Vb': 0.0101, 'Fb': 75.0}]
+    """
+    from viberesp.optimization.api.result_structures import (
+        DesignRecommendation,
+        OptimizationResult,
+    )
+
+    if isinstance(source, SeedDesigns):
+        seeds = source
+    elif isinstance(source, str):
+        with open(source) as f:
+            seeds = _from_dict(json.load(f))
+    elif isinstance(source, OptimizationResult):
+        seeds = _from_dict({
+            "pareto_front": source.pareto_front,
+            "optimization_metadata": source.optimization_metadata,
+        })
+    elif isinstance(source, DesignRecommendation):
+        seeds = SeedDesigns(
+            designs=[_design_parameters(source.suggested_parameters)],
+            enclosure_type=source.enclosure_type,
+        )
+    elif isinstance(source, dict):
+        seeds = _from_dict(source)
+    else:
+        seeds = SeedDesigns(designs=[_design_parameters(design) for design in source])
+
+    seeds.designs = [design for design in seeds.designs if design]
+    if not seeds.designs:
+        raise ValueError("Seed source contains no design parameters")
+    return seeds
+
+
+def seed_matrix(
+    seeds: SeedDesigns,
+    parameter_names: Sequence[str],
+    xl: np.ndarray,
+    xu: np.ndarray,
+    driver_name: Optional[str] = None,
+) -> np.ndarray:
+    """
+    Design matrix of seed designs in the current parameter space.
+
+    Designs from a different driver are rescaled from the source bounds to
+    (xl, xu); all other designs are clipped to (xl, xu). Parameters a design
+    does not define are NaN (left to the regular sampling).
+
+    Args:
+        seeds: Seed designs
+        parameter_names: Design variable names of the problem, in order
+        xl: Lower variable bounds
+        xu: Upper variable bounds
+        driver_name: Driver of the problem (None = no rescaling)
+
+    Returns:
+        Matrix (n_designs × n_var) without duplicate rows
+
+    Raises:
+        ValueError: If no design defines any of the problem's parameters
+    """
+    xl = np.asarray(xl, dtype=float)
+    xu = np.asarray(xu, dtype=float)
+    rescale = (
+        seeds.parameter_bounds is not None
+        and seeds.driver_name is not None
+        and driver_name is not None
+        and seeds.driver_name != driver_name
+    )
+
+    X = np.full((len(seeds.designs), len(parameter_names)), np.nan)
+    for j, name in enumerate(parameter_names):
+        values = np.array([design.get(name, np.nan) for design in seeds.designs])
+        if rescale and name in seeds.parameter_bounds:
+            low, high = seeds.parameter_bounds[name]
+            position = (values - low) / (high - low) if high > low else np.full_like(values, 0.5)
+            values = xl[j] + position * (xu[j] - xl[j])
+        X[:, j] = np.clip(values, xl[j], xu[j])
+
+    X = X[~np.all(np.isnan(X), axis=1)]
+    if len(X) == 0:
+        raise ValueError(
+            f"No seed design defines any of the parameters {list(parameter_names)}"
+        )
+
+    # np.unique treats NaNs as distinct; compare rows on a sentinel instead
+    _, first = np.unique(np.nan_to_num(X, nan=np.inf), axis=0, return_index=True)
+    return X[np.sort(first)]
+
+
+class SeededSampling(Sampling):
+    """
+    Initial population of seed designs, completed by another sampling.
+
+    If there are more seeds than the population size, seeds evenly spread
+    over the list are used (a saved Pareto front is ordered along the
+    front). Parameters missing from a seed design take the value sampled for
+    that slot.
+
+    Attributes:
+        seeds: Seed designs
+        parameter_names: Design variable names of the problem, in order
+        sampling: Sampling filling the remaining slots
+        driver_name: Driver of the problem (designs of other drivers are
+                     rescaled)
+        n_seeded: Number of seeds placed in the last sampled population
+
+    Examples:
+        >>> sampling = SeededSampling(
+        ...     load_seed_designs("previous_run.json"), param_space.get_parameter_names(),
+        ...     sampling=LHS(), driver_name="BC_15DS115"
+        ... )
+        >>> algorithm = NSGA2(pop_size=100, sampling=sampling)
+    """
+
+    def __init__(
+        self,
+        seeds: SeedDesigns,
+        parameter_names: Sequence[str],
+        sampling: Optional[Sampling] = None,
+        driver_name: Optional[str] = None,
+    ):
+        """
+        Args:
+            seeds: Seed designs (see load_seed_designs)
+            parameter_names: Design variable names of the problem, in order
+            sampling: Sampling filling the remaining slots (default:
+                      FloatRandomSampling)
+            driver_name: Driver of the problem (default: no rescaling)
+        """
+        super().__init__()
+        self.seeds = seeds
+        self.parameter_names = list(parameter_names)
+        self.sampling = sampling if sampling is not None else FloatRandomSampling()
+        self.driver_name = driver_name
+        self.n_seeded = 0
+
+    def _do(self, problem, n_samples, *args, random_state=None, **kwargs):
+        X = self.sampling.do(problem, n_samples, random_state=random_state).get("X")
+        seeds = seed_matrix(
+            self.seeds, self.parameter_names, problem.xl, problem.xu, self.driver_name
+        )
+        if len(seeds) > n_samples:
+            seeds = seeds[np.linspace(0, len(seeds) - 1, n_samples).round().astype(int)]
+
+        self.n_seeded = len(seeds)
+        X[:self.n_seeded] = np.where(np.isnan(seeds), X[:self.n_seeded], seeds)
+        return X
@@ -0,0 +1,190 @@
+"""
+Bounded archive of the non-dominated designs seen during a run.
+
+NSGA-II returns the non-dominated designs of its final population, which
+holds at most pop_size designs; good designs evaluated in earlier
+generations can be lost to crowding-distance truncation. A ParetoArchive
+observes every evaluated design (each generation's offspring) and keeps the
+feasible non-dominated ones, so the front of a run is the front of all its
+evaluations. minimize_with_checkpoints() stores the archive in its
+checkpoints, so a resumed run keeps the designs archived before the
+interruption.
+
+Insertion merges the new designs with the archive and keeps the
+non-dominated set (see pareto_front.non_dominated_mask, O(n log n) for 2
+and 3 objectives). An archive with ``max_size`` drops the most crowded
+designs (smallest crowding distance, recomputed in rounds of at most 5% of
+the archive) once it grows beyond that size; the extreme designs of every
+objective are always kept.
+
+Literature:
+    - Knowles & Corne (2000) - "Approximating the nondominated front using
+      the Pareto archived evolution strategy" (bounded external archive)
+    - Deb et al. (2002) - NSGA-II, crowding distance
+"""
+
+from typing import Dict, Optional
+
+import numpy as np
+
+from viberesp.optimization.results.pareto_front import crowding_distance, non_dominated_mask
+
+
+class ParetoArchive:
+    """
+    Non-dominated feasible designs with incremental insertion.
+
+    Attributes:
+        max_size: Maximum number of designs kept (None = unbounded)
+        X: Design vectors (n_designs × n_var)
+        F: Objective values (n_designs × n_obj)
+        G: Constraint values (n_designs × n_constr)
+        n_added: Number of designs offered to the archive
+        n_truncated: Number of non-dominated designs dropped by max_size
+
+    Examples:
+        >>> archive = ParetoArchive(max_size=500)
+        >>> archive.add(X, F, G)
+        37
+        >>> result = minimize_with_checkpoints(
+        ...     problem, algorithm, ("n_gen", 100), archive=archive
+        ... )
+        >>> archive.update_result(result)
+    """
+
+    def __init__(self, max_size: Optional[int] = None):
+        """
+        Args:
+            max_size: Maximum number of designs kept (None = unbounded)
+
+        Raises:
+            ValueError: If max_size < 2
+        """
+        if max_size is not None and max_size < 2:
+            raise ValueError(f"max_size must be >= 2, got {max_size}")
+        self.max_size = max_size
+        self.X: Optional[np.ndarray] = None
+        self.F: Optional[np.ndarray] = None
+        self.G: Optional[np.ndarray] = None
+        self.n_added = 0
+        self.n_truncated = 0
+
+    def __len__(self) -> int:
+        return 0 if self.F is None else len(self.F)
+
+    def add(self, X: np.ndarray, F: np.ndarray, G: Optional[np.ndarray] = None) -> int:
+        """
+        Insert designs, keeping the feasible non-dominated ones.
+
+        Infeasible designs (any G > 0) and designs with non-finite
+        objectives are ignored; a design vector already in the archive is
+        kept once.
+
+        Args:
+            X: Design vectors (n × n_var)
+            F: Objective values (n × n_obj)
+            G: Constraint values (n × n_constr), None if unconstrained
+
+        Returns:
+            Number of the inserted designs now in the archive
+        """
+        X = np.atleast_2d(np.asarray(X, dtype=float))
+        F = np.asarray(F, dtype=float).reshape(len(X), -1)
+        G = (np.empty((len(X), 0)) if G is None
+             else np.asarray(G, dtype=float).reshape(len(X), -1))
+        self.n_added += len(X)
+
+        valid = np.all(np.isfinite(F), axis=1) & np.all(G <= 0, axis=1)
+        X, F, G = X[valid], F[valid], G[valid]
+        if len(X) == 0:
+            return 0
+        keep = non_dominated_mask(F)
+        X, F, G = X[keep], F[keep], G[keep]
+
+        n_old = len(self)
+        if n_old:
+            X = np.vstack([self.X, X])
+            F = np.vstack([self.F, F])
+            G = np.vstack([self.G, G])
+            keep = non_dominated_mask(F)
+            X, F, G = X[keep], F[keep], G[keep]
+            n_old = int(np.sum(keep[:n_old]))
+
+        # One copy per design vector (archived copies come first)
+        _, first = np.unique(X, axis=0, return_index=True)
+        first.sort()
+        new = first >= n_old
+        self.X, self.F, self.G = X[first], F[first], G[first]
+
+        if self.max_size is not None and len(self) > self.max_size:
+            new = new[self._truncate()]
+        return int(np.sum(new))
+
+    def _truncate(self) -> np.ndarray:
+        """Drop the most crowded designs down to max_size; returns the kept rows."""
+        kept = np.arange(len(self))
+        while len(kept) > self.max_size:
+            n_remove = min(len(kept) - self.max_size, max(1, len(kept) // 20))
+            distance = crowding_distance(self.F[kept])
+            remove = np.argsort(distance, kind="stable")[:n_remove]
+            kept = np.delete(kept, remove)
+
+        self.n_truncated += len(self) - len(kept)
+        self.X, self.F, self.G = self.X[kept], self.F[kept], self.G[kept]
+        return kept
+
+    def observe(self, algorithm) -> None:
+        """
+        Insert the designs a pymoo algorithm evaluated in its last generation.
+
+        Called after every generation by minimize_with_checkpoints(archive=...).
+        The first generation's offspring are the initial population.
+        """
+        pop = algorithm.off if algorithm.off is not None else algorithm.pop
+        if pop is not None and len(pop) > 0:
+            self.add(pop.get("X"), pop.get("F"), pop.get("G"))
+
+    def update_result(self, result) -> None:
+        """
+        Replace a pymoo result's front by the archive.
+
+        result.opt and result.X/F/G/CV are set to the archived designs;
+        results without a feasible design (empty archive) are left as they
+        are.
+        """
+        if len(self) == 0:
+            return
+        from pymoo.core.population import Population
+
+        opt = Population.new("X", self.X, "F", self.F, "G", self.G)
+        result.opt = opt
+        result.X, result.F, result.G, result.CV = opt.get("X", "F", "G", "CV")
+
+    def get_state(self) -> Dict:
+        """Archived designs and insertion counts (stored in checkpoints)."""
+        return {
+            "X": self.X, "F": self.F, "G": self.G,
+            "n_added": self.n_added, "n_truncated": self.n_truncated,
+        }
+
+    def set_state(self, state: Dict) -> None:
+        """
+        Restore designs and counts saved by get_state().
+
+        The archive keeps its own max_size; a restored archive larger than
+        that is truncated.
+        """
+        self.X, self.F, self.G = state["X"], state["F"], state["G"]
+        self.n_added = state["n_added"]
+        self.n_truncated = state["n_truncated"]
+        if self.max_size is not None and len(self) > self.max_size:
+            self._truncate()
+
+    def stats(self) -> Dict:
+        """Archive size and insertion counts (for optimization metadata)."""
+        return {
+            "n_designs": len(self),
+            "max_size": self.max_size,
+            "n_added": self.n_added,
+            "n_truncated": self.n_truncated,
+        }
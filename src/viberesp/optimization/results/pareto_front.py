@@ -4,15 +4,157 @@ Pareto front analysis and design ranking.
 This module provides functions for analyzing multi-objective optimization
 results, extracting Pareto fronts, and ranking designs by various criteria.
 
+All functions scale to fronts of 100k designs and more: non-dominated
+filtering is O(n log n) for 2 and 3 objectives, ranking, knee selection and
+hypervolume avoid pairwise comparisons of all designs.
+
 Literature:
     - Deb (2001) - Multi-Objective Optimization using Evolutionary Algorithms
     - Pareto dominance principles
+    - Kung, Luccio & Preparata (1975) - "On finding the maxima of a set of
+      vectors" (dimension sweep)
+    - Zhang et al. (2015) - "An efficient approach to nondominated sorting
+      for evolutionary multiobjective optimization" (ENS)
 """
 
 import numpy as np
 from typing import List, Dict, Tuple, Optional
 
 
+def non_dominated_mask(F: np.ndarray, block_size: int = 256) -> np.ndarray:
+    """
+    Designs no other design dominates (minimization).
+
+    A design dominates another if it is no worse in every objective and
+    better in at least one; identical objective vectors do not dominate
+    each other, so duplicates of a non-dominated vector are all kept. The
+    distinct objective vectors are sorted lexicographically, so a vector
+    can only be dominated by vectors before it:
+
+    - 2 objectives: kept if f2 is below every earlier f2, O(n log n)
+    - 3 objectives: Kung's dimension sweep, querying the smallest f3 of
+      earlier vectors with f2 at most the vector's in a Fenwick tree,
+      O(n log n)
+    - 4+ objectives: ENS sequential search, comparing blocks of
+      ``block_size`` vectors with the non-dominated vectors found so far,
+      O(n × front size)
+
+    Literature:
+        - Kung, Luccio & Preparata (1975) - Dimension sweep
+        - Zhang et al. (2015) - Efficient non-dominated sort (ENS-SS)
+
+    Args:
+        F: Objective values (n_designs × n_objectives), finite
+        block_size: Vectors compared at once for 4+ objectives
+
+    Returns:
+        Boolean mask (n_designs,) of the non-dominated designs
+
+    Examples:
+        >>> non_dominated_mask(np.array([[1.0, 3.0], [2.0, 2.0], [2.5, 2.5], [1.0, 3.0]]))
+        array([ True,  True, False,  True])
+    """
+    F = np.asarray(F, dtype=float)
+    if F.ndim == 1:
+        F = F.reshape(-1, 1)
+    if len(F) == 0:
+        return np.zeros(0, dtype=bool)
+
+    # Distinct vectors in lexicographic order
+    U, inverse = np.unique(F, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+
+    n_obj = U.shape[1]
+    if n_obj == 1:
+        keep = np.arange(len(U)) == 0
+    elif n_obj == 2:
+        best_before = np.concatenate(([np.inf], np.minimum.accumulate(U[:-1, 1])))
+        keep = U[:, 1] < best_before
+    elif n_obj == 3:
+        keep = _non_dominated_3d(U)
+    else:
+        keep = _non_dominated_ens(U, block_size)
+    return keep[inverse]
+
+
+def _non_dominated_3d(U: np.ndarray) -> np.ndarray:
+    """Kung's sweep over distinct, lexicographically sorted 3-objective vectors."""
+    ranks = np.searchsorted(np.unique(U[:, 1]), U[:, 1]) + 1
+    tree = np.full(ranks.max() + 1, np.inf)  # Fenwick tree of prefix minima of f3
+
+    keep = np.ones(len(U), dtype=bool)
+    for i, (rank, f3) in enumerate(zip(ranks.tolist(), U[:, 2].tolist())):
+        # Smallest f3 of the earlier vectors with f2 <= this f2
+        best, j = np.inf, rank
+        while j > 0:
+            best = min(best, tree[j])
+            j -= j & -j
+        if best <= f3:
+            keep[i] = False
+            continue
+        j = rank
+        while j < len(tree):
+            if f3 < tree[j]:
+                tree[j] = f3
+            j += j & -j
+    return keep
+
+
+def _non_dominated_ens(U: np.ndarray, block_size: int) -> np.ndarray:
+    """ENS sequential search over distinct, lexicographically sorted vectors."""
+    keep = np.zeros(len(U), dtype=bool)
+    front = np.empty((0, U.shape[1]))
+    for start in range(0, len(U), block_size):
+        block = U[start:start + block_size]
+        # Distinct vectors: "no worse everywhere" implies domination
+        dominated = np.zeros(len(block), dtype=bool)
+        for front_start in range(0, len(front), block_size):
+            P = front[front_start:front_start + block_size]
+            dominated |= np.any(np.all(P[:, None, :] <= block[None, :, :], axis=2), axis=0)
+        within = np.all(block[:, None, :] <= block[None, :, :], axis=2)
+        np.fill_diagonal(within, False)
+        dominated |= np.any(within, axis=0)
+
+        keep[start:start + len(block)] = ~dominated
+        front = np.vstack([front, block[~dominated]])
+    return keep
+
+
+def crowding_distance(F: np.ndarray) -> np.ndarray:
+    """
+    NSGA-II crowding distance of a set of objective vectors.
+
+    The distance of a design is the sum over objectives of the normalized
+    gap between its two neighbours along that objective; the extreme
+    designs of each objective get infinity. O(n_objectives × n log n).
+
+    Literature:
+        - Deb et al. (2002) - NSGA-II, crowding distance
+
+    Args:
+        F: Objective values (n_designs × n_objectives)
+
+    Returns:
+        Crowding distance per design (larger = less crowded)
+    """
+    F = np.asarray(F, dtype=float)
+    if F.ndim == 1:
+        F = F.reshape(-1, 1)
+    n = len(F)
+    distance = np.zeros(n)
+    if n <= 2:
+        return np.full(n, np.inf)
+
+    for column in F.T:
+        order = np.argsort(column, kind="stable")
+        values = column[order]
+        span = values[-1] - values[0]
+        distance[order[[0, -1]]] = np.inf
+        if span > 0:
+            distance[order[1:-1]] += (values[2:] - values[:-2]) / span
+    return distance
+
+
 def analyze_pareto_front(
     result,
     objectives: List[str],
@@ -160,31 +302,24 @@ def rank_designs(
         else:
             F_normalized[:, i] = 0.0
 
-    # Calculate weighted scores
-    ranked = []
-    for i in range(len(F)):
-        # Weighted sum of normalized objectives
-        score = 0.0
-        for j, obj_name in enumerate(objectives):
-            if obj_name in weights:
-                score += weights[obj_name] * F_normalized[i, j]
-
-        ranked.append({
-            "rank": score,
-            "x": X[i],
-            "F": F[i]
-        })
+    # Weighted sum of normalized objectives (for all designs at once)
+    scores = np.zeros(len(F))
+    for j, obj_name in enumerate(objectives):
+        if obj_name in weights:
+            scores = scores + weights[obj_name] * F_normalized[:, j]
 
-    # Sort by rank (ascending - lower is better)
-    ranked.sort(key=lambda d: d["rank"])
+    # Sort by rank (ascending - lower is better); ties keep their order
+    indices = np.argsort(scores, kind="stable")
+    if top_n:
+        indices = indices[:top_n]
 
-    # Convert to output format
+    # Convert to output format (only the returned designs)
     output = []
-    for i, design in enumerate(ranked[:top_n] if top_n else ranked):
+    for i in indices:
         output.append({
-            "rank": float(design["rank"]),
-            "parameters": dict(zip(parameter_names, design["x"])),
-            "objectives": dict(zip(objectives, design["F"]))
+            "rank": float(scores[i]),
+            "parameters": dict(zip(parameter_names, X[i])),
+            "objectives": dict(zip(objectives, F[i]))
         })
 
     return output
@@ -250,7 +385,9 @@ def select_knee_point(
 
 def calculate_hypervolume(
     result,
-    reference_point: np.ndarray
+    reference_point: np.ndarray,
+    n_samples: int = 100_000,
+    seed: int = 0
 ) -> float:
     """
     Calculate hypervolume indicator for Pareto front.
@@ -265,23 +402,146 @@ def calculate_hypervolume(
     Args:
         result: pymoo optimization result
         reference_point: Reference point for hypervolume calculation
+        n_samples: Monte-Carlo samples for more than 3 objectives
+        seed: Monte-Carlo random seed
 
     Returns:
-        Hypervolume value
+        Hypervolume value (exact for 2 and 3 objectives)
+    """
+    return hypervolume(result.F, reference_point, n_samples=n_samples, seed=seed)
 
-    Note:
-        This requires pymoo's hypervolume calculation.
-        For now, returns a placeholder.
+
+def hypervolume(
+    F: np.ndarray,
+    reference_point: np.ndarray,
+    n_samples: int = 100_000,
+    seed: int = 0
+) -> float:
     """
-    # Placeholder - would use pymoo.indicators.HV in full implementation
-    # from pymoo.indicators.hv import HV
-    # indicator = HV(ref_point=reference_point)
-    # return indicator.calc(result.F)
+    Hypervolume dominated by a set of objective vectors (minimization).
+
+    Points that do not strictly dominate the reference point contribute
+    nothing; dominated points are allowed and ignored.
+
+    - 2 objectives: exact sweep over the points sorted by f1, O(n log n)
+    - 3 objectives: exact sweep along f3 (Beume et al. 2009), keeping the
+      2-objective staircase of the points swept so far and its area,
+      O(n log n) searches plus list updates
+    - 4+ objectives: Monte-Carlo estimate from n_samples uniform samples of
+      the box between the front's ideal point and the reference point. The
+      fixed seed makes the estimate reproducible for a given front; as the
+      box follows the front's ideal point, estimates of different fronts
+      carry independent sampling errors (standard error at most
+      box volume / (2·sqrt(n_samples))).
 
-    # Simple approximation: volume of bounding box
-    F = result.F
-    hv = 1.0
-    for i in range(F.shape[1]):
-        hv *= (reference_point[i] - np.min(F[:, i]))
+    Literature:
+        - Zitzler & Thiele (1999) - Hypervolume (S metric)
+        - While et al. (2006) - "A faster algorithm for calculating
+          hypervolume", hypervolume by slicing objectives
+        - Beume et al. (2009) - "On the complexity of computing the
+          hypervolume indicator" (3-objective dimension sweep)
+        - Bader & Zitzler (2011) - HypE, Monte-Carlo hypervolume estimation
 
-    return hv
+    Args:
+        F: Objective values (n_points × n_objectives)
+        reference_point: Reference point (n_objectives,), worse than the front
+        n_samples: Monte-Carlo samples for more than 3 objectives
+        seed: Monte-Carlo random seed
+
+    Returns:
+        Hypervolume value (0.0 if no point dominates the reference point)
+
+    Raises:
+        ValueError: If F and reference_point dimensions do not match
+
+    Examples:
+        >>> hypervolume(np.array([[1.0, 2.0], [2.0, 1.0]]), np.array([3.0, 3.0]))
+        3.0
+    """
+    F = np.atleast_2d(np.asarray(F, dtype=float))
+    ref = np.asarray(reference_point, dtype=float)
+    if F.shape[1] != len(ref):
+        raise ValueError(
+            f"reference_point has {len(ref)} objectives, F has {F.shape[1]}"
+        )
+
+    F = F[np.all(F < ref, axis=1)]
+    if len(F) == 0:
+        return 0.0
+    # Dominated points add no volume
+    F = F[non_dominated_mask(F)]
+
+    n_obj = F.shape[1]
+    if n_obj == 1:
+        return float(ref[0] - F[:, 0].min())
+    if n_obj == 2:
+        return _hypervolume_2d(F, ref)
+    if n_obj == 3:
+        return _hypervolume_3d(F, ref)
+    return _hypervolume_monte_carlo(F, ref, n_samples, seed)
+
+
+def _hypervolume_2d(F: np.ndarray, ref: np.ndarray) -> float:
+    """Exact 2-objective hypervolume (points all dominate ref)."""
+    F = F[np.lexsort((F[:, 1], F[:, 0]))]
+    # Each point adds the strip between its f2 and the best f2 so far
+    best_f2 = np.minimum.accumulate(F[:, 1])
+    previous = np.concatenate(([ref[1]], best_f2[:-1]))
+    return float(np.sum((ref[0] - F[:, 0]) * np.maximum(previous - F[:, 1], 0.0)))
+
+
+def _hypervolume_3d(F: np.ndarray, ref: np.ndarray) -> float:
+    """Exact 3-objective hypervolume by sweeping along f3."""
+    from bisect import bisect_left
+
+    F = F[np.argsort(F[:, 2], kind="stable")]
+    upper = np.concatenate((F[1:, 2], [ref[2]]))
+
+    # 2-objective staircase of the swept points: f1 ascending, f2 descending
+    xs, ys = [], []
+    area = 0.0
+    hv = 0.0
+    for (x, y, z), z_next in zip(F.tolist(), upper.tolist()):
+        i = bisect_left(xs, x)
+        dominated = (i > 0 and ys[i - 1] <= y) or (i < len(xs) and xs[i] == x and ys[i] <= y)
+        if not dominated:
+            # Points from i on with f2 >= y are now dominated
+            j = i
+            while j < len(ys) and ys[j] >= y:
+                j += 1
+            # Area gained between x and the next remaining point
+            right = xs[j] if j < len(xs) else ref[0]
+            left_height = ref[1] - ys[i - 1] if i > 0 else 0.0
+            edges = [x] + xs[i:j] + [right]
+            heights = [left_height] + [ref[1] - h for h in ys[i:j]]
+            area += (ref[1] - y) * (right - x) - sum(
+                (b - a) * h for a, b, h in zip(edges[:-1], edges[1:], heights)
+            )
+            xs[i:j] = [x]
+            ys[i:j] = [y]
+        hv += area * (z_next - z)
+    return float(hv)
+
+
+def _hypervolume_monte_carlo(
+    F: np.ndarray,
+    ref: np.ndarray,
+    n_samples: int,
+    seed: int,
+    chunk_size: int = 10_000
+) -> float:
+    """Monte-Carlo hypervolume estimate for 4+ objectives."""
+    ideal = F.min(axis=0)
+    box_volume = float(np.prod(ref - ideal))
+    rng = np.random.default_rng(seed)
+
+    n_dominated = 0
+    for start in range(0, n_samples, chunk_size):
+        m = min(chunk_size, n_samples - start)
+        samples = rng.uniform(ideal, ref, size=(m, len(ref)))
+        dominated = np.zeros(m, dtype=bool)
+        for point in F:
+            dominated |= np.all(samples >= point, axis=1)
+        n_dominated += int(np.sum(dominated))
+
+    return box_volume * n_dominated / n_samples
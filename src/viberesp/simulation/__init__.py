@@ -35,6 +35,7 @@ from viberesp.simulation.horn_theory import (
     conical_horn_throat_impedance,
     exponential_horn_throat_impedance,
     exponential_horn_tmatrix,
+    hyperbolic_horn_throat_impedance,
     throat_impedance_from_tmatrix,
 )
 
@@ -44,6 +45,9 @@ from viberesp.simulation.horn_driver_integration import (
     rear_chamber_impedance,
     horn_system_acoustic_impedance,
     horn_electrical_impedance,
+    horn_system_response,
+    horn_tmatrix,
+    exponential_horn_batch_response,
 )
 
 __all__ = [
@@ -63,12 +67,16 @@ __all__ = [
     "conical_horn_throat_impedance",
     "exponential_horn_throat_impedance",
     "exponential_horn_tmatrix",
+    "hyperbolic_horn_throat_impedance",
     "throat_impedance_from_tmatrix",
     # Horn driver integration functions
     "throat_chamber_impedance",
     "rear_chamber_impedance",
     "horn_system_acoustic_impedance",
     "horn_electrical_impedance",
+    "horn_system_response",
+    "horn_tmatrix",
+    "exponential_horn_batch_response",
     # Data structures
     "ConicalHorn",
     "ExponentialHorn",
@@ -25,8 +25,11 @@ from viberesp.simulation.horn_theory import (
     exponential_horn_throat_impedance,
     exponential_horn_tmatrix,
     conical_horn_throat_impedance,
+    hyperbolic_horn_throat_impedance,
     multsegment_horn_throat_impedance,
+    HORN_RADIATION_METHOD,
     circular_piston_radiation_impedance,
+    throat_impedance_from_tmatrix,
     MediumProperties,
 )
 from viberesp.simulation.types import ExponentialHorn, ConicalHorn, HyperbolicHorn, MultiSegmentHorn
@@ -121,7 +124,9 @@ def calculate_mouth_volume_velocity(
 
     # Get mouth impedance
     effective_mouth_area = 2 * np.pi * horn.mouth_area / radiation_angle
-    z_mouth = circular_piston_radiation_impedance(frequencies, effective_mouth_area, medium)
+    z_mouth = circular_piston_radiation_impedance(
+        frequencies, effective_mouth_area, medium, method=HORN_RADIATION_METHOD
+    )
 
     # Calculate mouth velocity: U_m = U_t / (C*Z_m + D)
     u_mouth = throat_volume_velocity / (c * z_mouth + d)
@@ -408,9 +413,8 @@ def horn_system_acoustic_impedance(
             frequencies, horn, medium, radiation_angle
         )
     elif isinstance(horn, HyperbolicHorn):
-        # Hyperbolic horn: use exponential for now (T=1 is exponential)
-        # TODO: Implement hyperbolic-specific throat impedance
-        Z_horn_throat = exponential_horn_throat_impedance(
+        # Hyperbolic horn: Mapes-Riordan hypex T-matrix
+        Z_horn_throat = hyperbolic_horn_throat_impedance(
             frequencies, horn, medium, radiation_angle
         )
     elif isinstance(horn, MultiSegmentHorn):
@@ -634,6 +638,451 @@ def horn_electrical_impedance(
     return result
 
 
+def horn_tmatrix(
+    frequencies: FloatArray,
+    horn: Union['ExponentialHorn', 'ConicalHorn', 'HyperbolicHorn', 'MultiSegmentHorn'],
+    medium: Optional[MediumProperties] = None
+) -> Tuple[ComplexArray, ComplexArray, ComplexArray, ComplexArray]:
+    """Calculate the throat-to-mouth T-matrix of any supported horn type.
+
+    Dispatches on horn type and returns the T-matrix elements as arrays over
+    the frequency vector. Multi-segment horns are chained in forward order
+    (throat to mouth), so the returned matrix relates throat quantities to
+    mouth quantities of the complete horn.
+
+    Literature:
+        - Kolbrek, "Horn Theory: An Introduction, Part 1" - T-matrix chaining
+          T_total = T_1 · T_2 · ... · T_n (throat to mouth)
+        - literature/horns/kolbrek_horn_theory_tutorial.md
+
+    T-matrix convention:
+        [p_t, U_t]ᵀ = [A B; C D] · [p_m, U_m]ᵀ
+
+    Args:
+        frequencies: Array of frequencies [Hz]
+        horn: Horn geometry (ExponentialHorn, ConicalHorn, HyperbolicHorn,
+            or MultiSegmentHorn)
+        medium: Acoustic medium properties (uses default if None)
+
+    Returns:
+        Tuple of (a, b, c, d) complex arrays, each with the shape of frequencies
+
+    Raises:
+        TypeError: If horn type is not supported
+
+    Examples:
+        >>> import numpy as np
+        >>> from viberesp.simulation.types import ExponentialHorn
+        >>> horn = ExponentialHorn(0.005, 0.05, 0.3)
+        >>> a, b, c, d = horn_tmatrix(np.array([100.0, 500.0]), horn)
+        >>> a.shape
+        (2,)
+
+    Validation:
+        Determinant a·d - b·c equals S_t/S_m for lossless segments.
+    """
+    if medium is None:
+        medium = MediumProperties()
+
+    frequencies = np.atleast_1d(frequencies).astype(float)
+
+    if isinstance(horn, MultiSegmentHorn):
+        # Start with identity matrix and chain segments throat -> mouth
+        a = np.ones_like(frequencies, dtype=complex)
+        b = np.zeros_like(frequencies, dtype=complex)
+        c = np.zeros_like(frequencies, dtype=complex)
+        d = np.ones_like(frequencies, dtype=complex)
+
+        for segment in horn.segments:
+            if isinstance(segment, (ConicalHorn, HyperbolicHorn)):
+                a_seg, b_seg, c_seg, d_seg = segment.calculate_t_matrix_array(
+                    frequencies, medium.c, medium.rho
+                )
+            else:
+                # HornSegment (exponential): use plane wave T-matrix
+                segment_horn = ExponentialHorn(
+                    throat_area=segment.throat_area,
+                    mouth_area=segment.mouth_area,
+                    length=segment.length
+                )
+                a_seg, b_seg, c_seg, d_seg = exponential_horn_tmatrix(
+                    frequencies, segment_horn, medium
+                )
+
+            # Chain: T_total = T_total @ T_segment
+            # (apply new segment on the right)
+            a, b, c, d = (
+                a * a_seg + b * c_seg,
+                a * b_seg + b * d_seg,
+                c * a_seg + d * c_seg,
+                c * b_seg + d * d_seg,
+            )
+
+        return a, b, c, d
+
+    if isinstance(horn, ExponentialHorn):
+        return exponential_horn_tmatrix(frequencies, horn, medium)
+
+    if isinstance(horn, (ConicalHorn, HyperbolicHorn)):
+        # Spherical-wave and hypex T-matrices, vectorized over frequencies
+        return horn.calculate_t_matrix_array(frequencies, medium.c, medium.rho)
+
+    raise TypeError(f"Unsupported horn type: {type(horn)}")
+
+
+def horn_system_response(
+    frequencies: FloatArray,
+    driver: ThieleSmallParameters,
+    horn: Union['ExponentialHorn', 'ConicalHorn', 'HyperbolicHorn', 'MultiSegmentHorn'],
+    V_tc: float = 0.0,
+    A_tc: Optional[float] = None,
+    V_rc: float = 0.0,
+    voltage: float = 2.83,
+    measurement_distance: float = 1.0,
+    medium: Optional[MediumProperties] = None,
+    radiation_angle: float = 2 * np.pi
+) -> dict:
+    """Calculate the complete horn-loaded driver response over a frequency array.
+
+    Array-native equivalent of horn_electrical_impedance() followed by the
+    mouth power and SPL calculation of FrontLoadedHorn. Every quantity is
+    computed for the whole frequency vector with NumPy broadcasting, so the
+    acoustic load and the horn T-matrix are evaluated exactly once.
+
+    Literature:
+        - Small (1972) - Electromechanical analogies
+        - Beranek (1954), Chapter 4 - Acoustic power radiation
+        - Kolbrek, "Horn Loudspeaker Simulation Part 3" - Power from T-matrix
+        - Kinsler et al. (1982), Chapter 4 - SPL from power
+        - literature/thiele_small/small_1972_closed_box.md
+        - literature/horns/beranek_1954.md
+        - literature/horns/kolbrek_horn_theory_tutorial.md
+
+    Model:
+        Z_e = R_e + jωL_e + (BL)² / Z_mech_total
+        u_d = BL·(V/Z_e) / Z_mech_total
+        U_t = u_d·S_d,  p_t = Z_acoustic·U_t
+        [p_m, U_m]ᵀ = T⁻¹ · [p_t, U_t]ᵀ
+        W = 0.5·Re(p_m·U_m*)
+        SPL = 20·log₁₀(√(W·ρ₀·c/(2π·r²)) / p_ref)
+
+    Args:
+        frequencies: Array of frequencies [Hz]
+        driver: ThieleSmallParameters instance
+        horn: Horn geometry (ExponentialHorn, ConicalHorn, HyperbolicHorn,
+            or MultiSegmentHorn)
+        V_tc: Throat chamber volume [m³], default 0
+        A_tc: Throat chamber area [m²], defaults to horn.throat_area
+        V_rc: Rear chamber volume [m³], default 0
+        voltage: Input voltage [V], default 2.83V
+        measurement_distance: SPL measurement distance [m], default 1m
+        medium: Acoustic medium properties (uses default if None)
+        radiation_angle: Solid angle of radiation [steradians]
+
+    Returns:
+        Dictionary with arrays (same shape as frequencies):
+        - 'frequencies': Frequency array (Hz)
+        - 'Ze': Complex electrical impedance (Ω)
+        - 'Ze_magnitude', 'Ze_phase', 'Ze_real', 'Ze_imag': Ze components
+        - 'diaphragm_velocity': Diaphragm velocity magnitude (m/s)
+        - 'diaphragm_displacement': Diaphragm displacement magnitude (m)
+        - 'Z_front': Front acoustic impedance (Pa·s/m³)
+        - 'Z_rear': Rear acoustic impedance (Pa·s/m³)
+        - 'throat_pressure': Complex throat pressure (Pa)
+        - 'throat_volume_velocity': Complex throat volume velocity (m³/s)
+        - 'mouth_pressure': Complex mouth pressure (Pa)
+        - 'mouth_volume_velocity': Complex mouth volume velocity (m³/s)
+        - 'acoustic_power': Radiated acoustic power (W)
+        - 'SPL': SPL at measurement_distance (dB), -inf where power is zero
+        - 'tmatrix': Chained horn T-matrix elements (a, b, c, d)
+
+    Raises:
+        ValueError: If any frequency <= 0
+        TypeError: If driver is not ThieleSmallParameters
+
+    Examples:
+        >>> import numpy as np
+        >>> from viberesp.simulation.types import ExponentialHorn
+        >>> from viberesp.driver import load_driver
+        >>> driver = load_driver("BC_8NDL51")
+        >>> horn = ExponentialHorn(0.001, 0.01, 0.3)
+        >>> response = horn_system_response(np.logspace(1, 4, 200), driver, horn)
+        >>> response['SPL'].shape
+        (200,)
+
+    Validation:
+        Matches horn_electrical_impedance() and FrontLoadedHorn.spl_response()
+        point-by-point to floating point precision.
+    """
+    frequencies = np.atleast_1d(frequencies).astype(float)
+
+    if np.any(frequencies <= 0):
+        raise ValueError(f"All frequencies must be > 0, min={np.min(frequencies)} Hz")
+
+    # Local import to avoid circular dependency
+    from viberesp.driver.parameters import ThieleSmallParameters
+
+    if not isinstance(driver, ThieleSmallParameters):
+        raise TypeError(f"driver must be ThieleSmallParameters, got {type(driver)}")
+
+    if medium is None:
+        medium = MediumProperties()
+
+    omega = 2 * np.pi * frequencies
+
+    # Acoustic load seen at the throat (one pass for all frequencies)
+    Z_front, Z_rear = horn_system_acoustic_impedance(
+        frequencies, horn, V_tc, A_tc, V_rc, driver.S_d, medium, radiation_angle
+    )
+    a, b, c, d = horn_tmatrix(frequencies, horn, medium)
+
+    response = {'frequencies': frequencies, 'tmatrix': (a, b, c, d)}
+    response.update(_solve_horn_driver_chain(
+        omega, driver, horn.throat_area, Z_front, Z_rear, (a, b, c, d),
+        voltage, measurement_distance, medium
+    ))
+    return response
+
+
+def _solve_horn_driver_chain(
+    omega: FloatArray,
+    driver: ThieleSmallParameters,
+    throat_area: Union[float, FloatArray],
+    Z_front: ComplexArray,
+    Z_rear: ComplexArray,
+    tmatrix: Tuple[ComplexArray, ComplexArray, ComplexArray, ComplexArray],
+    voltage: float,
+    measurement_distance: float,
+    medium: MediumProperties
+) -> dict:
+    """Solve the electro-mechano-acoustical chain for a given acoustic load.
+
+    Shared by horn_system_response() and exponential_horn_batch_response().
+    All arguments broadcast, so omega may be (n_freq,), throat_area a
+    scalar or (n_designs, 1) column, and the impedances and T-matrix
+    elements (n_freq,) or (n_designs, n_freq).
+    """
+    a, b, c, d = tmatrix
+    Z_acoustic = Z_front + Z_rear
+
+    # Mechanical impedance: driver + reflected acoustic load
+    # COMSOL (2020), Figure 2
+    Z_mechanical_driver = (driver.R_ms + 1j * omega * driver.M_md
+                           - 1j / (omega * driver.C_ms))
+    Z_mechanical_total = Z_mechanical_driver + scale_throat_acoustic_to_mechanical(
+        Z_acoustic, throat_area, driver.S_d
+    )
+
+    # Electrical impedance: Z_e = Z_vc + (BL)² / Z_mech_total
+    with np.errstate(divide='ignore', invalid='ignore'):
+        Z_reflected = np.where(
+            Z_mechanical_total == 0,
+            complex(0, float('inf')),
+            (driver.BL ** 2) / Z_mechanical_total,
+        )
+        Ze = driver.R_e + 1j * omega * driver.L_e + Z_reflected
+
+        # Diaphragm velocity: u_d = BL·I / Z_mech_total
+        if driver.BL == 0:
+            u_diaphragm = np.zeros_like(Ze)
+        else:
+            u_diaphragm = np.where(
+                Ze == 0, 0.0, driver.BL * (voltage / Ze) / Z_mechanical_total
+            )
+
+    x_diaphragm = u_diaphragm / (1j * omega)
+
+    # Throat quantities (compression driver: U_throat = u_d × S_d)
+    U_throat = u_diaphragm * driver.S_d
+    p_throat = Z_acoustic * U_throat
+
+    # Inverse T-matrix transform to the mouth
+    # [p_m, U_m] = (1/det) × [d, -b; -c, a] @ [p_t, U_t]
+    det = a * d - b * c
+    valid = np.abs(det) >= 1e-15
+    safe_det = np.where(valid, det, 1.0)
+    p_mouth = np.where(valid, (d * p_throat - b * U_throat) / safe_det, 0.0)
+    U_mouth = np.where(valid, (-c * p_throat + a * U_throat) / safe_det, 0.0)
+
+    # Acoustic power at mouth: W = 0.5·Re(p_m × U_m*)
+    # Kolbrek, "Horn Loudspeaker Simulation Part 3"
+    power = np.maximum(0.0, 0.5 * np.real(p_mouth * np.conj(U_mouth)))
+
+    # SPL from acoustic power (half-space radiation)
+    # Kinsler et al. (1982), Chapter 4
+    pressure_rms = np.sqrt(
+        power * medium.rho * medium.c / (2 * np.pi * measurement_distance ** 2)
+    )
+    p_ref = 20e-6  # Reference pressure: 20 μPa
+    with np.errstate(divide='ignore'):
+        spl = 20 * np.log10(pressure_rms / p_ref)
+
+    return {
+        'Ze': Ze,
+        'Ze_magnitude': np.abs(Ze),
+        'Ze_phase': np.degrees(np.angle(Ze)),
+        'Ze_real': Ze.real,
+        'Ze_imag': Ze.imag,
+        'diaphragm_velocity': np.abs(u_diaphragm),
+        'diaphragm_displacement': np.abs(x_diaphragm),
+        'Z_front': Z_front,
+        'Z_rear': Z_rear,
+        'throat_pressure': p_throat,
+        'throat_volume_velocity': U_throat,
+        'mouth_pressure': p_mouth,
+        'mouth_volume_velocity': U_mouth,
+        'acoustic_power': power,
+        'SPL': spl,
+    }
+
+
+def exponential_horn_batch_response(
+    frequencies: FloatArray,
+    driver: ThieleSmallParameters,
+    throat_area: FloatArray,
+    mouth_area: FloatArray,
+    length: FloatArray,
+    V_tc: Union[float, FloatArray] = 0.0,
+    V_rc: Union[float, FloatArray] = 0.0,
+    voltage: float = 2.83,
+    measurement_distance: float = 1.0,
+    medium: Optional[MediumProperties] = None,
+    radiation_angle: float = 2 * np.pi,
+    radiation_method: str = HORN_RADIATION_METHOD
+) -> dict:
+    """Calculate the response of many exponential horn designs at once.
+
+    Population × frequency version of horn_system_response() for
+    ExponentialHorn geometries. Each design is one entry in the geometry
+    arrays; the T-matrix, mouth radiation impedance, chamber impedances and
+    the driver chain are evaluated as (n_designs, n_freq) NumPy arrays, so a
+    whole optimizer generation costs a single vectorized computation.
+
+    Literature:
+        - Kolbrek, "Horn Loudspeaker Simulation Part 1" - Exponential T-matrix
+        - Beranek (1954), Eq. 5.20 - Piston radiation impedance
+        - Beranek (1954), Chapter 5 - Acoustic compliance of cavities
+        - Small (1972) - Electromechanical analogies
+        - literature/horns/kolbrek_horn_theory_tutorial.md
+        - literature/horns/beranek_1954.md
+
+    Args:
+        frequencies: Array of frequencies [Hz], shape (n_freq,)
+        driver: ThieleSmallParameters instance
+        throat_area: Throat areas [m²], shape (n_designs,)
+        mouth_area: Mouth areas [m²], shape (n_designs,)
+        length: Horn lengths [m], shape (n_designs,)
+        V_tc: Throat chamber volumes [m³], scalar or shape (n_designs,);
+            designs with V_tc <= 0 have no throat chamber
+        V_rc: Rear chamber volumes [m³], scalar or shape (n_designs,);
+            designs with V_rc <= 0 have no rear chamber
+        voltage: Input voltage [V], default 2.83V
+        measurement_distance: SPL measurement distance [m], default 1m
+        medium: Acoustic medium properties (uses default if None)
+        radiation_angle: Solid angle of radiation [steradians]
+        radiation_method: Mouth radiation evaluation passed to
+            circular_piston_radiation_impedance() ("exact", "table" or
+            "aarts_janssen"; default "table", as in horn_system_response)
+
+    Returns:
+        Dictionary with:
+        - 'frequencies': Frequency array (Hz), shape (n_freq,)
+        - every key of horn_system_response() except 'frequencies', each
+          with shape (n_designs, n_freq)
+
+    Raises:
+        ValueError: If any frequency <= 0, if geometry arrays have
+            mismatched lengths, or if any area or length is not positive
+
+    Examples:
+        >>> import numpy as np
+        >>> from viberesp.driver import load_driver
+        >>> driver = load_driver("BC_8NDL51")
+        >>> freqs = np.logspace(1, 4, 200)
+        >>> result = exponential_horn_batch_response(
+        ...     freqs, driver,
+        ...     throat_area=np.array([0.001, 0.002]),
+        ...     mouth_area=np.array([0.01, 0.05]),
+        ...     length=np.array([0.3, 0.6]),
+        ... )
+        >>> result['SPL'].shape
+        (2, 200)
+
+    Validation:
+        Row i matches horn_system_response() for
+        ExponentialHorn(throat_area[i], mouth_area[i], length[i]).
+    """
+    frequencies = np.atleast_1d(frequencies).astype(float)
+
+    if np.any(frequencies <= 0):
+        raise ValueError(f"All frequencies must be > 0, min={np.min(frequencies)} Hz")
+
+    # Local import to avoid circular dependency
+    from viberesp.driver.parameters import ThieleSmallParameters
+
+    if not isinstance(driver, ThieleSmallParameters):
+        raise TypeError(f"driver must be ThieleSmallParameters, got {type(driver)}")
+
+    if medium is None:
+        medium = MediumProperties()
+
+    S1 = np.atleast_1d(throat_area).astype(float)
+    S2 = np.atleast_1d(mouth_area).astype(float)
+    L = np.atleast_1d(length).astype(float)
+    n_designs = S1.shape[0]
+
+    if S2.shape != S1.shape or L.shape != S1.shape:
+        raise ValueError(
+            f"Geometry arrays must have the same shape, got throat {S1.shape}, "
+            f"mouth {S2.shape}, length {L.shape}"
+        )
+    if np.any(S1 <= 0) or np.any(S2 <= 0) or np.any(L <= 0):
+        raise ValueError("All horn areas and lengths must be positive")
+
+    V_tc = np.broadcast_to(np.asarray(V_tc, dtype=float), (n_designs,))
+    V_rc = np.broadcast_to(np.asarray(V_rc, dtype=float), (n_designs,))
+
+    # Designs along rows, frequencies along columns
+    S1 = S1[:, np.newaxis]
+    S2 = S2[:, np.newaxis]
+    L = L[:, np.newaxis]
+    V_tc = V_tc[:, np.newaxis]
+    V_rc = V_rc[:, np.newaxis]
+    omega = 2 * np.pi * frequencies
+
+    # Exponential T-matrix of every design, shape (n_designs, n_freq)
+    a, b, c, d = exponential_horn_tmatrix(
+        frequencies, ExponentialHorn(S1, S2, L), medium
+    )
+
+    # Mouth radiation impedance (Hornresp convention for radiation angle)
+    effective_mouth_area = 2 * np.pi * S2 / radiation_angle
+    z_mouth = circular_piston_radiation_impedance(
+        frequencies, effective_mouth_area, medium, method=radiation_method
+    )
+    Z_horn_throat = throat_impedance_from_tmatrix(z_mouth, a, b, c, d)
+
+    # Throat chamber in parallel with the horn, rear chamber compliance
+    # Beranek (1954), Chapter 5: C = V / (ρ·c²)
+    compliance_scale = medium.rho * medium.c ** 2
+    has_tc = V_tc > 0
+    has_rc = V_rc > 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        Z_tc = -1j / (omega * np.where(has_tc, V_tc, 1.0) / compliance_scale)
+        Z_front = np.where(
+            has_tc, 1.0 / (1.0 / Z_tc + 1.0 / Z_horn_throat), Z_horn_throat
+        )
+        Z_rc = -1j / (omega * np.where(has_rc, V_rc, 1.0) / compliance_scale)
+        Z_rear = np.where(has_rc, Z_rc, 0.0 + 0.0j)
+
+    response = {'frequencies': frequencies, 'tmatrix': (a, b, c, d)}
+    response.update(_solve_horn_driver_chain(
+        omega, driver, S1, Z_front, Z_rear, (a, b, c, d),
+        voltage, measurement_distance, medium
+    ))
+    return response
+
+
 @dataclass
 class HornSPLResult:
     """
@@ -764,10 +1213,7 @@ def calculate_horn_spl_flow(
             frequencies, horn, medium, radiation_angle
         )
     elif isinstance(horn, HyperbolicHorn):
-        # Hyperbolic horns use the exponential throat impedance (T=1 is exponential)
-        # For now, we use the exponential function as HyperbolicHorn shares
-        # similar impedance characteristics. TODO: Implement hyperbolic-specific impedance
-        z_throat_acoustic = exponential_horn_throat_impedance(
+        z_throat_acoustic = hyperbolic_horn_throat_impedance(
             frequencies, horn, medium, radiation_angle
         )
     else:
@@ -825,31 +1271,15 @@ def calculate_horn_spl_flow(
     # U_t = C·p_m + D·U_m = C·Z_mouth·U_m + D·U_m = U_m·(C·Z_mouth + D)
     # Therefore: U_m = U_t / (C·Z_mouth + D)
 
-    # Calculate T-matrix based on horn type
-    if isinstance(horn, ExponentialHorn):
-        # Exponential horns use the array-based function
-        a, b, c, d = exponential_horn_tmatrix(frequencies, horn, medium)
-    elif isinstance(horn, (ConicalHorn, HyperbolicHorn)):
-        # Conical and Hyperbolic horns have calculate_t_matrix method on the class
-        # which takes a single frequency, so we need to loop
-        a_list, b_list, c_list, d_list = [], [], [], []
-        for f in frequencies:
-            t_matrix = horn.calculate_t_matrix(f, medium.c, medium.rho)
-            a_list.append(t_matrix[0, 0])
-            b_list.append(t_matrix[0, 1])
-            c_list.append(t_matrix[1, 0])
-            d_list.append(t_matrix[1, 1])
-        a = np.array(a_list, dtype=complex)
-        b = np.array(b_list, dtype=complex)
-        c = np.array(c_list, dtype=complex)
-        d = np.array(d_list, dtype=complex)
-    else:
-        raise TypeError(f"Unsupported horn type: {type(horn)}")
+    # Calculate T-matrix based on horn type (vectorized over frequencies)
+    a, b, c, d = horn_tmatrix(frequencies, horn, medium)
 
     # Get mouth impedance (already calculated inside throat_impedance, but need it here)
     # Recalculate for clarity
     effective_mouth_area = 2 * np.pi * horn.mouth_area / radiation_angle
-    z_mouth = circular_piston_radiation_impedance(frequencies, effective_mouth_area, medium)
+    z_mouth = circular_piston_radiation_impedance(
+        frequencies, effective_mouth_area, medium, method=HORN_RADIATION_METHOD
+    )
 
     # Calculate mouth velocity using T-matrix transformation
     # U_mouth = U_throat / (C·Z_mouth + D)
@@ -11,7 +11,7 @@ Literature:
 """
 
 from dataclasses import dataclass
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple, Union
 
 import numpy as np
 from scipy.optimize import brentq
@@ -244,32 +244,68 @@ class HyperbolicHorn:
             Uses effective wavenumber k' = √(k² - m²).
             Below cutoff (k < m), k' becomes imaginary, handling reactive component.
         """
-        k = 2 * np.pi * f / c
+        A, B, C, D = self.calculate_t_matrix_array(np.array([f]), c, rho)
+        return np.array([[A[0], B[0]], [C[0], D[0]]], dtype=complex)
+
+    def calculate_t_matrix_array(
+        self,
+        frequencies: np.ndarray,
+        c: float = 343.2,
+        rho: float = 1.205
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Calculate the T-matrix elements of this segment over a frequency array.
+
+        Vectorized form of calculate_t_matrix(). The propagating (k ≥ m) and
+        evanescent (k < m) regimes are evaluated together and selected with
+        masks, so no per-frequency branching is required.
+
+        Literature:
+            - Mapes-Riordan (1993), Eq 13a-13d - Hyperbolic horn T-matrix
+            - Kolbrek, "Horn Theory: An Introduction, Part 1 & 2"
+            - literature/horns/kolbrek_horn_theory_tutorial.md
+
+        Args:
+            frequencies: Array of frequencies [Hz]
+            c: Speed of sound [m/s]
+            rho: Air density [kg/m³]
+
+        Returns:
+            Tuple of (A, B, C, D) complex arrays with the shape of frequencies,
+            relating [p₁, U₁]ᵀ = [A B; C D][p₂, U₂]ᵀ
+
+        Examples:
+            >>> horn = HyperbolicHorn(0.001, 0.1, 1.5, T=0.7)
+            >>> A, B, C, D = horn.calculate_t_matrix_array(np.array([20.0, 500.0]))
+            >>> A.shape
+            (2,)
+        """
+        frequencies = np.atleast_1d(np.asarray(frequencies, dtype=float))
+
+        k = 2 * np.pi * frequencies / c
         L = self.length
         m = self.m
 
         # Characteristic parameters
-        # mu is the complex propagation constant
+        # mu is the propagation constant, real above cutoff (k ≥ m) and
+        # the decay constant below cutoff (k < m)
         discriminant = k**2 - m**2
-
-        if discriminant >= 0:
-            mu = np.sqrt(discriminant)
-            # Above cutoff (propagating)
-            cos_mu_L = np.cos(mu * L)
-            sin_mu_L = np.sin(mu * L)
-
-            # Use sinc function for stability when mu -> 0 (cutoff)
-            if mu < 1e-9:
-                sinc_mu_L = L
-            else:
-                sinc_mu_L = sin_mu_L / mu
-        else:
-            # Below cutoff (evanescent)
-            mu = np.sqrt(-discriminant)  # Real value
-            cos_mu_L = np.cosh(mu * L)
-            sin_mu_L = 1j * np.sinh(mu * L)  # Returns imaginary
-            # Adjust sinc divisor to handle the imaginary mu properly
-            sinc_mu_L = np.sinh(mu * L) / mu if mu > 1e-9 else L
+        propagating = discriminant >= 0
+        mu = np.sqrt(np.abs(discriminant))
+        mu_L = mu * L
+
+        # Above cutoff: cos(μL), sin(μL)/μ
+        # Below cutoff (evanescent): cosh(μL), sinh(μL)/μ
+        cos_mu_L = np.where(propagating, np.cos(mu_L), np.cosh(mu_L))
+
+        # Use sinc limit sin(μL)/μ → L for stability when mu -> 0 (cutoff)
+        near_cutoff = np.where(propagating, mu < 1e-9, mu <= 1e-9)
+        safe_mu = np.where(near_cutoff, 1.0, mu)
+        sinc_mu_L = np.where(
+            near_cutoff,
+            L,
+            np.where(propagating, np.sin(mu_L), np.sinh(mu_L)) / safe_mu,
+        )
 
         # Ratios of areas (used for impedance scaling)
         # p scales with 1/r, u scales with 1/r
@@ -295,24 +331,22 @@ class HyperbolicHorn:
         # Adapted for general Hypex shape function
 
         # A = (r_in/r_out) * (cos(mu L) - grad_in * sin(mu L)/mu)
-        A = (r_in / r_out) * (cos_mu_L - grad_in * sinc_mu_L)
+        A = ((r_in / r_out) * (cos_mu_L - grad_in * sinc_mu_L)).astype(complex)
 
         # B = j * k * Z_scale / sqrt(S_in * S_out) * sinc_mu_L
         Z_scale = rho * c
         B = (1j * k * Z_scale / np.sqrt(self.throat_area * self.mouth_area)) * sinc_mu_L
 
         # D = (r_out/r_in) * (cos(mu L) + grad_out * sinc_mu_L)
-        D = (r_out / r_in) * (cos_mu_L + grad_out * sinc_mu_L)
+        D = ((r_out / r_in) * (cos_mu_L + grad_out * sinc_mu_L)).astype(complex)
 
         # Calculate C using Determinant = 1 property for reciprocal passive system
         # AD - BC = 1  => C = (AD - 1)/B
-        if abs(B) < 1e-12:
-            # Special case: L=0 or resonance node. Fallback to limit.
-            C = 0  # Approximation for safety
-        else:
-            C = (A * D - 1.0) / B
+        # Where |B| < 1e-12 (L=0 or resonance node) fall back to C = 0
+        degenerate = np.abs(B) < 1e-12
+        C = np.where(degenerate, 0.0, (A * D - 1.0) / np.where(degenerate, 1.0, B))
 
-        return np.array([[A, B], [C, D]], dtype=complex)
+        return A, B, C, D
 
 
 @dataclass
@@ -480,6 +514,11 @@ class ConicalHorn:
             >>> abs(det - 1.0) < 1e-6  # Reciprocal network
             True
         """
+        if use_explicit_form:
+            # Explicit Wronskian form shared with the vectorized implementation
+            A, B, C, D = self.calculate_t_matrix_array(np.array([f]), c, rho)
+            return np.array([[A[0], B[0]], [C[0], D[0]]], dtype=complex)
+
         from scipy import special
 
         k = 2 * np.pi * f / c
@@ -523,68 +562,132 @@ class ConicalHorn:
         y0_2 = special.spherical_yn(0, kr2)
         y1_2 = special.spherical_yn(1, kr2)
 
-        # Characteristic impedance of medium
+        # Legacy method: numerical matrix inversion
+        # This is retained for testing/validation purposes
+        u_scale_t = S_t / (1j * rho * c)
+        u_scale_m = S_m / (1j * rho * c)
+
+        M_throat = np.array([
+            [j0_1, y0_1],
+            [u_scale_t * j1_1, u_scale_t * y1_1]
+        ], dtype=complex)
+
+        M_mouth = np.array([
+            [j0_2, y0_2],
+            [u_scale_m * j1_2, u_scale_m * y1_2]
+        ], dtype=complex)
+
+        M_mouth_inv = np.linalg.inv(M_mouth)
+        T = np.matmul(M_throat, M_mouth_inv)
+
+        A, B = T[0, 0], T[0, 1]
+        C, D = T[1, 0], T[1, 1]
+
+        return np.array([[A, B], [C, D]], dtype=complex)
+
+    def calculate_t_matrix_array(
+        self,
+        frequencies: np.ndarray,
+        c: float = 343.2,
+        rho: float = 1.205
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Calculate the T-matrix elements of this conical horn over a frequency array.
+
+        Vectorized form of calculate_t_matrix() (explicit Wronskian form).
+        The spherical Bessel functions are evaluated once per port for the
+        whole frequency vector, and the DC limit (k·L < 1e-4) and the
+        cylindrical case (x0 = ∞) are applied as masks instead of branches.
+
+        Literature:
+            - Olson (1947), Section 5.21 - Conical horn T-matrix
+            - J.O. Smith, "Conical Acoustic Tubes", Physical Audio Signal Processing
+            - Pierce, A.D., Acoustics, Eq. 7-6.2
+            - literature/horns/conical_theory.md
+
+        Args:
+            frequencies: Array of frequencies [Hz]
+            c: Speed of sound [m/s]
+            rho: Air density [kg/m³]
+
+        Returns:
+            Tuple of (A, B, C, D) complex arrays with the shape of frequencies,
+            relating [p₁, U₁]ᵀ = [A B; C D][p₂, U₂]ᵀ
+
+        Examples:
+            >>> horn = ConicalHorn(throat_area=0.015, mouth_area=0.15, length=1.2)
+            >>> A, B, C, D = horn.calculate_t_matrix_array(np.array([100.0, 1000.0]))
+            >>> A.shape
+            (2,)
+        """
+        from scipy import special
+
+        frequencies = np.atleast_1d(np.asarray(frequencies, dtype=float))
+
+        k = 2 * np.pi * frequencies / c
+        L = self.length
+        S_t = self.throat_area
+        S_m = self.mouth_area
         Z0 = rho * c
 
-        if use_explicit_form:
-            # Use explicit ABCD formulas derived from Wronskian
-            # This is numerically stable at low frequencies
-            #
-            # The Wronskian for spherical Bessel functions:
-            # W{j₀, y₀}(z) = j₀(z)y₁(z) - j₁(z)y₀(z) = -z⁻²
-            #
-            # Using this identity, we can derive explicit formulas for the
-            # T-matrix elements without numerical matrix inversion:
-            #
-            # Let A_ij = j_i(kr₁)y_j(kr₂) - y_i(kr₁)j_j(kr₂)
-            #
-            # Then the T-matrix elements are:
-            # A = -(kr₂)² · A₀₀
-            # B = (jZ₀/S_m)(kr₂)² · [j₀(kr₁)y₀(kr₂) - j₀(kr₂)y₀(kr₁)]
-            # C = -(S_t/jZ₀)(kr₂)² · A₁₁
-            # D = (S_t/S_m)(r₁/r₂) · [j₀(kr₂)y₁(kr₁) - j₁(kr₁)y₀(kr₂)]
-
-            # Cross products needed for T-matrix elements
-            A_00 = j0_1 * y1_2 - y0_1 * j1_2  # j₀(kr₁)y₁(kr₂) - y₀(kr₁)j₁(kr₂)
-            A_01 = j0_1 * y0_2 - y0_1 * j0_2  # j₀(kr₁)y₀(kr₂) - y₀(kr₁)j₀(kr₂)
-            A_11 = j1_1 * y1_2 - y1_1 * j1_2  # j₁(kr₁)y₁(kr₂) - y₁(kr₁)j₁(kr₂)
-            A_10 = j0_2 * y1_1 - j1_1 * y0_2  # j₀(kr₂)y₁(kr₁) - j₁(kr₁)y₀(kr₂)
-
-            # Prefactors
-            kr2_sq = (kr2) ** 2
-            impedance_scale_t = S_t / (1j * Z0)
-            impedance_scale_m = S_m / (1j * Z0)
-
-            # T-matrix elements (explicit formulas using Wronskian)
-            # All elements scale with (kr2)² for consistency
-            A = -kr2_sq * A_00
-            B = (1j * Z0 / S_m) * kr2_sq * A_01
-            C = -(impedance_scale_t) * kr2_sq * A_11
-            D = -kr2_sq * (S_t / S_m) * A_10
+        # DC limit (very small k): identity matrix
+        A = np.ones_like(k, dtype=complex)
+        B = np.zeros_like(k, dtype=complex)
+        C = np.zeros_like(k, dtype=complex)
+        D = np.ones_like(k, dtype=complex)
 
-        else:
-            # Legacy method: numerical matrix inversion
-            # This is retained for testing/validation purposes
-            u_scale_t = S_t / (1j * rho * c)
-            u_scale_m = S_m / (1j * rho * c)
-
-            M_throat = np.array([
-                [j0_1, y0_1],
-                [u_scale_t * j1_1, u_scale_t * y1_1]
-            ], dtype=complex)
+        active = k * L >= 1e-4
+        if not np.any(active):
+            return A, B, C, D
 
-            M_mouth = np.array([
-                [j0_2, y0_2],
-                [u_scale_m * j1_2, u_scale_m * y1_2]
-            ], dtype=complex)
+        k_active = k[active]
+
+        if np.isinf(self.x0):
+            # Plane wave propagation (cylindrical pipe)
+            Z_c = Z0 / S_t
+            cos_kl = np.cos(k_active * L)
+            sin_kl = np.sin(k_active * L)
+            A[active] = cos_kl
+            B[active] = 1j * Z_c * sin_kl
+            C[active] = 1j * (1 / Z_c) * sin_kl
+            D[active] = cos_kl
+            return A, B, C, D
+
+        # Conical case (spherical wave)
+        kr1 = k_active * self.x0  # Throat radius from apex
+        kr2 = k_active * (self.x0 + L)  # Mouth radius from apex
 
-            M_mouth_inv = np.linalg.inv(M_mouth)
-            T = np.matmul(M_throat, M_mouth_inv)
+        j0_1 = special.spherical_jn(0, kr1)
+        j1_1 = special.spherical_jn(1, kr1)
+        y0_1 = special.spherical_yn(0, kr1)
+        y1_1 = special.spherical_yn(1, kr1)
 
-            A, B = T[0, 0], T[0, 1]
-            C, D = T[1, 0], T[1, 1]
+        j0_2 = special.spherical_jn(0, kr2)
+        j1_2 = special.spherical_jn(1, kr2)
+        y0_2 = special.spherical_yn(0, kr2)
+        y1_2 = special.spherical_yn(1, kr2)
 
-        return np.array([[A, B], [C, D]], dtype=complex)
+        # Explicit ABCD formulas derived from the Wronskian
+        # W{j₀, y₀}(z) = j₀(z)y₁(z) - j₁(z)y₀(z) = -z⁻²
+        # This is numerically stable at low frequencies.
+        #
+        # Let A_ij = j_i(kr₁)y_j(kr₂) - y_i(kr₁)j_j(kr₂), then:
+        # A = -(kr₂)² · A₀₀
+        # B = (jZ₀/S_m)(kr₂)² · A₀₁
+        # C = -(S_t/jZ₀)(kr₂)² · A₁₁
+        # D = -(kr₂)²(S_t/S_m) · A₁₀
+        A_00 = j0_1 * y1_2 - y0_1 * j1_2  # j₀(kr₁)y₁(kr₂) - y₀(kr₁)j₁(kr₂)
+        A_01 = j0_1 * y0_2 - y0_1 * j0_2  # j₀(kr₁)y₀(kr₂) - y₀(kr₁)j₀(kr₂)
+        A_11 = j1_1 * y1_2 - y1_1 * j1_2  # j₁(kr₁)y₁(kr₂) - y₁(kr₁)j₁(kr₂)
+        A_10 = j0_2 * y1_1 - j1_1 * y0_2  # j₀(kr₂)y₁(kr₁) - j₁(kr₁)y₀(kr₂)
+
+        kr2_sq = kr2 ** 2
+        A[active] = -kr2_sq * A_00
+        B[active] = (1j * Z0 / S_m) * kr2_sq * A_01
+        C[active] = -(S_t / (1j * Z0)) * kr2_sq * A_11
+        D[active] = -kr2_sq * (S_t / S_m) * A_10
+
+        return A, B, C, D
 
 
 @dataclass
@@ -396,5 +396,61 @@ class TestEdgeCases:
         assert T.shape == (2, 2)
 
 
+class TestVectorizedTMatrix:
+    """Test the array-valued T-matrix against pinned reference values."""
+
+    def test_array_matches_reference_across_cutoff(self):
+        """Test both regimes against the pre-vectorization scalar method.
+
+        Reference values were computed with the per-frequency
+        calculate_t_matrix() before it delegated to the array method.
+        """
+        horn = HyperbolicHorn(
+            throat_area=0.001,
+            mouth_area=0.1,
+            length=1.5,
+            T=0.7
+        )
+        fc = (horn.m * 343.2) / (2 * np.pi)
+        frequencies = fc * np.array([0.5, 0.99, 1.01, 3.0])
+        expected = np.array([
+            [0.09166703697554021, 9.942211684005272e+04j,
+             -7.364330511205633e-05j, 90.78261455706308],
+            [-0.06986015962695544, 1.0291736045550597e+05j,
+             3.3938280531153042e-05j, 35.68326015823904],
+            [-0.07502090549193617, 1.0083187210351702e+05j,
+             3.4823361815802798e-05j, 33.47473278758892],
+            [0.06173716385154216, 2.777103036726317e+04j,
+             1.383739080278937e-05j, 9.973269930129256],
+        ])
+
+        A, B, C, D = horn.calculate_t_matrix_array(frequencies)
+
+        np.testing.assert_allclose(np.column_stack([A, B, C, D]), expected, rtol=1e-10)
+
+        # Scalar method returns the same matrix
+        np.testing.assert_allclose(
+            horn.calculate_t_matrix(frequencies[0]).ravel(), expected[0], rtol=1e-10
+        )
+
+    def test_sinc_limit_at_cutoff(self):
+        """Test that the T-matrix is finite exactly at cutoff (mu -> 0)."""
+        horn = HyperbolicHorn(
+            throat_area=0.01,
+            mouth_area=0.1,
+            length=0.5,
+            T=0.7
+        )
+        fc = (horn.m * 343.2) / (2 * np.pi)
+
+        A, B, C, D = horn.calculate_t_matrix_array(np.array([fc]))
+
+        assert np.all(np.isfinite([A, B, C, D]))
+        # At cutoff sin(mu L)/mu -> L
+        k = 2 * np.pi * fc / 343.2
+        expected_B = 1j * k * 343.2 * 1.205 / np.sqrt(0.01 * 0.1) * horn.length
+        np.testing.assert_allclose(B[0], expected_B, rtol=1e-6)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,68 @@
+"""
+Shared fixtures for the unit tests.
+
+Literature:
+- Small (1972), "Closed-Box Loudspeaker Systems Part I", JAES
+- Small (1973), "Vented-Box Loudspeaker Systems Part I", JAES
+"""
+
+import pytest
+
+from viberesp.driver.parameters import ThieleSmallParameters
+from viberesp.optimization.objectives.composite import EnclosureOptimizationProblem
+
+
+@pytest.fixture
+def test_driver():
+    """Create a test driver with known parameters.
+
+    Driver specifications:
+    - Fs: 50 Hz
+    - Re: 6.0 ohms
+    - Qms: 5.0
+    - Qes: 0.5
+    - Qts: 0.45 (calculated)
+    - Vas: 20L
+    - Sd: 200 cm²
+    - Mms: 20g
+    - Cms: 0.5 mm/N
+    - BL: 8.0 T·m
+    - Le: 1.0 mH
+    """
+    return ThieleSmallParameters(
+        M_md=0.018,  # kg (approximate, without radiation mass)
+        C_ms=0.0005,  # m/N (0.5 mm/N)
+        R_ms=2.0,  # N·s/m (calculated from Qms)
+        R_e=6.0,  # ohms
+        L_e=0.001,  # H (1.0 mH)
+        BL=8.0,  # T·m
+        S_d=0.02,  # m² (200 cm²)
+        X_max=0.008,  # m (8mm)
+        F_s=50.0,  # Hz
+        Q_es=0.5,  # electrical Q
+        Q_ms=5.0,  # mechanical Q
+        Q_ts=0.45,  # total Q
+        V_as=0.020,  # m³ (20L)
+    )
+
+
+@pytest.fixture
+def make_problem(test_driver):
+    """Factory for ported-box optimization problems of the test driver.
+
+    Call as ``make_problem(bounds, objectives, constraints, driver=...,
+    **problem_kwargs)``; each test module passes its own (Vb, Fb) bounds.
+    """
+    def make(
+        bounds,
+        objectives=("f3", "flatness"),
+        constraints=("max_displacement",),
+        driver=None,
+        **kwargs,
+    ):
+        return EnclosureOptimizationProblem(
+            test_driver if driver is None else driver, "ported", list(objectives),
+            bounds, constraints=list(constraints), **kwargs
+        )
+
+    return make
@@ -0,0 +1,104 @@
+"""
+Unit tests for optimization checkpoint and resume.
+
+These tests verify that a run interrupted after a checkpoint and resumed
+produces exactly the same designs as an uninterrupted run.
+
+Literature:
+- Deb et al. (2002), "A fast and elitist multiobjective genetic algorithm: NSGA-II"
+"""
+
+import warnings
+
+import pytest
+from numpy.testing import assert_array_equal
+
+from viberesp.optimization.config import AlgorithmConfig, OptimizationConfig
+from viberesp.optimization.factory import OptimizationScriptFactory
+from viberesp.optimization.optimizers.checkpoint import load_checkpoint
+from viberesp.optimization.optimizers.pymoo_interface import run_nsga2
+from viberesp.optimization.results.archive import ParetoArchive
+
+
+BOUNDS = {"Vb": (0.01, 0.05), "Fb": (30.0, 60.0)}
+
+
+def nsga2(problem, n_generations, **kwargs):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return run_nsga2(problem, pop_size=10, n_generations=n_generations,
+                         verbose=False, **kwargs)
+
+
+class TestCheckpointResume:
+    """Test checkpointed runs against uninterrupted runs."""
+
+    def test_resume_is_bit_exact(self, make_problem, tmp_path):
+        """Test 3 + 3 resumed generations equal 6 uninterrupted generations."""
+        path = str(tmp_path / "run.ckpt")
+        full, full_meta = nsga2(make_problem(BOUNDS), 6, seed=4)
+
+        nsga2(make_problem(BOUNDS), 3, seed=4, checkpoint_path=path, checkpoint_every=1)
+        assert load_checkpoint(path).n_gen == 4  # Counter of the next generation
+
+        resumed, meta = nsga2(make_problem(BOUNDS), 6, seed=4,
+                              checkpoint_path=path, resume=True)
+
+        assert_array_equal(resumed.X, full.X)
+        assert_array_equal(resumed.F, full.F)
+        assert meta["n_evaluations"] == full_meta["n_evaluations"]
+
+    def test_resume_restores_archive(self, make_problem, tmp_path):
+        """Test a resumed run's archive equals the uninterrupted run's archive."""
+        path = str(tmp_path / "run.ckpt")
+        full_archive = ParetoArchive()
+        nsga2(make_problem(BOUNDS), 6, seed=4, archive=full_archive)
+
+        nsga2(make_problem(BOUNDS), 3, seed=4, archive=ParetoArchive(),
+              checkpoint_path=path, checkpoint_every=1)
+        archive = ParetoArchive()
+        nsga2(make_problem(BOUNDS), 6, seed=4, archive=archive,
+              checkpoint_path=path, resume=True)
+
+        assert_array_equal(archive.X, full_archive.X)
+        assert_array_equal(archive.F, full_archive.F)
+        assert archive.stats() == full_archive.stats()
+
+        nsga2(make_problem(BOUNDS), 2, seed=1, checkpoint_path=path)
+        with pytest.raises(ValueError, match="without a Pareto archive"):
+            load_checkpoint(path, archive=ParetoArchive())
+
+    def test_resume_without_checkpoint_starts_new_run(self, make_problem, tmp_path):
+        """Test --resume on a first launch runs from scratch and checkpoints."""
+        path = tmp_path / "new.ckpt"
+        result, _ = nsga2(make_problem(BOUNDS), 2, seed=1,
+                          checkpoint_path=str(path), resume=True)
+
+        assert path.exists()
+        assert result.F is not None
+
+    def test_resume_rejects_different_problem(self, make_problem, tmp_path):
+        """Test a checkpoint cannot be resumed with other objectives."""
+        path = str(tmp_path / "run.ckpt")
+        nsga2(make_problem(BOUNDS), 2, seed=1, checkpoint_path=path)
+
+        with pytest.raises(ValueError, match="different problem"):
+            load_checkpoint(path, make_problem(BOUNDS, objectives=("f3", "size")))
+
+    def test_factory_resume(self, tmp_path):
+        """Test the factory resumes to the same Pareto front."""
+        def run(n_generations, resume):
+            config = OptimizationConfig(
+                driver_name="BC_8NDL51", enclosure_type="sealed",
+                objectives=["f3", "volume"], parameter_space_preset="sealed",
+                algorithm=AlgorithmConfig(pop_size=10, n_generations=n_generations, seed=3),
+                save_results=False, verbose=False,
+                checkpoint_path=str(tmp_path / "factory.ckpt"), checkpoint_every=2,
+            )
+            return OptimizationScriptFactory(config).run(resume=resume).pareto_front
+
+        run(2, resume=False)
+        resumed = run(4, resume=True)
+        (tmp_path / "factory.ckpt").unlink()
+
+        assert resumed == run(4, resume=False)
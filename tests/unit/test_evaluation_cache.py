@@ -0,0 +1,111 @@
+"""
+Unit tests for the persistent evaluation cache.
+
+These tests verify that stored evaluations are returned unchanged across
+cache instances, that keys separate drivers and problem configurations, and
+that the least-recently-used designs are evicted first.
+
+Literature:
+- Deb et al. (2002), "A fast and elitist multiobjective genetic algorithm: NSGA-II"
+"""
+
+import dataclasses
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from viberesp.optimization.config import AlgorithmConfig, OptimizationConfig
+from viberesp.optimization.factory import OptimizationScriptFactory
+from viberesp.optimization.optimizers.evaluation_cache import (
+    EvaluationCache,
+    problem_signature,
+)
+
+
+BOUNDS = {"Vb": (0.01, 0.05), "Fb": (30.0, 60.0)}
+OBJECTIVES = ("f3", "flatness", "size")
+
+
+class TestEvaluationCache:
+    """Test cache storage, keys and eviction."""
+
+    def test_repeated_run_reuses_evaluations(self, make_problem, tmp_path):
+        """Test a second run (new cache instance) evaluates nothing."""
+        X = np.random.default_rng(0).uniform([0.01, 30.0], [0.05, 60.0], (12, 2))
+        path = tmp_path / "evaluations.sqlite"
+
+        with EvaluationCache(path) as cache:
+            first = {}
+            make_problem(BOUNDS, OBJECTIVES, evaluation_cache=cache)._evaluate(X, first)
+            assert cache.misses == 12
+
+        with EvaluationCache(path) as cache:
+            problem = make_problem(BOUNDS, OBJECTIVES, evaluation_cache=cache)
+            problem._evaluate_designs = None  # Must not be called
+            second = {}
+            problem._evaluate(X, second)
+
+            assert cache.hits == 12
+            assert cache.hit_rate == 1.0
+
+        assert_array_equal(second["F"], first["F"])
+        assert_array_equal(second["G"], first["G"])
+
+    def test_keys_separate_drivers_and_configs(self, test_driver, make_problem):
+        """Test driver parameters and constraints change the problem signature."""
+        other_driver = dataclasses.replace(test_driver, BL=9.0)
+
+        with EvaluationCache(":memory:") as cache:
+            signatures = {
+                make_problem(BOUNDS, OBJECTIVES, evaluation_cache=cache).cache_signature,
+                make_problem(
+                    BOUNDS, OBJECTIVES, driver=other_driver, evaluation_cache=cache
+                ).cache_signature,
+                make_problem(BOUNDS, OBJECTIVES, (), evaluation_cache=cache).cache_signature,
+            }
+            assert len(signatures) == 3
+            assert problem_signature(test_driver, "sealed") == \
+                problem_signature(test_driver, "sealed")
+
+    def test_design_vectors_quantized(self):
+        """Test vectors equal to the quantization share a key."""
+        with EvaluationCache(":memory:", significant_digits=6) as cache:
+            x = np.array([0.0251234, 41.5])
+            assert cache.design_key("sig", x) == cache.design_key("sig", x + 1e-12)
+            assert cache.design_key("sig", x) != cache.design_key("sig", x * 1.001)
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted beyond max_entries."""
+        row = (np.zeros(1), np.zeros(0))
+        with EvaluationCache(":memory:", max_entries=3) as cache:
+            cache.store({"a": row, "b": row, "c": row})
+            cache.lookup(["a"])  # "b" is now the least recently used
+            cache.store({"d": row})
+
+            assert len(cache) == 3
+            assert set(cache.lookup(["a", "b", "c", "d"])) == {"a", "c", "d"}
+
+    def test_invalid_settings(self):
+        """Test non-positive sizes are rejected."""
+        with pytest.raises(ValueError):
+            EvaluationCache(":memory:", max_entries=0)
+        with pytest.raises(ValueError):
+            OptimizationConfig(
+                driver_name="BC_8NDL51", enclosure_type="sealed", objectives=["f3"],
+                parameter_space_preset="sealed", cache_max_entries=0,
+            )
+
+    def test_factory_reports_hit_rate(self, tmp_path):
+        """Test factory runs record cache statistics in their metadata."""
+        config = OptimizationConfig(
+            driver_name="BC_8NDL51", enclosure_type="sealed",
+            objectives=["f3", "volume"], parameter_space_preset="sealed",
+            algorithm=AlgorithmConfig(pop_size=10, n_generations=2),
+            save_results=False, verbose=False,
+            cache_path=str(tmp_path / "cache" / "evaluations.sqlite"),
+        )
+        stats = OptimizationScriptFactory(config).run().optimization_metadata["evaluation_cache"]
+
+        assert stats["misses"] > 0
+        assert stats["entries"] == stats["misses"]
@@ -0,0 +1,226 @@
+"""
+Unit tests for the per-design EvaluationContext.
+
+These tests verify that objectives and constraints sharing one context give
+the same values as independent evaluations while simulating each frequency
+of a design only once.
+
+Literature:
+- Small (1972), "Closed-Box Loudspeaker Systems Part I", JAES
+- Kolbrek, "Horn Loudspeaker Simulation Part 1" - T-matrix method
+"""
+
+import warnings
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from viberesp.enclosure.sealed_box import calculate_spl_array
+from viberesp.optimization.constraints.performance import constraint_f3_limit
+from viberesp.optimization.objectives.composite import EnclosureOptimizationProblem
+from viberesp.optimization.objectives.context import (
+    EvaluationContext,
+    lattice_frequencies,
+    population_contexts,
+    shared_frequency_grid,
+)
+from viberesp.optimization.objectives.efficiency import (
+    objective_efficiency,
+    objective_efficiency_percent,
+)
+from viberesp.optimization.objectives.response_metrics import (
+    objective_f3,
+    objective_response_flatness,
+)
+
+
+HORN_DESIGN = np.array([0.005, 0.2, 1.5, 0.0005, 0.01])
+MULTISEGMENT_DESIGN = np.array([0.015, 0.275, 0.9, 2.25, 2.25, 1e-5, 0.035])
+
+
+class TestEvaluationContext:
+    """Test the shared SPL cache."""
+
+    def test_spl_cached_per_frequency(self, test_driver):
+        """Test overlapping grids only simulate the new frequencies."""
+        context = EvaluationContext(np.array([0.010]), test_driver, "sealed")
+        freqs = np.logspace(1, 3, 50)
+
+        first = context.spl(freqs)
+        second = context.spl(np.concatenate([freqs[:10], [1500.0]]))
+
+        assert context.n_simulated == 51
+        assert context.n_requested == 61
+        assert_allclose(first, calculate_spl_array(freqs, test_driver, 0.010))
+        assert_allclose(second[:10], first[:10])
+
+    def test_horn_built_once(self, test_driver):
+        """Test every request reuses one FrontLoadedHorn."""
+        context = EvaluationContext(HORN_DESIGN, test_driver, "exponential_horn")
+
+        assert context.front_loaded_horn() is context.front_loaded_horn()
+
+    def test_unsupported_enclosure(self, test_driver):
+        """Test unsupported enclosure types raise ValueError."""
+        context = EvaluationContext(np.array([0.01]), test_driver, "bandpass")
+
+        with pytest.raises(ValueError):
+            context.spl(np.array([100.0]))
+        with pytest.raises(ValueError):
+            context.electrical_response(np.array([100.0]))
+
+
+class TestSharedObjectives:
+    """Test objectives give identical results with a shared context."""
+
+    def test_horn_objectives_match_independent(self, test_driver):
+        """Test F3, flatness, efficiency and F3 limit match and share samples."""
+        context = EvaluationContext(HORN_DESIGN, test_driver, "exponential_horn")
+        args = (HORN_DESIGN, test_driver, "exponential_horn")
+
+        assert objective_f3(*args, context=context) == objective_f3(*args)
+        assert objective_response_flatness(*args, context=context) == \
+            objective_response_flatness(*args)
+        assert objective_efficiency(*args, context=context) == objective_efficiency(*args)
+
+        n_simulated = context.n_simulated
+        assert constraint_f3_limit(*args, context=context) == constraint_f3_limit(*args)
+        assert context.n_simulated == n_simulated  # F3 grid already cached
+
+    def test_horn_objectives_share_samples(self, test_driver):
+        """Test flatness and efficiency of a bass horn reuse the F3 sweep."""
+        context = EvaluationContext(HORN_DESIGN, test_driver, "exponential_horn")
+        args = (HORN_DESIGN, test_driver, "exponential_horn")
+
+        objective_f3(*args, context=context)
+        n_simulated = context.n_simulated
+        objective_response_flatness(*args, context=context)
+        objective_efficiency(*args, context=context)
+
+        assert context.n_simulated == n_simulated
+        assert context.n_requested > n_simulated
+
+    def test_efficiency_percent_uses_context(self, test_driver):
+        """Test objective_efficiency_percent solves the context's horn."""
+        context = EvaluationContext(MULTISEGMENT_DESIGN, test_driver, "multisegment_horn")
+        args = (MULTISEGMENT_DESIGN, test_driver, "multisegment_horn")
+
+        assert objective_efficiency_percent(*args, context=context) == \
+            objective_efficiency_percent(*args)
+        assert len(context.front_loaded_horn()._solutions) == 1
+
+    def test_problem_evaluate_unchanged(self, test_driver, make_problem):
+        """Test _evaluate gives the same F and G as the standalone functions."""
+        problem = make_problem(
+            {"Vb": (0.01, 0.05), "Fb": (30.0, 60.0)}, ("f3", "flatness", "efficiency"),
+            ("max_displacement", "f3_limit"),
+        )
+        X = np.array([[0.02, 45.0], [0.04, 35.0]])
+        out = {}
+        problem._evaluate(X, out)
+
+        for i, x in enumerate(X):
+            assert out["F"][i, 0] == objective_f3(x, test_driver, "ported")
+            assert out["F"][i, 1] == objective_response_flatness(x, test_driver, "ported")
+            assert out["F"][i, 2] == objective_efficiency(x, test_driver, "ported")
+            assert out["G"][i, 1] == constraint_f3_limit(x, test_driver, "ported")
+
+
+class TestFrequencyLattice:
+    """Test the shared frequency lattice."""
+
+    def test_grids_nest(self):
+        """Test 1/3-octave and flatness grids are samples of the F3 grid."""
+        f3_grid = shared_frequency_grid(20.0, 500.0, 200)
+        third_octave = lattice_frequencies(50.0, 200.0, points_per_octave=3)
+
+        assert_allclose(third_octave[[0, -1]], [50.0, 200.0])
+        assert len(third_octave) == 7
+        assert set(third_octave) <= set(f3_grid)
+        assert set(shared_frequency_grid(40.0, 200.0, 50)) <= set(f3_grid)
+        assert len(shared_frequency_grid(20.0, 500.0, 100)) >= 100
+
+    def test_n_points_is_a_minimum_on_the_lattice(self):
+        """Test n_points picks the coarsest lattice density with enough points."""
+        grid = shared_frequency_grid(40.0, 200.0, 50)
+        assert len(grid) == 56  # 12/octave gives 28 < 50, so 24/octave
+        assert_allclose(np.diff(np.log2(grid)), 1.0 / 24.0)
+        assert len(shared_frequency_grid(20.0, 500.0, 1000)) == 223  # Capped at 48/octave
+        assert_allclose(  # Narrow band: exact log-spaced fallback
+            shared_frequency_grid(100.0, 101.0, 10), np.logspace(2.0, np.log10(101.0), 10)
+        )
+
+    def test_flatness_evaluates_lattice_grid(self, test_driver):
+        """Test objective_response_flatness reads n_points as a lattice minimum."""
+        flatness = objective_response_flatness(
+            np.array([0.010]), test_driver, "sealed", frequency_range=(40.0, 200.0), n_points=50
+        )
+        grid = shared_frequency_grid(40.0, 200.0, 50)
+        assert_allclose(flatness, np.std(calculate_spl_array(grid, test_driver, 0.010)), rtol=1e-12)
+
+    def test_invalid_density(self):
+        """Test densities that do not divide the lattice are rejected."""
+        with pytest.raises(ValueError):
+            lattice_frequencies(50.0, 200.0, points_per_octave=5)
+
+
+class TestPopulationContexts:
+    """Test batch-simulated contexts of exponential horn populations."""
+
+    def horn_population(self):
+        rng = np.random.default_rng(4)
+        X = rng.uniform([0.003, 0.1, 1.0, 0.0, 0.005], [0.01, 0.5, 3.0, 1e-3, 0.03], (6, 5))
+        X[2, 0] = -0.001  # Invalid geometry, left to the per-design path
+        return X
+
+    def test_primed_contexts_match_per_design(self, test_driver):
+        """Test primed contexts give the per-design objectives without simulating again."""
+        X = self.horn_population()
+        contexts = population_contexts(X, test_driver, "exponential_horn")
+
+        assert contexts[2].n_simulated == 0
+        for i in (0, 1, 3, 4, 5):
+            n_simulated = contexts[i].n_simulated
+            for objective in (objective_f3, objective_response_flatness, objective_efficiency):
+                assert_allclose(
+                    objective(X[i], test_driver, "exponential_horn", context=contexts[i]),
+                    objective(X[i], test_driver, "exponential_horn"),
+                    rtol=1e-9,
+                )
+            assert contexts[i].n_simulated == n_simulated
+
+    HORN_BOUNDS = {
+        "throat_area": (0.003, 0.01), "mouth_area": (0.1, 0.5), "length": (1.0, 3.0),
+        "V_tc": (0.0, 1e-3), "V_rc": (0.005, 0.03),
+    }
+
+    def test_problem_batch_matches_per_design(self, test_driver):
+        """Test batched population evaluation equals the per-design path."""
+        X = self.horn_population()
+        args = (test_driver, "exponential_horn", ["f3", "flatness", "efficiency"], self.HORN_BOUNDS)
+        batched, per_design = {}, {}
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            EnclosureOptimizationProblem(*args)._evaluate(X, batched)
+            EnclosureOptimizationProblem(*args, vectorize=False)._evaluate(X, per_design)
+
+        assert_allclose(batched["F"], per_design["F"], rtol=1e-9)
+
+    def test_problem_batches_objective_grids_only(self, test_driver):
+        """Test the batch covers the union of the objectives' grids, not the audio band."""
+        X = self.horn_population()
+        problem = EnclosureOptimizationProblem(
+            test_driver, "exponential_horn", ["f3", "flatness", "efficiency"], self.HORN_BOUNDS
+        )
+        f3_grid = shared_frequency_grid(20.0, 500.0, 200)
+        assert_allclose(problem._batch_frequencies(), f3_grid)
+        assert problem._population_contexts(X)[0].n_simulated == len(f3_grid)
+
+        flatness_only = EnclosureOptimizationProblem(
+            test_driver, "exponential_horn", ["flatness", "size"], self.HORN_BOUNDS,
+            target_band=(40.0, 160.0),
+        )
+        assert_allclose(
+            flatness_only._batch_frequencies(), shared_frequency_grid(40.0, 160.0, 100)
+        )
@@ -17,7 +17,7 @@ import math
 
 from viberesp.simulation.types import ExponentialHorn
 from viberesp.driver.parameters import ThieleSmallParameters
-from viberesp.enclosure.front_loaded_horn import FrontLoadedHorn
+from viberesp.enclosure.front_loaded_horn import FrontLoadedHorn, HornSolution
 from viberesp.simulation.horn_theory import MediumProperties
 
 
@@ -363,6 +363,118 @@ class TestSystemParameters:
         assert params['driver_resonance'] == driver.F_s
 
 
+class TestHornSolution:
+    """Test single-pass solve() and the derived metrics."""
+
+    def setup_method(self):
+        """Set up test system."""
+        self.driver = ThieleSmallParameters(
+            M_md=0.026, C_ms=1.5e-4, R_ms=2.44,
+            R_e=2.6, L_e=0.15e-3, BL=7.3, S_d=0.022,
+        )
+
+        self.horn = ExponentialHorn(0.005, 0.2, 1.5)
+        self.flh = FrontLoadedHorn(self.driver, self.horn, V_tc=5e-4, V_rc=0.02)
+        self.freqs = np.logspace(np.log10(20), np.log10(500), 200)
+
+    def test_solve_matches_scalar_electrical_impedance(self):
+        """Test Ze and excursion match the scalar electrical path."""
+        solution = self.flh.solve(self.freqs)
+
+        assert isinstance(solution, HornSolution)
+        for i in range(0, len(self.freqs), 20):
+            result = self.flh.electrical_impedance(self.freqs[i])
+            assert_allclose(solution.Ze[i].real, result['Ze_real'], rtol=1e-9)
+            assert_allclose(solution.Ze[i].imag, result['Ze_imag'], rtol=1e-9)
+            assert_allclose(solution.diaphragm_displacement[i],
+                            result['diaphragm_displacement'], rtol=1e-9)
+
+    def test_solve_is_cached(self):
+        """Test repeated solves reuse the result until the system changes."""
+        first = self.flh.solve(self.freqs)
+        assert self.flh.solve(self.freqs.copy()) is first
+        assert self.flh.solve(self.freqs, voltage=4.0) is not first
+
+        self.flh.V_rc = 0.01
+        assert self.flh.solve(self.freqs) is not first
+
+    def test_new_horn_or_driver_resolves(self):
+        """Test reassigning the horn or driver invalidates cached solutions."""
+        self.flh.solve(self.freqs)
+        horn = ExponentialHorn(0.001, 0.01, 0.3)
+        self.flh.horn = horn
+        fresh = FrontLoadedHorn(self.driver, horn, V_tc=5e-4, A_tc=0.005, V_rc=0.02)
+        assert_allclose(self.flh.solve(self.freqs).spl, fresh.solve(self.freqs).spl)
+
+        driver = ThieleSmallParameters(
+            M_md=0.018, C_ms=0.0005, R_ms=2.0, R_e=6.0, L_e=0.001, BL=8.0, S_d=0.02,
+        )
+        self.flh.driver = driver
+        fresh.driver = driver
+        assert_allclose(self.flh.solve(self.freqs).spl, fresh.solve(self.freqs).spl)
+
+    def test_mutated_horn_or_driver_resolves(self):
+        """Test in-place edits of the horn or driver invalidate cached solutions."""
+        first = self.flh.solve(self.freqs)
+
+        self.flh.horn.length = 2.0
+        self.flh.horn.flare_constant = np.log(0.2 / 0.005) / 2.0
+        second = self.flh.solve(self.freqs)
+        fresh = FrontLoadedHorn(
+            self.driver, ExponentialHorn(0.005, 0.2, 2.0), V_tc=5e-4, V_rc=0.02
+        )
+        assert second is not first
+        assert_allclose(second.spl, fresh.solve(self.freqs).spl)
+
+        self.flh.driver.BL = 10.0
+        third = self.flh.solve(self.freqs)
+        assert third is not second
+        assert_allclose(third.spl, fresh.solve(self.freqs).spl)
+        assert self.flh.solve(self.freqs) is third
+
+    def test_solution_arrays_read_only(self):
+        """Test cached solutions cannot be modified through a caller's reference."""
+        freqs = self.freqs.copy()
+        solution = self.flh.solve(freqs)
+
+        with pytest.raises(ValueError):
+            solution.spl[0] = 0.0
+        with pytest.raises(ValueError):
+            solution.tmatrix[0][0] = 0.0
+        freqs[0] = 1.0  # The caller's array stays writable
+        assert solution.frequencies[0] == self.freqs[0]
+
+    def test_efficiency_from_power_and_impedance(self):
+        """Test efficiency = W_acoustic / (V²·Re(Ze)/|Ze|²)."""
+        solution = self.flh.solve(self.freqs)
+        W_electrical = 2.83 ** 2 * solution.Ze.real / np.abs(solution.Ze) ** 2
+
+        assert_allclose(solution.efficiency, solution.acoustic_power / W_electrical)
+        assert_allclose(self.flh.system_efficiency(self.freqs[50]),
+                        solution.efficiency[50], rtol=1e-9)
+
+    def test_f3_matches_objective(self):
+        """Test f3() agrees with the F3 optimization objective."""
+        from viberesp.optimization.objectives.context import shared_frequency_grid
+        from viberesp.optimization.objectives.response_metrics import objective_f3
+
+        design = np.array([0.005, 0.2, 1.5, 5e-4, 0.02])
+        expected = objective_f3(design, self.driver, "exponential_horn")
+        freqs = shared_frequency_grid(20.0, 500.0, 200)  # objective_f3's default grid
+
+        assert_allclose(self.flh.solve(freqs).f3(), expected, rtol=1e-9)
+
+    def test_band_metrics(self):
+        """Test flatness and peak excursion respect the frequency band."""
+        solution = self.flh.solve(self.freqs)
+        band = (self.freqs >= 100) & (self.freqs <= 400)
+
+        assert_allclose(solution.flatness(100, 400), np.std(solution.spl[band]))
+        assert solution.max_displacement() >= solution.max_displacement(100, 400)
+        assert_allclose(solution.max_displacement(100, 400),
+                        np.max(solution.diaphragm_displacement[band]))
+
+
 class TestFrontLoadedHornIntegration:
     """Integration tests for complete front-loaded horn system."""
 
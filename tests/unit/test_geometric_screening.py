@@ -0,0 +1,158 @@
+"""
+Unit tests for geometric constraint screening.
+
+These tests verify that the batch geometric constraints reproduce the
+per-design constraint functions exactly, and that optimization problems
+simulate only the designs that satisfy them.
+
+Literature:
+- Olson (1947), Chapter 8 - Horn area continuity
+- Deb (2000), "An efficient constraint handling method for genetic algorithms"
+"""
+
+import warnings
+from functools import partial
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from viberesp.optimization.config import OptimizationConfig
+from viberesp.optimization.constraints.geometric import (
+    GEOMETRIC_CONSTRAINTS,
+    batch_constraint,
+)
+from viberesp.optimization.constraints.physical import (
+    constraint_max_displacement,
+    constraint_multisegment_continuity,
+    constraint_multisegment_flare_limits,
+)
+from viberesp.optimization.factory import OptimizationScriptFactory
+from viberesp.optimization.objectives.composite import EnclosureOptimizationProblem
+from viberesp.optimization.parameters.multisegment_horn_params import (
+    get_multisegment_horn_parameter_space,
+)
+
+
+def evaluate(problem, X):
+    out = {}
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        problem._evaluate(X, out)
+    return out["F"], out["G"]
+
+
+def count_simulated(problem):
+    """Record the rows passed on to the full evaluation."""
+    simulated = []
+    evaluate_population = problem._evaluate_population
+
+    def recording(X):
+        simulated.append(len(X))
+        return evaluate_population(X)
+
+    problem._evaluate_population = recording
+    return simulated
+
+
+class TestBatchConstraints:
+    """Test the batch geometric constraints."""
+
+    @pytest.mark.parametrize("enclosure_type", [
+        "multisegment_horn", "mixed_profile_horn", "exponential_horn", "conical_horn", "sealed",
+    ])
+    @pytest.mark.parametrize("num_segments,n_var", [(2, 7), (2, 11), (3, 9), (3, 12)])
+    @pytest.mark.filterwarnings("ignore::RuntimeWarning")
+    def test_matches_per_design(self, test_driver, enclosure_type, num_segments, n_var):
+        """Test every batch constraint equals its per-design function row by row."""
+        X = np.random.default_rng(n_var).uniform(0.0, 0.3, (100, n_var))
+        X[:5, 0] = 0.0   # Degenerate throat
+        X[5:10, 3] = 0.0  # Zero-length segment
+
+        for func, batch in GEOMETRIC_CONSTRAINTS.items():
+            kwargs = {"num_segments": num_segments} if "num_segments" in func.__code__.co_varnames else {}
+            expected = [func(x, test_driver, enclosure_type, **kwargs) for x in X]
+            assert_array_equal(batch(X, test_driver, enclosure_type, **kwargs), expected)
+
+    def test_classification(self, test_driver):
+        """Test geometric constraints (also bound with partial) are recognized."""
+        assert batch_constraint(constraint_max_displacement) is None
+        assert batch_constraint(constraint_multisegment_continuity) is not None
+
+        batch = batch_constraint(partial(constraint_multisegment_flare_limits, max_mL=2.0))
+        X = np.array([[0.01, 0.1, 0.5, 0.5, 0.5, 0.0, 0.01]])
+        assert_array_equal(
+            batch(X, test_driver, "multisegment_horn"),
+            [constraint_multisegment_flare_limits(X[0], test_driver, "multisegment_horn", max_mL=2.0)],
+        )
+
+
+class TestScreenedEvaluation:
+    """Test problems skip the simulation of geometrically invalid designs."""
+
+    def make_problem(self, driver, constraints=("segment_continuity", "max_displacement"), **kwargs):
+        bounds = get_multisegment_horn_parameter_space(
+            driver, preset="bass_horn", num_segments=2
+        ).get_bounds_dict()
+        return EnclosureOptimizationProblem(
+            driver, "multisegment_horn", ["f3", "flatness"], bounds,
+            constraints=list(constraints), **kwargs
+        )
+
+    def test_invalid_designs_not_simulated(self, test_driver):
+        """Test failing designs get penalties and valid designs their simulated values."""
+        problem = self.make_problem(test_driver)
+        X = np.random.default_rng(0).uniform(problem.xl, problem.xu, (12, problem.n_var))
+        X[::3, 1] = X[::3, 2] * 1.5  # Middle wider than the mouth: 4 invalid designs
+        simulated = count_simulated(problem)
+
+        F, G = evaluate(problem, X)
+        reference_F, reference_G = evaluate(self.make_problem(test_driver, screen_geometry=False), X)
+
+        invalid = reference_G[:, 0] > 0
+        assert invalid.sum() >= 4
+        assert simulated == [12 - invalid.sum()]
+        assert np.all(F[invalid] == 1e10)
+        assert_array_equal(G[invalid, 0], reference_G[invalid, 0])
+        assert np.all(G[invalid, 1] == 0.0)
+        assert_array_equal(F[~invalid], reference_F[~invalid])
+        assert_array_equal(G[~invalid], reference_G[~invalid])
+
+    def test_screened_designs_keep_vectorized_constraints(self, test_driver):
+        """Test a screened design's volume limit matches the unscreened evaluation."""
+        constraints = ("segment_continuity", "max_displacement", "volume_limit")
+        problem = self.make_problem(test_driver, constraints)
+        X = np.random.default_rng(0).uniform(problem.xl, problem.xu, (6, problem.n_var))
+        X[::2, 1] = X[::2, 2] * 1.5  # Middle wider than the mouth
+
+        _, G = evaluate(problem, X)
+        _, reference_G = evaluate(
+            self.make_problem(test_driver, constraints, screen_geometry=False), X
+        )
+
+        assert np.all(G[::2, 0] > 0)
+        assert np.all(G[::2, 2] != 0.0)
+        assert_array_equal(G[:, 2], reference_G[:, 2])
+
+    def test_cache_signature(self, test_driver):
+        """Test screened and unscreened runs do not share cache entries."""
+        assert (self.make_problem(test_driver).cache_signature
+                != self.make_problem(test_driver, screen_geometry=False).cache_signature)
+
+    def test_factory_mixed_profile(self):
+        """Test the factory screens mixed-profile horns on area continuity."""
+        config = OptimizationConfig(
+            driver_name="BC_15DS115", enclosure_type="mixed_profile_horn",
+            objectives=["f3", "flatness"], parameter_space_preset="bass_horn",
+            save_results=False, verbose=False,
+        )
+        problem = OptimizationScriptFactory(config)._create_problem()
+        X = np.random.default_rng(1).uniform(problem.xl, problem.xu, (6, problem.n_var))
+        X[:3, 0] = X[:3, 1] * 1.2  # Throat wider than the middle section
+        simulated = count_simulated(problem)
+
+        F, G = evaluate(problem, X)
+        assert simulated == [3]
+        assert np.all(F[:3] == 1e6)
+        assert np.all(G[:3, 0] > 0)
+        assert np.all(F[3:] < 1e6)
@@ -0,0 +1,254 @@
+"""
+Unit tests for the exhaustive grid search.
+
+These tests verify that the grid search returns the exact non-dominated set
+of its grid, is deterministic, improves the front by refinement, and runs
+through OptimizationScriptFactory and DesignAssistant.optimize_design.
+
+Literature:
+- Deb (2001), Multi-Objective Optimization using Evolutionary Algorithms, Section 2.4
+- Torczon (1997), "On the convergence of pattern search algorithms"
+"""
+
+import warnings
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal
+
+from viberesp.optimization.api.design_assistant import DesignAssistant
+from viberesp.optimization.config import AlgorithmConfig, OptimizationConfig
+from viberesp.optimization import factory
+from viberesp.optimization.factory import FactoryOptimizationProblem, OptimizationScriptFactory
+from viberesp.optimization.objectives.composite import EnclosureOptimizationProblem
+from viberesp.optimization.optimizers.grid_search import (
+    grid_designs,
+    grid_points_per_variable,
+    run_grid_search,
+)
+from viberesp.optimization.results.pareto_front import hypervolume
+
+
+BOUNDS = {"Vb": (0.01, 0.08), "Fb": (25.0, 70.0)}
+CONSTRAINTS = ("port_velocity",)
+
+
+def grid_search(problem, **kwargs):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return run_grid_search(problem, verbose=False, **kwargs)
+
+
+def non_dominated(F):
+    """Rows of F no other row dominates (brute force)."""
+    dominated = [
+        np.any(np.all(F <= f, axis=1) & np.any(F < f, axis=1)) for f in F
+    ]
+    return ~np.array(dominated)
+
+
+class TestGrid:
+    """Test the grid construction."""
+
+    def test_points_per_variable(self):
+        """Test the largest grid within the budget."""
+        assert grid_points_per_variable(1, 4096) == 4096
+        assert grid_points_per_variable(2, 4096) == 64
+        assert grid_points_per_variable(3, 1000) == 10
+        assert grid_points_per_variable(4, 4095) == 7
+
+        with pytest.raises(ValueError):
+            grid_points_per_variable(4, 15)
+
+    def test_grid_designs(self):
+        """Test the full-factorial grid covers the bounds."""
+        X = grid_designs(np.array([0.0, 10.0]), np.array([1.0, 20.0]), 3)
+
+        assert X.shape == (9, 2)
+        assert_allclose(X[:3], [[0.0, 10.0], [0.0, 15.0], [0.0, 20.0]])
+        assert_allclose(X[-1], [1.0, 20.0])
+
+
+class TestRunGridSearch:
+    """Test the grid search on box problems."""
+
+    def test_exact_front_of_grid(self, make_problem):
+        """Test the result is the feasible non-dominated set of the grid."""
+        problem = make_problem(BOUNDS, constraints=CONSTRAINTS)
+        result, metadata = grid_search(problem, n_points=12, refinements=0)
+
+        X = grid_designs(problem.xl, problem.xu, 12)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            out = problem.evaluate(X, return_as_dictionary=True)
+        feasible = np.all(out["G"] <= 0, axis=1)
+        expected = X[feasible][non_dominated(out["F"][feasible])]
+
+        assert metadata["n_evaluations"] == 144
+        assert metadata["feasible"]
+        assert_array_equal(result.X[np.lexsort(result.X.T)], expected[np.lexsort(expected.T)])
+
+    def test_deterministic(self, make_problem):
+        """Test repeated runs return the same front."""
+        first, _ = grid_search(make_problem(BOUNDS, constraints=CONSTRAINTS), n_points=10)
+        second, _ = grid_search(make_problem(BOUNDS, constraints=CONSTRAINTS), n_points=10)
+
+        assert_array_equal(first.X, second.X)
+        assert_array_equal(first.F, second.F)
+
+    def test_refinement_improves_front(self, make_problem):
+        """Test refinement adds off-grid designs and does not lose hypervolume."""
+        coarse, coarse_metadata = grid_search(
+            make_problem(BOUNDS, constraints=CONSTRAINTS), n_points=8, refinements=0
+        )
+        refined, refined_metadata = grid_search(
+            make_problem(BOUNDS, constraints=CONSTRAINTS), n_points=8, refinements=3
+        )
+
+        assert refined_metadata["n_evaluations"] > coarse_metadata["n_evaluations"]
+        on_grid = np.isin(refined.X[:, 1], np.linspace(25.0, 70.0, 8))
+        assert not np.all(on_grid)
+
+        F = np.vstack([coarse.F, refined.F])
+        ideal, scale = F.min(axis=0), np.ptp(F, axis=0)
+        reference = np.full(2, 1.1)
+        assert (hypervolume((refined.F - ideal) / scale, reference)
+                >= hypervolume((coarse.F - ideal) / scale, reference))
+
+    def test_max_front(self, test_driver):
+        """Test large fronts are thinned along the first objective, keeping the extremes."""
+        problem = EnclosureOptimizationProblem(
+            test_driver, "sealed", ["f3", "size"], {"Vb": (0.005, 0.05)}
+        )
+        full, _ = grid_search(problem, n_points=200, refinements=0)
+        thinned, _ = grid_search(problem, n_points=200, refinements=0, max_front=20)
+
+        assert len(full.F) > 20
+        assert len(thinned.F) == 20
+        assert thinned.F[:, 0].min() == full.F[:, 0].min()
+        assert thinned.F[:, 0].max() == full.F[:, 0].max()
+
+    def test_infeasible_returns_least_infeasible(self, test_driver):
+        """Test a problem without feasible designs returns the least infeasible one."""
+        problem = EnclosureOptimizationProblem(
+            test_driver, "sealed", ["f3", "size"], {"Vb": (0.06, 0.10)},
+            constraints=["volume_limit"],
+        )
+        result, metadata = grid_search(problem, n_points=20, refinements=0)
+
+        assert not metadata["feasible"]
+        assert_allclose(result.X, [[0.06]])
+
+    def test_invalid_arguments(self, make_problem):
+        """Test invalid grid sizes and refinement counts."""
+        problem = make_problem(BOUNDS, constraints=CONSTRAINTS)
+        with pytest.raises(ValueError):
+            run_grid_search(problem, n_points=1, verbose=False)
+        with pytest.raises(ValueError):
+            run_grid_search(problem, refinements=-1, verbose=False)
+        with pytest.raises(ValueError):
+            run_grid_search(problem, n_points=10_000, verbose=False)
+
+
+class TestGridSearchEntryPoints:
+    """Test the grid search through the configuration and agent APIs."""
+
+    def test_algorithm_config(self):
+        """Test grid options are validated and unsupported combinations rejected."""
+        assert AlgorithmConfig(type="grid", grid_points=16).grid_points == 16
+        with pytest.raises(ValueError):
+            AlgorithmConfig(type="grid", grid_points=1)
+        with pytest.raises(ValueError):
+            AlgorithmConfig(type="grid", grid_refinements=-1)
+        with pytest.raises(ValueError):
+            OptimizationConfig(
+                driver_name="BC_8NDL51", enclosure_type="ported", objectives=["f3", "volume"],
+                parameter_space_preset="ported", algorithm=AlgorithmConfig(type="grid"),
+                islands=2,
+            )
+        with pytest.raises(ValueError, match="sealed, ported"):
+            OptimizationConfig(
+                driver_name="BC_8NDL51", enclosure_type="multisegment_horn",
+                objectives=["f3", "volume"], parameter_space_preset="bass_horn",
+                algorithm=AlgorithmConfig(type="grid"),
+            )
+
+    def test_factory(self):
+        """Test the factory runs a grid search and reports it in the metadata."""
+        config = OptimizationConfig(
+            driver_name="BC_8NDL51", enclosure_type="sealed",
+            objectives=["f3", "volume"], parameter_space_preset="sealed",
+            algorithm=AlgorithmConfig(type="grid", pop_size=10, grid_points=60, grid_refinements=1),
+            save_results=False, verbose=False,
+        )
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            result = OptimizationScriptFactory(config).run()
+
+        metadata = result.optimization_metadata
+        assert result.success
+        assert metadata["algorithm"] == "grid"
+        assert metadata["grid_points"] == 60
+        assert metadata["n_evaluations"] > 60
+        assert 0 < result.n_designs_found <= 10
+
+    def test_factory_evaluates_grid_blocks_vectorized(self):
+        """Test factory sealed/ported blocks are evaluated at once, as per design."""
+        config = OptimizationConfig(
+            driver_name="BC_8NDL51", enclosure_type="ported",
+            objectives=["f3", "flatness", "volume"], parameter_space_preset="ported",
+            save_results=False, verbose=False,
+        )
+        problem = OptimizationScriptFactory(config)._create_problem()
+        per_design = FactoryOptimizationProblem(
+            problem.objective_funcs, problem.constraint_funcs, problem.driver, "ported",
+            problem.xl, problem.xu, verbose=False, vectorize=False,
+        )
+        X = grid_designs(problem.xl, problem.xu, 3)
+        problem._evaluate_individual = None  # Never called for a vectorized block
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            out = problem.evaluate(X, return_as_dictionary=True)
+            expected = per_design.evaluate(X, return_as_dictionary=True)
+
+        assert_allclose(out["F"], expected["F"], rtol=1e-12)
+        assert_allclose(out["G"], expected["G"], rtol=1e-12)
+
+    def test_factory_clamps_grid_points(self, monkeypatch):
+        """Test grids above MAX_GRID_DESIGNS are clamped with a warning."""
+        monkeypatch.setattr(factory, "MAX_GRID_DESIGNS", 4096)
+        config = OptimizationConfig(
+            driver_name="BC_8NDL51", enclosure_type="ported",
+            objectives=["f3", "volume"], parameter_space_preset="ported",
+            algorithm=AlgorithmConfig(type="grid", pop_size=10, grid_points=40, grid_refinements=0),
+            save_results=False, verbose=False,
+        )
+        with pytest.warns(UserWarning, match="using 8 points per variable"):
+            result = OptimizationScriptFactory(config).run()
+
+        assert result.optimization_metadata["grid_points"] == 8
+        assert result.optimization_metadata["n_evaluations"] == 8 ** 4
+
+    def test_design_assistant(self):
+        """Test optimize_design(algorithm="grid") returns the same designs every call."""
+        assistant = DesignAssistant()
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            first = assistant.optimize_design(
+                "BC_8NDL51", "sealed", ["f3", "size"], population_size=20, algorithm="grid"
+            )
+            second = assistant.optimize_design(
+                "BC_8NDL51", "sealed", ["f3", "size"], population_size=20, algorithm="grid"
+            )
+
+        assert first.success
+        assert first.optimization_metadata["algorithm"] == "grid"
+        assert first.n_designs_found == 20
+        assert first.pareto_front == second.pareto_front
+
+        unsupported = assistant.optimize_design("BC_8NDL51", "sealed", ["f3"], algorithm="cmaes")
+        assert not unsupported.success
+        horn = assistant.optimize_design("BC_8NDL51", "multisegment_horn", ["f3"], algorithm="grid")
+        assert not horn.success
+        assert "multisegment_horn" in horn.warnings[0]
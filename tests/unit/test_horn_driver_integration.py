@@ -24,7 +24,12 @@ from viberesp.simulation.horn_driver_integration import (
     rear_chamber_impedance,
     horn_system_acoustic_impedance,
     horn_electrical_impedance,
+    horn_system_response,
+    horn_tmatrix,
+    exponential_horn_batch_response,
 )
+from viberesp.simulation.types import HornSegment, MultiSegmentHorn
+from viberesp.enclosure.front_loaded_horn import FrontLoadedHorn
 from viberesp.driver.parameters import ThieleSmallParameters
 
 
@@ -372,3 +377,144 @@ class TestHornSystemIntegration:
         assert all(np.isfinite(velocities))
         assert all(z > 0 for z in impedances)
         assert all(v >= 0 for v in velocities)
+
+
+class TestHornSystemResponse:
+    """Test array-native horn system response against the scalar path."""
+
+    def setup_method(self):
+        """Set up test driver and horns."""
+        self.driver = ThieleSmallParameters(
+            M_md=0.026, C_ms=1.5e-4, R_ms=2.44,
+            R_e=2.6, L_e=0.15e-3, BL=7.3, S_d=0.022,
+        )
+
+        self.horn = ExponentialHorn(0.001, 0.01, 0.3)
+        self.multisegment_horn = MultiSegmentHorn(segments=[
+            HornSegment(throat_area=0.001, mouth_area=0.01, length=0.3),
+            HornSegment(throat_area=0.01, mouth_area=0.1, length=0.6),
+        ])
+        self.freqs = np.logspace(1, 4, 25)
+
+    def test_matches_scalar_electrical_impedance(self):
+        """Test Ze and excursion match horn_electrical_impedance point-by-point."""
+        response = horn_system_response(
+            self.freqs, self.driver, self.horn, V_tc=0.001, V_rc=0.010
+        )
+
+        for i, freq in enumerate(self.freqs):
+            scalar = horn_electrical_impedance(
+                freq, self.driver, self.horn, V_tc=0.001, V_rc=0.010
+            )
+            assert_allclose(response['Ze_real'][i], scalar['Ze_real'], rtol=1e-10)
+            assert_allclose(response['Ze_imag'][i], scalar['Ze_imag'], rtol=1e-10)
+            assert_allclose(
+                response['diaphragm_displacement'][i],
+                scalar['diaphragm_displacement'],
+                rtol=1e-10
+            )
+
+    @pytest.mark.parametrize("chambers", [{}, {"V_tc": 0.001, "V_rc": 0.010}])
+    def test_matches_scalar_power_and_spl(self, chambers):
+        """Test power and SPL match FrontLoadedHorn scalar methods."""
+        for horn in (self.horn, self.multisegment_horn):
+            flh = FrontLoadedHorn(self.driver, horn, **chambers)
+            response = horn_system_response(
+                self.freqs, self.driver, horn, **chambers
+            )
+
+            power = [flh.acoustic_power(f) for f in self.freqs]
+            spl = [flh.spl_response(f, measurement_distance=2.0) for f in self.freqs]
+            spl_array = flh.spl_response_array(self.freqs, measurement_distance=2.0)
+
+            assert_allclose(response['acoustic_power'], power, rtol=1e-9)
+            assert_allclose(spl_array['SPL'], spl, rtol=1e-9)
+
+    def test_mouth_volume_velocity_consistent_with_tmatrix(self):
+        """Test U_t = C·p_m + D·U_m holds for returned quantities."""
+        response = horn_system_response(self.freqs, self.driver, self.horn)
+        a, b, c, d = horn_tmatrix(self.freqs, self.horn)
+
+        U_throat = c * response['mouth_pressure'] + d * response['mouth_volume_velocity']
+        assert_allclose(U_throat, response['throat_volume_velocity'], rtol=1e-8)
+
+    def test_invalid_frequency(self):
+        """Test that non-positive frequencies are rejected."""
+        with pytest.raises(ValueError):
+            horn_system_response(np.array([0.0, 100.0]), self.driver, self.horn)
+
+
+class TestExponentialHornBatchResponse:
+    """Test population × frequency batch solver against per-design responses."""
+
+    def setup_method(self):
+        """Set up test driver and a small population of horn designs."""
+        self.driver = ThieleSmallParameters(
+            M_md=0.026, C_ms=1.5e-4, R_ms=2.44,
+            R_e=2.6, L_e=0.15e-3, BL=7.3, S_d=0.022,
+        )
+        self.throat_area = np.array([0.001, 0.005, 0.01, 0.002])
+        self.mouth_area = np.array([0.01, 0.2, 0.5, 0.05])
+        self.length = np.array([0.3, 1.0, 2.5, 0.8])
+        self.V_tc = np.array([0.0, 5e-4, 0.0, 2e-4])
+        self.V_rc = np.array([0.0, 0.0, 0.02, 0.01])
+        self.freqs = np.logspace(1, 4, 40)
+
+    def test_rows_match_horn_system_response(self):
+        """Test each design row matches horn_system_response()."""
+        batch = exponential_horn_batch_response(
+            self.freqs, self.driver, self.throat_area, self.mouth_area,
+            self.length, V_tc=self.V_tc, V_rc=self.V_rc,
+            measurement_distance=2.0,
+        )
+
+        assert batch['SPL'].shape == (4, len(self.freqs))
+        for i in range(len(self.throat_area)):
+            horn = ExponentialHorn(
+                self.throat_area[i], self.mouth_area[i], self.length[i]
+            )
+            single = horn_system_response(
+                self.freqs, self.driver, horn,
+                V_tc=self.V_tc[i], V_rc=self.V_rc[i],
+                measurement_distance=2.0,
+            )
+            for key in ('Ze', 'diaphragm_displacement', 'acoustic_power', 'SPL'):
+                assert_allclose(batch[key][i], single[key], rtol=1e-9)
+
+    def test_scalar_chamber_broadcasts(self):
+        """Test scalar chamber volumes apply to every design."""
+        batch = exponential_horn_batch_response(
+            self.freqs, self.driver, self.throat_area, self.mouth_area,
+            self.length, V_rc=0.01,
+        )
+        per_design = exponential_horn_batch_response(
+            self.freqs, self.driver, self.throat_area, self.mouth_area,
+            self.length, V_rc=np.full(4, 0.01),
+        )
+        assert_allclose(batch['Ze'], per_design['Ze'])
+
+    def test_tabulated_radiation_matches_exact(self):
+        """Test the tabulated mouth radiation barely changes the SPL."""
+        kwargs = dict(V_tc=self.V_tc, V_rc=self.V_rc)
+        exact = exponential_horn_batch_response(
+            self.freqs, self.driver, self.throat_area, self.mouth_area,
+            self.length, **kwargs
+        )
+        table = exponential_horn_batch_response(
+            self.freqs, self.driver, self.throat_area, self.mouth_area,
+            self.length, radiation_method="table", **kwargs
+        )
+        assert_allclose(table['SPL'], exact['SPL'], atol=1e-6)
+
+    def test_invalid_geometry(self):
+        """Test mismatched or non-positive geometry is rejected."""
+        with pytest.raises(ValueError):
+            exponential_horn_batch_response(
+                self.freqs, self.driver, self.throat_area, self.mouth_area[:2],
+                self.length,
+            )
+        with pytest.raises(ValueError):
+            exponential_horn_batch_response(
+                self.freqs, self.driver, -self.throat_area, self.mouth_area,
+                self.length,
+            )
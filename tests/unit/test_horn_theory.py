@@ -144,6 +144,38 @@ class TestCircularPistonRadiationImpedance:
         assert z.shape == frequencies.shape
         assert np.all(np.isfinite(z))
 
+    @pytest.mark.parametrize("area", [1e-4, 0.01, 0.5, 2.0])
+    def test_table_matches_exact(self, area):
+        """Test tabulated R₁/X₁ stay within the documented 1e-10 bound."""
+        frequencies = np.logspace(0, 4.5, 500)  # spans in- and out-of-table ka
+        medium = MediumProperties()
+        z_exact = circular_piston_radiation_impedance(frequencies, area)
+        z_table = circular_piston_radiation_impedance(
+            frequencies, area, method="table"
+        )
+
+        normalized_error = np.abs(z_table - z_exact) * area / medium.z_rc
+        assert np.max(normalized_error) < 1e-10
+
+    @pytest.mark.parametrize("area", [1e-4, 0.01, 0.5, 2.0])
+    def test_aarts_janssen_matches_exact(self, area):
+        """Test Aarts-Janssen approximation is within 1% on X₁ and exact on R₁."""
+        frequencies = np.logspace(0, 4.5, 500)
+        z_exact = circular_piston_radiation_impedance(frequencies, area)
+        z_aj = circular_piston_radiation_impedance(
+            frequencies, area, method="aarts_janssen"
+        )
+
+        assert_allclose(z_aj.real, z_exact.real, rtol=1e-12, atol=0)
+        assert_allclose(z_aj.imag, z_exact.imag, rtol=0.01)
+
+    def test_invalid_method(self):
+        """Test that unknown evaluation methods are rejected."""
+        with pytest.raises(ValueError):
+            circular_piston_radiation_impedance(
+                np.array([100.0]), 0.01, method="spline"
+            )
+
 
 class TestExponentialHornTmatrix:
     """Test exponential horn T-matrix calculation."""
@@ -298,6 +330,17 @@ class TestExponentialHornThroatImpedance:
         ratios = magnitude[1:] / magnitude[:-1]
         assert np.all(ratios < 10), "Impedance magnitude should vary smoothly"
 
+    def test_tabulated_radiation_matches_exact(self):
+        """Test the tabulated mouth radiation keeps the exact throat impedance."""
+        horn = ExponentialHorn(0.005, 0.05, 0.3)
+        frequencies = np.logspace(1, 4.3, 200)  # Beyond the table's ka range
+        z_mouth = circular_piston_radiation_impedance(frequencies, horn.mouth_area, method="exact")
+        expected = throat_impedance_from_tmatrix(
+            z_mouth, *exponential_horn_tmatrix(frequencies, horn)
+        )
+
+        assert_allclose(exponential_horn_throat_impedance(frequencies, horn), expected, rtol=1e-8)
+
 
 class TestValidationTestCases:
     """Test cases based on research agent validation plan.
@@ -855,6 +898,32 @@ class TestConicalHornTMatrix:
             assert_allclose(det_numerical, 1.0, rtol=1e-6,
                            err_msg=f"Numerical T-matrix det != 1 at f={f}Hz")
 
+    def test_tmatrix_array_matches_scalar(self):
+        """Test that the vectorized T-matrix matches the scalar method."""
+        horn = ConicalHorn(throat_area=0.005, mouth_area=0.05, length=0.5)
+        frequencies = np.logspace(1, 4.5, 40)
+
+        A, B, C, D = horn.calculate_t_matrix_array(frequencies)
+
+        for i, f in enumerate(frequencies):
+            T = horn.calculate_t_matrix(f, use_explicit_form=False)
+            assert_allclose([A[i], B[i], C[i], D[i]], T.ravel(), rtol=1e-10,
+                           err_msg=f"Array T-matrix differs at f={f}Hz")
+
+    def test_tmatrix_array_dc_and_cylindrical_limits(self):
+        """Test DC (identity) and infinite-x0 (plane wave) masks."""
+        horn = ConicalHorn(throat_area=0.005, mouth_area=0.05, length=0.5)
+        frequencies = np.array([1e-3, 1000.0])
+        A, B, C, D = horn.calculate_t_matrix_array(frequencies)
+        assert_allclose([A[0], B[0], C[0], D[0]], [1.0, 0.0, 0.0, 1.0])
+
+        pipe = ConicalHorn(throat_area=0.005, mouth_area=0.05, length=0.5, x0=np.inf)
+        A, B, C, D = pipe.calculate_t_matrix_array(frequencies, c=343.2)
+        kL = 2 * np.pi * 1000.0 / 343.2 * 0.5
+        assert_allclose(A[1], np.cos(kL))
+        assert_allclose(D[1], np.cos(kL))
+        assert_allclose(A[0], 1.0)
+
 
 class TestConicalHornThroatImpedance:
     """Test conical horn throat impedance calculation."""
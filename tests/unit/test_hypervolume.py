@@ -0,0 +1,115 @@
+"""
+Unit tests for the hypervolume indicator and hypervolume-based termination.
+
+These tests verify the exact 2- and 3-objective hypervolume against known
+values and pymoo's reference implementation, the Monte-Carlo estimate for
+more objectives, and early stopping once the Pareto front stagnates.
+
+Literature:
+- Zitzler & Thiele (1999), "Multiobjective evolutionary algorithms: A
+  comparative case study and the strength Pareto approach"
+"""
+
+import warnings
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal
+from pymoo.indicators.hv import HV
+
+from viberesp.optimization.objectives.composite import EnclosureOptimizationProblem
+from viberesp.optimization.optimizers.pymoo_interface import run_nsga2
+from viberesp.optimization.optimizers.termination import HypervolumeStagnationTermination
+from viberesp.optimization.results.pareto_front import (
+    calculate_hypervolume,
+    hypervolume,
+)
+
+
+class TestHypervolume:
+    """Test hypervolume values."""
+
+    def test_known_values(self):
+        """Test staircase fronts with hand-computed volumes."""
+        F2 = np.array([[1.0, 3.0], [2.0, 2.0], [3.0, 1.0], [3.0, 3.0]])
+        assert hypervolume(F2, np.array([4.0, 4.0])) == 6.0
+
+        F3 = np.array([[0.0, 0.0, 1.0], [1.0, 1.0, 0.0]])
+        # 2×2×1 slab of the first point plus 1×1×1 below it from the second
+        assert hypervolume(F3, np.array([2.0, 2.0, 2.0])) == 5.0
+
+    @pytest.mark.parametrize("n_obj", [2, 3])
+    def test_exact_matches_pymoo(self, n_obj):
+        """Test 2 and 3 objectives against pymoo's HV indicator."""
+        F = np.random.default_rng(n_obj).random((80, n_obj))
+        ref = np.full(n_obj, 1.1)
+
+        assert_allclose(hypervolume(F, ref), HV(ref_point=ref)(F), rtol=1e-12)
+
+    def test_monte_carlo_estimate(self):
+        """Test the 5-objective estimate is within 1% of the exact value."""
+        F = np.random.default_rng(5).random((40, 5))
+        ref = np.full(5, 1.1)
+
+        assert_allclose(hypervolume(F, ref), HV(ref_point=ref)(F), rtol=0.01)
+
+    def test_points_beyond_reference_ignored(self):
+        """Test points not dominating the reference point add nothing."""
+        ref = np.array([1.0, 1.0])
+        assert hypervolume(np.array([[0.5, 1.5], [2.0, 0.1]]), ref) == 0.0
+        with pytest.raises(ValueError):
+            hypervolume(np.array([[0.5, 0.5]]), np.array([1.0, 1.0, 1.0]))
+
+    def test_calculate_hypervolume_uses_result_front(self):
+        """Test calculate_hypervolume is the exact value, not a bounding box."""
+        result = SimpleNamespace(F=np.array([[1.0, 2.0], [2.0, 1.0]]))
+
+        assert calculate_hypervolume(result, np.array([3.0, 3.0])) == 3.0
+
+
+class TestHypervolumeTermination:
+    """Test early stopping on hypervolume stagnation."""
+
+    def make_problem(self, driver):
+        return EnclosureOptimizationProblem(
+            driver, "sealed", ["f3", "size"], {"Vb": (0.005, 0.05)}
+        )
+
+    def nsga2(self, driver, **kwargs):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            return run_nsga2(self.make_problem(driver), pop_size=20, n_generations=200,
+                             seed=1, verbose=False, **kwargs)
+
+    def test_stops_early(self, test_driver):
+        """Test a converged sealed-box front stops well before 200 generations."""
+        result, metadata = self.nsga2(test_driver, hv_tolerance=1e-3, hv_patience=5)
+
+        assert metadata["terminated_early"]
+        assert metadata["n_generations_run"] < 100
+        assert len(metadata["hypervolume_history"]) == metadata["n_generations_run"]
+
+    def test_resume_keeps_stagnation_state(self, test_driver, tmp_path):
+        """Test a resumed run stops at the same generation with the same front."""
+        path = str(tmp_path / "hv.ckpt")
+        full, full_meta = self.nsga2(test_driver, hv_tolerance=1e-3, hv_patience=5)
+        assert full_meta["n_generations_run"] > 4
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            run_nsga2(self.make_problem(test_driver), pop_size=20, n_generations=4, seed=1,
+                      verbose=False, hv_tolerance=1e-3, hv_patience=5,
+                      checkpoint_path=path, checkpoint_every=1)
+        resumed, meta = self.nsga2(test_driver, hv_tolerance=1e-3, hv_patience=5,
+                                   checkpoint_path=path, resume=True)
+
+        assert meta["n_generations_run"] == full_meta["n_generations_run"]
+        assert_array_equal(resumed.F, full.F)
+
+    def test_invalid_settings(self):
+        """Test negative tolerance and zero patience are rejected."""
+        with pytest.raises(ValueError):
+            HypervolumeStagnationTermination(tolerance=-1.0)
+        with pytest.raises(ValueError):
+            HypervolumeStagnationTermination(patience=0)
@@ -0,0 +1,115 @@
+"""
+Unit tests for the island-model NSGA-II.
+
+These tests verify that island runs are reproducible regardless of the
+number of processes, that non-dominated designs migrate between islands
+(respecting each island's bounds), and that the merged front is
+non-dominated.
+
+Literature:
+- Whitley, Rana & Heckendorn (1999), "The island model genetic algorithm"
+- Deb et al. (2002), "A fast and elitist multiobjective genetic algorithm: NSGA-II"
+"""
+
+import warnings
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+from pymoo.algorithms.moo.nsga2 import NSGA2
+from pymoo.util.nds.non_dominated_sorting import NonDominatedSorting
+
+from viberesp.optimization.config import AlgorithmConfig, OptimizationConfig
+from viberesp.optimization.factory import OptimizationScriptFactory
+from viberesp.optimization.optimizers.islands import run_islands
+
+
+BOUNDS = {"Vb": (0.01, 0.08), "Fb": (25.0, 70.0)}
+
+
+def islands(problems, n_generations=8, **kwargs):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return run_islands(
+            problems, [NSGA2(pop_size=12) for _ in problems], n_generations,
+            migration_interval=3, seed=7, **kwargs
+        )
+
+
+class TestIslands:
+    """Test island runs and migration."""
+
+    def test_independent_of_process_count(self, make_problem):
+        """Test islands in worker processes give the in-process result."""
+        problems = [make_problem(BOUNDS) for _ in range(2)]
+        serial = islands(problems, processes=1)
+        parallel = islands(problems, processes=2)
+
+        assert_array_equal(parallel.X, serial.X)
+        assert_array_equal(parallel.F, serial.F)
+        assert [island.n_gen for island in parallel.islands] == [9, 9]
+
+    def test_migrants_evaluated_by_receiving_island(self, make_problem):
+        """Test each island evaluates 3 migrants at each of 2 migrations."""
+        problems = [make_problem(BOUNDS) for _ in range(3)]
+        isolated = islands(problems, n_migrants=0)
+        migrating = islands(problems, n_migrants=3)
+
+        for before, after in zip(isolated.islands, migrating.islands):
+            assert after.evaluator.n_eval - before.evaluator.n_eval == 2 * 3
+
+    def test_migrants_clipped_to_island_bounds(self, make_problem):
+        """Test an island with a smaller box only holds designs within its bounds."""
+        result = islands([make_problem(BOUNDS), make_problem(dict(BOUNDS, Vb=(0.01, 0.03)))])
+
+        X = result.islands[1].pop.get("X")
+        assert np.all(X[:, 0] <= 0.03)
+
+    def test_merged_front_non_dominated(self, make_problem):
+        """Test the merged front is non-dominated and free of duplicates."""
+        result = islands([make_problem(BOUNDS) for _ in range(3)])
+
+        assert len(NonDominatedSorting().do(result.F, only_non_dominated_front=True)) == len(result.F)
+        assert len(np.unique(result.X, axis=0)) == len(result.X)
+        pops = np.vstack([island.pop.get("F") for island in result.islands])
+        assert np.all(pops.min(axis=0) >= result.F.min(axis=0))
+
+    def test_mismatched_islands_rejected(self, make_problem):
+        """Test islands must share objectives."""
+        with pytest.raises(ValueError):
+            islands([make_problem(BOUNDS),
+                     make_problem(BOUNDS, objectives=("f3", "flatness", "size"))])
+
+
+class TestFactoryIslands:
+    """Test island runs through OptimizationScriptFactory."""
+
+    def make_config(self, **kwargs):
+        return OptimizationConfig(
+            driver_name="BC_8NDL51", enclosure_type="exponential_horn",
+            objectives=["f3", "flatness"], parameter_space_preset="bass_horn",
+            algorithm=AlgorithmConfig(pop_size=10, n_generations=4, seed=3),
+            save_results=False, verbose=False, **kwargs
+        )
+
+    def test_factory_islands(self):
+        """Test a two-preset island run reports the merged front."""
+        config = self.make_config(islands=2, migration_interval=2,
+                                  island_presets=["bass_horn", "fullrange_horn"])
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            result = OptimizationScriptFactory(config).run()
+
+        metadata = result.optimization_metadata
+        assert metadata["islands"] == 2
+        assert metadata["n_evaluations"] > 2 * 10 * 4
+        assert result.n_designs_found > 0
+
+    def test_invalid_settings(self):
+        """Test island settings and unsupported combinations are rejected."""
+        with pytest.raises(ValueError):
+            self.make_config(islands=0)
+        with pytest.raises(ValueError):
+            self.make_config(islands=2, island_presets=["unknown"])
+        with pytest.raises(ValueError, match="checkpoint_path"):
+            self.make_config(islands=2, checkpoint_path="run.ckpt")
@@ -0,0 +1,180 @@
+"""
+Unit tests for multi-fidelity objective evaluation.
+
+These tests verify the fidelity schedule's stage selection, that reduced
+frequency grids are passed to the response objectives, and that the designs
+returned by a multi-fidelity run carry their full-grid objective values.
+
+Literature:
+- Jin (2005), "A comprehensive survey of fitness approximation in
+  evolutionary computation"
+"""
+
+import warnings
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+from pymoo.algorithms.moo.nsga2 import NSGA2
+
+from viberesp.optimization.config import OptimizationConfig
+from viberesp.optimization.objectives.composite import EnclosureOptimizationProblem
+from viberesp.optimization.objectives.context import shared_frequency_grid
+from viberesp.optimization.optimizers.checkpoint import minimize_with_checkpoints
+from viberesp.optimization.optimizers.fidelity import (
+    DEFAULT_FIDELITY_SCHEDULE,
+    FidelitySchedule,
+    fidelity_kwargs,
+    parse_fidelity_schedule,
+)
+from viberesp.optimization.optimizers.pymoo_interface import run_nsga2
+
+
+HORN_BOUNDS = {
+    "throat_area": (0.003, 0.01),
+    "mouth_area": (0.1, 0.3),
+    "length": (1.0, 2.0),
+    "V_tc": (0.0, 0.001),
+    "V_rc": (0.005, 0.02),
+}
+
+
+def make_problem(driver):
+    return EnclosureOptimizationProblem(
+        driver, "exponential_horn", ["f3", "flatness"], HORN_BOUNDS
+    )
+
+
+def evaluate(problem, X):
+    out = {}
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        problem._evaluate(X, out)
+    return out["F"]
+
+
+class TestFidelitySchedule:
+    """Test schedule parsing and stage selection."""
+
+    def test_stage_selection(self):
+        """Test the default schedule uses 24 points, then 64, for 10 generations."""
+        schedule = FidelitySchedule(DEFAULT_FIDELITY_SCHEDULE, n_generations=10)
+
+        assert [schedule.n_points(gen) for gen in range(1, 11)] == [24] * 5 + [64] * 5
+        # Generations after the last stage use the full grids
+        assert FidelitySchedule([(0.5, 24)], n_generations=10).n_points(6) is None
+
+    def test_parse(self):
+        """Test command-line schedules and their validation."""
+        assert parse_fidelity_schedule("0.3:16, 0.7:48") == ((0.3, 16), (0.7, 48))
+        assert parse_fidelity_schedule("default") == DEFAULT_FIDELITY_SCHEDULE
+
+        for text in ("0.5", "0.7:24,0.5:64", "0.5:4", "1.5:24"):
+            with pytest.raises(ValueError):
+                parse_fidelity_schedule(text)
+        with pytest.raises(ValueError):
+            OptimizationConfig(
+                driver_name="BC_8NDL51", enclosure_type="sealed", objectives=["f3"],
+                parameter_space_preset="sealed", fidelity_schedule=[(0.5, 2)],
+            )
+
+    def test_grid_arguments(self):
+        """Test the horn F3 search and flatness grids are reduced."""
+        f3_grid = fidelity_kwargs("f3", 24)["frequency_points"]
+        assert_array_equal(f3_grid, shared_frequency_grid(20.0, 500.0, 24))
+        assert 24 <= len(f3_grid) < len(shared_frequency_grid(20.0, 500.0, 200))
+        assert fidelity_kwargs("flatness", 24) == {"n_points": 24}
+        assert fidelity_kwargs("size", 24) == {}
+        assert fidelity_kwargs("flatness", None) == {}
+
+
+class TestMultiFidelityRun:
+    """Test multi-fidelity optimization runs."""
+
+    def test_coarse_grid_changes_objectives(self, test_driver):
+        """Test the problem evaluates response objectives on its current grid."""
+        X = np.random.default_rng(0).uniform(
+            [b[0] for b in HORN_BOUNDS.values()], [b[1] for b in HORN_BOUNDS.values()], (4, 5)
+        )
+        problem = make_problem(test_driver)
+        full = evaluate(problem, X)
+        problem.n_frequency_points = 24
+        coarse = evaluate(problem, X)
+
+        assert not np.array_equal(coarse, full)
+        problem.n_frequency_points = None
+        assert_array_equal(evaluate(problem, X), full)
+
+    def test_coarse_grid_simulates_fewer_frequencies(self, test_driver):
+        """Test coarse stages batch-simulate and read fewer frequencies per design."""
+        X = np.random.default_rng(3).uniform(
+            [b[0] for b in HORN_BOUNDS.values()], [b[1] for b in HORN_BOUNDS.values()], (4, 5)
+        )
+        problem = make_problem(test_driver)
+
+        def n_simulated():
+            contexts = problem._population_contexts(X)
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                for i, x in enumerate(X):
+                    problem._evaluate_individual(i, x, contexts[i])
+            return np.array([context.n_simulated for context in contexts])
+
+        full = n_simulated()
+        problem.n_frequency_points = 24
+        coarse = n_simulated()
+
+        assert np.all(coarse < full)
+
+    def test_front_rescored_on_full_grid(self, test_driver):
+        """Test reported objective values equal full-grid evaluations of the designs."""
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            result, metadata = run_nsga2(
+                make_problem(test_driver), pop_size=10, n_generations=4, seed=2,
+                verbose=False, fidelity_schedule=DEFAULT_FIDELITY_SCHEDULE,
+            )
+
+        assert metadata["fidelity_schedule"] == list(DEFAULT_FIDELITY_SCHEDULE)
+        assert_array_equal(result.F, evaluate(make_problem(test_driver), result.X))
+        assert_array_equal(result.pop.get("F"),
+                           evaluate(make_problem(test_driver), result.pop.get("X")))
+
+    def test_resume_across_stage_switch(self, test_driver, tmp_path):
+        """Test a run checkpointed before the grid switch resumes bit-exactly."""
+        path = str(tmp_path / "fidelity.ckpt")
+
+        def run(n_generations, **kwargs):
+            schedule = FidelitySchedule(DEFAULT_FIDELITY_SCHEDULE, n_generations=6)
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                return minimize_with_checkpoints(
+                    make_problem(test_driver), NSGA2(pop_size=10), ("n_gen", n_generations),
+                    before_generation=schedule.before_generation, seed=5, **kwargs
+                )
+
+        full = run(6)
+        run(3, checkpoint_path=path)
+        resumed = run(6, checkpoint_path=path, resume=True)
+
+        assert_array_equal(resumed.X, full.X)
+        assert_array_equal(resumed.F, full.F)
+        assert resumed.algorithm.evaluator.n_eval == full.algorithm.evaluator.n_eval
+
+    def test_workers_use_current_grid(self, test_driver):
+        """Test the grid set in the parent process reaches the worker pool."""
+        X = np.random.default_rng(1).uniform(
+            [b[0] for b in HORN_BOUNDS.values()], [b[1] for b in HORN_BOUNDS.values()], (4, 5)
+        )
+        serial = make_problem(test_driver)
+        serial.n_frequency_points = 24
+
+        parallel = make_problem(test_driver)
+        parallel.workers = 2
+        try:
+            parallel.n_frequency_points = None
+            evaluate(parallel, X)  # Starts the pool on full grids
+            parallel.n_frequency_points = 24
+            assert_array_equal(evaluate(parallel, X), evaluate(serial, X))
+        finally:
+            parallel.close()
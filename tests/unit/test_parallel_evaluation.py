@@ -0,0 +1,100 @@
+"""
+Unit tests for process-pool population evaluation.
+
+These tests verify that spreading a generation across worker processes gives
+the same objectives and constraints, in the same order, as serial evaluation.
+
+Literature:
+- Deb et al. (2002), "A fast and elitist multiobjective genetic algorithm: NSGA-II"
+"""
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from viberesp.optimization.config import OptimizationConfig
+from viberesp.optimization.factory import OptimizationScriptFactory
+from viberesp.optimization.optimizers.parallel import PopulationEvaluator, resolve_workers
+from viberesp.optimization.optimizers.pymoo_interface import run_nsga2
+
+
+BOUNDS = {"Vb": (0.01, 0.05), "Fb": (30.0, 60.0)}
+OBJECTIVES = ("f3", "flatness", "efficiency")
+CONSTRAINTS = ("max_displacement", "f3_limit")
+
+
+class FailingProblem:
+    """Problem whose evaluation raises outside its own error handling."""
+
+    n_obj = 1
+    n_constr = 0
+
+    def _evaluate_individual(self, i, x):
+        if i == 2:
+            raise RuntimeError("broken design")
+        return np.array([x[0]]), np.zeros(0)
+
+
+class TestParallelEvaluation:
+    """Test worker-pool evaluation against serial evaluation."""
+
+    def test_problem_matches_serial(self, make_problem):
+        """Test F and G are identical and in population order."""
+        X = np.random.default_rng(0).uniform([0.01, 30.0], [0.05, 60.0], (13, 2))
+        serial, parallel = {}, {}
+        make_problem(BOUNDS, OBJECTIVES, CONSTRAINTS, workers=1)._evaluate(X, serial)
+
+        problem = make_problem(BOUNDS, OBJECTIVES, CONSTRAINTS, workers=3)
+        with pytest.warns(UserWarning):  # Worker warnings are re-emitted
+            problem._evaluate(X, parallel)
+        problem.close()
+
+        assert_array_equal(parallel["F"], serial["F"])
+        assert_array_equal(parallel["G"], serial["G"])
+
+    def test_run_nsga2_reproducible(self, make_problem):
+        """Test a seeded run gives the same Pareto front with workers."""
+        results = [
+            run_nsga2(make_problem(BOUNDS, OBJECTIVES, CONSTRAINTS, workers=1), pop_size=10,
+                      n_generations=3, seed=1, verbose=False, workers=workers)[0]
+            for workers in (1, 2)
+        ]
+
+        assert_array_equal(results[0].X, results[1].X)
+        assert_array_equal(results[0].F, results[1].F)
+
+    def test_factory_problem(self):
+        """Test the factory problem evaluates identically in a worker pool."""
+        config = OptimizationConfig(
+            driver_name="BC_8NDL51", enclosure_type="sealed",
+            objectives=["f3", "volume"], constraints={"max_volume": 20.0},
+            parameter_space_preset="sealed", verbose=False, workers=2,
+        )
+        problem = OptimizationScriptFactory(config)._create_problem()
+        X = np.linspace(problem.xl, problem.xu, 6)
+        serial, parallel = {}, {}
+
+        problem._evaluate(X, parallel)
+        problem.close()
+        problem.workers = 1
+        problem._evaluate(X, serial)
+
+        assert_array_equal(parallel["F"], serial["F"])
+        assert_array_equal(parallel["G"], serial["G"])
+
+    def test_worker_error_captured(self):
+        """Test an unhandled worker exception names the design and traceback."""
+        with PopulationEvaluator(FailingProblem(), workers=2) as evaluator:
+            with pytest.raises(RuntimeError, match="(?s)design 2.*broken design"):
+                evaluator.evaluate(np.arange(4.0).reshape(4, 1))
+
+    def test_invalid_workers(self):
+        """Test negative worker counts are rejected and 0 means all cores."""
+        assert resolve_workers(0) >= 1
+        with pytest.raises(ValueError):
+            resolve_workers(-1)
+        with pytest.raises(ValueError):
+            OptimizationConfig(
+                driver_name="BC_8NDL51", enclosure_type="sealed",
+                objectives=["f3"], parameter_space_preset="sealed", workers=-2,
+            )
@@ -0,0 +1,202 @@
+"""
+Unit tests for fast non-dominated sorting and the bounded Pareto archive.
+
+These tests verify the non-dominated filter and 3-objective hypervolume
+against pymoo, the archive's incremental insertion and crowding-based
+truncation, and the archive stage of run_nsga2 and the factory.
+
+Literature:
+- Kung, Luccio & Preparata (1975), "On finding the maxima of a set of vectors"
+- Zhang et al. (2015), "An efficient approach to nondominated sorting for evolutionary multiobjective optimization"
+- Knowles & Corne (2000), "Approximating the nondominated front using the Pareto archived evolution strategy"
+"""
+
+import time
+import warnings
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal
+from pymoo.core.result import Result
+from pymoo.indicators.hv import HV
+from pymoo.util.nds.non_dominated_sorting import NonDominatedSorting
+
+from viberesp.optimization.config import AlgorithmConfig, OptimizationConfig
+from viberesp.optimization.factory import OptimizationScriptFactory
+from viberesp.optimization.optimizers.pymoo_interface import run_nsga2
+from viberesp.optimization.results.archive import ParetoArchive
+from viberesp.optimization.results.pareto_front import (
+    crowding_distance,
+    hypervolume,
+    non_dominated_mask,
+    rank_designs,
+)
+
+
+BOUNDS = {"Vb": (0.01, 0.08), "Fb": (25.0, 70.0)}
+
+
+def pymoo_mask(F):
+    """Non-dominated rows by pymoo's sorting."""
+    mask = np.zeros(len(F), dtype=bool)
+    mask[NonDominatedSorting().do(F, only_non_dominated_front=True)] = True
+    return mask
+
+
+class TestNonDominatedMask:
+    """Test the non-dominated filter."""
+
+    @pytest.mark.parametrize("n_obj", [1, 2, 3, 4, 5])
+    def test_matches_pymoo(self, n_obj):
+        """Test random and integer (tied, duplicated) objectives against pymoo."""
+        rng = np.random.default_rng(n_obj)
+        for F in (rng.random((300, n_obj)), rng.integers(0, 5, (300, n_obj)).astype(float)):
+            assert_array_equal(non_dominated_mask(F), pymoo_mask(F))
+
+    def test_duplicates_kept(self):
+        """Test identical non-dominated rows are all kept."""
+        F = np.array([[1.0, 2.0], [1.0, 2.0], [2.0, 1.0], [2.0, 2.0]])
+        assert_array_equal(non_dominated_mask(F), [True, True, True, False])
+
+    def test_empty(self):
+        """Test an empty objective matrix."""
+        assert non_dominated_mask(np.empty((0, 2))).shape == (0,)
+
+    def test_large_front(self):
+        """Test 100k-point fronts are filtered without quadratic cost."""
+        rng = np.random.default_rng(0)
+        f1 = rng.random(100_000)
+        F = np.column_stack([f1, 1.0 - f1])  # Every point non-dominated
+        F3 = rng.random((100_000, 3))
+
+        result = Result()
+        result.X, result.F = F[:, :1], F
+
+        start = time.perf_counter()
+        mask = non_dominated_mask(F)
+        non_dominated_mask(F3)
+        ranked = rank_designs(result, ["f3", "volume"], ["Vb"], top_n=10)
+        assert time.perf_counter() - start < 20.0
+        assert np.all(mask)
+        assert len(ranked) == 10
+
+
+class TestCrowdingAndHypervolume:
+    """Test crowding distances and the 3-objective hypervolume."""
+
+    def test_crowding_distance(self):
+        """Test boundary designs are infinite and interior ones sum normalized gaps."""
+        F = np.array([[0.0, 4.0], [1.0, 3.0], [3.0, 1.0], [4.0, 0.0]])
+        distance = crowding_distance(F)
+
+        assert np.all(np.isinf(distance[[0, 3]]))
+        assert_allclose(distance[1:3], [1.5, 1.5])
+
+    def test_hypervolume_3d_matches_pymoo(self):
+        """Test the 3-objective sweep against pymoo's hypervolume."""
+        rng = np.random.default_rng(3)
+        F = rng.random((400, 3))
+        reference = np.full(3, 1.1)
+        assert_allclose(hypervolume(F, reference), HV(ref_point=reference).do(F))
+
+
+class TestParetoArchive:
+    """Test incremental insertion and truncation."""
+
+    def test_incremental_add(self):
+        """Test dominated, duplicate and infeasible designs are not archived."""
+        archive = ParetoArchive()
+        X = np.array([[0.0], [1.0], [2.0]])
+        F = np.array([[1.0, 3.0], [2.0, 2.0], [3.0, 3.0]])
+
+        assert archive.add(X, F) == 2
+        assert archive.add(X[:2], F[:2]) == 0  # Already archived
+        assert archive.add([[3.0]], [[5.0, 5.0]], [[1.0]]) == 0  # Infeasible
+        assert archive.add([[4.0]], [[0.5, 2.5]]) == 1
+
+        assert_array_equal(archive.X, [[1.0], [4.0]])
+        assert archive.stats() == {
+            "n_designs": 2, "max_size": None, "n_added": 7, "n_truncated": 0,
+        }
+
+    def test_matches_front_of_all_designs(self):
+        """Test batches add up to the non-dominated set of all designs."""
+        rng = np.random.default_rng(1)
+        X, F = rng.random((2000, 2)), rng.random((2000, 3))
+        archive = ParetoArchive()
+        for start in range(0, 2000, 100):
+            archive.add(X[start:start + 100], F[start:start + 100])
+
+        expected = np.sort(F[non_dominated_mask(F)], axis=0)
+        assert_array_equal(np.sort(archive.F, axis=0), expected)
+
+    def test_max_size_keeps_extremes(self):
+        """Test truncation drops crowded designs and keeps every objective's extremes."""
+        f1 = np.linspace(0.0, 1.0, 500)
+        F = np.column_stack([f1, 1.0 - f1])
+        archive = ParetoArchive(max_size=50)
+        archive.add(f1[:, None], F)
+
+        assert len(archive) == 50
+        assert archive.n_truncated == 450
+        assert archive.F[:, 0].min() == 0.0
+        assert archive.F[:, 0].max() == 1.0
+        gaps = np.diff(np.sort(archive.F[:, 0]))
+        assert gaps.max() < 5 * gaps.mean()
+
+        with pytest.raises(ValueError):
+            ParetoArchive(max_size=1)
+
+    def test_run_nsga2(self, make_problem):
+        """Test the archived front weakly dominates the final population's front."""
+        problem = make_problem(BOUNDS, constraints=("port_velocity",))
+        archive = ParetoArchive()
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            result, metadata = run_nsga2(
+                problem, pop_size=20, n_generations=10, seed=1, verbose=False, archive=archive
+            )
+
+        assert metadata["archive"]["n_added"] == metadata["n_evaluations"]
+        assert np.all(result.G <= 0)
+        assert_array_equal(result.F, archive.F)
+        for f in result.algorithm.opt.get("F"):
+            assert np.any(np.all(archive.F <= f, axis=1))
+
+        with pytest.raises(ValueError):
+            run_nsga2(problem, archive=ParetoArchive(), fidelity_schedule=[(1.0, 32)])
+
+
+class TestArchiveStage:
+    """Test the archive through OptimizationConfig and the factory."""
+
+    def test_config(self):
+        """Test archive sizes and unsupported combinations are rejected."""
+        base = dict(
+            driver_name="BC_8NDL51", enclosure_type="ported", objectives=["f3", "volume"],
+            parameter_space_preset="ported",
+        )
+        with pytest.raises(ValueError):
+            OptimizationConfig(archive=True, archive_size=1, **base)
+        with pytest.raises(ValueError):
+            OptimizationConfig(archive=True, islands=2, **base)
+        with pytest.raises(ValueError):
+            OptimizationConfig(archive=True, algorithm=AlgorithmConfig(type="grid"), **base)
+
+    def test_factory(self):
+        """Test config.archive returns the archived front and reports it."""
+        config = OptimizationConfig(
+            driver_name="BC_8NDL51", enclosure_type="ported",
+            objectives=["f3", "flatness"], parameter_space_preset="ported",
+            algorithm=AlgorithmConfig(pop_size=10, n_generations=5, seed=1),
+            archive=True, archive_size=40, save_results=False, verbose=False,
+        )
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            result = OptimizationScriptFactory(config).run()
+
+        archive = result.optimization_metadata["archive"]
+        assert result.success
+        assert archive["max_size"] == 40
+        assert 0 < archive["n_designs"] <= 40
+        assert result.n_designs_found == archive["n_designs"]
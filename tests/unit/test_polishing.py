@@ -0,0 +1,169 @@
+"""
+Unit tests for gradient-based polishing of Pareto designs.
+
+These tests verify the batched finite-difference Jacobians, that polished
+designs dominate the designs they replace while respecting constraints,
+and the polishing stage of the factory and DesignAssistant.
+
+Literature:
+- Benson (1978), "Existence of efficient solutions for vector maximization problems"
+- Kraft (1988), "A software package for sequential quadratic programming"
+"""
+
+import warnings
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal
+from pymoo.core.problem import Problem
+from pymoo.core.result import Result
+
+from viberesp.optimization.api.design_assistant import DesignAssistant
+from viberesp.optimization.config import AlgorithmConfig, OptimizationConfig
+from viberesp.optimization.factory import OptimizationScriptFactory
+from viberesp.optimization.optimizers.polishing import _FiniteDifferenceModel, polish_front
+from viberesp.optimization.optimizers.pymoo_interface import run_nsga2
+
+
+BOUNDS = {"Vb": (0.01, 0.08), "Fb": (25.0, 70.0)}
+
+
+class TwoObjectiveProblem(Problem):
+    """f1 = x0, f2 = 1 - sqrt(x0) + x1²; Pareto front at x1 = x1_min."""
+
+    def __init__(self, x1_min=None):
+        self.x1_min = x1_min
+        self.batches = []
+        super().__init__(n_var=2, n_obj=2, n_ieq_constr=0 if x1_min is None else 1,
+                         xl=np.array([0.0, 0.0]), xu=np.array([1.0, 1.0]))
+
+    def _evaluate(self, X, out, *args, **kwargs):
+        self.batches.append(len(X))
+        out["F"] = np.column_stack([X[:, 0], 1 - np.sqrt(X[:, 0]) + X[:, 1] ** 2])
+        if self.x1_min is not None:
+            out["G"] = self.x1_min - X[:, 1:2]
+
+
+def make_result(problem, X):
+    out = problem.evaluate(X, return_as_dictionary=True)
+    result = Result()
+    result.X, result.F, result.G = X, out["F"], out.get("G")
+    return result
+
+
+class TestFiniteDifferences:
+    """Test the batched finite-difference model."""
+
+    def test_jacobians(self):
+        """Test forward differences inside and backward differences at the upper bound."""
+        problem = TwoObjectiveProblem()
+        model = _FiniteDifferenceModel(problem, fd_step=1e-6)
+
+        dF, dG = model.jacobians(np.array([0.25, 0.5]))
+        assert_allclose(dF, [[1.0, 0.0], [-1.0, 1.0]], atol=1e-4)
+        assert dG.shape == (0, 2)
+        assert problem.batches == [3]  # Design and both perturbations in one call
+
+        dF, _ = model.jacobians(np.array([0.25, 1.0]))
+        assert_allclose(dF[1, 1], 2.0, atol=1e-4)
+
+
+class TestPolishFront:
+    """Test polishing fronts."""
+
+    def test_moves_designs_onto_front(self):
+        """Test designs off the front move to it without trading objectives."""
+        problem = TwoObjectiveProblem()
+        X = np.column_stack([np.linspace(0.1, 0.9, 5), np.full(5, 0.3)])
+        result = make_result(problem, X)
+        F0 = result.F.copy()
+
+        stats = polish_front(result, problem)
+
+        assert stats["n_designs"] == 5
+        assert stats["n_improved"] == 5
+        assert stats["n_evaluations"] > 0
+        assert_allclose(result.X[:, 1], 0.0, atol=1e-3)
+        assert np.all(result.F <= F0 + 1e-12)
+
+    def test_respects_constraints(self):
+        """Test polished designs stay feasible."""
+        problem = TwoObjectiveProblem(x1_min=0.1)
+        result = make_result(problem, np.array([[0.3, 0.5], [0.6, 0.4]]))
+
+        polish_front(result, problem)
+
+        assert np.all(result.G <= 0)
+        assert_allclose(result.X[:, 1], 0.1, atol=1e-3)
+
+    def test_infeasible_designs_kept(self):
+        """Test infeasible fronts are returned unchanged."""
+        problem = TwoObjectiveProblem(x1_min=0.5)
+        result = make_result(problem, np.array([[0.3, 0.2]]))
+
+        stats = polish_front(result, problem)
+
+        assert stats["n_designs"] == 0
+        assert_array_equal(result.X, [[0.3, 0.2]])
+
+    def test_invalid_arguments(self):
+        """Test invalid iteration counts and steps."""
+        problem = TwoObjectiveProblem()
+        result = make_result(problem, np.array([[0.3, 0.2]]))
+        with pytest.raises(ValueError):
+            polish_front(result, problem, max_iterations=0)
+        with pytest.raises(ValueError):
+            polish_front(result, problem, fd_step=0.0)
+
+    def test_ported_front(self, make_problem):
+        """Test every polished ported design dominates an NSGA-II design."""
+        problem = make_problem(BOUNDS, constraints=("port_velocity",))
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            result, _ = run_nsga2(problem, pop_size=20, n_generations=5, seed=1, verbose=False)
+            F0 = result.F.copy()
+            stats = polish_front(result, problem, max_iterations=10)
+
+        assert stats["n_improved"] > 0
+        assert np.all(result.G <= 0)
+        for f in result.F:
+            assert np.any(np.all(f <= F0 + 1e-12, axis=1))
+
+
+class TestPolishingStage:
+    """Test polishing through the factory and DesignAssistant."""
+
+    def test_factory(self):
+        """Test config.polish polishes the front and reports it."""
+        with pytest.raises(ValueError):
+            OptimizationConfig(
+                driver_name="BC_8NDL51", enclosure_type="ported", objectives=["f3", "volume"],
+                parameter_space_preset="ported", polish_iterations=0,
+            )
+
+        config = OptimizationConfig(
+            driver_name="BC_8NDL51", enclosure_type="ported",
+            objectives=["f3", "flatness"], parameter_space_preset="ported",
+            algorithm=AlgorithmConfig(pop_size=10, n_generations=3, seed=1),
+            polish=True, polish_iterations=3, save_results=False, verbose=False,
+        )
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            result = OptimizationScriptFactory(config).run()
+
+        polishing = result.optimization_metadata["polishing"]
+        assert result.success
+        assert polishing["n_designs"] > 0
+        assert polishing["n_evaluations"] > 0
+
+    def test_design_assistant(self):
+        """Test optimize_design(polish=True) reports the polishing stage."""
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            result = DesignAssistant().optimize_design(
+                "BC_8NDL51", "ported", ["f3", "flatness"],
+                population_size=10, generations=3, polish=True,
+            )
+
+        assert result.success
+        assert result.optimization_metadata["polishing"]["n_designs"] > 0
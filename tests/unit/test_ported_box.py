@@ -0,0 +1,172 @@
+"""
+Unit tests for vectorized ported box calculations.
+
+These tests verify that the array-based ported box functions reproduce the
+scalar per-frequency implementations.
+
+Literature:
+- Small (1973), "Vented-Box Loudspeaker Systems Part I", JAES, Eq. 13, 19, 25
+- Thiele (1971), "Loudspeakers in Vented Boxes"
+- literature/thiele_small/thiele_1971_vented_boxes.md
+"""
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from viberesp.enclosure.ported_box import (
+    calculate_f3_from_spl,
+    calculate_optimal_port_dimensions,
+    calculate_spl_ported_array,
+    calculate_spl_ported_transfer_function,
+    ported_box_electrical_impedance,
+    ported_box_electrical_impedance_array,
+    ported_box_grid,
+)
+
+
+class TestPortedSPLArray:
+    """Test calculate_spl_ported_array against the scalar transfer function."""
+
+    @pytest.mark.parametrize("kwargs", [
+        {},
+        {"include_hf_rolloff": False},
+        {"Qp": 15.0, "QL": 10.0, "QA": 50.0},
+        {"voltage": 4.0, "measurement_distance": 2.0},
+    ])
+    def test_matches_scalar(self, test_driver, kwargs):
+        """Test each frequency matches calculate_spl_ported_transfer_function."""
+        freqs = np.logspace(1, 4, 150)
+        spl = calculate_spl_ported_array(freqs, test_driver, 0.030, 45.0, **kwargs)
+        expected = [
+            calculate_spl_ported_transfer_function(f, test_driver, 0.030, 45.0, **kwargs)
+            for f in freqs
+        ]
+
+        assert spl.shape == freqs.shape
+        assert_allclose(spl, expected, rtol=1e-12)
+
+    def test_broadcasts_over_box_volume(self, test_driver):
+        """Test a column of volumes gives one SPL curve per volume."""
+        freqs = np.logspace(1, 3, 50)
+        volumes = np.array([0.015, 0.030, 0.060])
+        spl = calculate_spl_ported_array(freqs, test_driver, volumes[:, np.newaxis], 45.0)
+
+        assert spl.shape == (3, 50)
+        for i, Vb in enumerate(volumes):
+            assert_allclose(spl[i], calculate_spl_ported_array(freqs, test_driver, Vb, 45.0))
+
+    def test_invalid_inputs(self, test_driver):
+        """Test non-positive frequencies, volumes and tunings are rejected."""
+        freqs = np.array([20.0, 50.0])
+        with pytest.raises(ValueError):
+            calculate_spl_ported_array(np.array([0.0, 50.0]), test_driver, 0.03, 45.0)
+        with pytest.raises(ValueError):
+            calculate_spl_ported_array(freqs, test_driver, 0.0, 45.0)
+        with pytest.raises(ValueError):
+            calculate_spl_ported_array(freqs, test_driver, 0.03, -1.0)
+
+
+class TestPortedBoxGrid:
+    """Test the (Vb, Fb) grid engine against the scalar functions."""
+
+    def setup_method(self):
+        """Set up a small tuning grid."""
+        self.volumes = np.linspace(0.015, 0.080, 7)
+        self.tunings = np.linspace(30.0, 60.0, 5)
+
+    def test_shapes(self, test_driver):
+        """Test metric arrays are (n_vb, n_fb) and the SPL cube adds frequency."""
+        grid = ported_box_grid(test_driver, self.volumes, self.tunings)
+
+        assert grid.spl.shape == (7, 5, 280)
+        for metric in (grid.F3, grid.peak_db, grid.ripple_db, grid.Q_equivalent,
+                       grid.port_length, grid.port_velocity):
+            assert metric.shape == (7, 5)
+
+    def test_f3_matches_calculate_f3_from_spl(self, test_driver):
+        """Test grid F3 equals calculate_f3_from_spl for every cell."""
+        grid = ported_box_grid(test_driver, self.volumes, self.tunings)
+
+        for i, Vb in enumerate(self.volumes):
+            for j, Fb in enumerate(self.tunings):
+                assert_allclose(grid.F3[i, j], calculate_f3_from_spl(test_driver, Vb, Fb),
+                                rtol=1e-12)
+
+    def test_spl_matches_array_function(self, test_driver):
+        """Test each SPL curve equals calculate_spl_ported_array."""
+        freqs = np.logspace(1, 3, 50)
+        grid = ported_box_grid(test_driver, self.volumes, self.tunings, frequencies=freqs)
+
+        assert_allclose(
+            grid.spl[3, 2],
+            calculate_spl_ported_array(freqs, test_driver, self.volumes[3], self.tunings[2]),
+        )
+
+    def test_port_dimensions_match_optimal_port(self, test_driver):
+        """Test port sizing matches calculate_optimal_port_dimensions or is NaN."""
+        grid = ported_box_grid(test_driver, self.volumes, self.tunings)
+
+        for i, Vb in enumerate(self.volumes):
+            for j, Fb in enumerate(self.tunings):
+                try:
+                    Sp, Lpt, v_port = calculate_optimal_port_dimensions(test_driver, Vb, Fb)
+                except ValueError:
+                    assert np.isnan(grid.port_length[i, j])
+                    continue
+                assert_allclose(grid.port_area[i, j], Sp, rtol=1e-12)
+                assert_allclose(grid.port_length[i, j], Lpt, rtol=1e-12)
+                assert_allclose(grid.port_velocity[i, j], v_port, rtol=1e-12)
+
+    def test_peaking_and_equivalent_q(self, test_driver):
+        """Test Q_equivalent is 0.707 without peaking and grows with the peak."""
+        grid = ported_box_grid(test_driver, self.volumes, self.tunings)
+
+        flat = grid.peak_db <= 0
+        assert_allclose(grid.Q_equivalent[flat], 1 / np.sqrt(2))
+        assert np.all(grid.Q_equivalent[~flat] > 1 / np.sqrt(2))
+        assert np.all(grid.ripple_db >= 0)
+
+
+class TestPortedBoxImpedanceArray:
+    """Test ported_box_electrical_impedance_array against the scalar function."""
+
+    @pytest.mark.parametrize("kwargs", [
+        {},
+        {"voice_coil_model": "leach", "leach_K": 2.7, "leach_n": 0.5},
+        {"impedance_model": "circuit"},
+        {"use_transfer_function_spl": False, "QP": 10.0},
+    ])
+    def test_matches_scalar(self, test_driver, kwargs):
+        """Test impedance, velocity and SPL match at every frequency."""
+        freqs = np.logspace(1, 4, 80)
+        args = (test_driver, 0.030, 42.0, 0.004, 0.2)
+        result = ported_box_electrical_impedance_array(freqs, *args, **kwargs)
+
+        expected = [ported_box_electrical_impedance(f, *args, **kwargs) for f in freqs]
+        for key in ("Ze_real", "Ze_imag", "SPL", "diaphragm_velocity"):
+            assert_allclose(result[key], [r[key] for r in expected], rtol=1e-10)
+        assert result['QB'] == expected[0]['QB']
+
+    def test_displacement_is_velocity_over_omega(self, test_driver):
+        """Test displacement equals |u|/ω."""
+        freqs = np.logspace(1, 3, 50)
+        result = ported_box_electrical_impedance_array(
+            freqs, test_driver, 0.030, 42.0, 0.004, 0.2
+        )
+
+        assert_allclose(
+            result['diaphragm_displacement'],
+            result['diaphragm_velocity'] / (2 * np.pi * freqs),
+        )
+
+    def test_invalid_inputs(self, test_driver):
+        """Test non-positive frequencies and port dimensions are rejected."""
+        with pytest.raises(ValueError):
+            ported_box_electrical_impedance_array(
+                np.array([0.0, 50.0]), test_driver, 0.03, 42.0, 0.004, 0.2
+            )
+        with pytest.raises(ValueError):
+            ported_box_electrical_impedance_array(
+                np.array([50.0]), test_driver, 0.03, 42.0, 0.0, 0.2
+            )
@@ -0,0 +1,128 @@
+"""
+Unit tests for batched sealed box calculations.
+
+These tests verify that the volume-batched sealed box functions reproduce
+the scalar per-volume implementations.
+
+Literature:
+- Small (1972), "Closed-Box Loudspeaker Systems Part I", JAES, Eq. 1, 9
+- literature/thiele_small/small_1972_closed_box.md
+"""
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from viberesp.enclosure.sealed_box import (
+    calculate_sealed_box_system_parameters,
+    calculate_sealed_box_system_parameters_array,
+    calculate_spl_array,
+    calculate_spl_array_batch,
+    sealed_box_electrical_impedance,
+    sealed_box_electrical_impedance_array,
+)
+
+
+class TestSealedBoxBatch:
+    """Test volume-batched sealed box SPL and system parameters."""
+
+    def setup_method(self):
+        """Set up volume sweep and frequency grid."""
+        self.volumes = np.linspace(0.004, 0.080, 40)
+        self.freqs = np.logspace(1, 4, 60)
+
+    @pytest.mark.parametrize("Quc", [7.0, float('inf')])
+    def test_system_parameters_match_scalar(self, test_driver, Quc):
+        """Test array parameters match calculate_sealed_box_system_parameters."""
+        params = calculate_sealed_box_system_parameters_array(
+            test_driver, self.volumes, Quc=Quc
+        )
+
+        for i, Vb in enumerate(self.volumes):
+            expected = calculate_sealed_box_system_parameters(test_driver, Vb, Quc=Quc)
+            assert_allclose(params.Fc[i], expected.Fc, rtol=1e-12)
+            assert_allclose(params.Qtc_total[i], expected.Qtc_total, rtol=1e-12)
+            assert_allclose(params.F3[i], expected.F3, rtol=1e-12)
+
+    def test_spl_rows_match_calculate_spl_array(self, test_driver):
+        """Test each SPL row matches the single-volume array function."""
+        spl, params = calculate_spl_array_batch(
+            self.freqs, test_driver, self.volumes, f_mass=450.0
+        )
+
+        assert spl.shape == (len(self.volumes), len(self.freqs))
+        assert params.F3.shape == self.volumes.shape
+        for i, Vb in enumerate(self.volumes):
+            assert_allclose(
+                spl[i], calculate_spl_array(self.freqs, test_driver, Vb, f_mass=450.0)
+            )
+
+    def test_design_matrix_input(self, test_driver):
+        """Test an (n, k) design matrix uses its first column as Vb."""
+        design = np.column_stack([self.volumes, np.zeros_like(self.volumes)])
+        spl_matrix, _ = calculate_spl_array_batch(self.freqs, test_driver, design)
+        spl_vector, _ = calculate_spl_array_batch(self.freqs, test_driver, self.volumes)
+
+        assert_allclose(spl_matrix, spl_vector)
+
+    def test_matches_electrical_impedance_spl(self, test_driver):
+        """Test batched SPL matches sealed_box_electrical_impedance SPL."""
+        spl, _ = calculate_spl_array_batch(self.freqs, test_driver, self.volumes[:3])
+
+        for i, Vb in enumerate(self.volumes[:3]):
+            expected = [
+                sealed_box_electrical_impedance(f, test_driver, Vb)['SPL']
+                for f in self.freqs
+            ]
+            assert_allclose(spl[i], expected, rtol=1e-12)
+
+    def test_invalid_volume(self, test_driver):
+        """Test non-positive volumes are rejected."""
+        with pytest.raises(ValueError):
+            calculate_spl_array_batch(self.freqs, test_driver, np.array([0.01, 0.0]))
+        with pytest.raises(ValueError):
+            calculate_sealed_box_system_parameters_array(test_driver, np.array([-0.01]))
+
+
+class TestSealedBoxImpedanceArray:
+    """Test sealed_box_electrical_impedance_array against the scalar function."""
+
+    @pytest.mark.parametrize("kwargs", [
+        {},
+        {"voice_coil_model": "leach", "leach_K": 2.7, "leach_n": 0.5},
+        {"voice_coil_model": "leach-full", "leach_K": 2.7, "leach_n": 0.7},
+        {"use_transfer_function_spl": False, "Quc": float('inf')},
+    ])
+    def test_matches_scalar(self, test_driver, kwargs):
+        """Test impedance, velocity and SPL match at every frequency."""
+        freqs = np.logspace(1, 4, 80)
+        result = sealed_box_electrical_impedance_array(freqs, test_driver, 0.012, **kwargs)
+
+        expected = [
+            sealed_box_electrical_impedance(f, test_driver, 0.012, **kwargs) for f in freqs
+        ]
+        for key in ("Ze_real", "Ze_imag", "SPL", "diaphragm_velocity"):
+            assert_allclose(result[key], [r[key] for r in expected], rtol=1e-10)
+
+    def test_displacement_is_velocity_over_omega(self, test_driver):
+        """Test displacement equals |u|/ω and broadcasts over box volumes."""
+        freqs = np.logspace(1, 3, 50)
+        volumes = np.array([0.005, 0.020])
+        result = sealed_box_electrical_impedance_array(
+            freqs, test_driver, volumes[:, np.newaxis]
+        )
+
+        assert result['diaphragm_displacement'].shape == (2, 50)
+        assert_allclose(
+            result['diaphragm_displacement'],
+            result['diaphragm_velocity'] / (2 * np.pi * freqs),
+        )
+        single = sealed_box_electrical_impedance_array(freqs, test_driver, volumes[1])
+        assert_allclose(result['Ze'][1], single['Ze'])
+
+    def test_invalid_inputs(self, test_driver):
+        """Test non-positive frequencies and volumes are rejected."""
+        with pytest.raises(ValueError):
+            sealed_box_electrical_impedance_array(np.array([0.0, 50.0]), test_driver, 0.01)
+        with pytest.raises(ValueError):
+            sealed_box_electrical_impedance_array(np.array([50.0]), test_driver, 0.0)
@@ -0,0 +1,134 @@
+"""
+Unit tests for surrogate-assisted NSGA-II.
+
+These tests verify the RBF surrogate, that only the screened fraction of
+each generation is simulated, and that the surrogate-assisted run reaches
+the hypervolume of plain NSGA-II with far fewer simulations.
+
+Literature:
+- Jin (2005), "A comprehensive survey of fitness approximation in
+  evolutionary computation"
+- Regis & Shoemaker (2007), "A stochastic radial basis function method for
+  the global optimization of expensive functions"
+"""
+
+import warnings
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal
+
+from viberesp.optimization.optimizers.pymoo_interface import (
+    run_nsga2,
+    run_surrogate_nsga2,
+)
+from viberesp.optimization.optimizers.surrogate import (
+    RBFSurrogate,
+    SurrogateAssistedNSGA2,
+    surrogate_error_statistics,
+)
+from viberesp.optimization.results.pareto_front import hypervolume
+
+
+BOUNDS = {"Vb": (0.01, 0.08), "Fb": (25.0, 70.0)}
+
+
+def run(runner, problem, n_generations, **kwargs):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return runner(problem, pop_size=20, n_generations=n_generations,
+                      seed=1, verbose=False, **kwargs)
+
+
+class TestRBFSurrogate:
+    """Test the RBF model."""
+
+    def test_interpolates_smooth_function(self):
+        """Test exact fit at training designs and accuracy in between."""
+        rng = np.random.default_rng(0)
+        xl, xu = np.array([0.0, 10.0]), np.array([1.0, 20.0])
+
+        def f(X):
+            return np.column_stack([X[:, 0] ** 2 + X[:, 1] / 10, np.sin(X[:, 0])])
+
+        X = rng.uniform(xl, xu, (60, 2))
+        surrogate = RBFSurrogate(xl, xu)
+        assert surrogate.fit(X, f(X))
+
+        assert_allclose(surrogate.predict(X), f(X), atol=1e-8)
+        X_test = rng.uniform(xl + 0.1, xu - 0.1, (20, 2))
+        assert_allclose(surrogate.predict(X_test), f(X_test), atol=0.02)
+
+    def test_failed_designs_not_used(self):
+        """Test penalized designs are excluded and too few designs skip the fit."""
+        X = np.random.default_rng(1).random((8, 2))
+        Y = np.ones((8, 1))
+        Y[3:] = 1e10
+
+        surrogate = RBFSurrogate(np.zeros(2), np.ones(2))
+        assert not surrogate.fit(X, Y)
+        assert surrogate.n_training == 3
+        with pytest.raises(RuntimeError):
+            surrogate.predict(X)
+
+    def test_error_statistics(self):
+        """Test RMSE, MAE and rank correlation of known predictions."""
+        actual = np.array([[1.0], [2.0], [3.0], [4.0]])
+        # First two designs swapped: 1 - 6 * 2 / (4 * 15) = 0.8
+        stats = surrogate_error_statistics(np.array([[2.0], [1.0], [3.0], [4.0]]), actual)
+
+        assert stats["n_predictions"] == 4
+        assert_allclose(stats["rmse"], [np.sqrt(0.5)])
+        assert_allclose(stats["mae"], [0.5])
+        assert_allclose(stats["rank_correlation"], [0.8])
+
+
+class TestSurrogateAssistedNSGA2:
+    """Test surrogate-assisted runs."""
+
+    def test_simulates_screened_fraction(self, make_problem):
+        """Test only 5 of 20 candidates are simulated per generation."""
+        result, metadata = run(run_surrogate_nsga2, make_problem(BOUNDS), 10, screen_fraction=0.25)
+
+        assert metadata["n_evaluations"] == 20 + 9 * 5
+        assert metadata["surrogate"]["n_predictions"] == 9 * 5
+        assert metadata["surrogate"]["n_screened_out"] == 9 * 15
+        assert min(metadata["surrogate"]["rank_correlation"]) > 0.9
+
+        # The returned front carries simulated, not predicted, values
+        out = {}
+        make_problem(BOUNDS)._evaluate(result.X, out)
+        assert_array_equal(result.F, out["F"])
+
+    def test_same_hypervolume_with_fewer_simulations(self, make_problem):
+        """Test the hypervolume of plain NSGA-II is reached with ~1/3 of its simulations."""
+        plain, plain_meta = run(run_nsga2, make_problem(BOUNDS), 40)
+        screened, screened_meta = run(run_surrogate_nsga2, make_problem(BOUNDS), 40)
+
+        assert screened_meta["n_evaluations"] < plain_meta["n_evaluations"] / 3
+
+        F = np.vstack([plain.F, screened.F])
+        ideal, scale = F.min(axis=0), np.ptp(F, axis=0)
+        reference = np.full(2, 1.1)
+        hv_plain = hypervolume((plain.F - ideal) / scale, reference)
+        hv_screened = hypervolume((screened.F - ideal) / scale, reference)
+        assert hv_screened > 0.99 * hv_plain
+
+    def test_resume_is_bit_exact(self, make_problem, tmp_path):
+        """Test the surrogate's training data survives a checkpoint."""
+        path = str(tmp_path / "surrogate.ckpt")
+        full, _ = run(run_surrogate_nsga2, make_problem(BOUNDS), 6)
+
+        run(run_surrogate_nsga2, make_problem(BOUNDS), 3, checkpoint_path=path, checkpoint_every=1)
+        resumed, _ = run(run_surrogate_nsga2, make_problem(BOUNDS), 6,
+                         checkpoint_path=path, resume=True)
+
+        assert_array_equal(resumed.X, full.X)
+        assert_array_equal(resumed.F, full.F)
+
+    def test_invalid_screen_fraction(self):
+        """Test screen fractions outside (0, 1] are rejected."""
+        with pytest.raises(ValueError):
+            SurrogateAssistedNSGA2(screen_fraction=0.0)
+        with pytest.raises(ValueError):
+            SurrogateAssistedNSGA2(screen_fraction=1.5)
@@ -0,0 +1,163 @@
+"""
+Unit tests for population-vectorized constraints.
+
+These tests verify that every batch constraint reproduces its per-design
+constraint function exactly, and that optimization problems build the same
+G matrix population-wide as design by design.
+
+Literature:
+- Olson (1947), Chapter 5 - Horn flare and mouth limits
+- Small (1972) - Closed-box system parameters (Qtc)
+"""
+
+import warnings
+from functools import partial
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal
+
+from viberesp.enclosure.sealed_box import calculate_sealed_box_system_parameters
+from viberesp.optimization.config import OptimizationConfig
+from viberesp.optimization.constraints.performance import (
+    constraint_qtc_range,
+    constraint_volume_limit,
+)
+from viberesp.optimization.constraints.physical import constraint_max_displacement
+from viberesp.optimization.constraints.vectorized import (
+    VECTORIZED_CONSTRAINTS,
+    fill_vectorized_constraints,
+    vectorized_constraint,
+)
+from viberesp.optimization.factory import OptimizationScriptFactory
+from viberesp.optimization.objectives.composite import EnclosureOptimizationProblem
+
+
+def evaluate(problem, X):
+    out = {}
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        problem._evaluate(X, out)
+    return out["F"], out["G"]
+
+
+class TestBatchConstraints:
+    """Test the batch constraints against the per-design functions."""
+
+    @pytest.mark.parametrize("enclosure_type,n_var", [
+        ("sealed", 1), ("ported", 2), ("ported", 4), ("exponential_horn", 4),
+        ("conical_horn", 5), ("multisegment_horn", 7), ("mixed_profile_horn", 11),
+    ])
+    @pytest.mark.filterwarnings("ignore::RuntimeWarning")
+    def test_matches_per_design(self, test_driver, enclosure_type, n_var):
+        """Test every batch constraint equals its per-design function row by row."""
+        X = np.random.default_rng(n_var).uniform(-0.01, 0.3, (200, n_var))
+        X[:5, 0] = 0.0                   # Degenerate throat / box
+        X[5:10, -1] = 0.0
+        X[10:15, 1 % n_var] = X[10:15, 0]  # Equal throat and mouth
+
+        for func, batch in VECTORIZED_CONSTRAINTS.items():
+            if n_var < 7 and "num_segments" in func.__code__.co_varnames:
+                continue  # Segmented horn constraints need the full vector
+            expected = [func(x, test_driver, enclosure_type) for x in X]
+            assert_array_equal(batch(X, test_driver, enclosure_type), expected, err_msg=func.__name__)
+
+    def test_qtc_range(self, test_driver):
+        """Test the Qtc constraint uses the system Q (not the failure value)."""
+        Qtc = calculate_sealed_box_system_parameters(test_driver, 0.010).Qtc_total
+        X = np.array([[0.010], [0.0]])
+
+        assert_allclose(constraint_qtc_range(X[0], test_driver, "sealed", qtc_max=0.5), Qtc - 0.5)
+        batch = vectorized_constraint(partial(constraint_qtc_range, qtc_max=0.5))
+        assert_array_equal(batch(X, test_driver, "sealed"), [Qtc - 0.5, 1000.0])
+
+    def test_partial_and_unsupported(self, test_driver):
+        """Test bound keywords are kept and simulated constraints have no batch version."""
+        batch = vectorized_constraint(partial(constraint_volume_limit, max_volume_liters=30))
+        assert_allclose(batch(np.array([[0.020], [0.040]]), test_driver, "sealed"), [-10.0, 10.0])
+        assert vectorized_constraint(constraint_max_displacement) is None
+
+    def test_fill_keeps_evaluated_entries(self, test_driver):
+        """Test only NaN entries are filled, with the failure value if the batch raises."""
+        X = np.array([[0.020], [0.040], [0.060]])
+        G = np.array([[np.nan, np.nan], [1e6, 1e6], [np.nan, np.nan]])
+
+        def failing(X, driver, enclosure_type):
+            raise ValueError("no batch")
+
+        fill_vectorized_constraints(
+            X, G, [(0, VECTORIZED_CONSTRAINTS[constraint_volume_limit]), (1, failing)],
+            test_driver, "sealed", failure_value=1e6,
+        )
+        assert_allclose(G, [[-30.0, 1e6], [1e6, 1e6], [10.0, 1e6]])
+
+
+class TestPopulationConstraints:
+    """Test problems build G population-wide."""
+
+    def test_per_design_constraints_skipped(self, test_driver):
+        """Test a sealed problem with only vectorized constraints never loops over designs."""
+        problem = EnclosureOptimizationProblem(
+            test_driver, "sealed", ["f3", "size"], {"Vb": (0.005, 0.05)},
+            constraints=["qtc_range", "volume_limit"],
+        )
+        problem._evaluate_constraints = None  # Would fail if called
+        X = np.linspace(0.005, 0.05, 10).reshape(-1, 1)
+
+        _, G = evaluate(problem, X)
+        Qtc = [calculate_sealed_box_system_parameters(test_driver, Vb).Qtc_total for Vb in X[:, 0]]
+        assert_allclose(G[:, 0], np.maximum(np.maximum(0.5 - np.array(Qtc), np.array(Qtc) - 1.2), 0.0))
+        assert_allclose(G[:, 1], X[:, 0] * 1000.0 - 50.0)
+
+    @pytest.mark.parametrize("enclosure_type,bounds,constraints", [
+        ("ported", {"Vb": (0.01, 0.08), "Fb": (25.0, 70.0), "port_area": (0.001, 0.01)},
+         ["port_velocity", "max_displacement", "volume_limit"]),
+        ("exponential_horn",
+         {"throat_area": (0.005, 0.02), "mouth_area": (0.05, 0.4), "length": (0.5, 3.0), "V_rc": (0.0, 0.02)},
+         ["mouth_size", "monotonic_expansion", "volume_limit", "max_displacement"]),
+    ])
+    def test_matches_per_design_problem(self, test_driver, enclosure_type, bounds, constraints):
+        """Test vectorized and per-design problems give identical F and G."""
+        def make(vectorize):
+            return EnclosureOptimizationProblem(
+                test_driver, enclosure_type, ["f3", "size"], bounds,
+                constraints=constraints, vectorize=vectorize,
+            )
+
+        vectorized, per_design = make(True), make(False)
+        X = np.random.default_rng(2).uniform(vectorized.xl, vectorized.xu, (8, vectorized.n_var))
+        assert len(vectorized._vectorized_constraints) == len(constraints) - 1
+
+        F, G = evaluate(vectorized, X)
+        reference_F, reference_G = evaluate(per_design, X)
+        assert_array_equal(G, reference_G)
+        assert_allclose(F, reference_F)
+
+    def test_factory(self):
+        """Test the factory fills its batch constraints for the population."""
+        def make(**kwargs):
+            config = OptimizationConfig(
+                driver_name="BC_8NDL51", enclosure_type="multisegment_horn",
+                objectives=["f3", "volume"], parameter_space_preset="bass_horn",
+                constraints={"max_volume": 80.0}, save_results=False, verbose=False,
+            )
+            factory = OptimizationScriptFactory(config)
+            problem = factory._create_problem()
+            if kwargs:
+                problem = type(problem)(
+                    problem.objective_funcs, problem.constraint_funcs, factory.driver,
+                    problem.enclosure_type, problem.xl, problem.xu, verbose=False, **kwargs
+                )
+            return problem
+
+        vectorized = make()
+        X = np.random.default_rng(3).uniform(vectorized.xl, vectorized.xu, (10, vectorized.n_var))
+        names = [name for name, _ in vectorized.constraint_funcs]
+        assert names[-1] == "volume_limit"
+        assert len(vectorized.constraint_funcs) - 1 in vectorized._vectorized_columns
+
+        F, G = evaluate(vectorized, X)
+        reference_F, reference_G = evaluate(make(vectorize=False, screen_geometry=False), X)
+        simulated = ~np.any(G[:, [j for j, _ in vectorized._geometric_constraints]] > 0, axis=1)
+        assert_array_equal(G[simulated], reference_G[simulated])
+        assert_array_equal(F[simulated], reference_F[simulated])
@@ -0,0 +1,156 @@
+"""
+Unit tests for population-vectorized sealed and ported objectives.
+
+These tests verify that evaluating a whole population with array operations
+reproduces the per-design objective functions exactly, including the
+penalties assigned to invalid designs.
+
+Literature:
+- Small (1972), "Closed-Box Loudspeaker Systems Part I", JAES
+- Small (1973), "Vented-Box Loudspeaker Systems Part I", JAES
+"""
+
+import warnings
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from viberesp.optimization.objectives.composite import (
+    EnclosureEvaluationMixin,
+    EnclosureOptimizationProblem,
+)
+from viberesp.optimization.objectives.efficiency import objective_efficiency
+from viberesp.optimization.objectives.response_metrics import (
+    objective_f3,
+    objective_response_flatness,
+)
+from viberesp.optimization.objectives.size_metrics import objective_enclosure_volume
+from viberesp.optimization.objectives.vectorized import (
+    F3_PENALTY,
+    evaluate_objectives_vectorized,
+)
+
+
+BOUNDS = {"Vb": (0.01, 0.05), "Fb": (30.0, 60.0)}
+OBJECTIVES = ["f3", "flatness", "efficiency", "size"]
+
+
+def per_design(X, driver, enclosure_type, target_band=None):
+    """Objective matrix from the per-design functions (penalty 1e10 on F3 errors)."""
+    flatness_kwargs = {}
+    if target_band:
+        flatness_kwargs = {"frequency_range": target_band, "target_band": target_band}
+
+    rows = []
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for x in X:
+            try:
+                f3 = objective_f3(x, driver, enclosure_type)
+            except ValueError:
+                f3 = F3_PENALTY
+            rows.append([
+                f3,
+                objective_response_flatness(x, driver, enclosure_type, **flatness_kwargs),
+                objective_efficiency(x, driver, enclosure_type),
+                objective_enclosure_volume(x, driver, enclosure_type),
+            ])
+    return np.array(rows)
+
+
+def evaluate(X, driver, enclosure_type, target_band=None):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return evaluate_objectives_vectorized(
+            X, driver, enclosure_type, OBJECTIVES, target_band=target_band
+        )
+
+
+class TestVectorizedObjectives:
+    """Test vectorized objective columns against the per-design functions."""
+
+    def setup_method(self):
+        """Set up random populations."""
+        rng = np.random.default_rng(1)
+        self.sealed = rng.uniform(0.002, 0.100, (60, 1))
+        self.ported = rng.uniform([0.005, 20.0], [0.100, 80.0], (80, 2))
+        self.ported_with_port = np.column_stack([
+            self.ported, rng.uniform(0.0005, 0.01, 80), rng.uniform(0.02, 0.5, 80)
+        ])
+
+    @pytest.mark.parametrize("target_band", [None, (30.0, 300.0)])
+    def test_sealed_matches_per_design(self, test_driver, target_band):
+        """Test sealed F3, flatness, efficiency and size are bit-identical."""
+        assert_array_equal(
+            evaluate(self.sealed, test_driver, "sealed", target_band),
+            per_design(self.sealed, test_driver, "sealed", target_band),
+        )
+
+    @pytest.mark.parametrize("target_band", [None, (30.0, 300.0)])
+    def test_ported_matches_per_design(self, test_driver, target_band):
+        """Test ported objectives (optimal and explicit ports) are bit-identical."""
+        for X in (self.ported, self.ported_with_port):
+            assert_array_equal(
+                evaluate(X, test_driver, "ported", target_band),
+                per_design(X, test_driver, "ported", target_band),
+            )
+
+    def test_invalid_designs_penalized(self, test_driver):
+        """Test impractical ports get the per-design penalty values."""
+        X = np.array([[0.011, 30.5], [0.030, 45.0]])  # First port is too long
+        with pytest.warns(UserWarning, match="1 of 2"):
+            F = evaluate_objectives_vectorized(X, test_driver, "ported", OBJECTIVES)
+
+        assert_array_equal(F[0, :3], [F3_PENALTY, 1000.0, -1000.0])
+        assert np.all(F[1, :3] < 1000.0)
+
+    def test_unsupported_objective(self, test_driver):
+        """Test objectives without a vectorized version are rejected."""
+        with pytest.raises(ValueError):
+            evaluate_objectives_vectorized(
+                self.sealed, test_driver, "sealed", ["passband_flatness"]
+            )
+
+
+class TestProblemFastPath:
+    """Test EnclosureOptimizationProblem selects the vectorized path."""
+
+    def test_selected_automatically(self, test_driver):
+        """Test box problems vectorize and others keep per-design evaluation."""
+        assert EnclosureOptimizationProblem(test_driver, "ported", OBJECTIVES, BOUNDS).vectorized
+        assert not EnclosureOptimizationProblem(
+            test_driver, "ported", ["passband_flatness"], BOUNDS
+        ).vectorized
+        assert not EnclosureOptimizationProblem(
+            test_driver, "exponential_horn", ["f3"], {"throat_area": (0.001, 0.01)}
+        ).vectorized
+
+    def test_evaluate_matches_per_design_path(self, make_problem):
+        """Test F and G match the per-design evaluation exactly."""
+        X = np.random.default_rng(2).uniform([0.01, 30.0], [0.05, 60.0], (20, 2))
+        outs = []
+        for vectorize in (True, False):
+            problem = make_problem(
+                BOUNDS, OBJECTIVES, ("max_displacement", "f3_limit"), vectorize=vectorize
+            )
+            out = {}
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                problem._evaluate(X, out)
+            outs.append(out)
+
+        assert_array_equal(outs[0]["F"], outs[1]["F"])
+        assert_array_equal(outs[0]["G"], outs[1]["G"])
+
+    def test_default_falls_back_to_per_design(self, make_problem):
+        """Test the mixin's default vectorized hook evaluates designs individually."""
+        X = np.array([[0.02, 45.0], [0.04, 35.0]])
+        problem = make_problem(BOUNDS, OBJECTIVES)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            F, G = EnclosureEvaluationMixin._evaluate_vectorized_objectives(problem, X)
+            expected_F, expected_G = problem._evaluate_screened(X)
+
+        assert_array_equal(F, expected_F)
+        assert_array_equal(G, expected_G)
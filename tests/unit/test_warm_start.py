@@ -0,0 +1,148 @@
+"""
+Unit tests for warm-starting optimization runs.
+
+These tests verify that seed designs are read from results files,
+optimization results and design recommendations, mapped into the current
+parameter space (clipped, or rescaled for another driver), and that a
+warm-started run recovers the previous front within a few generations.
+
+Literature:
+- Louis & McDonnell (2004), "Learning with case-injected genetic algorithms"
+- Deb et al. (2002), "A fast and elitist multiobjective genetic algorithm: NSGA-II"
+"""
+
+import json
+import warnings
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal
+from pymoo.core.problem import Problem
+
+from viberesp.optimization.api.design_assistant import DesignAssistant
+from viberesp.optimization.config import AlgorithmConfig, OptimizationConfig
+from viberesp.optimization.factory import OptimizationScriptFactory
+from viberesp.optimization.optimizers.warm_start import (
+    SeedDesigns,
+    SeededSampling,
+    load_seed_designs,
+    seed_matrix,
+)
+from viberesp.optimization.results.pareto_front import hypervolume
+
+NAMES = ["Vb", "Fb"]
+XL, XU = np.array([0.01, 30.0]), np.array([0.05, 60.0])
+
+
+def make_config(n_generations, seed, driver_name="BC_8NDL51", **kwargs):
+    return OptimizationConfig(
+        driver_name=driver_name, enclosure_type="ported",
+        objectives=["f3", "volume"], parameter_space_preset="ported",
+        algorithm=AlgorithmConfig(pop_size=20, n_generations=n_generations, seed=seed),
+        save_results=False, verbose=False, **kwargs
+    )
+
+
+def run(config):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return OptimizationScriptFactory(config).run()
+
+
+def front(result):
+    return np.array([[d["objectives"][name] for name in result.objective_names]
+                     for d in result.pareto_front])
+
+
+class TestSeedDesigns:
+    """Test loading and mapping seed designs."""
+
+    def test_load_sources(self, tmp_path):
+        """Test results files, recommendations and design lists."""
+        path = tmp_path / "results.json"
+        path.write_text(json.dumps({
+            "pareto_front": [{"parameters": {"Vb": 0.02, "Fb": 40.0}, "objectives": {"f3": 45.0}}],
+            "optimization_metadata": {"driver": "BC_8NDL51", "enclosure_type": "ported",
+                                      "parameter_bounds": {"Vb": [0.01, 0.03]}},
+        }))
+        seeds = load_seed_designs(str(path))
+        assert seeds.designs == [{"Vb": 0.02, "Fb": 40.0}]
+        assert seeds.driver_name == "BC_8NDL51"
+        assert seeds.parameter_bounds == {"Vb": (0.01, 0.03)}
+
+        rec = DesignAssistant().recommend_design("BC_8NDL51", enclosure_preference="ported")
+        assert load_seed_designs(rec).designs == [rec.suggested_parameters]
+        assert load_seed_designs([{"Vb": 0.02}]).designs == [{"Vb": 0.02}]
+
+        with pytest.raises(ValueError):
+            load_seed_designs([{"parameters": {}}])
+        with pytest.raises(ValueError):
+            load_seed_designs({"designs": []})
+
+    def test_seed_matrix_clips_and_deduplicates(self):
+        """Test same-driver designs are clipped, missing parameters left open."""
+        seeds = SeedDesigns([{"Vb": 0.1, "Fb": 40.0}, {"Vb": 0.08, "Fb": 40.0}, {"Vb": 0.02}])
+
+        X = seed_matrix(seeds, NAMES, XL, XU, driver_name="BC_8NDL51")
+        assert_array_equal(X, [[0.05, 40.0], [0.02, np.nan]])
+
+        with pytest.raises(ValueError):
+            seed_matrix(SeedDesigns([{"port_area": 0.01}]), NAMES, XL, XU)
+
+    def test_other_driver_rescaled(self):
+        """Test designs of another driver keep their position within the bounds."""
+        seeds = SeedDesigns(
+            [{"Vb": 0.2, "Fb": 25.0}], driver_name="BC_15DS115",
+            parameter_bounds={"Vb": (0.1, 0.5), "Fb": (20.0, 40.0)},
+        )
+
+        assert_allclose(seed_matrix(seeds, NAMES, XL, XU, "BC_8NDL51"), [[0.02, 37.5]])
+        assert_allclose(seed_matrix(seeds, NAMES, XL, XU, "BC_15DS115"), [[0.05, 30.0]])
+
+    def test_sampling_places_seeds_first(self):
+        """Test seeds lead the population and the sampling fills the rest."""
+        problem = Problem(n_var=2, n_obj=1, xl=XL, xu=XU)
+        seeds = SeedDesigns([{"Vb": 0.01 + 0.001 * i, "Fb": 40.0} for i in range(5)])
+
+        X = SeededSampling(seeds, NAMES).do(problem, 8, random_state=np.random.default_rng(0)).get("X")
+        assert_allclose(X[:5, 0], 0.01 + 0.001 * np.arange(5))
+        assert np.all((X[5:] >= XL) & (X[5:] <= XU))
+
+        # More seeds than slots: evenly spread over the list
+        X = SeededSampling(seeds, NAMES).do(problem, 3, random_state=np.random.default_rng(0)).get("X")
+        assert_allclose(X[:, 0], [0.01, 0.012, 0.014])
+
+
+class TestFactoryWarmStart:
+    """Test warm-started factory runs."""
+
+    def test_warm_start_recovers_front(self, tmp_path):
+        """Test 3 warm-started generations match a 30-generation front."""
+        base = run(make_config(30, 1))
+        path = tmp_path / "base.json"
+        path.write_text(json.dumps({
+            "pareto_front": base.pareto_front,
+            "optimization_metadata": base.optimization_metadata,
+        }))
+
+        cold = run(make_config(3, 2))
+        warm = run(make_config(3, 2, seed_from=str(path)))
+        assert warm.optimization_metadata["seed_designs"] == 20
+
+        F = np.vstack([front(base), front(cold), front(warm)])
+        ideal, scale = F.min(axis=0), np.ptp(F, axis=0)
+        reference = np.full(2, 1.1)
+        hv_base, hv_cold, hv_warm = (
+            hypervolume((front(result) - ideal) / scale, reference)
+            for result in (base, cold, warm)
+        )
+        assert hv_warm > 0.99 * hv_base
+        assert hv_warm > hv_cold
+
+    def test_seed_from_other_driver(self):
+        """Test a front of another driver seeds a run after rescaling."""
+        base = run(make_config(5, 1))
+        warm = run(make_config(2, 1, driver_name="BC_15DS115", seed_from=base))
+
+        assert warm.optimization_metadata["seed_designs"] == base.n_designs_found
+        assert warm.n_designs_found > 0